@@ -1,29 +1,83 @@
-"""Contains implementations of evals for SteelThread."""
+"""Contains implementations of evals for SteelThread.
 
-from .backend import PortiaBackend
-from .default_evaluator import DefaultEvaluator
-from .eval_runner import EvalConfig, EvalRunner
-from .evaluator import Evaluator, PlanRunMetadata
-from .metrics import (
-    EvalLogMetricBackend,
-    EvalMetric,
-    PortiaEvalMetricsBackend,
-)
-from .models import EvalTestCase, InputConfig, OutcomeAssertion
-from .tags import EvalMetricTagger
+Exports are imported lazily so `import steelthread.evals` stays cheap until a name is used.
+"""
+
+from typing import TYPE_CHECKING
+
+from steelthread.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveIterations
+    from .backend import PortiaBackend
+    from .compiler import DatasetCompilationError, compile_dataset
+    from .deadlines import StragglerPolicy
+    from .default_evaluator import DefaultEvaluator
+    from .distributed import EvalCoordinator, EvalWorker
+    from .eval_runner import EvalConfig, EvalRunner
+    from .evaluator import Evaluator, PlanRunMetadata
+    from .metrics import (
+        ArrowEvalMetricsBackend,
+        EvalLogMetricBackend,
+        EvalMetric,
+        PortiaEvalMetricsBackend,
+        SQLiteEvalMetricsBackend,
+    )
+    from .models import EvalTestCase, InputConfig, OutcomeAssertion
+    from .tags import EvalMetricTagger
+    from .work_queue import SQLiteWorkQueue, WorkQueue
 
 __all__ = [
+    "AdaptiveIterations",
+    "ArrowEvalMetricsBackend",
+    "DatasetCompilationError",
     "DefaultEvaluator",
     "EvalConfig",
+    "EvalCoordinator",
     "EvalLogMetricBackend",
     "EvalMetric",
     "EvalMetricTagger",
     "EvalRunner",
     "EvalTestCase",
+    "EvalWorker",
     "Evaluator",
     "InputConfig",
     "OutcomeAssertion",
     "PlanRunMetadata",
     "PortiaBackend",
     "PortiaEvalMetricsBackend",
+    "SQLiteEvalMetricsBackend",
+    "SQLiteWorkQueue",
+    "StragglerPolicy",
+    "WorkQueue",
+    "compile_dataset",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AdaptiveIterations": ".adaptive",
+        "ArrowEvalMetricsBackend": ".metrics",
+        "DatasetCompilationError": ".compiler",
+        "DefaultEvaluator": ".default_evaluator",
+        "EvalConfig": ".eval_runner",
+        "EvalCoordinator": ".distributed",
+        "EvalLogMetricBackend": ".metrics",
+        "EvalMetric": ".metrics",
+        "EvalMetricTagger": ".tags",
+        "EvalRunner": ".eval_runner",
+        "EvalTestCase": ".models",
+        "EvalWorker": ".distributed",
+        "Evaluator": ".evaluator",
+        "InputConfig": ".models",
+        "OutcomeAssertion": ".models",
+        "PlanRunMetadata": ".evaluator",
+        "PortiaBackend": ".backend",
+        "PortiaEvalMetricsBackend": ".metrics",
+        "SQLiteEvalMetricsBackend": ".metrics",
+        "SQLiteWorkQueue": ".work_queue",
+        "StragglerPolicy": ".deadlines",
+        "WorkQueue": ".work_queue",
+        "compile_dataset": ".compiler",
+    },
+)
@@ -0,0 +1,165 @@
+"""Adaptive iteration counts with sequential early stopping."""
+
+import math
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from statistics import NormalDist
+
+from steelthread.evals.checkpoint import WorkUnit
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase
+from steelthread.utils.stats import RunningStats
+
+
+class AdaptiveIterations:
+    """Policy for sampling each test case until its scores are precise enough.
+
+    Every test case is run `min_iterations` times. After that a test case is only run again
+    while the confidence interval of the mean of any of its metrics is wider than
+    `target_half_width`, up to `max_iterations`. `max_total_runs` caps the runs of the
+    whole eval.
+
+    Attributes:
+        min_iterations (int): Iterations every test case gets.
+        max_iterations (int): Most iterations any test case gets.
+        target_half_width (float): Confidence interval half width at which sampling stops.
+        confidence (float): Confidence level of the interval.
+        max_total_runs (int | None): Global budget of runs across all test cases.
+
+    """
+
+    def __init__(
+        self,
+        min_iterations: int = 2,
+        max_iterations: int = 10,
+        target_half_width: float = 0.1,
+        confidence: float = 0.95,
+        max_total_runs: int | None = None,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            min_iterations (int): Iterations every test case gets, at least 2 so the
+                variance of its scores can be estimated.
+            max_iterations (int): Most iterations any test case gets.
+            target_half_width (float): Confidence interval half width (in score units) at
+                which a test case stops being sampled.
+            confidence (float): Confidence level of the interval, e.g. 0.95.
+            max_total_runs (int | None): Global budget of runs across all test cases.
+
+        """
+        if min_iterations < 2:  # noqa: PLR2004
+            raise ValueError("min_iterations must be at least 2 to estimate variance")
+        if max_iterations < min_iterations:
+            raise ValueError("max_iterations must be at least min_iterations")
+        if not 0 < confidence < 1:
+            raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+        if target_half_width <= 0:
+            raise ValueError("target_half_width must be positive")
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+        self.target_half_width = target_half_width
+        self.confidence = confidence
+        self.max_total_runs = max_total_runs
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    def half_width(self, stats: RunningStats) -> float:
+        """Get the confidence interval half width of the mean of the scores so far."""
+        if stats.count < 2:  # noqa: PLR2004
+            return math.inf
+        return self._z * stats.std / math.sqrt(stats.count)
+
+    def required_iterations(self, stats: RunningStats, iterations: int | None = None) -> int:
+        """Estimate the iterations needed to reach the target half width.
+
+        Uses the observed standard deviation, so the estimate is refined as results arrive.
+
+        Args:
+            stats (RunningStats): The scores of one metric, one per iteration.
+            iterations (int | None): The iterations already run, if some didn't record the
+                metric. Defaults to the number of scores.
+
+        Returns:
+            int: The total iterations needed.
+
+        """
+        done = stats.count if iterations is None else iterations
+        if stats.count < 2:  # noqa: PLR2004
+            return max(self.min_iterations, done)
+        if self.half_width(stats) <= self.target_half_width:
+            return done
+        needed = math.ceil((self._z * stats.std / self.target_half_width) ** 2)
+        return min(max(needed, done + 1), self.max_iterations)
+
+
+class AdaptiveSampler:
+    """Schedules the iterations of each test case of a run under an `AdaptiveIterations` policy.
+
+    Once every scheduled iteration of a test case has completed, further iterations are
+    scheduled in one batch sized by the policy's estimate of how many are still needed.
+    Scores are kept per assertion, the nth metric of a name in a unit's metrics, so a test
+    case with several assertions of the same type gets one score of each per iteration.
+    """
+
+    def __init__(self, policy: AdaptiveIterations) -> None:
+        """Initialize the sampler.
+
+        Args:
+            policy (AdaptiveIterations): The sampling policy.
+
+        """
+        self.policy = policy
+        self.scheduled = 0
+        self._iterations: dict[str, int] = defaultdict(int)
+        self._in_flight: dict[str, int] = defaultdict(int)
+        self._stats: dict[str, dict[tuple[str, int], RunningStats]] = defaultdict(dict)
+
+    def initial(self, test_cases: Sequence[EvalTestCase]) -> list[WorkUnit]:
+        """Schedule the minimum iterations of every test case."""
+        units = []
+        for _ in range(self.policy.min_iterations):
+            for tc in test_cases:
+                units.extend(self._schedule(tc, 1))
+        return units
+
+    def record(self, unit: WorkUnit, metrics: list[EvalMetric]) -> list[WorkUnit]:
+        """Record the metrics of a completed unit and get any iterations to run next.
+
+        Args:
+            unit (WorkUnit): The completed unit.
+            metrics (list[EvalMetric]): Its metrics.
+
+        Returns:
+            list[WorkUnit]: Further iterations of the same test case to run.
+
+        """
+        testcase = unit.test_case.testcase
+        self._in_flight[testcase] -= 1
+        stats = self._stats[testcase]
+        seen: Counter[str] = Counter()
+        for metric in metrics:
+            key = (metric.name, seen[metric.name])
+            seen[metric.name] += 1
+            if key not in stats:
+                stats[key] = RunningStats(quantiles=())
+            stats[key].add(metric.score)
+        if self._in_flight[testcase] > 0 or not stats:
+            return []
+        iterations = self._iterations[testcase]
+        target = max(self.policy.required_iterations(s, iterations) for s in stats.values())
+        return self._schedule(unit.test_case, target - iterations)
+
+    def iterations(self) -> dict[str, int]:
+        """Get the number of iterations scheduled for each test case."""
+        return dict(self._iterations)
+
+    def _schedule(self, tc: EvalTestCase, count: int) -> list[WorkUnit]:
+        """Schedule up to `count` more iterations of a test case within the global budget."""
+        if self.policy.max_total_runs is not None:
+            count = min(count, self.policy.max_total_runs - self.scheduled)
+        start = self._iterations[tc.testcase]
+        count = max(min(count, self.policy.max_iterations - start), 0)
+        self._iterations[tc.testcase] += count
+        self._in_flight[tc.testcase] += count
+        self.scheduled += count
+        return [WorkUnit(tc, iteration) for iteration in range(start, start + count)]
@@ -1,13 +1,29 @@
 """Backend for Portia evals."""
 
+from pathlib import Path
+from typing import NotRequired
+
 import httpx
-from portia import Config
+from portia import Config, logger
 from portia.storage import PortiaCloudClient
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
 
+from steelthread.evals.compiler import compile_dataset
+from steelthread.evals.dataset_cache import CachedPage, DatasetCache
 from steelthread.evals.models import EvalTestCase
 
 
+class _DatasetPage(TypedDict):
+    results: NotRequired[list[EvalTestCase]]
+    current_page: int
+    total_pages: int
+
+
+# Validates whole pages straight from the response bytes, without decoding them to dicts first.
+_DATASET_PAGE = TypeAdapter(_DatasetPage)
+
+
 class PortiaBackend(BaseModel):
     """Client interface for interacting with the Portia API for evaluations.
 
@@ -15,10 +31,15 @@ class PortiaBackend(BaseModel):
 
     Attributes:
         config (Config): The Portia configuration containing API credentials and context.
+        dataset_cache_dir (Path | None): If set, dataset pages are cached here and only
+            downloaded again when the server reports they changed.
+        offline (bool): Load datasets from the cache only, without contacting the server.
 
     """
 
     config: Config
+    dataset_cache_dir: Path | None = None
+    offline: bool = False
 
     def client(self) -> httpx.Client:
         """Create an HTTP client for interacting with the Portia API.
@@ -44,29 +65,83 @@ class PortiaBackend(BaseModel):
             raise ValueError(error_str)
 
     def load_evals(self, dataset_name: str, run_id: str) -> list[EvalTestCase]:
-        """Load test cases from the Portia API with pagination."""
-        client = self.client()
+        """Load test cases from the Portia API with pagination.
+
+        With a dataset cache each page is revalidated with the validators it was last
+        downloaded with, so unchanged pages aren't downloaded again. Offline, every page is
+        read from the cache.
+
+        The test cases are compiled as they are loaded, so a dataset with assertions that
+        can never be evaluated fails here rather than after its plan runs were paid for.
+
+        Raises:
+            ValueError: If offline and the dataset isn't cached.
+            DatasetCompilationError: If any test case can't be compiled.
+
+        """
+        if self.offline and not self.dataset_cache_dir:
+            raise ValueError("dataset_cache_dir is required to load datasets offline")
+        cache = DatasetCache(self.dataset_cache_dir) if self.dataset_cache_dir else None
+        client = None if self.offline else self.client()
         page = 1
-        base_url = "/api/v0/evals/dataset-test-cases/?dataset_name={dataset_name}&page={page}"
-        test_cases = []
+        test_cases: list[EvalTestCase] = []
+        downloaded = total_pages = 0
 
         while page:
-            url = base_url.format(dataset_name=dataset_name, page=page)
-            response = client.get(url)
-            self.check_response(response)
-            data = response.json()
-            test_cases.extend(
-                EvalTestCase(
-                    **tc,
-                    testcase=tc["id"],
-                    test_case_name=tc["description"],
-                    run=run_id,
-                )
-                for tc in data.get("results", [])
-            )
-            if data["current_page"] != data["total_pages"]:
+            body, fresh = self._load_page(client, cache, dataset_name, page)
+            downloaded += fresh
+            data = _DATASET_PAGE.validate_json(body, context={"run": run_id})
+            test_cases.extend(data.get("results", []))
+            total_pages = data["total_pages"]
+            if data["current_page"] != total_pages:
                 page += 1
             else:
                 page = None
 
-        return test_cases
+        if cache:
+            cache.prune(dataset_name, total_pages)
+            logger().info(
+                f"Loaded dataset {dataset_name}: downloaded {downloaded} of "
+                f"{total_pages} pages, the rest from the cache"
+            )
+        return compile_dataset(test_cases).test_cases
+
+    def _load_page(
+        self,
+        client: httpx.Client | None,
+        cache: DatasetCache | None,
+        dataset_name: str,
+        page: int,
+    ) -> tuple[str | bytes, bool]:
+        """Load a page of a dataset, from the cache if it hasn't changed.
+
+        Returns:
+            tuple[str | bytes, bool]: The raw JSON body of the page and whether it was
+                downloaded.
+
+        """
+        cached = cache.get(dataset_name, page) if cache else None
+        if client is None:
+            if cached is None:
+                raise ValueError(
+                    f"Page {page} of dataset {dataset_name} is not cached, "
+                    "load it online once before running offline"
+                )
+            return cached.body, False
+
+        url = f"/api/v0/evals/dataset-test-cases/?dataset_name={dataset_name}&page={page}"
+        response = client.get(url, headers=cached.validators() if cached else None)
+        if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached.body, False
+        self.check_response(response)
+        if cache:
+            cache.put(
+                dataset_name,
+                page,
+                CachedPage(
+                    response.text,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
+            )
+        return response.content, True
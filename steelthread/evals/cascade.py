@@ -0,0 +1,254 @@
+"""Cheap-first cascade for judging final outputs."""
+
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Any
+
+DEFAULT_ACCEPT_SIMILARITY = 0.9
+
+_TOKEN = re.compile(r"\w+")
+# a negation word ending the text before a phrase, e.g. "the answer is not" before "4"
+_NEGATED = re.compile(r"(?:(?<!\w)(?:not|no|never|nor|cannot)|n['\u2019]t)\s+$")
+
+
+def normalize(text: str) -> str:
+    """Normalize text for comparison: unicode form, case, whitespace and edge punctuation."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(text.split()).strip(" .!?;:,\"'")
+
+
+def contains_phrase(text: str, phrase: str) -> bool:
+    """Check whether a phrase appears in a text as whole words.
+
+    Args:
+        text (str): The text to search.
+        phrase (str): The phrase to find.
+
+    Returns:
+        bool: True if the phrase appears in the text without being part of a longer word or
+            number, e.g. "no" isn't found in "not" and "4" isn't found in "14" or "4.5".
+
+    """
+    return _phrase(phrase).search(text) is not None
+
+
+def affirms_phrase(text: str, phrase: str) -> bool:
+    """Check whether a text contains a phrase as whole words that isn't negated.
+
+    Args:
+        text (str): The normalized text to search.
+        phrase (str): The normalized phrase to find.
+
+    Returns:
+        bool: True if the phrase appears in the text, as with `contains_phrase`, at least
+            once without a negation word before it, e.g. "4" is in "it is 4, not 5" but
+            not in "it is not 4".
+
+    """
+    return any(
+        _NEGATED.search(text, 0, match.start()) is None for match in _phrase(phrase).finditer(text)
+    )
+
+
+def _phrase(phrase: str) -> re.Pattern[str]:
+    """Get the pattern matching a phrase as whole words and numbers."""
+    return re.compile(rf"(?<!\w)(?<!\d[.,]){re.escape(phrase)}(?!\w)(?![.,]\d)")
+
+
+def lexical_similarity(a: str, b: str) -> float:
+    """Get the cosine similarity of the word and word pair counts of two texts.
+
+    Args:
+        a (str): The first text.
+        b (str): The second text.
+
+    Returns:
+        float: The similarity between 0 (nothing shared) and 1 (same words in the same order).
+
+    """
+
+    def features(text: str) -> Counter[str]:
+        tokens = _TOKEN.findall(normalize(text))
+        return Counter(tokens) + Counter(f"{x} {y}" for x, y in pairwise(tokens))
+
+    fa, fb = features(a), features(b)
+    if not fa or not fb:
+        return 1.0 if fa == fb else 0.0
+    dot = sum(count * fb[feature] for feature, count in fa.items())
+    norm = math.sqrt(sum(c * c for c in fa.values())) * math.sqrt(sum(c * c for c in fb.values()))
+    return dot / norm
+
+
+def _leaves(value: Any, path: str = "$") -> dict[str, str]:  # noqa: ANN401
+    """Flatten a JSON value into normalized leaf values keyed by path."""
+    if isinstance(value, dict):
+        return {
+            k: v for key, item in value.items() for k, v in _leaves(item, f"{path}.{key}").items()
+        }
+    if isinstance(value, list):
+        return {
+            k: v for i, item in enumerate(value) for k, v in _leaves(item, f"{path}[{i}]").items()
+        }
+    return {path: normalize(str(value))}
+
+
+def _parse_json(text: str) -> dict | list | None:
+    """Parse text holding a JSON object or array, or return None."""
+    try:
+        value = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return value if isinstance(value, dict | list) else None
+
+
+@dataclass(frozen=True)
+class Expectation:
+    """An expected value prepared once for comparison with many outputs.
+
+    Attributes:
+        text (str): The expected value.
+        normalized (str): The normalized expected value.
+        json_leaves (dict[str, str] | None): The normalized leaf values by path if the
+            expected value is a JSON object or array.
+
+    """
+
+    text: str
+    normalized: str
+    json_leaves: dict[str, str] | None
+
+    @classmethod
+    def of(cls, text: str) -> "Expectation":
+        """Prepare an expected value.
+
+        Args:
+            text (str): The expected value.
+
+        Returns:
+            Expectation: The prepared expectation.
+
+        """
+        parsed = _parse_json(text)
+        return cls(text, normalize(text), None if parsed is None else _leaves(parsed))
+
+
+@dataclass(frozen=True)
+class CascadeVerdict:
+    """The result of the stage of the cascade that decided a comparison.
+
+    Attributes:
+        stage (str): The stage that decided, e.g. "exact_match" or "similarity".
+        score (float): The score between 0 and 1.
+        detail (str): How the stage came to its score.
+
+    """
+
+    stage: str
+    score: float
+    detail: str
+
+
+class CascadeJudge:
+    """Compares an output to an expected value with progressively more expensive stages.
+
+    The stages are:
+
+    1. exact_match: the normalized texts are equal.
+    2. partial_match: the normalized expected text appears in the output as whole words,
+       and not only after a negation such as "not".
+    3. json: when both are JSON objects or arrays, the fraction of expected leaves the output
+       has the same value for.
+    4. similarity: the lexical similarity is at least `accept_similarity` (a match) or, if
+       set, at most `reject_similarity` (not a match).
+
+    If no stage is conclusive the caller escalates to an LLM judge. Without a
+    `reject_similarity` every output that isn't accepted is escalated, as outputs sharing few
+    words with the expected value can still mean the same.
+
+    Attributes:
+        accept_similarity (float): Similarity at or above which the output matches.
+        reject_similarity (float | None): Similarity at or below which the output doesn't
+            match, or None to never reject by similarity.
+
+    """
+
+    def __init__(
+        self,
+        accept_similarity: float | None = None,
+        reject_similarity: float | None = None,
+    ) -> None:
+        """Initialize the judge.
+
+        Args:
+            accept_similarity (float | None): Similarity at or above which the output
+                matches. Defaults to 0.9.
+            reject_similarity (float | None): Similarity at or below which the output
+                doesn't match. Defaults to None, no output is rejected by similarity.
+
+        """
+        self.accept_similarity = (
+            DEFAULT_ACCEPT_SIMILARITY if accept_similarity is None else accept_similarity
+        )
+        self.reject_similarity = reject_similarity
+        if not 0 < self.accept_similarity <= 1:
+            raise ValueError("similarity thresholds must satisfy 0 < accept_similarity <= 1")
+        if reject_similarity is not None and not 0 <= reject_similarity < self.accept_similarity:
+            raise ValueError(
+                "similarity thresholds must satisfy 0 <= reject_similarity < accept_similarity"
+            )
+
+    def judge(self, actual: str, expected: str | Expectation) -> CascadeVerdict | None:
+        """Compare an output to the expected value with the cheap stages.
+
+        Args:
+            actual (str): The output.
+            expected (str | Expectation): The expected value, or the expectation prepared from
+                it when comparing it to many outputs.
+
+        Returns:
+            CascadeVerdict | None: The verdict of the first conclusive stage, or None if the
+                comparison needs an LLM judge.
+
+        """
+        if isinstance(expected, str):
+            expected = Expectation.of(expected)
+        norm_actual, norm_expected = normalize(actual), expected.normalized
+        if norm_actual == norm_expected:
+            return CascadeVerdict("exact_match", 1.0, "the normalized output equals the expected")
+        if norm_expected and affirms_phrase(norm_actual, norm_expected):
+            return CascadeVerdict("partial_match", 1.0, "the output contains the expected")
+
+        if expected.json_leaves is not None:
+            actual_json = _parse_json(actual)
+            if actual_json is not None:
+                return self._compare_json(actual_json, expected.json_leaves)
+
+        similarity = lexical_similarity(actual, expected.text)
+        if similarity >= self.accept_similarity:
+            return CascadeVerdict(
+                "similarity", 1.0, f"similarity {similarity:.2f} >= {self.accept_similarity}"
+            )
+        if self.reject_similarity is not None and similarity <= self.reject_similarity:
+            return CascadeVerdict(
+                "similarity", 0.0, f"similarity {similarity:.2f} <= {self.reject_similarity}"
+            )
+        return None
+
+    def _compare_json(self, actual: dict | list, expected_leaves: dict[str, str]) -> CascadeVerdict:
+        """Score the fraction of expected leaves the output has the same value for."""
+        actual_leaves = _leaves(actual)
+        if not expected_leaves:
+            score = 1.0 if not actual_leaves else 0.0
+        else:
+            matched = sum(
+                actual_leaves.get(path) == value for path, value in expected_leaves.items()
+            )
+            score = matched / len(expected_leaves)
+        return CascadeVerdict(
+            "json", score, f"{score:.0%} of the {len(expected_leaves)} expected JSON values match"
+        )
@@ -0,0 +1,114 @@
+"""Checkpointing of eval runs."""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from portia import logger
+
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase
+
+UnitKey = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """A single iteration of a single test case.
+
+    Attributes:
+        test_case (EvalTestCase): The test case to run.
+        iteration (int): Zero based iteration index of the test case.
+
+    """
+
+    test_case: EvalTestCase
+    iteration: int
+
+    @property
+    def key(self) -> UnitKey:
+        """Get a stable key for this unit within a run."""
+        return (self.test_case.testcase, self.iteration)
+
+
+def serialize_metric(metric: EvalMetric) -> dict:
+    """Serialize a metric to JSON compatible data, dropping the heavy `eval_output`."""
+    return metric.model_dump(mode="json", exclude={"eval_output"})
+
+
+def deserialize_metric(data: dict) -> EvalMetric:
+    """Rebuild a metric serialized with `serialize_metric`.
+
+    The data was produced from an already validated metric so validation is skipped.
+    """
+    return EvalMetric.model_construct(**data)
+
+
+class EvalCheckpoint:
+    """Append-only journal of the work units completed in an eval run.
+
+    Each completed (test case, iteration) is written as one JSON line together with its
+    metrics and flushed to disk before the next one, so a crashed run can be resumed and
+    only the missing units re-executed. `eval_output` is not journaled, so metrics restored
+    from a checkpoint do not carry the plan and plan run they were generated from.
+
+    Attributes:
+        path (Path): The journal file for the run.
+
+    """
+
+    def __init__(self, directory: str | Path, run_id: str) -> None:
+        """Initialize the checkpoint.
+
+        Args:
+            directory (str | Path): Directory holding one journal per run.
+            run_id (str): The id of the run.
+
+        """
+        self.path = Path(directory) / f"{run_id}.jsonl"
+
+    def record(self, key: UnitKey, metrics: list[EvalMetric]) -> None:
+        """Durably record a completed work unit and its metrics.
+
+        Args:
+            key (UnitKey): The (testcase, iteration) that completed.
+            metrics (list[EvalMetric]): The metrics it produced.
+
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(
+            {
+                "testcase": key[0],
+                "iteration": key[1],
+                "metrics": [serialize_metric(m) for m in metrics],
+            }
+        )
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load(self) -> dict[UnitKey, list[EvalMetric]]:
+        """Load the completed units and their metrics.
+
+        A partially written trailing line (e.g. from a crash mid-write) is ignored.
+
+        Returns:
+            dict[UnitKey, list[EvalMetric]]: Metrics for each completed unit.
+
+        """
+        completed: dict[UnitKey, list[EvalMetric]] = {}
+        if not self.path.exists():
+            return completed
+        with self.path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger().warning(f"Ignoring corrupt checkpoint line {line_number}")
+                    continue
+                completed[(entry["testcase"], entry["iteration"])] = [
+                    deserialize_metric(m) for m in entry["metrics"]
+                ]
+        return completed
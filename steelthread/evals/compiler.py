@@ -0,0 +1,260 @@
+"""Compile test cases into validated, ready to evaluate form when a dataset is loaded."""
+
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+from typing import Self
+
+from steelthread.evals.cascade import CascadeJudge, Expectation
+from steelthread.evals.models import Assertion, EvalTestCase
+from steelthread.evals.tool_calls import canonical_args
+
+
+class DatasetCompilationError(ValueError):
+    """Raised when test cases can't be compiled, listing every problem found.
+
+    Attributes:
+        errors (list[str]): A description of each problem.
+
+    """
+
+    def __init__(self, errors: list[str]) -> None:
+        """Initialize the error.
+
+        Args:
+            errors (list[str]): A description of each problem.
+
+        """
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} problem(s) found in the dataset:\n"
+            + "\n".join(f"- {e}" for e in errors)
+        )
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """Estimated work of evaluating test cases once.
+
+    Attributes:
+        plan_runs (int): Plan runs to execute.
+        judge_calls (int): LLM judge calls that will be made.
+        possible_judge_calls (int): LLM judge calls that may be made, e.g. by cascade final
+            output assertions whose cheaper stages are inconclusive.
+
+    """
+
+    plan_runs: int = 0
+    judge_calls: int = 0
+    possible_judge_calls: int = 0
+
+    def __add__(self, other: "CostEstimate") -> "CostEstimate":
+        """Add up two estimates."""
+        return CostEstimate(
+            self.plan_runs + other.plan_runs,
+            self.judge_calls + other.judge_calls,
+            self.possible_judge_calls + other.possible_judge_calls,
+        )
+
+    def times(self, iterations: int) -> "CostEstimate":
+        """Get the estimate for evaluating the test cases `iterations` times."""
+        return CostEstimate(
+            self.plan_runs * iterations,
+            self.judge_calls * iterations,
+            self.possible_judge_calls * iterations,
+        )
+
+    def __str__(self) -> str:
+        """Summarize the estimate."""
+        most = self.judge_calls + self.possible_judge_calls
+        judges = f"{self.judge_calls}" if most == self.judge_calls else f"{self.judge_calls}-{most}"
+        return f"{self.plan_runs} plan runs and {judges} LLM judge calls"
+
+
+@dataclass(frozen=True)
+class CompiledAssertion:
+    """An assertion with everything it compares against prepared ahead of evaluation.
+
+    Attributes:
+        assertion (Assertion): The assertion.
+        expectation (Expectation | None): The prepared expected value of a final_output
+            assertion.
+        judge (CascadeJudge | None): The judge of a cascade final_output assertion.
+        args (dict[str, str] | None): The canonical expected arguments of a tool_args assertion.
+
+    """
+
+    assertion: Assertion
+    expectation: Expectation | None = None
+    judge: CascadeJudge | None = None
+    args: dict[str, str] | None = None
+
+
+def compile_assertion(assertion: Assertion) -> CompiledAssertion:
+    """Prepare an assertion for evaluation.
+
+    Args:
+        assertion (Assertion): The assertion.
+
+    Returns:
+        CompiledAssertion: The prepared assertion.
+
+    Raises:
+        ValueError: If the assertion can never be evaluated, e.g. has invalid thresholds.
+
+    """
+    match assertion.type:
+        case "final_output":
+            match assertion.output_type:
+                case "exact_match" | "partial_match" | "llm_judge":
+                    return CompiledAssertion(assertion, Expectation.of(assertion.value))
+                case "cascade":
+                    judge = CascadeJudge(assertion.accept_similarity, assertion.reject_similarity)
+                    return CompiledAssertion(
+                        assertion, Expectation.of(assertion.value), judge=judge
+                    )
+                case _:
+                    raise ValueError(f"Unknown output_type: {assertion.output_type}")
+        case "tool_call_count":
+            if assertion.max_calls is not None and assertion.max_calls < assertion.min_calls:
+                raise ValueError(
+                    f"max_calls {assertion.max_calls} of {assertion.tool} is below "
+                    f"min_calls {assertion.min_calls}"
+                )
+            return CompiledAssertion(assertion)
+        case "tool_args":
+            return CompiledAssertion(assertion, args=canonical_args(assertion.args))
+        case _:
+            return CompiledAssertion(assertion)
+
+
+def required_tools(test_case: EvalTestCase) -> frozenset[str]:
+    """Get the ids of the tools a test case can't pass without.
+
+    These are the tools given to its plan runs and those its assertions expect to be called.
+    Tools that are expected not to be called don't need to exist.
+    """
+    tools = set(test_case.input_config.tools or [])
+    for assertion in test_case.assertions:
+        match assertion.type:
+            case "tool_calls":
+                tools.update(name for name, call in assertion.calls.items() if call.called)
+            case "tool_call_count" if assertion.min_calls > 0:
+                tools.add(assertion.tool)
+            case "tool_args":
+                tools.add(assertion.tool)
+            case "tool_order":
+                tools.update(assertion.tools)
+    return frozenset(tools)
+
+
+def estimate_cost(test_case: EvalTestCase) -> CostEstimate:
+    """Estimate the work of evaluating a test case once."""
+    judge_calls = 0
+    possible_judge_calls = 0
+    for assertion in test_case.assertions:
+        if assertion.type == "llm_as_judge" or (
+            assertion.type == "final_output" and assertion.output_type == "llm_judge"
+        ):
+            judge_calls += 1
+        elif assertion.type == "final_output" and assertion.output_type == "cascade":
+            possible_judge_calls += 1
+    return CostEstimate(1, judge_calls, possible_judge_calls)
+
+
+@dataclass(frozen=True)
+class CompiledTestCase:
+    """A test case's assertions prepared for evaluation, with the tools it needs and its cost.
+
+    Attributes:
+        assertions (tuple[CompiledAssertion, ...]): The prepared assertions, in order.
+        tools (frozenset[str]): The ids of the tools the test case can't pass without.
+        cost (CostEstimate): The estimated work of evaluating the test case once.
+
+    """
+
+    assertions: tuple[CompiledAssertion, ...]
+    tools: frozenset[str]
+    cost: CostEstimate
+
+    @classmethod
+    def compile(cls, test_case: EvalTestCase) -> Self:
+        """Compile a test case.
+
+        Args:
+            test_case (EvalTestCase): The test case.
+
+        Returns:
+            CompiledTestCase: The compiled test case.
+
+        Raises:
+            DatasetCompilationError: If any assertion can never be evaluated.
+
+        """
+        assertions: list[CompiledAssertion] = []
+        errors: list[str] = []
+        for i, assertion in enumerate(test_case.assertions):
+            try:
+                assertions.append(compile_assertion(assertion))
+            except ValueError as e:
+                errors.append(
+                    f"test case {test_case.testcase} ({test_case.test_case_name}) "
+                    f"assertion {i} ({assertion.type}): {e}"
+                )
+        if errors:
+            raise DatasetCompilationError(errors)
+        return cls(tuple(assertions), required_tools(test_case), estimate_cost(test_case))
+
+
+@dataclass(frozen=True)
+class CompiledDataset:
+    """Test cases that have all been compiled and checked against the available tools.
+
+    Attributes:
+        test_cases (list[EvalTestCase]): The test cases, each holding its compiled form.
+        cost (CostEstimate): The estimated work of evaluating every test case once.
+
+    """
+
+    test_cases: list[EvalTestCase]
+    cost: CostEstimate = field(default_factory=CostEstimate)
+
+
+def compile_dataset(
+    test_cases: Sequence[EvalTestCase],
+    tool_ids: Collection[str] | None = None,
+) -> CompiledDataset:
+    """Compile test cases, failing on the first use of a dataset rather than mid-run.
+
+    Test cases already compiled, e.g. by the backend that loaded them, are not compiled again.
+
+    Args:
+        test_cases (Sequence[EvalTestCase]): The test cases.
+        tool_ids (Collection[str] | None): The ids of the tools available to plan runs. If
+            given, test cases that need any other tool are rejected.
+
+    Returns:
+        CompiledDataset: The compiled test cases.
+
+    Raises:
+        DatasetCompilationError: Listing the problems of every test case that can't be run.
+
+    """
+    errors: list[str] = []
+    cost = CostEstimate()
+    available = None if tool_ids is None else set(tool_ids)
+    for tc in test_cases:
+        try:
+            compiled = tc.compiled()
+        except DatasetCompilationError as e:
+            errors.extend(e.errors)
+            continue
+        cost += compiled.cost
+        unknown = compiled.tools - available if available is not None else set()
+        if unknown:
+            errors.append(
+                f"test case {tc.testcase} ({tc.test_case_name}) needs unknown tools: "
+                f"{', '.join(sorted(unknown))}"
+            )
+    if errors:
+        raise DatasetCompilationError(errors)
+    return CompiledDataset(list(test_cases), cost)
@@ -0,0 +1,91 @@
+"""Local cache of dataset pages for conditional revalidation and offline runs."""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from portia import logger
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """A page of a dataset as last returned by the server.
+
+    Attributes:
+        body (str): The raw JSON body of the page, validated when the page is used.
+        etag (str | None): The page's ETag header, used to revalidate it.
+        last_modified (str | None): The page's Last-Modified header, used to revalidate it
+            when the server doesn't send an ETag.
+
+    """
+
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        """Get the headers asking the server to only send the page if it changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DatasetCache:
+    """Stores the pages of datasets on disk along with their validators.
+
+    Each dataset has its own directory and each page is one JSON file written atomically.
+
+    Attributes:
+        directory (Path): The directory holding the datasets.
+
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory (str | Path): The directory holding the datasets.
+
+        """
+        self.directory = Path(directory)
+
+    def _dataset_dir(self, dataset_name: str) -> Path:
+        # dataset names are free text, so key the directory by a digest of the name
+        digest = hashlib.sha256(dataset_name.encode("utf-8")).hexdigest()[:32]
+        return self.directory / digest
+
+    def _path(self, dataset_name: str, page: int) -> Path:
+        return self._dataset_dir(dataset_name) / f"page-{page}.json"
+
+    def get(self, dataset_name: str, page: int) -> CachedPage | None:
+        """Get a cached page of a dataset, if any."""
+        path = self._path(dataset_name, page)
+        if not path.exists():
+            return None
+        try:
+            return CachedPage(**json.loads(path.read_text(encoding="utf-8")))
+        except (json.JSONDecodeError, TypeError):
+            logger().warning(f"Ignoring corrupt dataset cache entry {path}")
+            return None
+
+    def put(self, dataset_name: str, page: int, cached: CachedPage) -> None:
+        """Store a page of a dataset, replacing any previous version."""
+        path = self._path(dataset_name, page)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(asdict(cached)), encoding="utf-8")
+        tmp.replace(path)
+
+    def prune(self, dataset_name: str, pages: int) -> None:
+        """Remove the cached pages beyond the last page of a dataset that shrank."""
+        directory = self._dataset_dir(dataset_name)
+        if not directory.exists():
+            return
+        for path in directory.glob("page-*.json"):
+            if int(path.stem.removeprefix("page-")) > pages:
+                path.unlink(missing_ok=True)
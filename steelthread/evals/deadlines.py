@@ -0,0 +1,223 @@
+"""Deadlines for test case executions and re-execution of stragglers."""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+
+from steelthread.evals.checkpoint import UnitKey, WorkUnit
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase
+from steelthread.evals.scheduling import LatencyScheduler
+from steelthread.utils.stats import P2Quantile
+
+TIMEOUT_METRIC = "timeout"
+
+
+def phase_timeout(phase: float | None, run: float | None, elapsed: float = 0) -> float | None:
+    """Get the seconds a phase may take given its own deadline and what's left of the run's.
+
+    Args:
+        phase (float | None): The deadline of the phase, if any.
+        run (float | None): The deadline of the whole run, if any.
+        elapsed (float): Seconds of the run's deadline used by earlier phases.
+
+    Returns:
+        float | None: The tighter of the two deadlines, or None if neither is set.
+
+    """
+    remaining = None if run is None else max(run - elapsed, 0)
+    if phase is None:
+        return remaining
+    if remaining is None:
+        return phase
+    return min(phase, remaining)
+
+
+def timeout_metric(test_case: EvalTestCase, phase: str, timeout: float) -> EvalMetric:
+    """Create the metric recorded in place of a test case's results when a phase times out.
+
+    Args:
+        test_case (EvalTestCase): The test case.
+        phase (str): The phase that timed out, e.g. "execution" or "scoring".
+        timeout (float): The deadline in seconds that was exceeded.
+
+    Returns:
+        EvalMetric: A metric with a score of 0.
+
+    """
+    return EvalMetric.from_test_case(
+        test_case=test_case,
+        score=0,
+        name=TIMEOUT_METRIC,
+        description="Whether the test case finished within its deadline",
+        explanation=f"The {phase} phase did not finish within {timeout:.1f}s",
+        actual_value=phase,
+    )
+
+
+class StragglerPolicy:
+    """Policy for starting duplicate attempts of work units that run unusually long.
+
+    Once `min_samples` units have finished, a unit still running after the `percentile`
+    of their latencies gets another attempt, up to `max_attempts` in total. Whichever
+    attempt finishes first is used and the others are discarded.
+
+    Attributes:
+        percentile (float): Latency percentile after which a unit is a straggler.
+        min_samples (int): Finished units needed before stragglers are detected.
+        max_attempts (int): Most attempts of any unit, including the first.
+        check_interval (float): Seconds between checks for stragglers.
+
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 10,
+        max_attempts: int = 2,
+        check_interval: float = 1.0,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            percentile (float): Latency percentile after which a unit is a straggler.
+            min_samples (int): Finished units needed before stragglers are detected.
+            max_attempts (int): Most attempts of any unit, including the first.
+            check_interval (float): Seconds between checks for stragglers.
+
+        """
+        if not 0 < percentile < 1:
+            raise ValueError(f"percentile must be between 0 and 1, got {percentile}")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if check_interval <= 0:
+            raise ValueError("check_interval must be positive")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_attempts = max_attempts
+        self.check_interval = check_interval
+
+
+class StragglerDetector:
+    """Tracks running work units and finds the ones that have become stragglers."""
+
+    def __init__(self, policy: StragglerPolicy) -> None:
+        """Initialize the detector.
+
+        Args:
+            policy (StragglerPolicy): When units count as stragglers.
+
+        """
+        self.policy = policy
+        self.duplicates = 0
+        self._latency = P2Quantile(policy.percentile)
+        self._finished = 0
+        self._running: dict[UnitKey, tuple[float, int]] = {}
+
+    def started(self, key: UnitKey) -> None:
+        """Track a unit whose first attempt was submitted."""
+        self._running[key] = (time.perf_counter(), 1)
+
+    def finished(self, key: UnitKey) -> None:
+        """Record the latency of a unit that finished."""
+        started = self._running.pop(key, None)
+        if started is None:
+            return
+        self._latency.add(time.perf_counter() - started[0])
+        self._finished += 1
+
+    def threshold(self) -> float | None:
+        """Get the seconds after which a running unit is a straggler, once enough are known."""
+        if self._finished < self.policy.min_samples:
+            return None
+        return self._latency.value
+
+    def stragglers(self) -> Iterable[UnitKey]:
+        """Get the running units that need another attempt, counting the attempt as made."""
+        threshold = self.threshold()
+        if threshold is None:
+            return []
+        now = time.perf_counter()
+        found = [
+            key
+            for key, (started_at, attempts) in self._running.items()
+            if attempts < self.policy.max_attempts and now - started_at > threshold
+        ]
+        for key in found:
+            started_at, attempts = self._running[key]
+            self._running[key] = (started_at, attempts + 1)
+        self.duplicates += len(found)
+        return found
+
+
+class UnitAttempts:
+    """The work units being executed and the futures of their attempts.
+
+    A unit usually has a single attempt. Stragglers get more, and the unit is settled by
+    whichever finishes first.
+    """
+
+    def __init__(self, scheduler: LatencyScheduler, straggler: StragglerPolicy | None) -> None:
+        """Initialize the attempts.
+
+        Args:
+            scheduler (LatencyScheduler): Notified when a unit starts and finishes.
+            straggler (StragglerPolicy | None): When units get another attempt, if ever.
+
+        """
+        self.scheduler = scheduler
+        self.stragglers = StragglerDetector(straggler) if straggler else None
+        self._units: dict[Future, WorkUnit] = {}
+        self._attempts: dict[UnitKey, list[Future]] = {}
+
+    @property
+    def duplicates(self) -> int:
+        """Get the number of extra attempts started for stragglers."""
+        return self.stragglers.duplicates if self.stragglers else 0
+
+    def __len__(self) -> int:
+        """Get the number of attempts in flight."""
+        return len(self._units)
+
+    def __iter__(self) -> Iterator[Future]:
+        """Iterate over the futures of the attempts in flight."""
+        return iter(self._units)
+
+    def __contains__(self, future: object) -> bool:
+        """Check whether a future is an attempt in flight."""
+        return future in self._units
+
+    def start(self, future: Future, unit: WorkUnit) -> None:
+        """Track the first attempt of a unit."""
+        self.add(future, unit)
+        self.scheduler.started(future, unit)
+        if self.stragglers:
+            self.stragglers.started(unit.key)
+
+    def add(self, future: Future, unit: WorkUnit) -> None:
+        """Track another attempt of a unit."""
+        self._units[future] = unit
+        self._attempts.setdefault(unit.key, []).append(future)
+
+    def retry_stragglers(self, submit: Callable[[WorkUnit], Future]) -> None:
+        """Submit another attempt of every unit that has become a straggler."""
+        if not self.stragglers:
+            return
+        for key in self.stragglers.stragglers():
+            unit = self._units[self._attempts[key][0]]
+            self.add(submit(unit), unit)
+
+    def settle(self, future: Future) -> WorkUnit:
+        """Stop tracking a unit once one of its attempts finished, discarding the others."""
+        unit = self._units.pop(future)
+        first, *others = self._attempts.pop(unit.key)
+        for attempt in (first, *others):
+            if attempt is not future:
+                self._units.pop(attempt)
+                attempt.cancel()
+        self.scheduler.finished(first)
+        if self.stragglers:
+            self.stragglers.finished(unit.key)
+        return unit
@@ -1,19 +1,31 @@
 """LLM as Judge implementation."""
 
+from typing import Any
+
 from portia import Config, Output, Plan
 from portia.plan_run import PlanRun
 
-from steelthread.evals.evaluator import Evaluator, PlanRunMetadata
+from steelthread.evals.cascade import CascadeJudge
+from steelthread.evals.compiler import CompiledAssertion, compile_assertion
+from steelthread.evals.evaluator import Evaluator, PlanRunMetadata, plain_settings
 from steelthread.evals.metrics import EvalMetric
 from steelthread.evals.models import (
     Assertion,
     EvalTestCase,
     FinalOutputAssertion,
+    ForbiddenToolsAssertion,
     LatencyAssertion,
     LLMAsJudgeAssertion,
     OutcomeAssertion,
+    SemanticMatchAssertion,
+    ToolArgsAssertion,
+    ToolCallCountAssertion,
     ToolCallsAssertion,
+    ToolOrderAssertion,
 )
+from steelthread.evals.semantic import EmbeddingFunction, SemanticIndex
+from steelthread.evals.tool_calls import canonical_args, canonicalize
+from steelthread.utils.concurrency import BoundedExecutor, shared_executor
 from steelthread.utils.llm import LLMScorer, MetricOnly
 
 
@@ -54,6 +66,7 @@ class AssertionEvaluator:
         plan: Plan,
         plan_run: PlanRun,
         metadata: PlanRunMetadata,
+        semantic_index: SemanticIndex | None = None,
     ) -> None:
         """Initialize the evaluator with Portia config and run data.
 
@@ -63,6 +76,8 @@ class AssertionEvaluator:
             plan (Plan): The linked plan.
             plan_run (PlanRun): The plan run to evaluate.
             metadata (PlanRunMetadata): Additional data about the run (e.g., latency, tool calls).
+            semantic_index (SemanticIndex | None): Reference embeddings for semantic_match
+                assertions, shared across test cases.
 
         """
         self.config = config
@@ -70,6 +85,7 @@ class AssertionEvaluator:
         self.plan = plan
         self.plan_run = plan_run
         self.metadata = metadata
+        self.semantic_index = semantic_index or SemanticIndex()
 
     def evaluate(self, assertion: Assertion) -> list[EvalMetric]:
         """Evaluate a single assertion and return one or more EvalMetrics.
@@ -81,15 +97,30 @@ class AssertionEvaluator:
             list[EvalMetric]: One or more EvalMetric results.
 
         """
+        return self.evaluate_compiled(compile_assertion(assertion))
+
+    def evaluate_compiled(self, compiled: CompiledAssertion) -> list[EvalMetric]:  # noqa: PLR0911
+        """Evaluate an assertion prepared ahead of time and return one or more EvalMetrics.
+
+        Args:
+            compiled (CompiledAssertion): The compiled assertion to evaluate.
+
+        Returns:
+            list[EvalMetric]: One or more EvalMetric results.
+
+        """
+        assertion = compiled.assertion
         match assertion.type:
             case "outcome":
                 return [self._evaluate_outcome(assertion)]
             case "final_output":
-                return self._evaluate_final_output(assertion)
+                return self._evaluate_final_output(assertion, compiled)
+            case "semantic_match":
+                return [self._evaluate_semantic_match(assertion)]
             case "latency":
                 return [self._evaluate_latency(assertion)]
-            case "tool_calls":
-                return [self._evaluate_tool_calls(assertion)]
+            case "tool_calls" | "tool_call_count" | "tool_order" | "tool_args" | "forbidden_tools":
+                return [self._evaluate_tool_assertion(assertion, compiled)]
             case "llm_as_judge":
                 return self._evaluate_llm_judge(assertion)
             case "custom":
@@ -148,7 +179,11 @@ class AssertionEvaluator:
             eval_output=self._format_eval_output(),
         )
 
-    def _evaluate_final_output(self, assertion: FinalOutputAssertion) -> list[EvalMetric]:
+    def _evaluate_final_output(
+        self,
+        assertion: FinalOutputAssertion,
+        compiled: CompiledAssertion,
+    ) -> list[EvalMetric]:
         """Evaluate the final output using either string comparison or LLM-based scoring."""
         assertion_value = assertion.value
         actual_value = str(
@@ -158,32 +193,9 @@ class AssertionEvaluator:
         )
 
         if assertion.output_type == "llm_judge":
-            scorer = LLMScorer(self.config)
-            metrics = scorer.score(
-                task_data=[
-                    f"Please score based on how well the output matches {assertion.value}",
-                    self.plan_run.model_dump_json(),
-                ],
-                metrics_to_score=[
-                    MetricOnly(
-                        name=assertion.type,
-                        description="LLM-based final output score",
-                    )
-                ],
-            )
-            return [
-                EvalMetric.from_test_case(
-                    test_case=self.test_case,
-                    score=m.score,
-                    name=m.name,
-                    expectation=assertion_value,
-                    actual_value=actual_value,
-                    description=m.description,
-                    explanation=m.explanation,
-                    eval_output=self._format_eval_output(),
-                )
-                for m in metrics
-            ]
+            return self._judge_final_output(assertion, actual_value)
+        if assertion.output_type == "cascade":
+            return self._cascade_final_output(assertion, compiled, actual_value)
 
         score = OutputScoreCalculator.calculate(self.plan_run.outputs.final_output, assertion)
         return [
@@ -198,6 +210,92 @@ class AssertionEvaluator:
             )
         ]
 
+    def _judge_final_output(
+        self,
+        assertion: FinalOutputAssertion,
+        actual_value: str,
+        stage_note: str | None = None,
+    ) -> list[EvalMetric]:
+        """Score the final output with the LLM judge."""
+        scorer = LLMScorer(self.config)
+        metrics = scorer.score(
+            task_data=[
+                f"Please score based on how well the output matches {assertion.value}",
+                self.plan_run.model_dump_json(),
+            ],
+            metrics_to_score=[
+                MetricOnly(
+                    name=assertion.type,
+                    description="LLM-based final output score",
+                )
+            ],
+        )
+        return [
+            EvalMetric.from_test_case(
+                test_case=self.test_case,
+                score=m.score,
+                name=m.name,
+                expectation=assertion.value,
+                actual_value=actual_value,
+                description=m.description,
+                explanation=f"{stage_note} {m.explanation}" if stage_note else m.explanation,
+                eval_output=self._format_eval_output(),
+            )
+            for m in metrics
+        ]
+
+    def _cascade_final_output(
+        self,
+        assertion: FinalOutputAssertion,
+        compiled: CompiledAssertion,
+        actual_value: str,
+    ) -> list[EvalMetric]:
+        """Score the final output with the cheapest conclusive stage of the cascade."""
+        judge = compiled.judge or CascadeJudge(
+            assertion.accept_similarity, assertion.reject_similarity
+        )
+        verdict = judge.judge(actual_value, compiled.expectation or assertion.value)
+        if verdict is None:
+            return self._judge_final_output(
+                assertion,
+                actual_value,
+                stage_note="Decided by the llm_judge stage as cheaper stages were inconclusive.",
+            )
+        return [
+            EvalMetric.from_test_case(
+                test_case=self.test_case,
+                score=verdict.score,
+                name=assertion.type,
+                expectation=assertion.value,
+                actual_value=actual_value,
+                description="Cascade final output match",
+                explanation=f"Decided by the {verdict.stage} stage: {verdict.detail}",
+                eval_output=self._format_eval_output(),
+            )
+        ]
+
+    def _evaluate_semantic_match(self, assertion: SemanticMatchAssertion) -> EvalMetric:
+        """Evaluate the final output by its embedding similarity to the closest reference."""
+        actual_value = str(
+            self.plan_run.outputs.final_output.get_value()
+            if self.plan_run.outputs.final_output
+            else ""
+        )
+        similarity = float(self.semantic_index.score([actual_value], [assertion.references])[0])
+        score = (
+            similarity if assertion.threshold is None else float(similarity >= assertion.threshold)
+        )
+        return EvalMetric.from_test_case(
+            test_case=self.test_case,
+            score=score,
+            name=assertion.type,
+            expectation=assertion.references,
+            actual_value=actual_value,
+            description="Semantic similarity of the final output to the closest reference",
+            explanation=f"Cosine similarity of {similarity:.3f} to the closest reference",
+            eval_output=self._format_eval_output(),
+        )
+
     def _evaluate_latency(self, assertion: LatencyAssertion) -> EvalMetric:
         """Evaluate the latency against a threshold using normalized difference."""
         actual = self.metadata.latency_ms
@@ -213,13 +311,36 @@ class AssertionEvaluator:
             eval_output=self._format_eval_output(),
         )
 
+    def _evaluate_tool_assertion(
+        self,
+        assertion: ToolCallsAssertion
+        | ToolCallCountAssertion
+        | ToolOrderAssertion
+        | ToolArgsAssertion
+        | ForbiddenToolsAssertion,
+        compiled: CompiledAssertion,
+    ) -> EvalMetric:
+        """Evaluate an assertion about tool calls against the plan run's tool call index."""
+        match assertion.type:
+            case "tool_calls":
+                return self._evaluate_tool_calls(assertion)
+            case "tool_call_count":
+                return self._evaluate_tool_call_count(assertion)
+            case "tool_order":
+                return self._evaluate_tool_order(assertion)
+            case "tool_args":
+                return self._evaluate_tool_args(assertion, compiled)
+            case "forbidden_tools":
+                return self._evaluate_forbidden_tools(assertion)
+
     def _evaluate_tool_calls(self, assertion: ToolCallsAssertion) -> EvalMetric:
         """Evaluate whether expected tools were called (or not called)."""
         expected_calls = 0
         actual_calls = 0
 
+        index = self.metadata.tool_call_index
         for tool_call_name, expectation in assertion.calls.items():
-            matched = [tc for tc in self.metadata.tool_calls if tc.tool_name == tool_call_name]
+            matched = index.called(tool_call_name)
             if expectation.called:
                 expected_calls += 1
                 actual_calls += 1 if matched else 0
@@ -240,15 +361,121 @@ class AssertionEvaluator:
             expectation=[
                 tool_name for tool_name in assertion.calls if assertion.calls[tool_name].called
             ],
-            actual_value=[tc.tool_name for tc in self.metadata.tool_calls],
+            actual_value=index.sequence,
             description="Tool call usage score",
             eval_output=self._format_eval_output(),
         )
 
+    def _evaluate_tool_call_count(self, assertion: ToolCallCountAssertion) -> EvalMetric:
+        """Evaluate whether a tool was called within the expected number of times."""
+        count = self.metadata.tool_call_index.count(assertion.tool)
+        within = count >= assertion.min_calls and (
+            assertion.max_calls is None or count <= assertion.max_calls
+        )
+        upper = "" if assertion.max_calls is None else f" and at most {assertion.max_calls}"
+        return EvalMetric.from_test_case(
+            test_case=self.test_case,
+            score=float(within),
+            name=assertion.type,
+            expectation=f"at least {assertion.min_calls}{upper}",
+            actual_value=str(count),
+            description=f"Number of calls to {assertion.tool}",
+            eval_output=self._format_eval_output(),
+        )
+
+    def _evaluate_tool_order(self, assertion: ToolOrderAssertion) -> EvalMetric:
+        """Evaluate whether tools were called in the expected order."""
+        index = self.metadata.tool_call_index
+        return EvalMetric.from_test_case(
+            test_case=self.test_case,
+            score=float(index.in_order(assertion.tools)),
+            name=assertion.type,
+            expectation=assertion.tools,
+            actual_value=index.sequence,
+            description="Whether tools were called in the expected order",
+            eval_output=self._format_eval_output(),
+        )
+
+    def _evaluate_tool_args(
+        self,
+        assertion: ToolArgsAssertion,
+        compiled: CompiledAssertion,
+    ) -> EvalMetric:
+        """Evaluate whether a tool was called with the expected arguments."""
+        index = self.metadata.tool_call_index
+        expected = compiled.args if compiled.args is not None else canonical_args(assertion.args)
+        return EvalMetric.from_test_case(
+            test_case=self.test_case,
+            score=float(index.args_match(assertion.tool, expected)),
+            name=assertion.type,
+            expectation=expected,
+            actual_value=[
+                canonicalize(call.input) for call in index.by_tool.get(assertion.tool, [])
+            ],
+            description=f"Whether {assertion.tool} was called with the expected arguments",
+            eval_output=self._format_eval_output(),
+        )
+
+    def _evaluate_forbidden_tools(self, assertion: ForbiddenToolsAssertion) -> EvalMetric:
+        """Evaluate that none of the forbidden tools were called."""
+        index = self.metadata.tool_call_index
+        called = [tool for tool in assertion.tools if index.called(tool)]
+        return EvalMetric.from_test_case(
+            test_case=self.test_case,
+            score=0.0 if called else 1.0,
+            name=assertion.type,
+            expectation=assertion.tools,
+            actual_value=called,
+            description="Whether forbidden tools were avoided",
+            eval_output=self._format_eval_output(),
+        )
+
 
 class DefaultEvaluator(Evaluator):
     """Default implementation of an evaluator that evaluates test case assertions."""
 
+    def __init__(
+        self,
+        config: Config,
+        executor: BoundedExecutor | None = None,
+        embed: EmbeddingFunction | None = None,
+    ) -> None:
+        """Initialize the evaluator.
+
+        Args:
+            config (Config): Configuration object for Portia and LLM integration.
+            executor (BoundedExecutor | None): Executor the assertions of a test case are
+                evaluated on concurrently. Defaults to the process wide shared executor.
+            embed (EmbeddingFunction | None): Embeds a batch of texts for semantic_match
+                assertions. Defaults to a local `HashingEmbedder`.
+
+        """
+        super().__init__(config)
+        self.executor = executor or shared_executor()
+        self.semantic_index = SemanticIndex(embed)
+
+    def settings(self) -> dict[str, Any]:
+        """Get the settings the scores depend on: the embedder of semantic_match assertions."""
+        embed = self.semantic_index.embed
+        # a function is named itself, an embedder object by its class
+        name = getattr(embed, "__qualname__", type(embed).__qualname__)
+        return {
+            **super().settings(),
+            "embed": {
+                "name": f"{embed.__module__}.{name}",
+                **(plain_settings(embed) if hasattr(embed, "__dict__") else {}),
+            },
+        }
+
+    def prepare(self, test_cases: list[EvalTestCase]) -> None:
+        """Embed the references of all semantic_match assertions of the run in one batch.
+
+        Args:
+            test_cases (list[EvalTestCase]): The test cases that will be evaluated.
+
+        """
+        self.semantic_index.add_test_cases(test_cases)
+
     def eval_test_case(
         self,
         test_case: EvalTestCase,
@@ -269,9 +496,13 @@ class DefaultEvaluator(Evaluator):
 
         """
         evaluator = AssertionEvaluator(
-            self.config, test_case, final_plan, final_plan_run, additional_data
+            self.config,
+            test_case,
+            final_plan,
+            final_plan_run,
+            additional_data,
+            self.semantic_index,
         )
-        all_metrics = []
-        for assertion in test_case.assertions:
-            all_metrics.extend(evaluator.evaluate(assertion))
-        return all_metrics
+        # assertions are independent (several may be LLM judge calls) so run them together
+        results = self.executor.map(evaluator.evaluate_compiled, test_case.compiled().assertions)
+        return [metric for metrics in results for metric in metrics]
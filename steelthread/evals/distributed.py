@@ -0,0 +1,230 @@
+"""Coordinator and workers for sharing an eval run between hosts."""
+
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from os import getpid
+from uuid import uuid4
+
+from portia import Portia, logger
+
+from steelthread.evals.backend import PortiaBackend
+from steelthread.evals.checkpoint import WorkUnit
+from steelthread.evals.eval_runner import EvalConfig, EvalRunner
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.tags import EvalMetricTagger
+from steelthread.evals.work_queue import Lease, WorkQueue
+
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_POLL_SECONDS = 5.0
+ERROR_METRIC = "error"
+
+
+class EvalCoordinator:
+    """Fills a work queue with the units of a run and collects their metrics.
+
+    Start one coordinator per run and any number of `EvalWorker`s (on any host that can
+    reach the queue) with the same `run_id`.
+    """
+
+    def __init__(
+        self,
+        config: EvalConfig,
+        queue: WorkQueue,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            config (EvalConfig): Evaluation configuration. Its metrics backends receive the
+                merged metrics of the run.
+            queue (WorkQueue): The queue shared with the workers.
+            poll_seconds (float): How often to check the queue while waiting.
+
+        """
+        self.config = config
+        self.queue = queue
+        self.poll_seconds = poll_seconds
+        self.backend = PortiaBackend(
+            config=config.portia_config,
+            dataset_cache_dir=config.dataset_cache_dir,
+            offline=config.offline,
+        )
+
+    def enqueue(self, run_id: str | None = None) -> str:
+        """Load the test cases of the dataset and enqueue one unit per iteration.
+
+        Args:
+            run_id (str | None): The run to enqueue, a new one is created if not given.
+
+        Returns:
+            str: The id of the run workers should be started with.
+
+        """
+        run_id = run_id or str(uuid4())
+        test_cases = self.backend.load_evals(self.config.eval_dataset_name, run_id)
+        units = [
+            WorkUnit(tc, iteration)
+            for tc in test_cases
+            for iteration in range(self.config.iterations)
+        ]
+        self.queue.enqueue(run_id, units)
+        logger().info(f"Enqueued {len(units)} units for run {run_id}")
+        return run_id
+
+    def wait(self, run_id: str, timeout: float | None = None) -> list[EvalMetric]:
+        """Wait for every unit to complete then save the merged metrics.
+
+        Expired leases are returned to the queue while waiting so units held by workers that
+        died are picked up by the others.
+
+        Args:
+            run_id (str): The run to wait for.
+            timeout (float | None): Maximum seconds to wait.
+
+        Returns:
+            list[EvalMetric]: The metrics of the run.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            reclaimed = self.queue.reclaim_expired(run_id)
+            if reclaimed:
+                logger().warning(f"Reclaimed {reclaimed} expired leases in run {run_id}")
+            completed, total = self.queue.progress(run_id)
+            if completed >= total:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"run {run_id} has {total - completed} of {total} units left")
+            time.sleep(self.poll_seconds)
+
+        metrics = self.queue.results(run_id)
+        if len(metrics) > 0:
+            for backend in self.config.metrics_backends:
+                backend.save_eval_metrics(metrics)
+        return metrics
+
+    def run(self, run_id: str | None = None, timeout: float | None = None) -> list[EvalMetric]:
+        """Enqueue a run and wait for the workers to complete it."""
+        return self.wait(self.enqueue(run_id), timeout=timeout)
+
+
+class EvalWorker:
+    """Claims units of a run from a work queue, executes them and reports their metrics.
+
+    Each worker runs up to `config.max_concurrency` units at a time and renews their leases
+    while they execute. Metrics are saved by the coordinator, not the worker. A unit that
+    raises is completed with an error metric rather than returned to the queue, so it can't
+    take down every worker in turn.
+    """
+
+    def __init__(
+        self,
+        portia: Portia,
+        config: EvalConfig,
+        queue: WorkQueue,
+        worker_id: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            portia (Portia): Portia engine instance to execute runs.
+            config (EvalConfig): Evaluation configuration.
+            queue (WorkQueue): The queue shared with the coordinator.
+            worker_id (str | None): Identifies this worker's leases, defaults to host and pid.
+            lease_seconds (float): How long a claimed unit is held without renewal.
+            poll_seconds (float): How often to renew leases and look for new units.
+
+        """
+        self.runner = EvalRunner(portia, config)
+        self.config = config
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{getpid()}-{uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+
+    def run(self, run_id: str, start_timeout: float | None = None) -> int:
+        """Work on a run until all of its units have completed.
+
+        A worker may be started before the coordinator enqueues the run, it waits for the
+        run's units to appear.
+
+        Args:
+            run_id (str): The run to work on.
+            start_timeout (float | None): Maximum seconds to wait for the run to be enqueued.
+
+        Returns:
+            int: The number of units this worker completed.
+
+        """
+        deadline = None if start_timeout is None else time.monotonic() + start_timeout
+        completed = 0
+        leases: dict[Future, Lease] = {}
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            while True:
+                while len(leases) < self.config.max_concurrency:
+                    lease = self.queue.claim(run_id, self.worker_id, self.lease_seconds)
+                    if lease is None:
+                        break
+                    leases[executor.submit(self._execute, lease)] = lease
+
+                if not leases:
+                    # other workers may still hold leases that expire, so only stop once done
+                    if self.queue.is_finished(run_id):
+                        return completed
+                    if (
+                        deadline is not None
+                        and time.monotonic() >= deadline
+                        and not self.queue.is_started(run_id)
+                    ):
+                        raise TimeoutError(f"run {run_id} wasn't enqueued in {start_timeout}s")
+                    time.sleep(self.poll_seconds)
+                    continue
+
+                done, _ = wait(leases, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                for future in done:
+                    lease = leases.pop(future)
+                    try:
+                        metrics = future.result()
+                    except Exception as e:  # noqa: BLE001
+                        metrics = self._failed(lease, e)
+                    if self.queue.complete(lease, metrics):
+                        completed += 1
+                    else:
+                        logger().warning(f"Lease on {lease.unit.key} was lost, dropping result")
+                self._renew(leases)
+
+    def _execute(self, lease: Lease) -> list[EvalMetric]:
+        """Execute the unit of a lease."""
+        metrics, _ = self.runner._execute_test_case(lease.unit.test_case)  # noqa: SLF001
+        return metrics
+
+    def _failed(self, lease: Lease, error: Exception) -> list[EvalMetric]:
+        """Get the metrics recorded for a unit whose execution raised."""
+        tc = lease.unit.test_case
+        logger().exception(f"Unit {lease.unit.key} failed")
+        metric = EvalMetric.from_test_case(
+            test_case=tc,
+            score=0,
+            name=ERROR_METRIC,
+            description="Whether the test case ran without raising",
+            explanation=f"{type(error).__name__}: {error}",
+            actual_value=type(error).__name__,
+        )
+        return EvalMetricTagger.attach_tags_to_test_case(
+            metric, tc, None, None, self.config.portia_config, self.config.additional_tags
+        )
+
+    def _renew(self, leases: dict[Future, Lease]) -> None:
+        """Renew leases that would expire before the next poll."""
+        renew_before = time.time() + 2 * self.poll_seconds
+        for future, lease in list(leases.items()):
+            if lease.expires_at > renew_before:
+                continue
+            renewed = self.queue.renew(lease, self.lease_seconds)
+            if renewed is None:
+                logger().warning(f"Lease on {lease.unit.key} was lost while running")
+            else:
+                leases[future] = renewed
@@ -1,15 +1,39 @@
 """Eval runner for steel thread."""
 
+import copy
+import multiprocessing
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
+from pathlib import Path
 from uuid import uuid4
 
 from portia import Config, Plan, PlanRun, Portia, logger
 from portia.prefixed_uuid import PlanUUID
 
+from steelthread.evals.adaptive import AdaptiveIterations, AdaptiveSampler
 from steelthread.evals.backend import PortiaBackend
+from steelthread.evals.checkpoint import EvalCheckpoint, UnitKey, WorkUnit
+from steelthread.evals.compiler import compile_dataset
+from steelthread.evals.deadlines import (
+    TIMEOUT_METRIC,
+    StragglerPolicy,
+    UnitAttempts,
+    phase_timeout,
+    timeout_metric,
+)
 from steelthread.evals.default_evaluator import DefaultEvaluator
 from steelthread.evals.evaluator import Evaluator, PlanRunMetadata
+from steelthread.evals.fingerprint import FingerprintCache, FingerprintContext, FingerprintReport
 from steelthread.evals.metrics import (
     EvalLogMetricBackend,
     EvalMetric,
@@ -17,10 +41,27 @@ from steelthread.evals.metrics import (
     PortiaEvalMetricsBackend,
 )
 from steelthread.evals.models import EvalTestCase
+from steelthread.evals.pipeline import (
+    ExecutedTestCase,
+    ScoringStage,
+    StageMonitor,
+    StageUtilization,
+)
+from steelthread.evals.scheduling import LatencyScheduler, MakespanReport
+from steelthread.evals.sharding import select_shard
 from steelthread.evals.tags import EvalMetricTagger
 from steelthread.portia.portia import NoAuthPullPortia
 from steelthread.portia.storage import ReadOnlyStorage
 from steelthread.portia.tools import ToolStubRegistry
+from steelthread.utils.concurrency import (
+    BoundedExecutor,
+    DaemonThreadExecutor,
+    DeadlineExceededError,
+    RateLimiter,
+    abandoning,
+    run_with_timeout,
+    shared_executor,
+)
 from steelthread.utils.timing import EventTimer
 
 
@@ -35,10 +76,32 @@ class EvalConfig:
         additional_tags (dict[str, str]): Tags to attach to each metric result.
         metrics_backends (list[MetricsBackend]): Where to send/save metric results.
         max_concurrency (int | None): Maximum number of concurrent tests to run.
+        checkpoint_dir (Path | None): Directory for run journals used by `EvalRunner.resume`.
+        worker_processes (int | None): If set, run test cases in this many worker processes.
+        portia_factory (Callable[[Config], Portia] | None): Builds the Portia used by workers.
+        run_id (str | None): Fixed id for the run, shared by every shard.
+        shard_index (int): The shard of the dataset this runner executes.
+        shard_count (int): The number of shards the dataset is split into.
+        shard_weights (Mapping[str, float] | None): Cost of each test case used to balance shards.
+        adaptive (AdaptiveIterations | None): If set, replaces the fixed iteration count.
+        fingerprint_cache_dir (Path | None): Directory of metrics reused for unchanged test cases.
+        dataset_cache_dir (Path | None): Directory the dataset is cached in between runs.
+        offline (bool): Whether the dataset is loaded from the cache without the server.
+        code_version (str | None): Version of the code under test, part of each fingerprint.
+        expected_latencies (Mapping[str, float] | None): Historical latency per test case id.
+        scoring_executor (BoundedExecutor): Executor evaluators and assertions fan out on.
+        scoring_concurrency (int | None): If set, test cases are scored by a separate pool.
+        scoring_queue_size (int): Executed test cases that may wait for a scoring worker.
+        execution_rate_limit (float | None): Maximum test case executions started per second.
+        scoring_rate_limit (float | None): Maximum test cases scored per second.
+        run_timeout (float | None): Seconds a test case may take to execute and score.
+        execution_timeout (float | None): Seconds a test case may take to execute.
+        scoring_timeout (float | None): Seconds a test case may take to score.
+        straggler (StragglerPolicy | None): If set, slow units get duplicate attempts.
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         eval_dataset_name: str,
         config: Config,
@@ -47,6 +110,29 @@ class EvalConfig:
         additional_tags: dict[str, str] | None = None,
         metrics_backends: list[MetricsBackend] | None = None,
         max_concurrency: int | None = None,
+        *,
+        checkpoint_dir: str | Path | None = None,
+        worker_processes: int | None = None,
+        portia_factory: Callable[[Config], Portia] | None = None,
+        run_id: str | None = None,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        shard_weights: Mapping[str, float] | None = None,
+        adaptive: AdaptiveIterations | None = None,
+        fingerprint_cache_dir: str | Path | None = None,
+        dataset_cache_dir: str | Path | None = None,
+        offline: bool = False,
+        code_version: str | None = None,
+        expected_latencies: Mapping[str, float] | None = None,
+        scoring_executor: BoundedExecutor | None = None,
+        scoring_concurrency: int | None = None,
+        scoring_queue_size: int | None = None,
+        execution_rate_limit: float | None = None,
+        scoring_rate_limit: float | None = None,
+        run_timeout: float | None = None,
+        execution_timeout: float | None = None,
+        scoring_timeout: float | None = None,
+        straggler: StragglerPolicy | None = None,
     ) -> None:
         """Initialize EvalConfig.
 
@@ -58,19 +144,101 @@ class EvalConfig:
             additional_tags (dict[str, str] | None): Custom tags to attach to metrics.
             metrics_backends (list[MetricsBackend] | None): Output backends (defaults to logger).
             max_concurrency (int | None): Maximum number of concurrent tests to run.
+            checkpoint_dir (str | Path | None): If set, each completed test case iteration is
+                journaled here so an interrupted run can be resumed.
+            worker_processes (int | None): Run test cases in a pool of this many processes
+                instead of threads, so evaluation scales past a single GIL.
+            portia_factory (Callable[[Config], Portia] | None): Required with worker_processes.
+                A picklable (module level) function each worker calls to build its own Portia.
+                Evaluators must also be picklable.
+            run_id (str | None): Id to run under instead of a random one. Set the same id
+                (e.g. the CI pipeline id) on every shard so their metrics form a single run.
+            shard_index (int): The shard of the dataset to execute, in [0, shard_count).
+            shard_count (int): The number of shards (e.g. CI nodes) the dataset is split into.
+            shard_weights (Mapping[str, float] | None): Cost of each test case by id, such as
+                `SQLiteMetricsStore.testcase_latencies()`. If given, shards are balanced by
+                cost rather than assigned by hash.
+            adaptive (AdaptiveIterations | None): Sample each test case until its scores
+                are precise enough instead of running it `iterations` times.
+            fingerprint_cache_dir (str | Path | None): If set, the metrics of each test case
+                are stored here by fingerprint and reused by later runs in which the test
+                case, models, tools, evaluators and code_version are unchanged.
+            dataset_cache_dir (str | Path | None): If set, the dataset is cached here and later
+                runs only download the pages of it the server reports changed.
+            offline (bool): Load the dataset from dataset_cache_dir without contacting the
+                server, e.g. to rerun a dataset loaded earlier without network access.
+            code_version (str | None): Version of the code under test (e.g. a git sha) so
+                cached results are not reused across code changes.
+            expected_latencies (Mapping[str, float] | None): Historical latency in ms by test
+                case id, e.g. `SQLiteMetricsStore.testcase_latencies()`. Slow test cases are
+                started first so they don't leave a long tail at the end of the run.
+            scoring_executor (BoundedExecutor | None): Executor the evaluators of a test case,
+                and the assertions of the default evaluator, are run on concurrently.
+                Defaults to the process wide shared executor.
+            scoring_concurrency (int | None): Score test cases on a separate pool of this
+                many workers. Execution workers hand each finished plan run to the scoring
+                pool through a bounded queue and move straight on to the next test case, so
+                slow judge calls don't hold execution slots. Not supported with
+                worker_processes.
+            scoring_queue_size (int | None): How many executed test cases may wait for a
+                scoring worker before execution workers block (defaults to
+                scoring_concurrency).
+            execution_rate_limit (float | None): Maximum number of test case executions
+                started per second, e.g. to stay under the agent model's rate limit. With
+                worker_processes the limit applies to each process.
+            scoring_rate_limit (float | None): Maximum number of test cases scored per
+                second, e.g. to stay under the judge model's rate limit.
+            run_timeout (float | None): Seconds a test case iteration may take in total.
+                A phase that runs past its deadline is abandoned and a `timeout` metric is
+                recorded in place of the iteration's results, so a hung tool or LLM call
+                can't stall the run.
+            execution_timeout (float | None): Seconds the plan run of a test case may take.
+            scoring_timeout (float | None): Seconds the evaluators of a test case may take.
+            straggler (StragglerPolicy | None): Start a duplicate attempt of an iteration
+                that runs longer than most, and keep whichever attempt finishes first.
 
         """
         config.must_get_api_key("portia_api_key")
         self.eval_dataset_name = eval_dataset_name
         self.portia_config = config
         self.iterations = iterations or 3
-        self.evaluators = evaluators or [DefaultEvaluator(config)]
+        self.scoring_executor = scoring_executor or shared_executor()
+        self.evaluators = evaluators or [DefaultEvaluator(config, self.scoring_executor)]
         self.additional_tags = additional_tags or {}
         self.metrics_backends = metrics_backends or [
             EvalLogMetricBackend(),
             PortiaEvalMetricsBackend(config),
         ]
         self.max_concurrency = max_concurrency or 5
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        if worker_processes and not portia_factory:
+            raise ValueError("portia_factory is required when worker_processes is set")
+        self.worker_processes = worker_processes
+        self.portia_factory = portia_factory
+        if not 0 <= shard_index < shard_count:
+            raise ValueError(f"shard_index must be in [0, {shard_count}), got {shard_index}")
+        self.run_id = run_id
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.shard_weights = shard_weights
+        self.adaptive = adaptive
+        self.fingerprint_cache_dir = Path(fingerprint_cache_dir) if fingerprint_cache_dir else None
+        if offline and not dataset_cache_dir:
+            raise ValueError("dataset_cache_dir is required when offline is set")
+        self.dataset_cache_dir = Path(dataset_cache_dir) if dataset_cache_dir else None
+        self.offline = offline
+        self.code_version = code_version
+        self.expected_latencies = expected_latencies
+        if scoring_concurrency and worker_processes:
+            raise ValueError("scoring_concurrency is not supported with worker_processes")
+        self.scoring_concurrency = scoring_concurrency
+        self.scoring_queue_size = scoring_queue_size or scoring_concurrency or 0
+        self.execution_rate_limit = execution_rate_limit
+        self.scoring_rate_limit = scoring_rate_limit
+        self.run_timeout = run_timeout
+        self.execution_timeout = execution_timeout
+        self.scoring_timeout = scoring_timeout
+        self.straggler = straggler
 
 
 class EvalRunner:
@@ -88,7 +256,24 @@ class EvalRunner:
         """
         self.original_portia = portia
         self.config = config
-        self.backend = PortiaBackend(config=config.portia_config)
+        self.backend = PortiaBackend(
+            config=config.portia_config,
+            dataset_cache_dir=config.dataset_cache_dir,
+            offline=config.offline,
+        )
+        self.fingerprint_report: FingerprintReport | None = None
+        self.makespan_report: MakespanReport | None = None
+        self.execution_monitor = StageMonitor(
+            "execution",
+            config.max_concurrency,
+            RateLimiter(config.execution_rate_limit) if config.execution_rate_limit else None,
+        )
+        self.scoring_monitor = StageMonitor(
+            "scoring",
+            config.scoring_concurrency or config.max_concurrency,
+            RateLimiter(config.scoring_rate_limit) if config.scoring_rate_limit else None,
+        )
+        self.stage_utilization: list[StageUtilization] = []
 
     def run(self) -> None:
         """Run the evaluation process.
@@ -98,38 +283,386 @@ class EvalRunner:
         - Applies evaluators to generate metrics.
         - Saves metrics using configured backends.
 
+        If the config is sharded only this shard's test cases are executed.
+
         """
-        run_id = str(uuid4())
-        test_cases = self.backend.load_evals(self.config.eval_dataset_name, run_id)
-        all_metrics = []
+        self._run(self.config.run_id or str(uuid4()), completed={})
 
-        total_events = len(test_cases) * self.config.iterations
-        progress = EventTimer(total_events=total_events)
+    def resume(self, run_id: str) -> None:
+        """Resume an interrupted run from its checkpoint.
 
-        futures = []
+        Test case iterations already recorded in the checkpoint are skipped and their
+        journaled metrics are saved alongside the metrics of the re-submitted iterations.
 
-        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
-            futures.extend(
-                executor.submit(self._evaluate_and_collect_metrics, tc, progress)
-                for tc in test_cases
-                for _ in range(self.config.iterations)
+        Args:
+            run_id (str): The id of the run to resume.
+
+        """
+        if not self.config.checkpoint_dir:
+            raise ValueError("checkpoint_dir must be set on the EvalConfig to resume a run")
+        completed = EvalCheckpoint(self.config.checkpoint_dir, run_id).load()
+        logger().info(f"Resuming run {run_id} with {len(completed)} completed iterations")
+        self._run(run_id, completed=completed)
+
+    def _run(self, run_id: str, completed: dict[UnitKey, list[EvalMetric]]) -> None:
+        """Execute every work unit of the run not in `completed` and save all metrics."""
+        test_cases, reused, fingerprints = self._reuse_cached(self._load_test_cases(run_id), run_id)
+        checkpoint = (
+            EvalCheckpoint(self.config.checkpoint_dir, run_id)
+            if self.config.checkpoint_dir
+            else None
+        )
+        sampler = AdaptiveSampler(self.config.adaptive) if self.config.adaptive else None
+        pending, all_metrics = self._plan_units(test_cases, completed, sampler)
+        for evaluator in self.config.evaluators:
+            evaluator.prepare(test_cases)
+        all_metrics.extend(reused)
+
+        scheduler = LatencyScheduler(self.config.expected_latencies)
+        scheduler.add(pending)
+        predicted = scheduler.predict_makespan(self._pool_size())
+        progress = EventTimer(total_events=len(pending))
+
+        self.execution_monitor.reset()
+        self.scoring_monitor.reset()
+        with self._executor() as executor, self._scoring_stage() as scoring:
+            all_metrics.extend(
+                self._execute_units(executor, scoring, scheduler, sampler, checkpoint, progress)
             )
 
-            for future in as_completed(futures):
-                metrics = future.result()
-                if metrics:
-                    all_metrics.extend(metrics)
+        self.makespan_report = MakespanReport(predicted, scheduler.actual_makespan())
+        logger().info(str(self.makespan_report))
+        if not self.config.worker_processes:
+            # workers in other processes have their own monitors
+            self.stage_utilization = [
+                self.execution_monitor.report(),
+                self.scoring_monitor.report(),
+            ]
+            for utilization in self.stage_utilization:
+                logger().info(str(utilization))
+
+        if sampler:
+            logger().info(
+                f"Adaptive sampling ran {sampler.scheduled} iterations "
+                f"across {len(test_cases)} test cases"
+            )
+
+        self._cache_results(fingerprints, all_metrics)
 
         if len(all_metrics) > 0:
             for backend in self.config.metrics_backends:
                 backend.save_eval_metrics(all_metrics)
 
+    def _execute_units(
+        self,
+        executor: Executor,
+        scoring: ScoringStage | None,
+        scheduler: LatencyScheduler,
+        sampler: AdaptiveSampler | None,
+        checkpoint: EvalCheckpoint | None,
+        progress: EventTimer,
+    ) -> list[EvalMetric]:
+        """Execute the scheduled units, keeping every worker of the pool busy.
+
+        Only as many units as there are workers are submitted at a time so the scheduler can
+        pick each next unit using the latencies observed so far. With a scoring stage a unit
+        frees its execution worker once its plan run is handed to the scoring pool. With a
+        straggler policy slow units get duplicate attempts and the first to finish is used.
+        """
+        window = self._pool_size()
+        executing = UnitAttempts(scheduler, self.config.straggler)
+        scoring_units: dict[Future, WorkUnit] = {}
+        all_metrics: list[EvalMetric] = []
+
+        submit = partial(self._submit, executor, progress=progress, scoring=scoring)
+
+        def fill() -> None:
+            for unit in scheduler.take(window - len(executing)):
+                executing.start(submit(unit), unit)
+
+        fill()
+        while executing or scoring_units:
+            future = self._next_completed([*executing, *scoring_units])
+            if future is None:
+                executing.retry_stragglers(submit)
+                continue
+            if future in executing:
+                unit = executing.settle(future)
+                if scoring:
+                    scoring_units[future.result()] = unit
+                    fill()
+                    continue
+            else:
+                unit = scoring_units.pop(future)
+            metrics = self._result(future, progress)
+            all_metrics.extend(metrics)
+            if checkpoint:
+                checkpoint.record(unit.key, metrics)
+            if sampler:
+                scheduler.add(self._follow_ups(sampler, unit, metrics, progress))
+            fill()
+        if executing.duplicates:
+            logger().info(f"Started {executing.duplicates} duplicate attempts of stragglers")
+        return all_metrics
+
+    def _follow_ups(
+        self,
+        sampler: AdaptiveSampler,
+        unit: WorkUnit,
+        metrics: list[EvalMetric],
+        progress: EventTimer,
+    ) -> list[WorkUnit]:
+        """Get the further iterations the sampler wants after a unit finished."""
+        follow_ups = sampler.record(unit, metrics)
+        progress.total_events += len(follow_ups)
+        return follow_ups
+
+    def _next_completed(self, futures: list[Future]) -> Future | None:
+        """Wait for the next future to finish, or return None when stragglers are due a check."""
+        timeout = self.config.straggler.check_interval if self.config.straggler else None
+        try:
+            return next(iter(as_completed(futures, timeout=timeout)))
+        except TimeoutError:
+            return None
+
+    def _pool_size(self) -> int:
+        """Get the number of units executed concurrently."""
+        return self.config.worker_processes or self.config.max_concurrency
+
+    def _load_test_cases(self, run_id: str) -> list[EvalTestCase]:
+        """Load the test cases of the dataset, or of this runner's shard of it."""
+        test_cases = self.backend.load_evals(self.config.eval_dataset_name, run_id)
+        if self.config.shard_count > 1:
+            test_cases = select_shard(
+                test_cases,
+                self.config.shard_index,
+                self.config.shard_count,
+                self.config.shard_weights,
+            )
+            logger().info(
+                f"Running shard {self.config.shard_index + 1}/{self.config.shard_count} "
+                f"with {len(test_cases)} test cases"
+            )
+        # fail before anything runs if a test case could never be evaluated
+        dataset = compile_dataset(
+            test_cases,
+            tool_ids={tool.id for tool in self.original_portia.tool_registry.get_tools()},
+        )
+        logger().info(
+            f"Compiled {len(test_cases)} test cases, estimated at up to "
+            f"{dataset.cost.times(self._max_iterations())}"
+        )
+        return dataset.test_cases
+
+    def _max_iterations(self) -> int:
+        """Get the most iterations any test case of the run may get."""
+        adaptive = self.config.adaptive
+        return adaptive.max_iterations if adaptive else self.config.iterations
+
+    def _reuse_cached(
+        self,
+        test_cases: list[EvalTestCase],
+        run_id: str,
+    ) -> tuple[list[EvalTestCase], list[EvalMetric], dict[str, str]]:
+        """Reuse the cached metrics of unchanged test cases.
+
+        Returns:
+            tuple: The test cases to execute, the reused metrics, and the fingerprint of each
+                test case to execute by id.
+
+        """
+        if not self.config.fingerprint_cache_dir:
+            return test_cases, [], {}
+        cache = FingerprintCache(self.config.fingerprint_cache_dir)
+        context = FingerprintContext.build(
+            self.config.portia_config,
+            self.original_portia.tool_registry,
+            self.config.evaluators,
+            self.config.code_version,
+            iterations=self.config.iterations,
+            adaptive=self.config.adaptive,
+        )
+        report = FingerprintReport()
+        to_execute: list[EvalTestCase] = []
+        reused: list[EvalMetric] = []
+        fingerprints: dict[str, str] = {}
+        for tc in test_cases:
+            fingerprint = context.fingerprint(tc)
+            cached = cache.get(fingerprint)
+            if cached is None:
+                to_execute.append(tc)
+                fingerprints[tc.testcase] = fingerprint
+                report.executed.append(tc.testcase)
+            else:
+                # the cached metrics may be of an identical test case elsewhere, so they take
+                # this test case's identity, and tags from this run's config
+                identity = {"run": run_id, "dataset": tc.dataset, "testcase": tc.testcase}
+                reused.extend(
+                    EvalMetricTagger.attach_tags_to_test_case(
+                        [m.model_copy(update=identity) for m in cached],
+                        tc,
+                        None,
+                        None,
+                        self.config.portia_config,
+                        self.config.additional_tags,
+                    )
+                )
+                report.reused.append(tc.testcase)
+        self.fingerprint_report = report
+        logger().info(str(report))
+        return to_execute, reused, fingerprints
+
+    def _cache_results(self, fingerprints: dict[str, str], metrics: list[EvalMetric]) -> None:
+        """Store the metrics of executed test cases under their fingerprints."""
+        if not self.config.fingerprint_cache_dir:
+            return
+        cache = FingerprintCache(self.config.fingerprint_cache_dir)
+        by_testcase: dict[str, list[EvalMetric]] = {testcase: [] for testcase in fingerprints}
+        for metric in metrics:
+            if metric.testcase in by_testcase:
+                by_testcase[metric.testcase].append(metric)
+        for testcase, testcase_metrics in by_testcase.items():
+            # a timeout says nothing about the test case's results, so it's run again next time
+            if any(m.name == TIMEOUT_METRIC for m in testcase_metrics):
+                continue
+            cache.put(fingerprints[testcase], testcase_metrics)
+
+    def _plan_units(
+        self,
+        test_cases: list[EvalTestCase],
+        completed: dict[UnitKey, list[EvalMetric]],
+        sampler: AdaptiveSampler | None,
+    ) -> tuple[list[WorkUnit], list[EvalMetric]]:
+        """Split the initial units into those to execute and the metrics of completed ones.
+
+        Completed units are fed to the sampler, which may schedule further iterations.
+        """
+        if sampler:
+            units = deque(sampler.initial(test_cases))
+        else:
+            units = deque(
+                WorkUnit(tc, iteration)
+                for tc in test_cases
+                for iteration in range(self.config.iterations)
+            )
+
+        pending: list[WorkUnit] = []
+        restored: list[EvalMetric] = []
+        while units:
+            unit = units.popleft()
+            if unit.key not in completed:
+                pending.append(unit)
+                continue
+            restored.extend(completed[unit.key])
+            if sampler:
+                units.extend(sampler.record(unit, completed[unit.key]))
+        return pending, restored
+
+    def _executor(self) -> AbstractContextManager[Executor]:
+        """Create the pool work units are executed on.
+
+        With a straggler policy the run mustn't wait for the attempts that lost to a duplicate,
+        so attempts run on their own daemon threads, which are abandoned once they lose. The
+        number running is still bounded by the units submitted at a time. Worker processes
+        can't be abandoned, but the run returns without waiting for them.
+        """
+        if self.config.worker_processes:
+            # spawn rather than fork so workers don't inherit locks or open HTTP connections
+            pool = ProcessPoolExecutor(
+                max_workers=self._pool_size(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(_worker_config(self.config),),
+            )
+            return abandoning(pool) if self.config.straggler else pool
+        if self.config.straggler:
+            return DaemonThreadExecutor()
+        return ThreadPoolExecutor(max_workers=self._pool_size())
+
+    def _scoring_stage(self) -> AbstractContextManager[ScoringStage | None]:
+        """Create the scoring pool, if scoring is separate from execution."""
+        if not self.config.scoring_concurrency:
+            return nullcontext()
+        return ScoringStage(self.config.scoring_concurrency, self.config.scoring_queue_size)
+
+    def _submit(
+        self,
+        executor: Executor,
+        unit: WorkUnit,
+        progress: EventTimer,
+        scoring: ScoringStage | None = None,
+    ) -> Future:
+        """Submit a work unit to the executor.
+
+        With a scoring stage the future's result is the future of the unit's scoring.
+        """
+        if self.config.worker_processes:
+            return executor.submit(_evaluate_in_worker, unit.test_case)
+        if scoring:
+            return executor.submit(self._execute_and_enqueue, unit.test_case, scoring, progress)
+        return executor.submit(self._evaluate_and_collect_metrics, unit.test_case, progress)
+
+    def _result(self, future: Future, progress: EventTimer) -> list[EvalMetric]:
+        """Get the metrics of a finished work unit.
+
+        Workers in other processes can't update the progress timer so they return their
+        latency alongside the metrics and it is recorded here instead.
+        """
+        if self.config.worker_processes:
+            metrics, latency = future.result()
+            progress.record_timing_milliseconds(latency, update_display=True)
+            return metrics or []
+        return future.result() or []
+
     def _evaluate_and_collect_metrics(
         self,
         tc: EvalTestCase,
         progress: EventTimer,
     ) -> list[EvalMetric]:
         """Run a single test case with isolated tool registry and evaluators."""
+        metrics, latency = self._execute_test_case(tc)
+        progress.record_timing_milliseconds(latency, update_display=True)
+        return metrics
+
+    def _execute_and_enqueue(
+        self,
+        tc: EvalTestCase,
+        scoring: ScoringStage,
+        progress: EventTimer,
+    ) -> Future:
+        """Run a test case and queue it for scoring, blocking while the queue is full."""
+        try:
+            executed = self._execute(tc)
+        except DeadlineExceededError as e:
+            future: Future = Future()
+            future.set_result(self._timed_out(tc, "execution", e.timeout))
+            progress.record_timing_milliseconds(e.timeout * 1000, update_display=True)
+            return future
+        return scoring.submit(self._score_and_record, executed, progress)
+
+    def _score_and_record(
+        self, executed: ExecutedTestCase, progress: EventTimer
+    ) -> list[EvalMetric]:
+        """Score an executed test case and record its latency."""
+        metrics = self._score(executed)
+        progress.record_timing_milliseconds(executed.metadata.latency_ms, update_display=True)
+        return metrics
+
+    def _execute_test_case(self, tc: EvalTestCase) -> tuple[list[EvalMetric], float]:
+        """Run and evaluate a single test case, returning its metrics and run latency."""
+        try:
+            executed = self._execute(tc)
+        except DeadlineExceededError as e:
+            return self._timed_out(tc, "execution", e.timeout), e.timeout * 1000
+        return self._score(executed), executed.metadata.latency_ms
+
+    def _execute(self, tc: EvalTestCase) -> ExecutedTestCase:
+        """Run a single test case with an isolated tool registry.
+
+        Raises:
+            DeadlineExceededError: If the run doesn't finish within its deadline.
+
+        """
         inner_registry = self.original_portia.tool_registry
         tool_registry = ToolStubRegistry(inner_registry, stubs={}, test_case_name=tc.test_case_name)
 
@@ -138,33 +671,64 @@ class EvalRunner:
         portia.storage = ReadOnlyStorage(portia.storage)  # type: ignore  # noqa: PGH003
 
         # Run the test case
-        plan, plan_run, latency = self._run_test_case(tc, portia)
-        progress.record_timing_milliseconds(latency, update_display=True)
+        timeout = phase_timeout(self.config.execution_timeout, self.config.run_timeout)
+        with self.execution_monitor.busy():
+            plan, plan_run, latency = run_with_timeout(
+                lambda: self._run_test_case(tc, portia), timeout
+            )
 
-        # Evaluate with isolated evaluator instances
-        all_metrics = []
-        for evaluator in self.config.evaluators:
-            metrics = evaluator.eval_test_case(
+        metadata = PlanRunMetadata(latency_ms=latency, tool_calls=tool_registry.get_tool_calls())
+        return ExecutedTestCase(tc, plan, plan_run, metadata)
+
+    def _score(self, executed: ExecutedTestCase) -> list[EvalMetric]:
+        """Evaluate an executed test case concurrently, merging metrics in evaluator order."""
+        tc, plan, plan_run = executed.test_case, executed.plan, executed.plan_run
+
+        def evaluate(evaluator: Evaluator) -> list[EvalMetric]:
+            metrics = evaluator.eval_test_case(tc, plan, plan_run, executed.metadata)
+            if not metrics:
+                return []
+            return EvalMetricTagger.attach_tags_to_test_case(
+                metrics,
                 tc,
                 plan,
                 plan_run,
-                PlanRunMetadata(
-                    latency_ms=latency,
-                    tool_calls=tool_registry.get_tool_calls(),
-                ),
+                self.config.portia_config,
+                self.config.additional_tags,
             )
-            if metrics:
-                all_metrics.extend(
-                    EvalMetricTagger.attach_tags_to_test_case(
-                        metrics,
-                        tc,
-                        plan,
-                        plan_run,
-                        self.config.portia_config,
-                        self.config.additional_tags,
-                    )
+
+        timeout = phase_timeout(
+            self.config.scoring_timeout,
+            self.config.run_timeout,
+            executed.metadata.latency_ms / 1000,
+        )
+        with self.scoring_monitor.busy():
+            try:
+                results = run_with_timeout(
+                    lambda: self.config.scoring_executor.map(evaluate, self.config.evaluators),
+                    timeout,
                 )
-        return all_metrics
+            except DeadlineExceededError as e:
+                return self._timed_out(tc, "scoring", e.timeout, plan)
+        return [metric for metrics in results for metric in metrics]
+
+    def _timed_out(
+        self,
+        tc: EvalTestCase,
+        phase: str,
+        timeout: float,
+        plan: Plan | None = None,
+    ) -> list[EvalMetric]:
+        """Get the metrics recorded for a test case whose phase ran past its deadline."""
+        logger().warning(f"Test case {tc.testcase} timed out after {timeout:.1f}s in {phase}")
+        return EvalMetricTagger.attach_tags_to_test_case(
+            timeout_metric(tc, phase, timeout),
+            tc,
+            plan,
+            None,
+            self.config.portia_config,
+            self.config.additional_tags,
+        )
 
     def _run_test_case(self, tc: EvalTestCase, portia: Portia) -> tuple[Plan, PlanRun, float]:
         """Execute a single test case and record latency.
@@ -193,3 +757,30 @@ class EvalRunner:
             raise ValueError(f"invalid input_config type: {tc.input_config.type}")
         end = time.perf_counter()
         return plan, output, (end - start) * 1000
+
+
+# The runner owned by a worker process, built once per process by `_init_worker`.
+_worker_runner: EvalRunner | None = None
+
+
+def _worker_config(config: EvalConfig) -> EvalConfig:
+    """Copy the config for sending to workers; metrics are saved by the parent process."""
+    worker_config = copy.copy(config)
+    worker_config.metrics_backends = []
+    worker_config.worker_processes = None
+    return worker_config
+
+
+def _init_worker(config: EvalConfig) -> None:
+    """Build the Portia and runner used for every work unit in this worker process."""
+    global _worker_runner  # noqa: PLW0603
+    if config.portia_factory is None:
+        raise ValueError("portia_factory is required when worker_processes is set")
+    _worker_runner = EvalRunner(config.portia_factory(config.portia_config), config)
+
+
+def _evaluate_in_worker(tc: EvalTestCase) -> tuple[list[EvalMetric], float]:
+    """Execute a test case in a worker process."""
+    if _worker_runner is None:
+        raise RuntimeError("worker process has not been initialized")
+    return _worker_runner._execute_test_case(tc)  # noqa: SLF001
@@ -1,6 +1,8 @@
 """Core evaluator abstraction."""
 
 from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Any
 
 from portia import Config, Plan, PlanRun
 from portia.storage import ToolCallRecord
@@ -8,6 +10,18 @@ from pydantic import BaseModel
 
 from steelthread.evals.metrics import EvalMetric
 from steelthread.evals.models import EvalTestCase
+from steelthread.evals.tool_calls import ToolCallIndex
+
+PlainValue = str | int | float | bool | None
+
+
+def plain_settings(obj: object) -> dict[str, Any]:
+    """Get the public attributes of an object that hold plain values, such as thresholds."""
+    return {
+        name: value
+        for name, value in vars(obj).items()
+        if not name.startswith("_") and isinstance(value, PlainValue)
+    }
 
 
 class PlanRunMetadata(BaseModel):
@@ -22,6 +36,11 @@ class PlanRunMetadata(BaseModel):
     tool_calls: list[ToolCallRecord]
     latency_ms: float
 
+    @cached_property
+    def tool_call_index(self) -> ToolCallIndex:
+        """Get the tool calls indexed by tool and step, built once on first use."""
+        return ToolCallIndex(self.tool_calls)
+
 
 class Evaluator(ABC):
     """Abstract base class for implementing evaluation logic.
@@ -44,6 +63,28 @@ class Evaluator(ABC):
         super().__init__()
         self.config = config
 
+    def settings(self) -> dict[str, Any]:
+        """Get the settings the evaluator's scores depend on, besides its config.
+
+        Used to tell when cached results can be reused. Defaults to the public attributes
+        holding plain values; override to describe other settings.
+
+        Returns:
+            dict[str, Any]: JSON serializable settings.
+
+        """
+        return plain_settings(self)
+
+    def prepare(self, test_cases: list[EvalTestCase]) -> None:  # noqa: B027
+        """Prepare to evaluate the test cases of a run, e.g. by precomputing shared data.
+
+        Called once per run before any test case is evaluated. Does nothing by default.
+
+        Args:
+            test_cases (list[EvalTestCase]): The test cases that will be evaluated.
+
+        """
+
     @abstractmethod
     def eval_test_case(
         self,
@@ -0,0 +1,178 @@
+"""Fingerprinting of test cases for incremental evaluation."""
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from portia import Config, ToolRegistry, logger
+
+from steelthread.evals.adaptive import AdaptiveIterations
+from steelthread.evals.checkpoint import deserialize_metric, serialize_metric
+from steelthread.evals.evaluator import Evaluator
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase
+from steelthread.evals.tags import EvalMetricTagger
+
+
+def tool_signatures(registry: ToolRegistry) -> list[dict[str, Any]]:
+    """Get the id and schemas of every tool in a registry, ordered by id."""
+    return [
+        {
+            "id": tool.id,
+            "args_schema": tool.args_schema.model_json_schema(),
+            "output_schema": list(tool.output_schema),
+        }
+        for tool in sorted(registry.get_tools(), key=lambda t: t.id)
+    ]
+
+
+def iteration_policy(iterations: int, adaptive: AdaptiveIterations | None) -> dict[str, Any]:
+    """Describe how many times the test cases of a run are run."""
+    if adaptive is None:
+        return {"iterations": iterations}
+    return {
+        "adaptive": {
+            "min_iterations": adaptive.min_iterations,
+            "max_iterations": adaptive.max_iterations,
+            "target_half_width": adaptive.target_half_width,
+            "confidence": adaptive.confidence,
+            "max_total_runs": adaptive.max_total_runs,
+        }
+    }
+
+
+def evaluator_signature(evaluator: Evaluator) -> dict[str, Any]:
+    """Get the class of an evaluator and the settings its scores depend on."""
+    return {
+        "class": f"{type(evaluator).__module__}.{type(evaluator).__qualname__}",
+        "settings": evaluator.settings(),
+    }
+
+
+@dataclass(frozen=True)
+class FingerprintContext:
+    """Everything besides the test case itself that determines its results.
+
+    Attributes:
+        models (dict[str, str]): The model names tagged by `EvalMetricTagger`.
+        tools (list[dict[str, Any]]): The ids and schemas of the available tools.
+        evaluators (list[dict[str, Any]]): The classes and settings of the evaluators
+            scoring the test case.
+        code_version (str | None): A user supplied version of the code under test.
+        iterations (dict[str, Any]): How many times test cases are run, either a fixed count
+            or the settings of adaptive iterations.
+
+    """
+
+    models: dict[str, str]
+    tools: list[dict[str, Any]]
+    evaluators: list[dict[str, Any]]
+    code_version: str | None
+    iterations: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        config: Config,
+        registry: ToolRegistry,
+        evaluators: Sequence[Evaluator],
+        code_version: str | None,
+        iterations: int = 1,
+        adaptive: AdaptiveIterations | None = None,
+    ) -> "FingerprintContext":
+        """Build the context of an eval run."""
+        return cls(
+            models=EvalMetricTagger.model_tags(config),
+            tools=tool_signatures(registry),
+            evaluators=[evaluator_signature(e) for e in evaluators],
+            code_version=code_version,
+            iterations=iteration_policy(iterations, adaptive),
+        )
+
+    def fingerprint(self, tc: EvalTestCase) -> str:
+        """Get a fingerprint that changes whenever the results of a test case could.
+
+        Args:
+            tc (EvalTestCase): The test case.
+
+        Returns:
+            str: A hex sha256 digest.
+
+        """
+        payload = {
+            "input_config": tc.input_config.model_dump(mode="json"),
+            "assertions": [a.model_dump(mode="json") for a in tc.assertions],
+            "models": self.models,
+            "tools": self.tools,
+            "evaluators": self.evaluators,
+            "code_version": self.code_version,
+            "iterations": self.iterations,
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class FingerprintCache:
+    """Stores the metrics of test cases by fingerprint so unchanged test cases can be reused.
+
+    Each entry is one JSON file written atomically. Like checkpoints, `eval_output` is not
+    stored so reused metrics do not carry the plan and plan run they were generated from.
+
+    Attributes:
+        directory (Path): The directory holding the entries.
+
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory (str | Path): The directory holding the entries.
+
+        """
+        self.directory = Path(directory)
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.directory / f"{fingerprint}.json"
+
+    def get(self, fingerprint: str) -> list[EvalMetric] | None:
+        """Get the stored metrics for a fingerprint, if any."""
+        path = self._path(fingerprint)
+        if not path.exists():
+            return None
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger().warning(f"Ignoring corrupt fingerprint cache entry {path}")
+            return None
+        return [deserialize_metric(m) for m in entries]
+
+    def put(self, fingerprint: str, metrics: list[EvalMetric]) -> None:
+        """Store the metrics for a fingerprint, replacing any previous entry."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(fingerprint)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps([serialize_metric(m) for m in metrics]), encoding="utf-8")
+        tmp.replace(path)
+
+
+@dataclass
+class FingerprintReport:
+    """Which test cases of a run were reused from the cache and which were executed.
+
+    Attributes:
+        reused (list[str]): Ids of test cases whose cached metrics were reused.
+        executed (list[str]): Ids of test cases that were executed.
+
+    """
+
+    reused: list[str] = field(default_factory=list)
+    executed: list[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        """Summarize the report."""
+        return f"Reused {len(self.reused)} test cases, executed {len(self.executed)}"
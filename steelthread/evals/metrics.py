@@ -1,14 +1,19 @@
 """Metrics backend."""
 
+import json
 from abc import ABC, abstractmethod
+from pathlib import Path
 
 import httpx
-import pandas as pd
 from portia.config import Config
 from portia.storage import PortiaCloudClient
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
 from steelthread.evals.models import EvalTestCase
+from steelthread.utils.arrow import ArrowPartitionedWriter
+from steelthread.utils.serialization import to_json
+from steelthread.utils.sqlite_store import DEFAULT_BATCH_SIZE, SQLiteMetricsStore
+from steelthread.utils.stats import MetricAggregator
 
 MIN_EXPLANATION_LENGTH = 10
 
@@ -142,30 +147,87 @@ class EvalLogMetricBackend(MetricsBackend):
     This backend prints average metric scores grouped by name and tags.
     """
 
-    def save_eval_metrics(self, metrics: list[EvalMetric]) -> None:
-        """Log metrics via pandas.
-
-        Converts the metrics list into a DataFrame, expands tags into columns,
-        groups by metric name and tag combinations, and prints average scores.
+    def __init__(self, detailed: bool = False) -> None:
+        """Init the backend.
 
         Args:
-            eval_run (EvalRun): The evaluation run context (unused).
-            metrics (list[MetricWithTag]): The metrics to log.
+            detailed (bool): Also print count, std, min/max and quantiles for each group.
 
         """
-        # Convert list of metrics to DataFrame
-        dataframe = pd.DataFrame([m.model_dump() for m in metrics])
+        self.detailed = detailed
+
+    def save_eval_metrics(self, metrics: list[EvalMetric]) -> None:
+        """Log metrics via a streaming aggregator.
 
-        # Expand the 'tags' column into separate columns
-        tags_df = dataframe["tags"].apply(pd.Series)
-        dataframe = pd.concat([dataframe.drop(columns=["tags"]), tags_df], axis=1)
+        Folds each metric into a per (name, tags) accumulator and prints the average
+        score of every group. Only the aggregates are held in memory.
 
-        # Determine which columns to group by: metric name + all tag columns
-        group_keys = ["name", *tags_df.columns.tolist()]
+        Args:
+            metrics (list[EvalMetric]): The metrics to log.
 
-        # Group by name + tags, then compute mean score
-        avg_scores = dataframe.groupby(group_keys)["score"].mean().reset_index()
+        """
+        aggregator = MetricAggregator()
+        aggregator.extend(metrics)
 
         # Print
         print("\n=== Metric Averages ===")  # noqa: T201
-        print(avg_scores.to_string(index=False))  # noqa: T201
+        print(aggregator.to_string(detailed=self.detailed))  # noqa: T201
+
+
+class ArrowEvalMetricsBackend(MetricsBackend):
+    """Backend that appends metrics to a local Parquet dataset.
+
+    Files are partitioned as `dataset=<dataset>/run=<run>/date=<date>/` with tags stored as
+    dictionary encoded `tag_<key>` columns and `eval_output` as a JSON blob column, so scans
+    that only need scores never read the plan runs. Requires the `arrow` extra.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Init the backend.
+
+        Args:
+            path (str | Path): Root directory of the metrics dataset.
+
+        """
+        self.writer = ArrowPartitionedWriter(path, partition_by=["dataset", "run"])
+
+    def save_eval_metrics(self, metrics: list[EvalMetric]) -> None:
+        """Append metrics as new files in their partitions."""
+        self.writer.write(
+            {
+                **m.model_dump(
+                    mode="json",
+                    exclude={"eval_output", "expectation", "actual_value"},
+                ),
+                "expectation": to_json(m.expectation),
+                "actual_value": to_json(m.actual_value),
+                "eval_output": json.dumps(
+                    m.model_dump(mode="json", include={"eval_output"})["eval_output"]
+                ).encode()
+                if m.eval_output
+                else None,
+            }
+            for m in metrics
+        )
+
+
+class SQLiteEvalMetricsBackend(MetricsBackend):
+    """Backend that saves metrics to a local, indexed SQLite database.
+
+    Use `store` to query across runs without re-fetching from the Portia API, e.g.
+    `backend.store.latest_runs("testcase-id")` or `backend.store.average_score_by_tag()`.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """Init the backend.
+
+        Args:
+            path (str | Path): The SQLite database file.
+            batch_size (int): Maximum number of metrics inserted per transaction.
+
+        """
+        self.store = SQLiteMetricsStore(path, batch_size=batch_size)
+
+    def save_eval_metrics(self, metrics: list[EvalMetric]) -> None:
+        """Insert metrics in batched transactions."""
+        self.store.add_eval_metrics(metrics)
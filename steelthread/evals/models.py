@@ -1,8 +1,20 @@
 """Models for test cases."""
 
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Self
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+if TYPE_CHECKING:
+    from steelthread.evals.compiler import CompiledTestCase
 
 
 class InputConfig(BaseModel):
@@ -40,14 +52,39 @@ class FinalOutputAssertion(BaseModel):
 
     Attributes:
         type (Literal["final_output"]): Discriminator for the assertion type.
-        output_type (Literal["exact_match", "partial_match", "llm_judge"]): How to eval the output.
+        output_type (Literal["exact_match", "partial_match", "llm_judge", "cascade"]): How
+            to eval the output. "cascade" tries cheap comparisons first and only asks the LLM
+            judge when they are inconclusive.
         value (str): Expected final output value.
+        accept_similarity (float | None): For "cascade", the similarity at or above which the
+            output matches without asking the LLM judge.
+        reject_similarity (float | None): For "cascade", the similarity at or below which the
+            output doesn't match without asking the LLM judge. If not set, every output that
+            doesn't match is judged by the LLM.
 
     """
 
     type: Literal["final_output"]
-    output_type: Literal["exact_match", "partial_match", "llm_judge"]
+    output_type: Literal["exact_match", "partial_match", "llm_judge", "cascade"]
     value: str
+    accept_similarity: float | None = None
+    reject_similarity: float | None = None
+
+
+class SemanticMatchAssertion(BaseModel):
+    """Assertion scoring the final output by its semantic similarity to reference answers.
+
+    Attributes:
+        type (Literal["semantic_match"]): Discriminator for the assertion type.
+        references (list[str]): Acceptable answers; the closest one is used.
+        threshold (float | None): If set, the score is 1 when the similarity reaches it and 0
+            otherwise. If not set, the score is the similarity.
+
+    """
+
+    type: Literal["semantic_match"]
+    references: list[str] = Field(min_length=1)
+    threshold: float | None = Field(default=None, ge=0, le=1)
 
 
 class ToolCallAssertion(BaseModel):
@@ -74,6 +111,66 @@ class ToolCallsAssertion(BaseModel):
     calls: dict[str, ToolCallAssertion]
 
 
+class ToolCallCountAssertion(BaseModel):
+    """Assertion for verifying how many times a tool was called.
+
+    Attributes:
+        type (Literal["tool_call_count"]): Discriminator for the assertion type.
+        tool (str): The tool.
+        min_calls (int): The fewest calls expected.
+        max_calls (int | None): The most calls expected, if limited.
+
+    """
+
+    type: Literal["tool_call_count"]
+    tool: str
+    min_calls: int = Field(default=0, ge=0)
+    max_calls: int | None = Field(default=None, ge=0)
+
+
+class ToolOrderAssertion(BaseModel):
+    """Assertion for verifying tools were called in a given order.
+
+    Other calls may happen before, between and after the expected ones.
+
+    Attributes:
+        type (Literal["tool_order"]): Discriminator for the assertion type.
+        tools (list[str]): The tools in the order they are expected to be called.
+
+    """
+
+    type: Literal["tool_order"]
+    tools: list[str] = Field(min_length=1)
+
+
+class ToolArgsAssertion(BaseModel):
+    """Assertion for verifying a tool was called with given arguments.
+
+    Attributes:
+        type (Literal["tool_args"]): Discriminator for the assertion type.
+        tool (str): The tool.
+        args (dict[str, Any]): Arguments at least one call must have. The call may have others.
+
+    """
+
+    type: Literal["tool_args"]
+    tool: str
+    args: dict[str, Any]
+
+
+class ForbiddenToolsAssertion(BaseModel):
+    """Assertion for verifying none of a set of tools was called.
+
+    Attributes:
+        type (Literal["forbidden_tools"]): Discriminator for the assertion type.
+        tools (list[str]): The tools that must not be called.
+
+    """
+
+    type: Literal["forbidden_tools"]
+    tools: list[str] = Field(min_length=1)
+
+
 class LatencyAssertion(BaseModel):
     """Assertion for validating runtime latency.
 
@@ -117,7 +214,12 @@ class CustomAssertion(BaseModel):
 Assertion = Annotated[
     OutcomeAssertion
     | FinalOutputAssertion
+    | SemanticMatchAssertion
     | ToolCallsAssertion
+    | ToolCallCountAssertion
+    | ToolOrderAssertion
+    | ToolArgsAssertion
+    | ForbiddenToolsAssertion
     | LatencyAssertion
     | LLMAsJudgeAssertion
     | CustomAssertion,
@@ -136,11 +238,63 @@ class EvalTestCase(BaseModel):
     """
 
     dataset: str
-    testcase: str
-    test_case_name: str
-    run: str
+    # the API names these id and description, so pages can be validated as they are sent
+    testcase: str = Field(validation_alias=AliasChoices("testcase", "id"))
+    test_case_name: str = Field(validation_alias=AliasChoices("test_case_name", "description"))
+    run: str = Field(default="", validate_default=True)
     input_config: InputConfig
     assertions: list[Assertion]
+    _compiled: "CompiledTestCase | None" = PrivateAttr(default=None)
+
+    # assignments are validated so replacing a field discards the compiled form
+    model_config = ConfigDict(validate_assignment=True)
+
+    @field_validator("run")
+    @classmethod
+    def _run_from_context(cls, run: str, info: ValidationInfo) -> str:
+        """Take the run from the validation context when the data doesn't have one.
+
+        A field rather than model validator, so pages validated from JSON aren't first
+        decoded to dicts to add the run.
+        """
+        if not run and info.context and "run" in info.context:
+            return info.context["run"]
+        if not run:
+            raise ValueError("run is required")
+        return run
+
+    @model_validator(mode="after")
+    def _discard_compiled(self) -> Self:
+        """Discard the compiled form when a field is assigned."""
+        self._compiled = None
+        return self
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the test case, discarding the compiled form if any field is replaced."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._compiled = None  # noqa: SLF001
+        return copied
+
+    def compiled(self) -> "CompiledTestCase":
+        """Get the test case compiled for evaluation, compiling it on first use.
+
+        The compiled form is kept until a field is assigned or replaced by
+        `model_copy(update=...)`. Lists of the test case aren't watched, so replace the
+        assertions rather than changing them in place.
+
+        Returns:
+            CompiledTestCase: The compiled assertions, needed tools and cost estimate.
+
+        Raises:
+            DatasetCompilationError: If any assertion can never be evaluated.
+
+        """
+        if self._compiled is None:
+            from steelthread.evals.compiler import CompiledTestCase  # noqa: PLC0415
+
+            self._compiled = CompiledTestCase.compile(self)
+        return self._compiled
 
     def get_custom_assertion(self, key: str) -> str | None:
         """Return the value of a custom assertion by key, if it exists.
@@ -0,0 +1,190 @@
+"""Separate execution and scoring stages of an eval run."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Self
+
+from portia import Plan, PlanRun
+
+from steelthread.evals.evaluator import PlanRunMetadata
+from steelthread.evals.models import EvalTestCase
+from steelthread.utils.concurrency import RateLimiter
+
+
+@dataclass(frozen=True)
+class ExecutedTestCase:
+    """A test case that has been executed and is waiting to be scored.
+
+    Attributes:
+        test_case (EvalTestCase): The test case.
+        plan (Plan): The plan that was run.
+        plan_run (PlanRun): The finished plan run.
+        metadata (PlanRunMetadata): Tool calls and latency of the plan run.
+
+    """
+
+    test_case: EvalTestCase
+    plan: Plan
+    plan_run: PlanRun
+    metadata: PlanRunMetadata
+
+
+@dataclass(frozen=True)
+class StageUtilization:
+    """How busy the workers of a stage were over a run.
+
+    Attributes:
+        name (str): The stage.
+        workers (int): The number of workers of the stage.
+        items (int): The number of items the stage processed.
+        busy_seconds (float): Total time workers spent processing items.
+        wall_seconds (float): Time from the stage's first item starting to its last finishing.
+
+    """
+
+    name: str
+    workers: int
+    items: int
+    busy_seconds: float
+    wall_seconds: float
+
+    @property
+    def utilization(self) -> float:
+        """Get the fraction of the stage's worker time spent processing items."""
+        if self.wall_seconds <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / (self.workers * self.wall_seconds))
+
+    def __str__(self) -> str:
+        """Summarize the utilization."""
+        return (
+            f"Stage {self.name}: {self.items} items on {self.workers} workers, "
+            f"{self.utilization:.0%} utilized"
+        )
+
+
+class StageMonitor:
+    """Measures the time workers of a stage spend busy, and applies the stage's rate limit.
+
+    Time spent waiting on the rate limiter is not counted as busy, so a stage held back by
+    its limit shows as under utilized.
+
+    Attributes:
+        name (str): The stage.
+        workers (int): The number of workers of the stage.
+        rate_limiter (RateLimiter | None): Limits how often items start.
+
+    """
+
+    def __init__(self, name: str, workers: int, rate_limiter: RateLimiter | None = None) -> None:
+        """Initialize the monitor.
+
+        Args:
+            name (str): The stage.
+            workers (int): The number of workers of the stage.
+            rate_limiter (RateLimiter | None): Limits how often items start.
+
+        """
+        self.name = name
+        self.workers = workers
+        self.rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the items processed so far."""
+        with self._lock:
+            self._items = 0
+            self._busy = 0.0
+            self._first_start: float | None = None
+            self._last_end: float | None = None
+
+    @contextmanager
+    def busy(self) -> Iterator[None]:
+        """Wait for the rate limit, then time the processing of one item."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        start = time.perf_counter()
+        with self._lock:
+            if self._first_start is None:
+                self._first_start = start
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self._items += 1
+                self._busy += end - start
+                self._last_end = max(self._last_end or end, end)
+
+    def report(self) -> StageUtilization:
+        """Get the utilization of the stage so far."""
+        with self._lock:
+            wall = (
+                self._last_end - self._first_start
+                if self._first_start is not None and self._last_end is not None
+                else 0.0
+            )
+            return StageUtilization(self.name, self.workers, self._items, self._busy, wall)
+
+
+class ScoringStage:
+    """Pool of scoring workers fed through a bounded queue.
+
+    Submitting blocks while the queue is full, so execution workers that produce results
+    faster than they can be scored slow down instead of piling up plan runs in memory.
+
+    Attributes:
+        workers (int): The number of scoring threads.
+        queue_size (int): The number of submitted items that may wait for a free worker.
+
+    """
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        """Initialize the stage.
+
+        Args:
+            workers (int): The number of scoring threads.
+            queue_size (int): The number of submitted items that may wait for a free worker.
+
+        """
+        self.workers = workers
+        self.queue_size = queue_size
+        self._capacity = threading.BoundedSemaphore(workers + queue_size)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="steelthread-score")
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Submit an item, blocking while the queue is full.
+
+        Args:
+            fn (Callable[..., Any]): The scoring function.
+            *args (Any): Its arguments.
+
+        Returns:
+            Future: The future of the scoring call.
+
+        """
+        self._capacity.acquire()
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._capacity.release()
+            raise
+        future.add_done_callback(lambda _: self._capacity.release())
+        return future
+
+    def shutdown(self) -> None:
+        """Stop the scoring threads, waiting for submitted items to be scored."""
+        self._pool.shutdown()
+
+    def __enter__(self) -> Self:
+        """Use the stage as a context manager."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Shut the stage down."""
+        self.shutdown()
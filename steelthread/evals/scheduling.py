@@ -0,0 +1,177 @@
+"""Latency aware scheduling of work units."""
+
+import heapq
+import itertools
+import math
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from steelthread.evals.checkpoint import WorkUnit
+
+
+@dataclass(frozen=True)
+class MakespanReport:
+    """Predicted and actual wall clock time of executing a run's work units.
+
+    Attributes:
+        predicted_seconds (float | None): Makespan predicted from latency estimates, if any.
+        actual_seconds (float): Time from the first unit starting to the last finishing.
+
+    """
+
+    predicted_seconds: float | None
+    actual_seconds: float
+
+    def __str__(self) -> str:
+        """Summarize the report."""
+        predicted = (
+            "unknown" if self.predicted_seconds is None else f"{self.predicted_seconds:.1f}s"
+        )
+        return f"Makespan predicted={predicted} actual={self.actual_seconds:.1f}s"
+
+
+def predict_makespan(durations: Iterable[float], workers: int) -> float:
+    """Predict the makespan of running durations in order on a pool of workers.
+
+    Each duration goes to the worker that frees up first, as a pool does.
+
+    Args:
+        durations (Iterable[float]): Durations in submission order.
+        workers (int): The size of the pool.
+
+    Returns:
+        float: The time the last worker finishes.
+
+    """
+    finish_times = [0.0] * workers
+    for duration in durations:
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + duration)
+    return max(finish_times)
+
+
+class LatencyScheduler:
+    """Hands out work units longest first to keep the tail of a run short.
+
+    Submitting slow test cases last leaves one worker busy long after the others go idle,
+    so units are handed out in order of their test case's expected latency. Expected
+    latency comes from historical latencies and is replaced by the mean latency observed in
+    this run as units finish. Test cases with no estimate go first so that their first
+    iteration provides one. Ties are broken by iteration, which interleaves the iterations
+    of test cases rather than running each test case's iterations back to back.
+
+    Units should be taken only as workers become free so that later choices use the
+    latencies observed so far.
+    """
+
+    def __init__(self, history: Mapping[str, float] | None = None) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            history (Mapping[str, float] | None): Historical latency in milliseconds by test
+                case id, e.g. from `SQLiteMetricsStore.testcase_latencies()`.
+
+        """
+        self.history = dict(history or {})
+        self._pending: dict[str, deque[WorkUnit]] = defaultdict(deque)
+        self._heap: list[tuple[float, int, int, str, int]] = []
+        self._versions: dict[str, int] = defaultdict(int)
+        self._order = itertools.count()
+        self._observed: dict[str, tuple[float, int]] = {}
+        self._started: dict[Future, tuple[WorkUnit, float]] = {}
+        self._finished: dict[Future, float] = {}
+        self._first_start: float | None = None
+        self._last_finish: float | None = None
+
+    def estimate(self, testcase: str) -> float | None:
+        """Get the expected latency in milliseconds of a test case, if known."""
+        if testcase in self._observed:
+            total, count = self._observed[testcase]
+            return total / count
+        return self.history.get(testcase)
+
+    def add(self, units: Iterable[WorkUnit]) -> None:
+        """Add units to be scheduled."""
+        for unit in units:
+            testcase = unit.test_case.testcase
+            queue = self._pending[testcase]
+            queue.append(unit)
+            if len(queue) == 1:
+                self._push(testcase)
+
+    def take(self, n: int) -> list[WorkUnit]:
+        """Take up to n units, longest expected latency first."""
+        units: list[WorkUnit] = []
+        while self._heap and len(units) < n:
+            *_, testcase, version = heapq.heappop(self._heap)
+            queue = self._pending[testcase]
+            if version != self._versions[testcase] or not queue:
+                continue
+            units.append(queue.popleft())
+            if queue:
+                self._push(testcase)
+        return units
+
+    def started(self, future: Future, unit: WorkUnit) -> None:
+        """Track a submitted unit so its latency is observed when it finishes."""
+        now = time.perf_counter()
+        if self._first_start is None:
+            self._first_start = now
+        self._started[future] = (unit, now)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future) -> None:
+        self._finished[future] = time.perf_counter()
+
+    def finished(self, future: Future) -> None:
+        """Record the latency of a finished unit and update its test case's estimate."""
+        started = self._started.pop(future, None)
+        if started is None:
+            return
+        # done callbacks may run just after waiters are woken, so fall back to now
+        finished_at = self._finished.pop(future, None) or time.perf_counter()
+        unit, started_at = started
+        self._last_finish = max(self._last_finish or finished_at, finished_at)
+        testcase = unit.test_case.testcase
+        total, count = self._observed.get(testcase, (0.0, 0))
+        self._observed[testcase] = (total + (finished_at - started_at) * 1000, count + 1)
+        if self._pending[testcase]:
+            self._push(testcase)
+
+    def predict_makespan(self, workers: int) -> float | None:
+        """Predict the makespan in seconds of the pending units from the current estimates.
+
+        Test cases without an estimate are assumed to take the mean of the known estimates.
+        Returns None if no estimates are known.
+        """
+        known = {tc: e for tc in self._pending if (e := self.estimate(tc)) is not None}
+        if not known:
+            return None
+        default = sum(known.values()) / len(known)
+        ordered = sorted(
+            (
+                (-known.get(testcase, math.inf), unit.iteration, known.get(testcase, default))
+                for testcase, queue in self._pending.items()
+                for unit in queue
+            ),
+        )
+        return predict_makespan((duration / 1000 for *_, duration in ordered), workers)
+
+    def actual_makespan(self) -> float:
+        """Get the seconds from the first unit starting to the last one finishing."""
+        if self._first_start is None or self._last_finish is None:
+            return 0.0
+        return self._last_finish - self._first_start
+
+    def _push(self, testcase: str) -> None:
+        """(Re)insert a test case into the heap with its current priority."""
+        self._versions[testcase] += 1
+        estimate = self.estimate(testcase)
+        priority = -math.inf if estimate is None else -estimate
+        next_iteration = self._pending[testcase][0].iteration
+        heapq.heappush(
+            self._heap,
+            (priority, next_iteration, next(self._order), testcase, self._versions[testcase]),
+        )
@@ -0,0 +1,187 @@
+"""Embedding based semantic similarity of final outputs."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections.abc import Callable, Sequence
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+from steelthread.evals.cascade import normalize
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from steelthread.evals.models import EvalTestCase
+
+# Embeds a batch of texts into a (len(texts), dimensions) matrix.
+EmbeddingFunction = Callable[[Sequence[str]], "np.ndarray"]
+
+DEFAULT_DIMENSIONS = 1024
+
+_TOKEN = re.compile(r"\w+")
+
+
+def require_numpy() -> None:
+    """Raise a helpful error if numpy is not installed."""
+    try:
+        import numpy as np  # noqa: F401, PLC0415
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for semantic_match assertions. "
+            "Install it with `pip install steel-thread[semantic]`."
+        ) from e
+
+
+class HashingEmbedder:
+    """Local embedding of texts by hashing their words and word pairs into a fixed vector.
+
+    Needs no model or network access, so it is fast and deterministic, but it only captures
+    lexical overlap. Pass a real embedding model's function for paraphrase-level similarity.
+
+    Attributes:
+        dimensions (int): The length of each embedding.
+
+    """
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS) -> None:
+        """Initialize the embedder.
+
+        Args:
+            dimensions (int): The length of each embedding.
+
+        """
+        self.dimensions = dimensions
+
+    def _bucket(self, feature: str) -> int:
+        # a keyed hash rather than hash() so embeddings are stable across processes
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little") % self.dimensions
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed a batch of texts.
+
+        Args:
+            texts (Sequence[str]): The texts.
+
+        Returns:
+            np.ndarray: A (len(texts), dimensions) matrix of feature counts.
+
+        """
+        require_numpy()
+        import numpy as np  # noqa: PLC0415
+
+        rows: list[int] = []
+        columns: list[int] = []
+        for row, text in enumerate(texts):
+            tokens = _TOKEN.findall(normalize(text))
+            for feature in [*tokens, *(f"{x} {y}" for x, y in pairwise(tokens))]:
+                rows.append(row)
+                columns.append(self._bucket(feature))
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        np.add.at(matrix, (rows, columns), 1.0)
+        return matrix
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length, leaving all zero rows as they are."""
+    import numpy as np  # noqa: PLC0415
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+class SemanticIndex:
+    """Cache of reference answer embeddings that scores outputs against them.
+
+    Reference embeddings are kept as the rows of a single matrix, so each reference is
+    embedded once however many test cases and iterations share it. Outputs are scored
+    against their references with one matrix product.
+
+    Attributes:
+        embed (EmbeddingFunction): Embeds a batch of texts.
+
+    """
+
+    def __init__(self, embed: EmbeddingFunction | None = None) -> None:
+        """Initialize the index.
+
+        Args:
+            embed (EmbeddingFunction | None): Embeds a batch of texts into a matrix with one
+                row per text. Defaults to a `HashingEmbedder`.
+
+        """
+        self.embed = embed or HashingEmbedder()
+        self._lock = threading.Lock()
+        self._rows: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle only the embedding function; workers build their own cache."""
+        return {"embed": self.embed}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore an empty index around the embedding function."""
+        self.__init__(state["embed"])
+
+    def __len__(self) -> int:
+        """Get the number of cached references."""
+        return len(self._rows)
+
+    def add_references(self, references: Sequence[str]) -> None:
+        """Embed the references that aren't cached yet, in a single batch."""
+        if not references:
+            return
+        require_numpy()
+        import numpy as np  # noqa: PLC0415
+
+        with self._lock:
+            new = list(dict.fromkeys(r for r in references if r not in self._rows))
+            if not new:
+                return
+            embedded = _unit_rows(np.asarray(self.embed(new), dtype=np.float32))
+            self._rows.update({r: len(self._rows) + i for i, r in enumerate(new)})
+            self._matrix = embedded if self._matrix is None else np.vstack([self._matrix, embedded])
+
+    def add_test_cases(self, test_cases: Sequence[EvalTestCase]) -> None:
+        """Embed the references of every semantic_match assertion of the test cases."""
+        self.add_references(
+            [
+                reference
+                for tc in test_cases
+                for assertion in tc.assertions
+                if assertion.type == "semantic_match"
+                for reference in assertion.references
+            ]
+        )
+
+    def score(self, outputs: Sequence[str], references: Sequence[Sequence[str]]) -> np.ndarray:
+        """Get the best cosine similarity of each output to any of its references.
+
+        Args:
+            outputs (Sequence[str]): The outputs, embedded in a single batch.
+            references (Sequence[Sequence[str]]): The reference answers of each output.
+
+        Returns:
+            np.ndarray: The similarity of each output, clipped to [0, 1].
+
+        """
+        require_numpy()
+        import numpy as np  # noqa: PLC0415
+
+        if len(outputs) != len(references):
+            raise ValueError("each output needs its own list of references")
+        self.add_references([r for refs in references for r in refs])
+        with self._lock:
+            matrix = self._matrix
+            if not outputs or matrix is None:
+                return np.zeros(len(outputs), dtype=np.float32)
+            rows = self._rows
+            mask = np.zeros((len(outputs), len(rows)), dtype=bool)
+            for i, refs in enumerate(references):
+                mask[i, [rows[r] for r in refs]] = True
+        embedded = _unit_rows(np.asarray(self.embed(list(outputs)), dtype=np.float32))
+        similarities = np.where(mask, embedded @ matrix.T, -np.inf)
+        return np.clip(similarities.max(axis=1), 0, 1)
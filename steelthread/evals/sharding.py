@@ -0,0 +1,71 @@
+"""Deterministic partitioning of test cases across CI nodes."""
+
+import hashlib
+import heapq
+from collections.abc import Mapping, Sequence
+
+from steelthread.evals.models import EvalTestCase
+
+
+def stable_shard(testcase: str, shard_count: int) -> int:
+    """Get the shard of a test case from a hash that is stable across processes and hosts.
+
+    Args:
+        testcase (str): The test case id.
+        shard_count (int): The number of shards.
+
+    Returns:
+        int: The shard index in [0, shard_count).
+
+    """
+    digest = hashlib.sha256(testcase.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def assign_shards(
+    test_cases: Sequence[EvalTestCase],
+    shard_count: int,
+    weights: Mapping[str, float] | None = None,
+) -> list[list[EvalTestCase]]:
+    """Partition test cases into shards.
+
+    Without weights each test case goes to its `stable_shard`, so a test case stays on the
+    same shard as the dataset grows. With weights (e.g. historical latency per test case id)
+    test cases are assigned greedily, heaviest first, to the currently lightest shard, which
+    keeps the slowest shard close to the average. Test cases without a weight are given the
+    mean of the known weights. Either way every node computes the same assignment.
+
+    Args:
+        test_cases (Sequence[EvalTestCase]): The test cases of the dataset.
+        shard_count (int): The number of shards.
+        weights (Mapping[str, float] | None): Optional cost of each test case by id.
+
+    Returns:
+        list[list[EvalTestCase]]: The test cases of each shard.
+
+    """
+    shards: list[list[EvalTestCase]] = [[] for _ in range(shard_count)]
+    if not weights:
+        for tc in test_cases:
+            shards[stable_shard(tc.testcase, shard_count)].append(tc)
+        return shards
+
+    default = sum(weights.values()) / len(weights)
+    # order by id as well so ties are broken the same way on every node
+    ordered = sorted(test_cases, key=lambda tc: (-weights.get(tc.testcase, default), tc.testcase))
+    loads = [(0.0, index) for index in range(shard_count)]
+    for tc in ordered:
+        load, index = heapq.heappop(loads)
+        shards[index].append(tc)
+        heapq.heappush(loads, (load + weights.get(tc.testcase, default), index))
+    return shards
+
+
+def select_shard(
+    test_cases: Sequence[EvalTestCase],
+    shard_index: int,
+    shard_count: int,
+    weights: Mapping[str, float] | None = None,
+) -> list[EvalTestCase]:
+    """Get the test cases of one shard, see `assign_shards`."""
+    return assign_shards(test_cases, shard_count, weights)[shard_index]
@@ -9,11 +9,29 @@ from steelthread.evals.models import EvalTestCase
 class EvalMetricTagger:
     """Class for attaching tags to metrics."""
 
+    @staticmethod
+    def model_tags(config: Config) -> dict[str, str]:
+        """Get the names of the models used by a config, keyed by their tag.
+
+        Args:
+            config (Config): Portia config used.
+
+        Returns:
+            dict[str, str]: The model names.
+
+        """
+        return {
+            "planning_model": config.get_planning_model().model_name,
+            "execution_model": config.get_execution_model().model_name,
+            "introspection_model": config.get_introspection_model().model_name,
+            "summarizer_model": config.get_summarizer_model().model_name,
+        }
+
     @staticmethod
     def attach_tags_to_test_case(
         metrics: list[EvalMetric] | EvalMetric,
         test_case: EvalTestCase,
-        plan: Plan,  # noqa: ARG004
+        plan: Plan | None,  # noqa: ARG004
         plan_run: PlanRun | None,  # noqa: ARG004
         config: Config,
         additional_tags: dict[str, str] | None = None,
@@ -23,7 +41,7 @@ class EvalMetricTagger:
         Args:
             metrics (list[EvalMetric] | EvalMetric): the original metrics to tag.
             test_case (EvalTestCase): the original test case.
-            plan (Plan): The associated plan
+            plan (Plan | None): The associated plan
             plan_run (PlanRun): The associated plan_run
             config (Config): Portia config used.
             additional_tags (dict[str, str] | None): Extra tags to include (optional).
@@ -36,10 +54,7 @@ class EvalMetricTagger:
         def append_tags(m: EvalMetric) -> EvalMetric:
             m.tags = {
                 "test_case": str(test_case.testcase),
-                "planning_model": config.get_planning_model().model_name,
-                "execution_model": config.get_execution_model().model_name,
-                "introspection_model": config.get_introspection_model().model_name,
-                "summarizer_model": config.get_summarizer_model().model_name,
+                **EvalMetricTagger.model_tags(config),
                 **(additional_tags or {}),
             }
             return m
@@ -0,0 +1,129 @@
+"""Index of the tool calls made during a plan run."""
+
+import json
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from portia.storage import ToolCallRecord
+
+
+def canonicalize(value: Any) -> str:  # noqa: ANN401
+    """Get a canonical JSON form of a value so equal values compare equal as strings.
+
+    Strings holding JSON are parsed first, and object keys are sorted.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: The canonical form.
+
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return json.dumps(value)
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def canonical_args(tool_input: Any) -> dict[str, str]:  # noqa: ANN401
+    """Get the canonical form of each argument of a tool call.
+
+    Args:
+        tool_input (Any): The input of the tool call, usually a mapping of argument names to
+            values or a JSON string of one.
+
+    Returns:
+        dict[str, str]: The canonical value of each argument, or an empty dict if the input
+            isn't a mapping.
+
+    """
+    if isinstance(tool_input, str):
+        try:
+            tool_input = json.loads(tool_input)
+        except json.JSONDecodeError:
+            return {}
+    if not isinstance(tool_input, Mapping):
+        return {}
+    return {str(name): canonicalize(value) for name, value in tool_input.items()}
+
+
+class ToolCallIndex:
+    """Tool calls of a plan run indexed in a single pass for assertions to look up.
+
+    Attributes:
+        sequence (list[str]): The names of the tools in the order they were called.
+        counts (Counter[str]): The number of calls to each tool.
+        by_tool (dict[str, list[ToolCallRecord]]): The calls to each tool, in order.
+        by_step (dict[int, list[ToolCallRecord]]): The calls made by each plan step, in order.
+
+    """
+
+    def __init__(self, tool_calls: Sequence[ToolCallRecord]) -> None:
+        """Index the tool calls.
+
+        Args:
+            tool_calls (Sequence[ToolCallRecord]): The tool calls, in the order they were made.
+
+        """
+        self.sequence: list[str] = []
+        self.counts: Counter[str] = Counter()
+        self.by_tool: dict[str, list[ToolCallRecord]] = {}
+        self.by_step: dict[int, list[ToolCallRecord]] = {}
+        self._positions: dict[str, list[int]] = {}
+        self._args: dict[str, list[dict[str, str]]] = {}
+        for position, call in enumerate(tool_calls):
+            name = call.tool_name
+            self.sequence.append(name)
+            self.counts[name] += 1
+            self.by_tool.setdefault(name, []).append(call)
+            self.by_step.setdefault(call.step, []).append(call)
+            self._positions.setdefault(name, []).append(position)
+            self._args.setdefault(name, []).append(canonical_args(call.input))
+
+    def count(self, tool_name: str) -> int:
+        """Get the number of calls to a tool."""
+        return self.counts[tool_name]
+
+    def called(self, tool_name: str) -> bool:
+        """Check whether a tool was called at all."""
+        return tool_name in self.counts
+
+    def args_match(self, tool_name: str, expected: Mapping[str, str]) -> bool:
+        """Check whether any call to a tool had the expected arguments.
+
+        Args:
+            tool_name (str): The tool.
+            expected (Mapping[str, str]): The canonical form of each argument the call must
+                have, as given by `canonical_args`. It may have others.
+
+        Returns:
+            bool: Whether a call had every expected argument with an equal value.
+
+        """
+        return any(
+            all(args.get(name) == value for name, value in expected.items())
+            for args in self._args.get(tool_name, [])
+        )
+
+    def in_order(self, tool_names: Sequence[str]) -> bool:
+        """Check whether the tools were called in the given order, other calls allowed between.
+
+        Args:
+            tool_names (Sequence[str]): The tools in their expected order.
+
+        Returns:
+            bool: Whether the calls contain the tools as a subsequence.
+
+        """
+        position = -1
+        for name in tool_names:
+            positions = self._positions.get(name, [])
+            following = bisect_right(positions, position)
+            if following == len(positions):
+                return False
+            position = positions[following]
+        return True
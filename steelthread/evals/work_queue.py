@@ -0,0 +1,232 @@
+"""Lease based work queues for sharing an eval run between hosts."""
+
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from steelthread.evals.checkpoint import WorkUnit, deserialize_metric, serialize_metric
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase
+
+
+@dataclass(frozen=True)
+class Lease:
+    """A work unit claimed by a worker until `expires_at`.
+
+    Attributes:
+        run_id (str): The run the unit belongs to.
+        unit (WorkUnit): The claimed unit.
+        worker_id (str): The worker holding the lease.
+        expires_at (float): Unix time after which the unit may be reclaimed.
+
+    """
+
+    run_id: str
+    unit: WorkUnit
+    worker_id: str
+    expires_at: float
+
+
+class WorkQueue(ABC):
+    """Queue of (test case, iteration) work units leased to workers.
+
+    A worker claims a unit for a fixed lease, renews the lease while it is running and
+    reports metrics on completion. Units whose lease expires (e.g. the worker died) are
+    handed out again, so every unit eventually completes exactly once.
+    """
+
+    @abstractmethod
+    def enqueue(self, run_id: str, units: list[WorkUnit]) -> None:
+        """Add units to a run. Units that are already queued are left untouched."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim(self, run_id: str, worker_id: str, lease_seconds: float) -> Lease | None:
+        """Lease the next available unit of a run, or return None if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def renew(self, lease: Lease, lease_seconds: float) -> Lease | None:
+        """Extend a lease, returning None if it has been lost to another worker."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, lease: Lease, metrics: list[EvalMetric]) -> bool:
+        """Record the metrics of a leased unit, returning False if the lease was lost."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def reclaim_expired(self, run_id: str) -> int:
+        """Return units with expired leases to the queue and return how many there were."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def progress(self, run_id: str) -> tuple[int, int]:
+        """Get the (completed, total) number of units in a run."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def results(self, run_id: str) -> list[EvalMetric]:
+        """Get the metrics of all completed units in a run."""
+        raise NotImplementedError
+
+    def is_started(self, run_id: str) -> bool:
+        """Check whether any unit of a run has been enqueued."""
+        _, total = self.progress(run_id)
+        return total > 0
+
+    def is_finished(self, run_id: str) -> bool:
+        """Check whether every unit of a run has completed.
+
+        A run without units hasn't been enqueued yet, so it isn't finished.
+        """
+        completed, total = self.progress(run_id)
+        return total > 0 and completed >= total
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_units (
+    run_id TEXT NOT NULL,
+    testcase TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    test_case TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    metrics TEXT,
+    PRIMARY KEY (run_id, testcase, iteration)
+);
+CREATE INDEX IF NOT EXISTS ix_work_units_state ON work_units (run_id, state, lease_expires);
+"""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue backed by a SQLite file.
+
+    Suitable for workers on one machine or in tests. Hosts sharing it must see the same
+    file and have reasonably synchronized clocks since leases are wall clock based.
+
+    Attributes:
+        path (Path): The SQLite database file.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (and if needed create) the queue.
+
+        Args:
+            path (str | Path): The SQLite database file.
+
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open an autocommit connection; writes manage their own transactions."""
+        with closing(sqlite3.connect(self.path, isolation_level=None, timeout=30)) as conn:
+            yield conn
+
+    def enqueue(self, run_id: str, units: list[WorkUnit]) -> None:
+        """Add units to a run. Units that are already queued are left untouched."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR IGNORE INTO work_units (run_id, testcase, iteration, test_case) "
+                "VALUES (?, ?, ?, ?)",
+                [(run_id, *unit.key, unit.test_case.model_dump_json()) for unit in units],
+            )
+            conn.execute("COMMIT")
+
+    def claim(self, run_id: str, worker_id: str, lease_seconds: float) -> Lease | None:
+        """Lease the next pending unit, or one whose lease has expired."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT testcase, iteration, test_case FROM work_units "
+                "WHERE run_id = ? "
+                "AND (state = 'pending' OR (state = 'leased' AND lease_expires < ?)) "
+                "ORDER BY attempts, rowid LIMIT 1",
+                (run_id, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            testcase, iteration, test_case = row
+            expires_at = now + lease_seconds
+            conn.execute(
+                "UPDATE work_units SET state = 'leased', worker_id = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE run_id = ? AND testcase = ? AND iteration = ?",
+                (worker_id, expires_at, run_id, testcase, iteration),
+            )
+            conn.execute("COMMIT")
+        return Lease(
+            run_id=run_id,
+            unit=WorkUnit(EvalTestCase.model_validate_json(test_case), iteration),
+            worker_id=worker_id,
+            expires_at=expires_at,
+        )
+
+    def _update_lease(self, lease: Lease, assignments: str, params: tuple) -> bool:
+        """Update a unit only if it is still leased by the same worker."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE work_units SET {assignments} "  # noqa: S608
+                "WHERE run_id = ? AND testcase = ? AND iteration = ? "
+                "AND state = 'leased' AND worker_id = ?",
+                (*params, lease.run_id, *lease.unit.key, lease.worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def renew(self, lease: Lease, lease_seconds: float) -> Lease | None:
+        """Extend a lease, returning None if it has been lost to another worker."""
+        expires_at = time.time() + lease_seconds
+        if not self._update_lease(lease, "lease_expires = ?", (expires_at,)):
+            return None
+        return Lease(lease.run_id, lease.unit, lease.worker_id, expires_at)
+
+    def complete(self, lease: Lease, metrics: list[EvalMetric]) -> bool:
+        """Record the metrics of a leased unit, returning False if the lease was lost."""
+        payload = json.dumps([serialize_metric(m) for m in metrics])
+        return self._update_lease(
+            lease, "state = 'done', lease_expires = NULL, metrics = ?", (payload,)
+        )
+
+    def reclaim_expired(self, run_id: str) -> int:
+        """Return units with expired leases to the queue."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE work_units SET state = 'pending', worker_id = NULL, lease_expires = NULL "
+                "WHERE run_id = ? AND state = 'leased' AND lease_expires < ?",
+                (run_id, time.time()),
+            )
+            return cursor.rowcount
+
+    def progress(self, run_id: str) -> tuple[int, int]:
+        """Get the (completed, total) number of units in a run."""
+        with self._connect() as conn:
+            completed, total = conn.execute(
+                "SELECT COALESCE(SUM(state = 'done'), 0), COUNT(*) FROM work_units "
+                "WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+            return completed, total
+
+    def results(self, run_id: str) -> list[EvalMetric]:
+        """Get the metrics of all completed units in a run, in enqueue order."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT metrics FROM work_units WHERE run_id = ? AND state = 'done' ORDER BY rowid",
+                (run_id,),
+            )
+            return [deserialize_metric(m) for (payload,) in rows for m in json.loads(payload)]
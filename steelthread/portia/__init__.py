@@ -1,8 +1,16 @@
-"""Contains implementations of portia specific logic for SteelThread."""
+"""Contains implementations of portia specific logic for SteelThread.
 
-from .portia import NoAuthPullPortia
-from .storage import ReadOnlyStorage
-from .tools import ToolStub, ToolStubContext, ToolStubRegistry
+Exports are imported lazily so the portia SDK is only loaded once a name is used.
+"""
+
+from typing import TYPE_CHECKING
+
+from steelthread.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .portia import NoAuthPullPortia
+    from .storage import ReadOnlyStorage
+    from .tools import ToolStub, ToolStubContext, ToolStubRegistry
 
 __all__ = [
     "NoAuthPullPortia",
@@ -11,3 +19,14 @@ __all__ = [
     "ToolStubContext",
     "ToolStubRegistry",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "NoAuthPullPortia": ".portia",
+        "ReadOnlyStorage": ".storage",
+        "ToolStub": ".tools",
+        "ToolStubContext": ".tools",
+        "ToolStubRegistry": ".tools",
+    },
+)
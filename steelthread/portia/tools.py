@@ -37,6 +37,8 @@ class ToolStub(Tool):
         child_tool (Tool | None): If set, the stub will defer to this tool for execution.
         return_callable (ToolResponseStub | None): A function used to return fake tool outputs.
         tool_calls (list[ToolCallRecord]): A record of all tool calls made to this stub.
+        on_call (Callable[[ToolCallRecord], None] | None): If set, called with the record of
+            each call, e.g. to log calls to several stubs in the order they are made.
 
     """
 
@@ -53,6 +55,11 @@ class ToolStub(Tool):
         description="A list of all the tool calls this tool has seen."
     )
     test_case_name: str = Field(description="The name of the test case.")
+    on_call: Callable[[ToolCallRecord], None] | None = Field(
+        default=None,
+        exclude=True,
+        description="A callable called with the record of each call to this tool.",
+    )
 
     def run(
         self,
@@ -115,6 +122,8 @@ class ToolStub(Tool):
             latency_seconds=0,
         )
         self.tool_calls.append(tc)
+        if self.on_call:
+            self.on_call(tc)
         return tool_output
 
 
@@ -127,6 +136,7 @@ class ToolStubRegistry(ToolRegistry):
     Attributes:
         stubs (dict[str, ToolResponseStub]): A mapping of tool IDs to response stubs.
         stubbed_tools (dict[str, ToolStub]): Cached stubbed tool instances.
+        call_log (list[ToolCallRecord]): Calls to any of the stubbed tools, in the order made.
 
     """
 
@@ -148,6 +158,7 @@ class ToolStubRegistry(ToolRegistry):
         self.stubs = stubs
         self.stubbed_tools: dict[str, ToolStub] = {}
         self.test_case_name = test_case_name or ""
+        self.call_log: list[ToolCallRecord] = []
 
     def get_tool_calls(self, tool_id: str | None = None) -> list[ToolCallRecord]:
         """Get recorded tool calls for a specific stubbed tool or all stubbed tools.
@@ -156,14 +167,11 @@ class ToolStubRegistry(ToolRegistry):
             tool_id (str | None): The tool ID to filter by, or None for all.
 
         Returns:
-            list[ToolCallRecord]: A list of tool call records.
+            list[ToolCallRecord]: A list of tool call records, in the order they were made.
 
         """
         if not tool_id:
-            all_calls = []
-            for tool_details in self.stubbed_tools.values():
-                all_calls.extend(tool_details.tool_calls)
-            return all_calls
+            return list(self.call_log)
         if tool_id in self.stubbed_tools:
             return self.stubbed_tools[tool_id].tool_calls
         return []
@@ -190,6 +198,7 @@ class ToolStubRegistry(ToolRegistry):
             # wrapping another ToolStubRegistry.
             tool_stub = tool.model_copy(deep=True)
             tool_stub.test_case_name = self.test_case_name
+            tool_stub.on_call = self.call_log.append
         elif tool_id in self.stubs:
             tool_stub = ToolStub(
                 id=tool.id,
@@ -201,6 +210,7 @@ class ToolStubRegistry(ToolRegistry):
                 return_callable=self.stubs[tool.id],
                 tool_calls=[],
                 test_case_name=self.test_case_name,
+                on_call=self.call_log.append,
             )
         else:
             tool_stub = ToolStub(
@@ -214,6 +224,7 @@ class ToolStubRegistry(ToolRegistry):
                 return_callable=None,
                 tool_calls=[],
                 test_case_name=self.test_case_name,
+                on_call=self.call_log.append,
             )
 
         self.stubbed_tools[tool_id] = tool_stub
@@ -3,7 +3,7 @@
 from portia import Portia
 
 from steelthread.evals import EvalConfig, EvalRunner
-from steelthread.streams import StreamConfig, StreamProcessor
+from steelthread.streams import MultiStreamProcessor, StreamConfig, StreamProcessor
 
 
 class SteelThread:
@@ -22,6 +22,18 @@ class SteelThread:
         """
         StreamProcessor(config).run()
 
+    @staticmethod
+    def process_streams(configs: list[StreamConfig], judge_rate_limit: float | None = None) -> None:
+        """Process the items of many streams, sharing workers between them fairly.
+
+        Args:
+            configs (list[StreamConfig]): Configurations for the streams.
+            judge_rate_limit (float | None): Maximum number of stream items judged per second
+                across every stream.
+
+        """
+        MultiStreamProcessor(configs, judge_rate_limit=judge_rate_limit).run()
+
     @staticmethod
     def run_evals(portia: Portia, config: EvalConfig) -> None:
         """Run evaluations using Portia and the provided configuration.
@@ -1,24 +1,39 @@
-"""Contains implementations of streams for SteelThread."""
+"""Contains implementations of streams for SteelThread.
 
-from .backend import PortiaStreamBackend
-from .evaluator import StreamEvaluator
-from .llm_as_judge import LLMJudgeEvaluator
-from .metrics import (
-    PortiaStreamMetricsBackend,
-    StreamLogMetricBackend,
-    StreamMetric,
-    StreamMetricsBackend,
-)
-from .models import PlanRunStreamItem, PlanStreamItem, Stream, StreamSource
-from .stream_processor import StreamConfig, StreamProcessor
-from .tags import StreamMetricTagger
+Exports are imported lazily so `import steelthread.streams` stays cheap until a name is used.
+"""
+
+from typing import TYPE_CHECKING
+
+from steelthread.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .backend import PortiaStreamBackend
+    from .evaluator import StreamEvaluator
+    from .llm_as_judge import LLMJudgeEvaluator
+    from .metrics import (
+        ArrowStreamMetricsBackend,
+        PortiaStreamMetricsBackend,
+        SQLiteStreamMetricsBackend,
+        StreamLogMetricBackend,
+        StreamMetric,
+        StreamMetricsBackend,
+    )
+    from .models import PlanRunStreamItem, PlanStreamItem, Stream, StreamSource
+    from .sampling import StreamSampling
+    from .scheduler import StreamThroughput
+    from .stream_processor import MultiStreamProcessor, StreamConfig, StreamProcessor
+    from .tags import StreamMetricTagger
 
 __all__ = [
+    "ArrowStreamMetricsBackend",
     "LLMJudgeEvaluator",
+    "MultiStreamProcessor",
     "PlanRunStreamItem",
     "PlanStreamItem",
     "PortiaStreamBackend",
     "PortiaStreamMetricsBackend",
+    "SQLiteStreamMetricsBackend",
     "Stream",
     "StreamConfig",
     "StreamEvaluator",
@@ -27,5 +42,32 @@ __all__ = [
     "StreamMetricTagger",
     "StreamMetricsBackend",
     "StreamProcessor",
+    "StreamSampling",
     "StreamSource",
+    "StreamThroughput",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ArrowStreamMetricsBackend": ".metrics",
+        "LLMJudgeEvaluator": ".llm_as_judge",
+        "MultiStreamProcessor": ".stream_processor",
+        "PlanRunStreamItem": ".models",
+        "PlanStreamItem": ".models",
+        "PortiaStreamBackend": ".backend",
+        "PortiaStreamMetricsBackend": ".metrics",
+        "SQLiteStreamMetricsBackend": ".metrics",
+        "Stream": ".models",
+        "StreamConfig": ".stream_processor",
+        "StreamEvaluator": ".evaluator",
+        "StreamLogMetricBackend": ".metrics",
+        "StreamMetric": ".metrics",
+        "StreamMetricTagger": ".tags",
+        "StreamMetricsBackend": ".metrics",
+        "StreamProcessor": ".stream_processor",
+        "StreamSampling": ".sampling",
+        "StreamSource": ".models",
+        "StreamThroughput": ".scheduler",
+    },
+)
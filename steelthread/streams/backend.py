@@ -1,17 +1,16 @@
 """Backend for Portia evals."""
 
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Generic, NotRequired, TypeVar
+
 import httpx
-from portia import (
-    Config,
-    LocalDataValue,
-    Plan,
-    PlanRun,
-    PlanRunState,
-    PlanUUID,
-)
-from portia.plan_run import PlanRunOutputs, PlanRunUUID
+from portia import Config
 from portia.storage import PortiaCloudClient
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
+from typing_extensions import TypedDict
 
 from steelthread.streams.models import (
     PlanRunStreamItem,
@@ -19,6 +18,34 @@ from steelthread.streams.models import (
     Stream,
 )
 
+_T = TypeVar("_T")
+
+
+class _Page(TypedDict, Generic[_T]):
+    results: NotRequired[list[_T]]
+    current_page: NotRequired[int]
+    total_pages: NotRequired[int]
+
+
+# The plan and plan run payloads are kept as decoded JSON, stream items only build models
+# from them when they're used.
+class _PlanItem(TypedDict):
+    id: str
+    plan: dict[str, Any]
+
+
+class _PlanRunItem(TypedDict):
+    id: str
+    plan: dict[str, Any]
+    plan_run: dict[str, Any]
+
+
+DEFAULT_MARK_CONCURRENCY = 8
+
+# Validate whole pages straight from the response bytes.
+_PLAN_PAGE = TypeAdapter(_Page[_PlanItem])
+_PLAN_RUN_PAGE = TypeAdapter(_Page[_PlanRunItem])
+
 
 class PortiaStreamBackend(BaseModel):
     """Client interface for interacting with the Portia API for evaluations.
@@ -31,15 +58,23 @@ class PortiaStreamBackend(BaseModel):
     """
 
     config: Config
+    _client: httpx.Client | None = PrivateAttr(default=None)
+    _client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     def client(self) -> httpx.Client:
-        """Create an HTTP client for interacting with the Portia API.
+        """Get the HTTP client for interacting with the Portia API.
+
+        The client is created on first use and then reused, so its connections stay open
+        across calls and polls.
 
         Returns:
             httpx.Client: A configured HTTP client.
 
         """
-        return PortiaCloudClient(self.config).new_client(self.config)
+        with self._client_lock:
+            if self._client is None:
+                self._client = PortiaCloudClient(self.config).new_client(self.config)
+            return self._client
 
     def check_response(self, response: httpx.Response) -> None:
         """Validate the response from Portia API.
@@ -71,81 +106,50 @@ class PortiaStreamBackend(BaseModel):
         self.check_response(response)
         return Stream(**response.json())
 
-    def load_plan_stream_items(self, stream_id: str, batch_size: int) -> list[PlanStreamItem]:
-        """Load stream items from the Portia API with pagination."""
+    def _iter_results(self, stream_id: str, adapter: TypeAdapter[_Page[_T]]) -> Iterator[_T]:
+        """Iterate over the results of a stream, only loading each page when it's reached.
+
+        Pages are validated from their raw bytes.
+        """
         client = self.client()
         page = 1
         base_url = "/api/v0/evals/stream-items/?stream_id={stream_id}&page={page}"
-        test_cases = []
-
-        while page:
-            url = base_url.format(stream_id=stream_id, page=page)
-            response = client.get(url)
+        while True:
+            response = client.get(base_url.format(stream_id=stream_id, page=page))
             self.check_response(response)
-            data = response.json()
-            results = data.get("results", [])
-            if len(results) == 0:
-                return test_cases
-            for tc in results:
-                if len(test_cases) == batch_size:
-                    return test_cases
-                test_cases.append(
-                    PlanStreamItem(
-                        stream=stream_id,
-                        stream_item=tc["id"],
-                        plan=Plan(**tc["plan"]),
-                    )
-                )
-            if data["current_page"] != data["total_pages"]:
-                page += 1
-            else:
-                page = None
+            data = adapter.validate_json(response.content)
+            page_results = data.get("results", [])
+            if not page_results:
+                return
+            yield from page_results
+            if data.get("current_page") == data.get("total_pages"):
+                return
+            page += 1
+
+    def iter_plan_stream_items(self, stream_id: str) -> Iterator[PlanStreamItem]:
+        """Iterate over every stream item of a plan stream, loading pages as they're reached."""
+        for item in self._iter_results(stream_id, _PLAN_PAGE):
+            yield PlanStreamItem(stream=stream_id, stream_item=item["id"], raw_plan=item["plan"])
+
+    def iter_plan_run_stream_items(self, stream_id: str) -> Iterator[PlanRunStreamItem]:
+        """Iterate over every stream item of a plan run stream, loading pages as they're reached."""
+        for item in self._iter_results(stream_id, _PLAN_RUN_PAGE):
+            yield PlanRunStreamItem(
+                stream=stream_id,
+                stream_item=item["id"],
+                raw_plan=item["plan"],
+                raw_plan_run=item["plan_run"],
+            )
 
-        return test_cases
+    def load_plan_stream_items(self, stream_id: str, batch_size: int) -> list[PlanStreamItem]:
+        """Load stream items from the Portia API with pagination."""
+        return list(islice(self.iter_plan_stream_items(stream_id), batch_size))
 
     def load_plan_run_stream_items(
         self, stream_id: str, batch_size: int
     ) -> list[PlanRunStreamItem]:
         """Load stream items from the Portia API with pagination."""
-        client = self.client()
-        page = 1
-        base_url = "/api/v0/evals/stream-items/?stream_id={stream_id}&page={page}"
-        test_cases = []
-        while page:
-            url = base_url.format(stream_id=stream_id, page=page)
-            response = client.get(url)
-            self.check_response(response)
-            data = response.json()
-            results = data.get("results", [])
-            if len(results) == 0:
-                return test_cases
-            for tc in results:
-                if len(test_cases) == batch_size:
-                    return test_cases
-                test_cases.append(
-                    PlanRunStreamItem(
-                        stream=stream_id,
-                        stream_item=tc["id"],
-                        plan=Plan.from_response(tc["plan"]),
-                        plan_run=PlanRun(
-                            id=PlanRunUUID.from_string(tc["plan_run"]["id"]),
-                            plan_id=PlanUUID.from_string(tc["plan_run"]["plan"]["id"]),
-                            end_user_id=tc["plan_run"]["end_user"],
-                            current_step_index=tc["plan_run"]["current_step_index"],
-                            state=PlanRunState(tc["plan_run"]["state"]),
-                            outputs=PlanRunOutputs.model_validate(tc["plan_run"]["outputs"]),
-                            plan_run_inputs={
-                                key: LocalDataValue.model_validate(value)
-                                for key, value in tc["plan_run"]["plan_run_inputs"].items()
-                            },
-                        ),
-                    )
-                )
-            if data["current_page"] != data["total_pages"]:
-                page += 1
-            else:
-                page = None
-        return test_cases
+        return list(islice(self.iter_plan_run_stream_items(stream_id), batch_size))
 
     def mark_processed(self, item: PlanStreamItem | PlanRunStreamItem) -> None:
         """Mark a stream item as processed in the Portia API.
@@ -160,3 +164,37 @@ class PortiaStreamBackend(BaseModel):
             json={"processed": True, "id": str(item.stream_item)},
         )
         self.check_response(response)
+
+    def mark_many_processed(
+        self,
+        stream_items: Iterable[str],
+        max_concurrency: int = DEFAULT_MARK_CONCURRENCY,
+    ) -> list[str]:
+        """Mark many stream items as processed in the Portia API over a single client.
+
+        Up to `max_concurrency` requests are in flight at once. A failed request doesn't stop
+        the others, its item is returned instead so the caller can retry or report it.
+
+        Args:
+            stream_items (Iterable[str]): The ids of the stream items.
+            max_concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            list[str]: The ids of the stream items that couldn't be marked processed.
+
+        """
+        client = self.client()
+
+        def mark(stream_item: str) -> str | None:
+            try:
+                response = client.patch(
+                    url="/api/v0/evals/stream-items/",
+                    json={"processed": True, "id": str(stream_item)},
+                )
+                self.check_response(response)
+            except (httpx.HTTPError, ValueError):
+                return stream_item
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return [item for item in executor.map(mark, stream_items) if item is not None]
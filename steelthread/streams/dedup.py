@@ -0,0 +1,107 @@
+"""Deduplication of stream items with identical content."""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem
+
+StreamItemT = TypeVar("StreamItemT", PlanStreamItem, PlanRunStreamItem)
+
+# Fields that differ between otherwise identical plans and plan runs, e.g. when the same query
+# is planned again. They are dropped at any depth before hashing.
+VOLATILE_FIELDS = frozenset(
+    {
+        "id",
+        "plan_id",
+        "end_user",
+        "end_user_id",
+        "created_at",
+        "updated_at",
+        "timestamp",
+    }
+)
+
+
+def _strip_volatile(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, dict):
+        return {k: _strip_volatile(v) for k, v in value.items() if k not in VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def _payload(item: PlanStreamItem | PlanRunStreamItem) -> dict[str, Any]:
+    """Get the JSON content of an item, from its raw payloads when it has them."""
+    plan = item.raw_plan if item.raw_plan is not None else item.plan.model_dump(mode="json")
+    if isinstance(item, PlanStreamItem):
+        return {"plan": plan}
+    plan_run = (
+        item.raw_plan_run
+        if item.raw_plan_run is not None
+        else item.plan_run.model_dump(mode="json")
+    )
+    return {"plan": plan, "plan_run": plan_run}
+
+
+def content_hash(item: PlanStreamItem | PlanRunStreamItem) -> str:
+    """Get a hash of the content of a stream item, ignoring its ids and timestamps.
+
+    Args:
+        item (PlanStreamItem | PlanRunStreamItem): The stream item.
+
+    Returns:
+        str: A hex sha256 digest, equal for items that only differ in volatile fields.
+
+    """
+    canonical = json.dumps(
+        _strip_volatile(_payload(item)), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class DuplicateGroups(Generic[StreamItemT]):
+    """Stream items grouped by content, so each content is only evaluated once.
+
+    Attributes:
+        groups (list[list[StreamItemT]]): The items with the same content, in the order each
+            content was first seen. The first item of a group is evaluated for all of them.
+
+    """
+
+    groups: list[list[StreamItemT]]
+
+    @property
+    def items(self) -> int:
+        """The number of items."""
+        return sum(len(group) for group in self.groups)
+
+    @property
+    def ratio(self) -> float:
+        """The fraction of items that duplicate an earlier one and so aren't evaluated."""
+        items = self.items
+        return (items - len(self.groups)) / items if items else 0.0
+
+
+def group_duplicates(
+    items: Sequence[StreamItemT], *, deduplicate: bool = True
+) -> DuplicateGroups[StreamItemT]:
+    """Group stream items with the same content.
+
+    Args:
+        items (Sequence[StreamItemT]): The stream items.
+        deduplicate (bool): Whether to group duplicates. If not, every item is its own group.
+
+    Returns:
+        DuplicateGroups[StreamItemT]: The groups of items.
+
+    """
+    if not deduplicate:
+        return DuplicateGroups([[item] for item in items])
+    groups: dict[str, list[StreamItemT]] = {}
+    for item in items:
+        groups.setdefault(content_hash(item), []).append(item)
+    return DuplicateGroups(list(groups.values()))
@@ -1,14 +1,16 @@
 """Stream Metrics."""
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 
 import httpx
-import pandas as pd
 from portia import Config
 from portia.storage import PortiaCloudClient
 from pydantic import BaseModel, Field, field_validator
 
 from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem
+from steelthread.utils.arrow import ArrowPartitionedWriter
+from steelthread.utils.sqlite_store import DEFAULT_BATCH_SIZE, SQLiteMetricsStore
 
 MIN_EXPLANATION_LENGTH = 10
 
@@ -130,6 +132,9 @@ class StreamLogMetricBackend(StreamMetricsBackend):
             metrics (list[StreamMetric]): The metrics to log.
 
         """
+        # pandas is slow to import so only load it when this backend actually runs
+        import pandas as pd  # noqa: PLC0415
+
         flattened = [m.model_dump() for m in metrics]
 
         # Convert list of metrics to DataFrame
@@ -145,3 +150,42 @@ class StreamLogMetricBackend(StreamMetricsBackend):
         # Print
         print("\n=== Metric Averages by Stream Item ===")  # noqa: T201
         print(avg_scores.to_string(index=False))  # noqa: T201
+
+
+class ArrowStreamMetricsBackend(StreamMetricsBackend):
+    """Backend that appends stream metrics to a local Parquet dataset.
+
+    Files are partitioned as `stream=<stream>/date=<date>/` with tags stored as dictionary
+    encoded `tag_<key>` columns. Requires the `arrow` extra.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Init the backend.
+
+        Args:
+            path (str | Path): Root directory of the metrics dataset.
+
+        """
+        self.writer = ArrowPartitionedWriter(path, partition_by=["stream"])
+
+    def save_metrics(self, metrics: list[StreamMetric]) -> None:
+        """Append metrics as new files in their partitions."""
+        self.writer.write(m.model_dump(mode="json") for m in metrics)
+
+
+class SQLiteStreamMetricsBackend(StreamMetricsBackend):
+    """Backend that saves stream metrics to a local, indexed SQLite database."""
+
+    def __init__(self, path: str | Path, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """Init the backend.
+
+        Args:
+            path (str | Path): The SQLite database file.
+            batch_size (int): Maximum number of metrics inserted per transaction.
+
+        """
+        self.store = SQLiteMetricsStore(path, batch_size=batch_size)
+
+    def save_metrics(self, metrics: list[StreamMetric]) -> None:
+        """Insert metrics in batched transactions."""
+        self.store.add_stream_metrics(metrics)
@@ -4,7 +4,7 @@ import enum
 from typing import Any
 
 from portia import Plan, PlanRun
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class StreamSource(enum.Enum):
@@ -34,36 +34,104 @@ class Stream(BaseModel):
     last_sampled: str
 
 
+def _plan_run_fields(payload: dict[str, Any]) -> dict[str, Any]:
+    """Map a plan run as the API returns it onto the fields of a PlanRun."""
+    return {
+        "id": payload["id"],
+        "plan_id": payload["plan"]["id"],
+        "end_user_id": payload["end_user"],
+        "current_step_index": payload["current_step_index"],
+        "state": payload["state"],
+        "outputs": payload["outputs"],
+        "plan_run_inputs": payload["plan_run_inputs"],
+    }
+
+
 class PlanStreamItem(BaseModel):
     """Definition of a StreamItem.
 
-    Represents a stream item containing both a plan only.
+    Represents a stream item containing both a plan only. Items loaded from the API keep the
+    plan's raw JSON payload and only build the `Plan` the first time it's used.
 
     Attributes:
-         id (str): Unique identifier for the test case.
-         plan (Plan): The plan from the StreamItem
-         plan_run (PlanRun | None): The plan_run from the StreamItem
+        stream (str): The id of the stream.
+        stream_item (str): The id of the stream item.
+        raw_plan (dict[str, Any] | None): The plan's JSON payload as loaded from the API.
+        plan (Plan): The plan from the StreamItem, built from the raw payload on first use.
 
     """
 
     stream: str
     stream_item: str
-    plan: Plan
+    raw_plan: dict[str, Any] | None = Field(default=None, repr=False)
+    _plan: Plan | None = PrivateAttr(default=None)
+
+    def __init__(self, plan: Plan | None = None, **data: Any) -> None:
+        """Initialize the item from a plan, or from its raw payload with `raw_plan`."""
+        super().__init__(**data)
+        self._plan = plan
+
+    @property
+    def plan(self) -> Plan:
+        """The plan, built from the raw payload on first use."""
+        if self._plan is None:
+            if self.raw_plan is None:
+                raise ValueError(f"stream item {self.stream_item} has no plan")
+            self._plan = Plan.model_validate(self.raw_plan)
+        return self._plan
 
 
 class PlanRunStreamItem(BaseModel):
     """Definition of a PlanRunStreamItem.
 
-    Represents a stream item containing both a plan + plan_run.
+    Represents a stream item containing both a plan + plan_run. Items loaded from the API
+    keep the raw JSON payloads and only build the `Plan` and `PlanRun` the first time each is
+    used.
 
     Attributes:
-        id (str): Unique identifier for the test case.
-        plan (Plan): The plan from the StreamItem
-        plan_run (PlanRun): The plan_run from the StreamItem
+        stream (str): The id of the stream.
+        stream_item (str): The id of the stream item.
+        raw_plan (dict[str, Any] | None): The plan's JSON payload as loaded from the API.
+        raw_plan_run (dict[str, Any] | None): The plan run's JSON payload as loaded from the
+            API.
+        plan (Plan): The plan from the StreamItem, built from the raw payload on first use.
+        plan_run (PlanRun): The plan_run from the StreamItem, built from the raw payload on
+            first use.
 
     """
 
     stream: str
     stream_item: str
-    plan: Plan
-    plan_run: PlanRun
+    raw_plan: dict[str, Any] | None = Field(default=None, repr=False)
+    raw_plan_run: dict[str, Any] | None = Field(default=None, repr=False)
+    _plan: Plan | None = PrivateAttr(default=None)
+    _plan_run: PlanRun | None = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        plan: Plan | None = None,
+        plan_run: PlanRun | None = None,
+        **data: Any,
+    ) -> None:
+        """Initialize the item from a plan and plan run, or from their raw payloads."""
+        super().__init__(**data)
+        self._plan = plan
+        self._plan_run = plan_run
+
+    @property
+    def plan(self) -> Plan:
+        """The plan, built from the raw payload on first use."""
+        if self._plan is None:
+            if self.raw_plan is None:
+                raise ValueError(f"stream item {self.stream_item} has no plan")
+            self._plan = Plan.from_response(self.raw_plan)
+        return self._plan
+
+    @property
+    def plan_run(self) -> PlanRun:
+        """The plan run, built from the raw payload on first use."""
+        if self._plan_run is None:
+            if self.raw_plan_run is None:
+                raise ValueError(f"stream item {self.stream_item} has no plan run")
+            self._plan_run = PlanRun.model_validate(_plan_run_fields(self.raw_plan_run))
+        return self._plan_run
@@ -0,0 +1,288 @@
+"""Budgeted sampling of stream items."""
+
+import heapq
+import itertools
+import json
+import math
+import random
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, Literal
+
+from pydantic import BaseModel
+
+from steelthread.streams.dedup import StreamItemT
+from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem
+
+StreamItem = PlanStreamItem | PlanRunStreamItem
+
+# Characters per token when estimating what it costs to judge an item.
+CHARS_PER_TOKEN = 4
+
+
+def plan_run_state(item: StreamItem) -> str:
+    """Get the state of an item's plan run, or "plan" for items without one."""
+    if isinstance(item, PlanStreamItem):
+        return "plan"
+    if item.raw_plan_run is not None:
+        return str(item.raw_plan_run.get("state"))
+    return item.plan_run.state.value
+
+
+def end_user(item: StreamItem) -> str | None:
+    """Get the end user of an item's plan run, or None for items without one."""
+    if isinstance(item, PlanStreamItem):
+        return None
+    if item.raw_plan_run is not None:
+        return item.raw_plan_run.get("end_user")
+    return item.plan_run.end_user_id
+
+
+def tools_used(item: StreamItem) -> tuple[str, ...]:
+    """Get the ids of the tools used by the steps of an item's plan, sorted."""
+    if item.raw_plan is not None:
+        steps: list[Any] = item.raw_plan.get("steps") or []
+        tools = {step.get("tool_id") for step in steps if isinstance(step, dict)}
+    else:
+        tools = {step.tool_id for step in item.plan.steps}
+    return tuple(sorted(tool for tool in tools if tool))
+
+
+def _json_chars(raw: dict[str, Any] | None, build: Callable[[], BaseModel]) -> int:
+    """Get the length of a payload as JSON, from its raw payload if it has one."""
+    return len(json.dumps(raw)) if raw is not None else len(build().model_dump_json())
+
+
+def judge_tokens(item: StreamItem) -> float:
+    """Estimate the tokens of the plan and plan run an LLM judge reads for an item.
+
+    Raw payloads are measured without building the plan and plan run, their JSON is about
+    as long as what the judge reads.
+    """
+    chars = _json_chars(item.raw_plan, lambda: item.plan)
+    if isinstance(item, PlanRunStreamItem):
+        chars += _json_chars(item.raw_plan_run, lambda: item.plan_run)
+    return chars / CHARS_PER_TOKEN
+
+
+STRATA: dict[str, Callable[[StreamItem], Hashable]] = {
+    "state": plan_run_state,
+    "end_user": end_user,
+    "tools": tools_used,
+}
+
+
+class StreamSampling:
+    """Policy for sampling a stream backlog that is larger than can be evaluated.
+
+    Every item of the backlog is read and a uniform random sample that fits the budget is
+    kept. With `stratify_by` the budget is split across strata in proportion to their sizes,
+    so each stratum is represented as it is in the backlog, and budget a stratum can't use
+    goes to the others. Items that aren't sampled are acknowledged without being evaluated.
+
+    Attributes:
+        max_items (int | None): Most items to evaluate.
+        max_cost (float | None): Most total cost of the items to evaluate.
+        cost (Callable[[StreamItem], float]): Estimates the cost of evaluating an item.
+        stratify_by (Callable[[StreamItem], Hashable] | None): Gets the stratum of an item.
+        seed (int | None): Seed of the random sample, for reproducible runs.
+
+    """
+
+    def __init__(
+        self,
+        max_items: int | None = None,
+        max_cost: float | None = None,
+        cost: Callable[[StreamItem], float] | None = None,
+        stratify_by: Literal["state", "end_user", "tools"]
+        | Callable[[StreamItem], Hashable]
+        | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            max_items (int | None): Most items to evaluate.
+            max_cost (float | None): Most total cost of the items to evaluate. Items that
+                cost more than this on their own are never sampled.
+            cost (Callable[[StreamItem], float] | None): Estimates the cost of evaluating an
+                item. Defaults to the estimated tokens a judge reads, see `judge_tokens`.
+            stratify_by (str | Callable[[StreamItem], Hashable] | None): Gets the stratum of
+                an item, either one of "state" (plan run state), "end_user" or "tools" (the
+                tools its plan uses), or a function of the item.
+            seed (int | None): Seed of the random sample, for reproducible runs.
+
+        """
+        if max_items is None and max_cost is None:
+            raise ValueError("sampling needs max_items or max_cost")
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        if max_cost is not None and max_cost <= 0:
+            raise ValueError("max_cost must be positive")
+        if isinstance(stratify_by, str) and stratify_by not in STRATA:
+            raise ValueError(f"unknown stratify_by {stratify_by!r}, use one of {sorted(STRATA)}")
+        self.max_items = max_items
+        self.max_cost = max_cost
+        self.cost = cost or judge_tokens
+        self.stratify_by = STRATA[stratify_by] if isinstance(stratify_by, str) else stratify_by
+        self.seed = seed
+
+
+class _Stratum(Generic[StreamItemT]):
+    """The items of a stratum with the smallest random keys that fit in the budget.
+
+    The kept items are always a prefix of the stratum's items ordered by key, so any prefix
+    of them is a uniform sample too, which is how the final sample is cut down to the
+    stratum's share of the budget.
+    """
+
+    def __init__(self, max_items: float, max_cost: float) -> None:
+        self.max_items = max_items
+        self.max_cost = max_cost
+        self.size = 0
+        self.cost = 0.0
+        self.cutoff = math.inf
+        self._heap: list[tuple[float, int, float, StreamItemT]] = []
+
+    def offer(self, key: float, order: int, cost: float, item: StreamItemT) -> list[StreamItemT]:
+        """Offer an item, returning the items that can no longer be sampled."""
+        self.size += 1
+        if cost > self.max_cost or key >= self.cutoff:
+            return [item]
+        # a max heap on key, so the first item to drop is on top
+        heapq.heappush(self._heap, (-key, order, cost, item))
+        self.cost += cost
+        skipped = []
+        while len(self._heap) > self.max_items or self.cost > self.max_cost:
+            neg_key, _, dropped_cost, dropped = heapq.heappop(self._heap)
+            self.cost -= dropped_cost
+            self.cutoff = min(self.cutoff, -neg_key)
+            skipped.append(dropped)
+        return skipped
+
+    def ordered(self) -> list[tuple[float, int, float, StreamItemT]]:
+        """Get the kept items as (key, order, cost, item), ascending on the key."""
+        return [
+            (-neg_key, order, cost, item)
+            for neg_key, order, cost, item in sorted(self._heap, reverse=True)
+        ]
+
+
+class StreamSampler(Generic[StreamItemT]):
+    """Samples stream items as they are read, following a `StreamSampling` policy.
+
+    Memory is bounded by the budget per stratum rather than by the size of the backlog.
+
+    Attributes:
+        policy (StreamSampling): The sampling policy.
+        offered (int): The number of items offered so far.
+
+    """
+
+    def __init__(self, policy: StreamSampling) -> None:
+        """Initialize the sampler.
+
+        Args:
+            policy (StreamSampling): The sampling policy.
+
+        """
+        self.policy = policy
+        self.offered = 0
+        self._random = random.Random(policy.seed)  # noqa: S311
+        self._order = itertools.count()
+        self._strata: dict[Hashable, _Stratum[StreamItemT]] = {}
+
+    @property
+    def _max_items(self) -> float:
+        return math.inf if self.policy.max_items is None else self.policy.max_items
+
+    @property
+    def _max_cost(self) -> float:
+        return math.inf if self.policy.max_cost is None else self.policy.max_cost
+
+    def offer(self, item: StreamItemT) -> list[StreamItemT]:
+        """Offer an item to the sample.
+
+        Args:
+            item (StreamItemT): The item.
+
+        Returns:
+            list[StreamItemT]: The items that are now certain not to be sampled, possibly
+                including this one.
+
+        """
+        self.offered += 1
+        key = self.policy.stratify_by(item) if self.policy.stratify_by else None
+        stratum = self._strata.get(key)
+        if stratum is None:
+            stratum = self._strata[key] = _Stratum(self._max_items, self._max_cost)
+        cost = self.policy.cost(item) if self.policy.max_cost is not None else 0.0
+        return stratum.offer(self._random.random(), next(self._order), cost, item)
+
+    def _item_shares(self) -> dict[Hashable, float]:
+        """Split the item budget across strata in proportion to their sizes."""
+        if self.policy.max_items is None or not self.offered:
+            return dict.fromkeys(self._strata, math.inf)
+        exact = {k: self.policy.max_items * s.size / self.offered for k, s in self._strata.items()}
+        shares: dict[Hashable, float] = {k: math.floor(v) for k, v in exact.items()}
+        # hand out what rounding down left over to the strata that lost the most
+        left = self.policy.max_items - int(sum(shares.values()))
+        for k in sorted(exact, key=lambda k: shares[k] - exact[k])[:left]:
+            shares[k] += 1
+        return shares
+
+    def finish(self) -> tuple[list[StreamItemT], list[StreamItemT]]:
+        """Get the sample once every item was offered.
+
+        Each stratum first takes what fits its share of the budget. Budget left over, e.g.
+        by strata whose share is too small for a single item, is then handed out one item
+        per stratum at a time, least sampled strata first, so many small strata don't leave
+        the budget unused.
+
+        Returns:
+            tuple[list[StreamItemT], list[StreamItemT]]: The sampled items, in the order they
+                were offered, and the kept items that didn't make the final sample.
+
+        """
+        item_shares = self._item_shares()
+        kept = {key: stratum.ordered() for key, stratum in self._strata.items()}
+        taken = dict.fromkeys(self._strata, 0)
+        items, cost = 0, 0.0
+
+        def fits(key: Hashable, max_items: float, max_cost: float) -> bool:
+            return (
+                taken[key] < len(kept[key])
+                and items < max_items
+                and cost + kept[key][taken[key]][2] <= max_cost
+            )
+
+        for key, stratum in self._strata.items():
+            cost_share = self._max_cost * stratum.size / self.offered
+            stratum_cost = 0.0
+            while taken[key] < item_shares[key] and fits(key, self._max_items, math.inf):
+                item_cost = kept[key][taken[key]][2]
+                if stratum_cost + item_cost > cost_share:
+                    break
+                stratum_cost += item_cost
+                cost += item_cost
+                taken[key] += 1
+                items += 1
+
+        while True:
+            # least sampled strata first, ties broken by the random key of their next item
+            waiting = sorted(
+                (k for k in kept if fits(k, self._max_items, self._max_cost)),
+                key=lambda k: (taken[k] / self._strata[k].size, kept[k][taken[k]][0]),
+            )
+            if not waiting:
+                break
+            for key in waiting:
+                if fits(key, self._max_items, self._max_cost):
+                    cost += kept[key][taken[key]][2]
+                    taken[key] += 1
+                    items += 1
+
+        sampled = sorted(
+            (order, item) for key in kept for _, order, _, item in kept[key][: taken[key]]
+        )
+        skipped = [item for key in kept for *_, item in kept[key][taken[key] :]]
+        return [item for _, item in sampled], skipped
@@ -0,0 +1,99 @@
+"""Fair scheduling of stream items across several streams."""
+
+import heapq
+import itertools
+from collections import Counter
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class FairQueue(Generic[T]):
+    """Weighted fair queue of work from several streams.
+
+    Each piece of work gets a virtual finish time: the later of the queue's virtual time and
+    the finish time of the stream's previous piece, plus its cost divided by the stream's
+    weight. Work is popped in order of finish time, so a stream with a large backlog gets its
+    weighted share of pops rather than all of them, and a stream that was idle joins at the
+    current virtual time rather than catching up on the time it was idle.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._heap: list[tuple[float, int, float, str, T]] = []
+        self._order = itertools.count()
+        self._virtual_time = 0.0
+        self._finish: dict[str, float] = {}
+        self._backlog: Counter[str] = Counter()
+
+    def push(self, stream: str, item: T, weight: float = 1.0, cost: float = 1.0) -> None:
+        """Queue a piece of work.
+
+        Args:
+            stream (str): The stream the work is from.
+            item (T): The work.
+            weight (float): The stream's share relative to other streams.
+            cost (float): The cost of the work, e.g. the number of judge calls it makes.
+
+        """
+        if weight <= 0:
+            raise ValueError(f"weight must be positive, got {weight}")
+        start = max(self._virtual_time, self._finish.get(stream, 0.0))
+        finish = self._finish[stream] = start + cost / weight
+        heapq.heappush(self._heap, (finish, next(self._order), start, stream, item))
+        self._backlog[stream] += 1
+
+    def pop(self) -> tuple[str, T]:
+        """Take the piece of work with the earliest virtual finish time.
+
+        Returns:
+            tuple[str, T]: The stream the work is from and the work.
+
+        """
+        _, _, start, stream, item = heapq.heappop(self._heap)
+        self._virtual_time = max(self._virtual_time, start)
+        self._backlog[stream] -= 1
+        return stream, item
+
+    def backlog(self, stream: str) -> int:
+        """Get the number of pieces of work of a stream still queued."""
+        return self._backlog[stream]
+
+    def __len__(self) -> int:
+        """Get the number of pieces of work queued."""
+        return len(self._heap)
+
+
+@dataclass(frozen=True)
+class StreamThroughput:
+    """How much of a stream a multi-stream processor got through.
+
+    Attributes:
+        stream (str): The name of the stream.
+        weight (float): The stream's share of the workers.
+        items (int): The number of stream items evaluated.
+        backlog (int): The number of stream items loaded but not evaluated yet.
+        seconds (float): The time the items were evaluated over.
+
+    """
+
+    stream: str
+    weight: float
+    items: int
+    backlog: int
+    seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        """Get the stream items evaluated per second."""
+        if self.seconds <= 0:
+            return 0.0
+        return self.items / self.seconds
+
+    def __str__(self) -> str:
+        """Summarize the throughput."""
+        return (
+            f"Stream {self.stream}: {self.items} items at {self.items_per_second:.1f}/s "
+            f"(weight {self.weight:g}), {self.backlog} waiting"
+        )
@@ -1,13 +1,22 @@
 """Stream Processor for steel thread."""
 
+import signal
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-from portia import Config
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+
+from portia import Config, logger
 from portia.portia import PortiaCloudStorage
 
 from steelthread.streams.backend import PortiaStreamBackend
+from steelthread.streams.dedup import StreamItemT, group_duplicates
 from steelthread.streams.evaluator import StreamEvaluator
 from steelthread.streams.llm_as_judge import LLMJudgeEvaluator
 from steelthread.streams.metrics import (
@@ -17,7 +26,15 @@ from steelthread.streams.metrics import (
     StreamMetricsBackend,
 )
 from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem, Stream, StreamSource
+from steelthread.streams.sampling import StreamSampler, StreamSampling
+from steelthread.streams.scheduler import FairQueue, StreamThroughput
 from steelthread.streams.tags import StreamMetricTagger
+from steelthread.streams.watermark import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_WATERMARK_SIZE,
+    StreamWatermark,
+)
+from steelthread.utils.concurrency import RateLimiter
 from steelthread.utils.timing import EventTimer
 
 
@@ -33,6 +50,11 @@ class StreamConfig:
         metrics_backends (list[MetricsBackend]): Output destinations for metrics.
         max_concurrency (int | None): Maximum number of concurrent tests to run.
         batch_size (int | None): Maximum number of items to process.
+        deduplicate (bool): Evaluate items with the same content once, copying the metrics
+            to the duplicates.
+        sampling (StreamSampling | None): If set, replaces batch_size with a random sample
+            of the whole backlog that fits a budget.
+        weight (float): The stream's share of the workers of a `MultiStreamProcessor`.
 
     """
 
@@ -45,6 +67,9 @@ class StreamConfig:
         metrics_backends: list[StreamMetricsBackend] | None = None,
         max_concurrency: int | None = None,
         batch_size: int | None = None,
+        deduplicate: bool = True,
+        sampling: StreamSampling | None = None,
+        weight: float = 1.0,
     ) -> None:
         """Initialize the evaluation configuration.
 
@@ -56,8 +81,17 @@ class StreamConfig:
             metrics_backends (list[MetricsBackend] | None): Metric writers.
             max_concurrency (int | None): Maximum number of concurrent tests to run.
             batch_size (int | None): Number of items to process.
+            deduplicate (bool): Evaluate items whose content only differs in ids and
+                timestamps once, copying the metrics to every duplicate.
+            sampling (StreamSampling | None): Rather than the first batch_size items, read
+                the whole backlog and evaluate a random sample of it that fits the budget,
+                optionally stratified. The other items are marked processed unevaluated.
+            weight (float): When processed by a `MultiStreamProcessor` alongside other
+                streams, the stream's share of the workers relative to theirs.
 
         """
+        if weight <= 0:
+            raise ValueError(f"weight must be positive, got {weight}")
         config.must_get_api_key("portia_api_key")
         self.stream_name = stream_name
         self.portia_config = config
@@ -69,21 +103,68 @@ class StreamConfig:
         ]
         self.max_concurrency = max_concurrency or 5
         self.batch_size = batch_size or sys.maxsize
+        self.deduplicate = deduplicate
+        self.sampling = sampling
+        self.weight = weight
+
+
+@dataclass(frozen=True)
+class StreamWork:
+    """Stream items with the same content, evaluated together.
+
+    Attributes:
+        items (int): The number of stream items.
+        evaluate (Callable[[EventTimer], list[StreamMetric] | None]): Evaluates the items,
+            marks them processed and returns their metrics, or None if they were left
+            unprocessed because evaluating them failed or the processor is stopping.
+
+    """
+
+    items: int
+    evaluate: Callable[[EventTimer], list[StreamMetric] | None]
+
+
+def _handle_signals(stop: Callable[[], None]) -> Callable[[], None]:
+    """Stop on SIGTERM and SIGINT, returning a function restoring the previous handlers."""
+    if threading.current_thread() is not threading.main_thread():
+        return lambda: None
+    previous = {
+        signum: signal.signal(signum, lambda *_: stop())
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+
+    def restore() -> None:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+    return restore
+
+
+def _check_intervals(min_interval: float, max_interval: float) -> None:
+    if min_interval <= 0 or max_interval < min_interval:
+        raise ValueError("intervals must be positive with min_interval <= max_interval")
 
 
 class StreamProcessor:
     """Runner for executing stream evaluation test cases and collecting metrics."""
 
-    def __init__(self, config: StreamConfig) -> None:
+    def __init__(self, config: StreamConfig, backend: PortiaStreamBackend | None = None) -> None:
         """Initialize the runner.
 
         Args:
             config (StreamConfig): The configuration for the stream.
+            backend (PortiaStreamBackend | None): The backend to load the stream from, e.g. to
+                share its connections with other processors. Created from the config if not
+                given.
 
         """
         self.config = config
-        self.backend = PortiaStreamBackend(config=config.portia_config)
+        self.backend = backend or PortiaStreamBackend(config=config.portia_config)
         self.storage = PortiaCloudStorage(config.portia_config)
+        # the items already taken, while running continuously
+        self.watermark: StreamWatermark | None = None
+        self._stop = threading.Event()
+        self._executor: ThreadPoolExecutor | None = None
 
     def run(self) -> None:
         """Execute all test cases in the configured dataset and save metrics.
@@ -94,45 +175,281 @@ class StreamProcessor:
         - Marks cases as processed and writes metrics to backends.
         """
         stream = self.backend.get_stream(self.config.stream_name)
+        self._run_cycle(stream)
+
+    def run_forever(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        watermark_size: int = DEFAULT_WATERMARK_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        """Keep processing new stream items as they arrive, until stopped.
+
+        The stream is polled again straight after a poll that evaluated items, and otherwise
+        after an interval that doubles from `min_interval` up to `max_interval` while the
+        stream is empty or only has items that fail. The backend's client, the evaluators
+        and the worker threads are kept across polls. Items already taken are tracked by a
+        watermark so they aren't evaluated again while they're still listed. Items whose
+        evaluation fails are retried up to `max_attempts` times.
+
+        Stops on SIGTERM or SIGINT (when run on the main thread) or `stop()`, after the items
+        being evaluated finish. Items not started yet are left for the next run.
+
+        Args:
+            min_interval (float): Seconds to wait after the first empty poll.
+            max_interval (float): Most seconds to wait between polls.
+            watermark_size (int): Most item ids the watermark remembers.
+            max_attempts (int): Most times an item is evaluated before it's no longer retried.
+
+        """
+        _check_intervals(min_interval, max_interval)
+        stream = self.get_stream()
+        self._stop.clear()
+        self.watermark = StreamWatermark(watermark_size, max_attempts)
+        restore = _handle_signals(self.stop)
+        interval = min_interval
+        try:
+            with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+                self._executor = executor
+                while not self._stop.is_set():
+                    try:
+                        evaluated = self._run_cycle(stream)
+                    except Exception:  # noqa: BLE001
+                        logger().exception("Processing the stream failed, retrying after a pause")
+                        evaluated = 0
+                    if evaluated:
+                        interval = min_interval
+                        continue
+                    self._stop.wait(interval)
+                    interval = min(interval * 2, max_interval)
+        finally:
+            self._executor = None
+            self.watermark = None
+            restore()
+        logger().info("Stopped processing the stream")
+
+    def stop(self) -> None:
+        """Ask `run_forever` to stop once the items being evaluated finish."""
+        self._stop.set()
+
+    def get_stream(self) -> Stream:
+        """Get the stream, checking its source is one that can be processed.
+
+        Returns:
+            Stream: Information on the stream.
+
+        """
+        stream = self.backend.get_stream(self.config.stream_name)
+        if stream.source not in (StreamSource.PLAN, StreamSource.PLAN_RUN):
+            raise ValueError("invalid source")
+        return stream
+
+    def _run_cycle(self, stream: Stream) -> int:
+        """Process the items waiting in the stream, returning how many were evaluated."""
+        return self._process_work(self.load_work(stream))
+
+    def load_work(self, stream: Stream) -> list[StreamWork]:
+        """Load the items waiting in the stream, grouped into the work evaluating them.
+
+        Args:
+            stream (Stream): The stream.
+
+        Returns:
+            list[StreamWork]: The work, one per distinct content among the items.
+
+        """
         if stream.source == StreamSource.PLAN:
-            return self._process_plan(stream)
+            items = self._load_items(
+                stream,
+                self.backend.load_plan_stream_items,
+                self.backend.iter_plan_stream_items,
+            )
+            return self._group_work(items, self._evaluate_plan_stream_item)
         if stream.source == StreamSource.PLAN_RUN:
-            return self._process_plan_runs(stream)
+            run_items = self._load_items(
+                stream,
+                self.backend.load_plan_run_stream_items,
+                self.backend.iter_plan_run_stream_items,
+            )
+            return self._group_work(run_items, self._evaluate_plan_run_stream_item)
 
         raise ValueError("invalid source")
 
-    def _process_plan(self, stream: Stream) -> None:
-        items = self.backend.load_plan_stream_items(
-            stream.id,
-            self.config.batch_size,
+    def _load_items(
+        self,
+        stream: Stream,
+        load: Callable[[str, int], list[StreamItemT]],
+        iterate: Callable[[str], Iterator[StreamItemT]],
+    ) -> list[StreamItemT]:
+        """Load the items to evaluate, sampling the whole backlog if configured to.
+
+        Items past the watermark of a long running processor are skipped. Items left out of
+        the sample are marked processed together once every page was read, as marking them
+        while paging could shift the pages still to be read.
+        """
+        watermark = self.watermark
+        if self.config.sampling is None and watermark is None:
+            return load(stream.id, self.config.batch_size)
+        items = iterate(stream.id)
+        if watermark is not None:
+            items = (item for item in items if item.stream_item not in watermark)
+        if self.config.sampling is None:
+            taken = list(islice(items, self.config.batch_size))
+        else:
+            taken = self._sample(items, self.config.sampling)
+        if watermark is not None:
+            watermark.update(item.stream_item for item in taken)
+        return taken
+
+    def _sample(self, items: Iterator[StreamItemT], sampling: StreamSampling) -> list[StreamItemT]:
+        """Sample the items, marking the ones left out processed."""
+        sampler: StreamSampler[StreamItemT] = StreamSampler(sampling)
+        skipped = [item.stream_item for it in items for item in sampler.offer(it)]
+        sample, rest = sampler.finish()
+        skipped.extend(item.stream_item for item in rest)
+        logger().info(
+            f"Sampled {len(sample)} of {sampler.offered} stream items, "
+            f"acknowledging {len(skipped)} without evaluating them"
         )
+        failed = self.backend.mark_many_processed(skipped)
+        if failed:
+            logger().warning(
+                f"Failed to acknowledge {len(failed)} skipped stream items, "
+                "they will be offered again"
+            )
+        return sample
 
-        progress = EventTimer(total_events=len(items))
+    def _group_work(
+        self,
+        items: Sequence[StreamItemT],
+        evaluate: Callable[[StreamItemT, EventTimer], list[StreamMetric]],
+    ) -> list[StreamWork]:
+        """Group the items so each distinct content among them is evaluated once."""
+        duplicates = group_duplicates(items, deduplicate=self.config.deduplicate)
+        if self.config.deduplicate:
+            logger().info(
+                f"Deduplicated {duplicates.items} stream items to {len(duplicates.groups)} "
+                f"unique ({duplicates.ratio:.0%} duplicates)"
+            )
+        return [
+            StreamWork(len(group), partial(self._evaluate_group, group, evaluate))
+            for group in duplicates.groups
+        ]
+
+    def _process_work(self, work: Sequence[StreamWork]) -> int:
+        """Evaluate the work and save the metrics, returning how many items were evaluated."""
+        progress = EventTimer(total_events=len(work))
 
         all_metrics: list[StreamMetric] = []
+        evaluated = 0
 
-        futures = []
-        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
-            futures.extend(
-                executor.submit(self._evaluate_plan_stream_item, item, progress) for item in items
-            )
+        with self._pool() as executor:
+            futures = {executor.submit(w.evaluate, progress): w.items for w in work}
 
             for future in as_completed(futures):
-                result: list[StreamMetric] | StreamMetric | None = future.result()
-                if result:
-                    all_metrics.extend(result) if isinstance(result, list) else all_metrics.append(
-                        result
-                    )
+                metrics = future.result()
+                if metrics is not None:
+                    all_metrics.extend(metrics)
+                    evaluated += futures[future]
+
+        self.save_metrics(all_metrics)
+        return evaluated
+
+    def save_metrics(self, metrics: list[StreamMetric]) -> None:
+        """Write metrics to the configured backends.
 
-        if len(all_metrics) > 0:
+        Args:
+            metrics (list[StreamMetric]): The metrics.
+
+        """
+        if len(metrics) > 0:
             for backend in self.config.metrics_backends:
-                backend.save_metrics(all_metrics)
+                backend.save_metrics(metrics)
+
+    @contextmanager
+    def _pool(self) -> Iterator[ThreadPoolExecutor]:
+        """Get the worker threads, kept across polls when running continuously."""
+        if self._executor is not None:
+            yield self._executor
+            return
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            yield executor
+
+    def _evaluate_group(
+        self,
+        group: list[StreamItemT],
+        evaluate: Callable[[StreamItemT, EventTimer], list[StreamMetric]],
+        progress: EventTimer,
+    ) -> list[StreamMetric] | None:
+        """Evaluate the first item of a group and copy its metrics to the duplicates.
+
+        The items are acknowledged together once every metric is built, and only the metrics
+        of the items acknowledged are returned, so an item that stays unprocessed is saved
+        once when it is evaluated again. If the evaluation fails, or the processor is
+        stopping, the items are left unprocessed and released from the watermark so a later
+        poll takes them again. Failed items are only retried up to the watermark's
+        `max_attempts`.
+        """
+        if self._stop.is_set():
+            if self.watermark is not None:
+                self.watermark.discard(item.stream_item for item in group)
+            return None
+        first, *duplicates = group
+        try:
+            metrics = evaluate(first, progress)
+            by_item = [(first, metrics)] + [
+                (
+                    item,
+                    StreamMetricTagger.attach_tags(
+                        [
+                            m.model_copy(
+                                update={"stream": item.stream, "stream_item": item.stream_item}
+                            )
+                            for m in metrics
+                        ],
+                        item,
+                        self.config.additional_tags,
+                    ),
+                )
+                for item in duplicates
+            ]
+            failed = set(self.backend.mark_many_processed([item.stream_item for item in group]))
+        except Exception:  # noqa: BLE001
+            logger().exception(f"Evaluating stream item {first.stream_item} failed")
+            self._release(group)
+            return None
+        if failed:
+            logger().warning(
+                f"Failed to acknowledge stream items {', '.join(sorted(failed))}, "
+                "their metrics are dropped until they are evaluated again"
+            )
+            self._release([item for item in group if item.stream_item in failed])
+            if len(failed) == len(group):
+                return None
+        return [
+            m
+            for item, item_metrics in by_item
+            if item.stream_item not in failed
+            for m in item_metrics
+        ]
+
+    def _release(self, group: list[StreamItemT]) -> None:
+        """Record a failed attempt at items, so they are retried while running continuously."""
+        if self.watermark is None:
+            return
+        given_up = self.watermark.release(item.stream_item for item in group)
+        if given_up:
+            logger().error(
+                f"Giving up on stream items {', '.join(given_up)} after "
+                f"{self.watermark.max_attempts} failed attempts"
+            )
 
     def _evaluate_plan_stream_item(
         self, stream_item: PlanStreamItem, progress: EventTimer
     ) -> list[StreamMetric]:
         """Evaluate a single test case across all evaluators."""
-        metrics_out = []
+        metrics_out: list[StreamMetric] = []
         start = time.perf_counter()
         for evaluator in self.config.evaluators:
             metrics = evaluator.process_plan(stream_item)
@@ -146,37 +463,8 @@ class StreamProcessor:
                 )
         end = time.perf_counter()
         progress.record_timing_seconds(end - start, update_display=True)
-        self.backend.mark_processed(stream_item)
         return metrics_out
 
-    def _process_plan_runs(self, stream: Stream) -> None:
-        items = self.backend.load_plan_run_stream_items(
-            stream.id,
-            self.config.batch_size,
-        )
-
-        progress = EventTimer(total_events=len(items))
-
-        all_metrics: list[StreamMetric] = []
-
-        futures = []
-        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
-            futures.extend(
-                executor.submit(self._evaluate_plan_run_stream_item, item, progress)
-                for item in items
-            )
-
-            for future in as_completed(futures):
-                result: list[StreamMetric] | StreamMetric | None = future.result()
-                if result:
-                    all_metrics.extend(result) if isinstance(result, list) else all_metrics.append(
-                        result
-                    )
-
-        if len(all_metrics) > 0:
-            for backend in self.config.metrics_backends:
-                backend.save_metrics(all_metrics)
-
     def _evaluate_plan_run_stream_item(
         self,
         stream_item: PlanRunStreamItem,
@@ -197,5 +485,179 @@ class StreamProcessor:
                 )
         end = time.perf_counter()
         progress.record_timing_seconds(end - start, update_display=True)
-        self.backend.mark_processed(stream_item)
         return metrics_out
+
+
+class MultiStreamProcessor:
+    """Processes many streams in one process, sharing workers, connections and a rate limit.
+
+    Each round loads the waiting items of every stream into a weighted fair queue and
+    evaluates them from it, so a stream with a large backlog gets its weighted share of the
+    workers and can't starve the others. A stream's batch_size caps what it adds to a round.
+
+    Attributes:
+        configs (list[StreamConfig]): The configurations of the streams.
+        max_concurrency (int): The number of workers shared by the streams.
+        rate_limiter (RateLimiter | None): Limits how often stream items are judged, across
+            every stream.
+        stream_throughput (list[StreamThroughput]): The throughput of each stream over the
+            last round.
+
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[StreamConfig],
+        max_concurrency: int | None = None,
+        judge_rate_limit: float | None = None,
+    ) -> None:
+        """Initialize the processor.
+
+        Args:
+            configs (Sequence[StreamConfig]): The configurations of the streams. Streams with
+                the same Portia config share its connections.
+            max_concurrency (int | None): The number of workers shared by the streams.
+                Defaults to the largest max_concurrency of the configs.
+            judge_rate_limit (float | None): Maximum number of stream items judged per
+                second across every stream, e.g. to stay under the judge model's rate limit.
+
+        """
+        if not configs:
+            raise ValueError("at least one stream config is required")
+        names = [config.stream_name for config in configs]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"streams configured more than once: {duplicates}")
+        self.configs = list(configs)
+        self.max_concurrency = max_concurrency or max(c.max_concurrency for c in configs)
+        self.rate_limiter = RateLimiter(judge_rate_limit) if judge_rate_limit else None
+        self.stream_throughput: list[StreamThroughput] = []
+        backends: dict[int, PortiaStreamBackend] = {}
+        self._processors: dict[str, StreamProcessor] = {}
+        for config in configs:
+            key = id(config.portia_config)
+            if key not in backends:
+                backends[key] = PortiaStreamBackend(config=config.portia_config)
+            self._processors[config.stream_name] = StreamProcessor(config, backends[key])
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        """Process the items waiting in every stream once and save the metrics."""
+        streams = self._get_streams()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            self._run_round(streams, executor)
+
+    def run_forever(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        watermark_size: int = DEFAULT_WATERMARK_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        """Keep processing new items of every stream as they arrive, until stopped.
+
+        Polls back off like `StreamProcessor.run_forever` while no stream has items that can
+        be evaluated, and failed items are retried up to `max_attempts` times.
+
+        Stops on SIGTERM or SIGINT (when run on the main thread) or `stop()`, after the items
+        being evaluated finish. Items not started yet are left for the next run.
+
+        Args:
+            min_interval (float): Seconds to wait after the first empty poll.
+            max_interval (float): Most seconds to wait between polls.
+            watermark_size (int): Most item ids the watermark of each stream remembers.
+            max_attempts (int): Most times an item is evaluated before it's no longer retried.
+
+        """
+        _check_intervals(min_interval, max_interval)
+        streams = self._get_streams()
+        self._stop.clear()
+        for processor in self._processors.values():
+            processor.watermark = StreamWatermark(watermark_size, max_attempts)
+        restore = _handle_signals(self.stop)
+        interval = min_interval
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                while not self._stop.is_set():
+                    if self._run_round(streams, executor):
+                        interval = min_interval
+                        continue
+                    self._stop.wait(interval)
+                    interval = min(interval * 2, max_interval)
+        finally:
+            for processor in self._processors.values():
+                processor.watermark = None
+            restore()
+        logger().info("Stopped processing the streams")
+
+    def stop(self) -> None:
+        """Ask `run_forever` to stop once the items being evaluated finish."""
+        self._stop.set()
+
+    def _get_streams(self) -> dict[str, Stream]:
+        return {name: p.get_stream() for name, p in self._processors.items()}
+
+    def _poll(self, streams: dict[str, Stream], queue: FairQueue[StreamWork]) -> Counter[str]:
+        """Queue the items waiting in every stream, returning how many each stream added."""
+        taken: Counter[str] = Counter()
+        for name, stream in streams.items():
+            processor = self._processors[name]
+            try:
+                work = processor.load_work(stream)
+            except Exception:  # noqa: BLE001
+                logger().exception(f"Loading stream {name} failed, retrying next round")
+                continue
+            for w in work:
+                queue.push(name, w, weight=processor.config.weight)
+                taken[name] += w.items
+        return taken
+
+    def _run_round(self, streams: dict[str, Stream], executor: ThreadPoolExecutor) -> int:
+        """Load the items of every stream and evaluate them fairly.
+
+        Returns:
+            int: The number of items evaluated.
+
+        """
+        start = time.perf_counter()
+        queue: FairQueue[StreamWork] = FairQueue()
+        taken = self._poll(streams, queue)
+        progress = {name: EventTimer(total_events=queue.backlog(name)) for name in streams}
+        waiting = taken.copy()
+        # only as many pieces of work as there are workers are handed to the pool, so the
+        # pool's own queue can't undo the fair order
+        slots = threading.BoundedSemaphore(self.max_concurrency)
+        futures: dict[Future[list[StreamMetric] | None], tuple[str, int]] = {}
+        while queue:
+            slots.acquire()
+            if self._stop.is_set():
+                break
+            name, work = queue.pop()
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            future = executor.submit(work.evaluate, progress[name])
+            future.add_done_callback(lambda _: slots.release())
+            futures[future] = (name, work.items)
+
+        metrics: dict[str, list[StreamMetric]] = {name: [] for name in streams}
+        evaluated: Counter[str] = Counter()
+        for future in as_completed(futures):
+            name, items = futures[future]
+            waiting[name] -= items
+            # failures are logged by the stream's processor and left for a retry
+            result = future.result()
+            if result is not None:
+                metrics[name].extend(result)
+                evaluated[name] += items
+        for name, stream_metrics in metrics.items():
+            self._processors[name].save_metrics(stream_metrics)
+
+        seconds = time.perf_counter() - start
+        self.stream_throughput = [
+            StreamThroughput(name, p.config.weight, evaluated[name], waiting[name], seconds)
+            for name, p in self._processors.items()
+        ]
+        if futures:
+            for throughput in self.stream_throughput:
+                logger().info(str(throughput))
+        return evaluated.total()
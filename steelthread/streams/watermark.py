@@ -0,0 +1,84 @@
+"""Watermark of the stream items a long running processor has already taken."""
+
+from collections.abc import Iterable
+
+DEFAULT_WATERMARK_SIZE = 100_000
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class StreamWatermark:
+    """The ids of the stream items already taken for evaluation, oldest first.
+
+    The stream items API only lists items that aren't processed yet, so earlier pages empty
+    out as items are processed and a page number doesn't mark a stable position. Instead
+    the watermark remembers the items themselves, so items that are still being evaluated
+    aren't taken again on the next poll. Items whose evaluation failed are released from it
+    so they are retried, until they have failed `max_attempts` times.
+
+    Attributes:
+        max_size (int): Most ids remembered. The oldest are forgotten first.
+        max_attempts (int): Most times an item is taken before it's no longer retried.
+
+    """
+
+    def __init__(
+        self, max_size: int = DEFAULT_WATERMARK_SIZE, max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> None:
+        """Initialize the watermark.
+
+        Args:
+            max_size (int): Most ids remembered. The oldest are forgotten first.
+            max_attempts (int): Most times an item is taken before it's no longer retried.
+
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_size = max_size
+        self.max_attempts = max_attempts
+        # dicts keep insertion order, so the first key is the oldest
+        self._seen: dict[str, None] = {}
+        self._failures: dict[str, int] = {}
+
+    def __contains__(self, stream_item: object) -> bool:
+        """Check whether an item was already taken."""
+        return stream_item in self._seen
+
+    def __len__(self) -> int:
+        """Get the number of ids remembered."""
+        return len(self._seen)
+
+    def update(self, stream_items: Iterable[str]) -> None:
+        """Remember items as taken, forgetting the oldest beyond max_size."""
+        for stream_item in stream_items:
+            self._seen[stream_item] = None
+        while len(self._seen) > self.max_size:
+            del self._seen[next(iter(self._seen))]
+
+    def release(self, stream_items: Iterable[str]) -> list[str]:
+        """Record a failed attempt at items, forgetting those that may be retried.
+
+        Items that have failed `max_attempts` times stay remembered, so they aren't taken
+        again while they're remembered.
+
+        Returns:
+            list[str]: The items that won't be retried.
+
+        """
+        given_up = []
+        for stream_item in stream_items:
+            failures = self._failures.pop(stream_item, 0) + 1
+            if failures >= self.max_attempts:
+                given_up.append(stream_item)
+                continue
+            self._failures[stream_item] = failures
+            self._seen.pop(stream_item, None)
+        while len(self._failures) > self.max_size:
+            del self._failures[next(iter(self._failures))]
+        return given_up
+
+    def discard(self, stream_items: Iterable[str]) -> None:
+        """Forget items, so they are taken again if they're still listed."""
+        for stream_item in stream_items:
+            self._seen.pop(stream_item, None)
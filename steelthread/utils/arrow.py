@@ -0,0 +1,139 @@
+"""Partitioned Arrow/Parquet writer for metrics."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+
+TAG_PREFIX = "tag_"
+BLOB_COLUMNS = frozenset({"eval_output"})
+
+
+def require_pyarrow() -> None:
+    """Raise a helpful error if pyarrow is not installed."""
+    try:
+        import pyarrow as pa  # noqa: F401, PLC0415
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow metrics backends. "
+            "Install it with `pip install steel-thread[arrow]`."
+        ) from e
+
+
+class ArrowPartitionedWriter:
+    """Append-only writer of metric rows to hive partitioned Parquet files.
+
+    Each call to `write` turns the given rows into Arrow record batches and writes one new
+    file per partition, so existing files are never rewritten. Rows are plain dicts where:
+
+    - `tags` (dict[str, str]) is expanded into one dictionary encoded `tag_<key>` column per key.
+    - blob columns such as `eval_output` are stored as binary so scans can skip them.
+    - a `date` partition and `recorded_at` timestamp are added at write time.
+
+    Attributes:
+        root (Path): The root directory of the dataset.
+        partition_by (Sequence[str]): Row keys used as partition directories, before `date`.
+
+    """
+
+    def __init__(self, root: str | Path, partition_by: Sequence[str]) -> None:
+        """Initialize the writer.
+
+        Args:
+            root (str | Path): The root directory of the dataset.
+            partition_by (Sequence[str]): Row keys to partition by, e.g. dataset and run.
+
+        """
+        require_pyarrow()
+        self.root = Path(root)
+        self.partition_by = [*partition_by, "date"]
+
+    def write(self, rows: Iterable[dict[str, Any]]) -> list[Path]:
+        """Write rows as new Parquet files, one per partition.
+
+        Args:
+            rows (Iterable[dict[str, Any]]): The rows to write.
+
+        Returns:
+            list[Path]: The files that were written.
+
+        """
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        now = datetime.now(tz=UTC)
+        partitions: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            row = {**row, "date": now.date().isoformat(), "recorded_at": now}  # noqa: PLW2901
+            partitions[tuple(str(row[c]) for c in self.partition_by)].append(row)
+
+        written = []
+        for values, partition_rows in partitions.items():
+            directory = self.root.joinpath(
+                *(
+                    f"{c}={quote(v, safe='')}"
+                    for c, v in zip(self.partition_by, values, strict=True)
+                )
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"part-{now:%Y%m%dT%H%M%S}-{uuid4().hex[:8]}.parquet"
+            pq.write_table(self._to_table(partition_rows), path)
+            written.append(path)
+        return written
+
+    def _to_table(self, rows: list[dict[str, Any]]) -> pa.Table:
+        """Build a columnar table for rows of a single partition."""
+        import pyarrow as pa  # noqa: PLC0415
+
+        tag_keys = list(dict.fromkeys(k for row in rows for k in (row.get("tags") or {})))
+        columns = [
+            c
+            for c in dict.fromkeys(c for row in rows for c in row)
+            if c not in ("tags", *self.partition_by)
+        ]
+
+        arrays: dict[str, pa.Array] = {}
+        for column in columns:
+            values = [row.get(column) for row in rows]
+            if column in BLOB_COLUMNS:
+                arrays[column] = pa.array(values, type=pa.large_binary())
+            else:
+                arrays[column] = pa.array(values)
+        for key in tag_keys:
+            values = [(row.get("tags") or {}).get(key) for row in rows]
+            arrays[f"{TAG_PREFIX}{key}"] = pa.array(values, type=pa.string()).dictionary_encode()
+        return pa.table(arrays)
+
+
+def open_metrics_dataset(root: str | Path) -> pads.Dataset:
+    """Open a metrics directory written by `ArrowPartitionedWriter` for scanning.
+
+    Files may carry different tag columns so their schemas are unified before scanning.
+    Use `dataset.to_table(columns=[...], filter=...)` to project away blob columns.
+
+    Args:
+        root (str | Path): The root directory of the dataset.
+
+    Returns:
+        pyarrow.dataset.Dataset: A hive partitioned dataset over all written files.
+
+    """
+    require_pyarrow()
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.dataset as pads  # noqa: PLC0415
+
+    discovered = pads.dataset(root, format="parquet", partitioning="hive")
+    schema = pa.unify_schemas(
+        [fragment.physical_schema for fragment in discovered.get_fragments()]
+        + [discovered.partitioning.schema]
+    )
+    return pads.dataset(root, schema=schema, format="parquet", partitioning="hive")
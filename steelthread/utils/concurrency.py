@@ -0,0 +1,279 @@
+"""Concurrency utils."""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class BoundedExecutor:
+    """Thread pool for fanning out small independent calls, such as LLM judge calls.
+
+    `map` hands each item to a free pool thread or, when all threads are busy, runs it in
+    the calling thread. Because callers never wait for a thread to free up, the same executor
+    can be shared across nested fan outs (evaluators that fan out over assertions) without
+    deadlocking, while the total number of extra threads stays bounded.
+
+    The pool is created on first use, and the executor pickles as a fresh, unstarted copy so
+    configs holding one can be sent to worker processes.
+
+    Attributes:
+        max_workers (int): Maximum number of pool threads.
+
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers (int): Maximum number of pool threads.
+
+        """
+        self.max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __reduce__(self) -> tuple[type[BoundedExecutor], tuple[int]]:
+        """Pickle as a new executor of the same size."""
+        return (BoundedExecutor, (self.max_workers,))
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="steelthread-fanout"
+                )
+            return self._pool
+
+    def _run_in_slot(self, fn: Callable[[T], R], item: T) -> R:
+        try:
+            return fn(item)
+        finally:
+            self._slots.release()
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply fn to every item concurrently and return the results in item order.
+
+        Args:
+            fn (Callable[[T], R]): The function to apply.
+            items (Iterable[T]): The items.
+
+        Returns:
+            list[R]: The result for each item, in the order of the items. If any call raises,
+                the exception of the first failing item (in item order) is raised.
+
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        results: list[Future[R]] = []
+        # the caller runs the last item itself rather than sitting idle
+        for item in items[:-1]:
+            if self._slots.acquire(blocking=False):
+                results.append(self._get_pool().submit(self._run_in_slot, fn, item))
+            else:
+                results.append(_completed(fn, item))
+        results.append(_completed(fn, items[-1]))
+        return [future.result() for future in results]
+
+    def shutdown(self) -> None:
+        """Stop the pool threads, waiting for running calls to finish."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+def _completed(fn: Callable[[T], R], item: T) -> Future[R]:
+    """Run fn in the calling thread and capture the outcome in a future."""
+    future: Future[R] = Future()
+    try:
+        future.set_result(fn(item))
+    except Exception as e:  # noqa: BLE001
+        future.set_exception(e)
+    return future
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call doesn't finish within its deadline."""
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the error.
+
+        Args:
+            timeout (float): The deadline in seconds.
+
+        """
+        super().__init__(f"call did not finish within {timeout:.1f}s")
+        self.timeout = timeout
+
+
+def run_with_timeout(fn: Callable[[], R], timeout: float | None) -> R:
+    """Call fn, giving up after timeout seconds.
+
+    Threads can't be interrupted, so fn runs on a daemon thread that is abandoned if it
+    doesn't finish in time. The caller gets its thread back and an abandoned call can't
+    keep the interpreter from exiting.
+
+    Args:
+        fn (Callable[[], R]): The function to call.
+        timeout (float | None): Seconds to wait, or None to call fn directly.
+
+    Returns:
+        R: The result of fn.
+
+    Raises:
+        DeadlineExceededError: If fn didn't finish in time.
+
+    """
+    if timeout is None:
+        return fn()
+    future: Future[R] = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn())
+        except BaseException as e:  # noqa: BLE001
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="steelthread-deadline", daemon=True).start()
+    try:
+        return future.result(timeout=max(timeout, 0))
+    except TimeoutError as e:
+        if future.done():
+            # fn raised a TimeoutError of its own
+            raise
+        raise DeadlineExceededError(timeout) from e
+
+
+class DaemonThreadExecutor(Executor):
+    """Executor running every call on a daemon thread of its own.
+
+    Shutting down never waits for calls still running: like `run_with_timeout`, a call that
+    is no longer needed is abandoned rather than joined, and can't keep the interpreter from
+    exiting. Callers bound how many calls run at once themselves.
+    """
+
+    def __init__(self, thread_name_prefix: str = "steelthread-attempt") -> None:
+        """Initialize the executor.
+
+        Args:
+            thread_name_prefix (str): Prefix of the names of the threads.
+
+        """
+        self.thread_name_prefix = thread_name_prefix
+        self._count = itertools.count()
+
+    def submit(self, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> Future[R]:
+        """Run fn on a new daemon thread."""
+        future: Future[R] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:  # noqa: BLE001
+                future.set_exception(e)
+
+        name = f"{self.thread_name_prefix}-{next(self._count)}"
+        threading.Thread(target=run, name=name, daemon=True).start()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Return straight away, abandoning the calls still running."""
+
+
+@contextmanager
+def abandoning(executor: Executor) -> Iterator[Executor]:
+    """Use an executor, shutting it down without waiting for its calls.
+
+    Calls not started yet are cancelled. Calls still running are left to finish on their
+    own, so a hung call doesn't hold up the caller.
+
+    Args:
+        executor (Executor): The executor.
+
+    Yields:
+        Executor: The executor.
+
+    """
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class RateLimiter:
+    """Token bucket limiting how often calls start, shared by any number of threads.
+
+    Attributes:
+        rate (float): Calls allowed per second on average.
+        burst (int): Calls that may start back to back after a quiet period.
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate (float): Calls allowed per second on average.
+            burst (int): Calls that may start back to back after a quiet period.
+
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a call may start.
+
+        Returns:
+            float: The seconds spent waiting.
+
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+_shared: BoundedExecutor | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_executor() -> BoundedExecutor:
+    """Get the process wide executor used when none is configured."""
+    global _shared  # noqa: PLW0603
+    with _shared_lock:
+        if _shared is None:
+            _shared = BoundedExecutor()
+        return _shared
@@ -0,0 +1,38 @@
+"""Lazy import utils."""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module level `__getattr__` and `__dir__` hooks that import exports on first use.
+
+    Importing a package that uses these hooks does not import any of its submodules (or their
+    dependencies such as the portia SDK) until one of the exported names is accessed.
+
+    Args:
+        package (str): The name of the package the hooks are installed on.
+        exports (dict[str, str]): Exported name to the relative submodule that defines it.
+
+    Returns:
+        tuple: The `__getattr__` and `__dir__` functions for the package.
+
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401, N807
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        # cache on the package so later lookups skip this hook
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
@@ -0,0 +1,11 @@
+"""Serialization utils shared by the metrics stores."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def to_json(value: Any) -> str | None:  # noqa: ANN401
+    """Serialize a value to a JSON string column, keeping None as null."""
+    return None if value is None else json.dumps(value, default=str)
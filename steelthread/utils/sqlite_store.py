@@ -0,0 +1,347 @@
+"""Local SQLite store for metrics."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from steelthread.utils.serialization import to_json
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from steelthread.evals.metrics import EvalMetric
+    from steelthread.streams.metrics import StreamMetric
+
+DEFAULT_BATCH_SIZE = 500
+
+BUCKET_FORMATS = {
+    "hour": "%Y-%m-%dT%H:00",
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS eval_metrics (
+    id INTEGER PRIMARY KEY,
+    dataset TEXT NOT NULL,
+    testcase TEXT NOT NULL,
+    run TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score REAL NOT NULL,
+    description TEXT,
+    explanation TEXT,
+    expectation TEXT,
+    actual_value TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_eval_metrics_lookup
+    ON eval_metrics (dataset, testcase, run, name);
+CREATE INDEX IF NOT EXISTS ix_eval_metrics_testcase_time
+    ON eval_metrics (testcase, recorded_at);
+CREATE TABLE IF NOT EXISTS eval_metric_tags (
+    metric_id INTEGER NOT NULL REFERENCES eval_metrics (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (metric_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_eval_metric_tags_kv ON eval_metric_tags (key, value, metric_id);
+
+CREATE TABLE IF NOT EXISTS stream_metrics (
+    id INTEGER PRIMARY KEY,
+    stream TEXT NOT NULL,
+    stream_item TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score REAL NOT NULL,
+    description TEXT,
+    explanation TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_stream_metrics_lookup
+    ON stream_metrics (stream, stream_item, name);
+CREATE TABLE IF NOT EXISTS stream_metric_tags (
+    metric_id INTEGER NOT NULL REFERENCES stream_metrics (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (metric_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_stream_metric_tags_kv ON stream_metric_tags (key, value, metric_id);
+"""
+
+
+@dataclass(frozen=True)
+class RunScore:
+    """Average score of one metric within one run."""
+
+    run: str
+    name: str
+    score: float
+    count: int
+    recorded_at: float
+
+
+@dataclass(frozen=True)
+class TagScore:
+    """Average score of one metric for one tag value within one time bucket."""
+
+    tag_value: str | None
+    period: str
+    name: str
+    score: float
+    count: int
+
+
+class SQLiteMetricsStore:
+    """Embedded, indexed store of eval and stream metrics for cross-run queries.
+
+    Metrics are indexed by (dataset, testcase, run, name) and their tags are kept in a
+    key/value table indexed on (key, value) so queries such as "average score per planning
+    model" never scan unrelated rows. Inserts are batched into transactions.
+
+    Attributes:
+        path (Path): The SQLite database file.
+        batch_size (int): Maximum number of metrics inserted per transaction.
+
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """Open (and if needed create) the store.
+
+        Args:
+            path (str | Path): The SQLite database file.
+            batch_size (int): Maximum number of metrics inserted per transaction.
+
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open an autocommit connection; writes manage their own transactions."""
+        with closing(sqlite3.connect(self.path, isolation_level=None)) as conn:
+            conn.execute("PRAGMA foreign_keys=ON")
+            yield conn
+
+    def _insert(
+        self,
+        table: str,
+        tag_table: str,
+        columns: Sequence[str],
+        rows: Iterable[tuple[tuple[Any, ...], dict[str, str] | None]],
+    ) -> int:
+        """Insert (values, tags) rows in batched transactions and return the row count."""
+        placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+        insert_metric = f"INSERT INTO {table} (id, {', '.join(columns)}) VALUES ({placeholders})"  # noqa: S608
+        insert_tag = f"INSERT INTO {tag_table} (metric_id, key, value) VALUES (?, ?, ?)"  # noqa: S608
+
+        batch: list[tuple[tuple[Any, ...], dict[str, str] | None]] = []
+        total = 0
+        with self._connect() as conn:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    total += self._insert_batch(conn, table, insert_metric, insert_tag, batch)
+                    batch = []
+            if batch:
+                total += self._insert_batch(conn, table, insert_metric, insert_tag, batch)
+        return total
+
+    @staticmethod
+    def _insert_batch(
+        conn: sqlite3.Connection,
+        table: str,
+        insert_metric: str,
+        insert_tag: str,
+        batch: list[tuple[tuple[Any, ...], dict[str, str] | None]],
+    ) -> int:
+        # take the write lock up front so the ids we allocate cannot be claimed concurrently
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            (next_id,) = conn.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").fetchone()  # noqa: S608
+            metric_rows = []
+            tag_rows = []
+            for offset, (values, tags) in enumerate(batch):
+                metric_rows.append((next_id + offset, *values))
+                tag_rows.extend((next_id + offset, k, v) for k, v in (tags or {}).items())
+            conn.executemany(insert_metric, metric_rows)
+            conn.executemany(insert_tag, tag_rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return len(batch)
+
+    def add_eval_metrics(self, metrics: Iterable[EvalMetric]) -> int:
+        """Insert eval metrics. `eval_output` is not stored.
+
+        Args:
+            metrics (Iterable[EvalMetric]): The metrics to insert.
+
+        Returns:
+            int: The number of metrics inserted.
+
+        """
+        now = time.time()
+        return self._insert(
+            "eval_metrics",
+            "eval_metric_tags",
+            (
+                "dataset",
+                "testcase",
+                "run",
+                "name",
+                "score",
+                "description",
+                "explanation",
+                "expectation",
+                "actual_value",
+                "recorded_at",
+            ),
+            (
+                (
+                    (
+                        m.dataset,
+                        m.testcase,
+                        m.run,
+                        m.name,
+                        m.score,
+                        m.description,
+                        m.explanation,
+                        to_json(m.expectation),
+                        to_json(m.actual_value),
+                        now,
+                    ),
+                    m.tags,
+                )
+                for m in metrics
+            ),
+        )
+
+    def add_stream_metrics(self, metrics: Iterable[StreamMetric]) -> int:
+        """Insert stream metrics.
+
+        Args:
+            metrics (Iterable[StreamMetric]): The metrics to insert.
+
+        Returns:
+            int: The number of metrics inserted.
+
+        """
+        now = time.time()
+        return self._insert(
+            "stream_metrics",
+            "stream_metric_tags",
+            ("stream", "stream_item", "name", "score", "description", "explanation", "recorded_at"),
+            (
+                (
+                    (m.stream, m.stream_item, m.name, m.score, m.description, m.explanation, now),
+                    m.tags,
+                )
+                for m in metrics
+            ),
+        )
+
+    def latest_runs(
+        self,
+        testcase: str,
+        n: int = 5,
+        dataset: str | None = None,
+    ) -> list[RunScore]:
+        """Get per-metric average scores of the latest N runs of a test case.
+
+        Args:
+            testcase (str): The test case id.
+            n (int): How many runs to return.
+            dataset (str | None): Optionally restrict to a dataset.
+
+        Returns:
+            list[RunScore]: Scores ordered from the newest run, then by metric name.
+
+        """
+        query = """
+            WITH latest AS (
+                SELECT run, MAX(recorded_at) AS recorded_at
+                FROM eval_metrics
+                WHERE testcase = :testcase AND (:dataset IS NULL OR dataset = :dataset)
+                GROUP BY run
+                ORDER BY recorded_at DESC
+                LIMIT :n
+            )
+            SELECT m.run, m.name, AVG(m.score), COUNT(*), latest.recorded_at
+            FROM eval_metrics m JOIN latest ON latest.run = m.run
+            WHERE m.testcase = :testcase AND (:dataset IS NULL OR m.dataset = :dataset)
+            GROUP BY m.run, m.name
+            ORDER BY latest.recorded_at DESC, m.name
+        """
+        with self._connect() as conn:
+            rows = conn.execute(query, {"testcase": testcase, "dataset": dataset, "n": n})
+            return [RunScore(*row) for row in rows]
+
+    def testcase_latencies(
+        self,
+        dataset: str | None = None,
+        name: str = "latency",
+    ) -> dict[str, float]:
+        """Get the average measured latency of each test case, e.g. to balance shards.
+
+        Latency is read from the `actual_value` of metrics produced by latency assertions.
+
+        Args:
+            dataset (str | None): Optionally restrict to a dataset.
+            name (str): The name of the latency metric.
+
+        Returns:
+            dict[str, float]: Average latency in milliseconds by test case id.
+
+        """
+        query = """
+            SELECT testcase, AVG(CAST(json_extract(actual_value, '$') AS REAL))
+            FROM eval_metrics
+            WHERE name = :name AND actual_value IS NOT NULL
+              AND (:dataset IS NULL OR dataset = :dataset)
+            GROUP BY testcase
+        """
+        with self._connect() as conn:
+            return dict(conn.execute(query, {"name": name, "dataset": dataset}).fetchall())
+
+    def average_score_by_tag(
+        self,
+        tag_key: str = "planning_model",
+        name: str | None = None,
+        dataset: str | None = None,
+        bucket: Literal["hour", "day", "week", "month"] = "day",
+    ) -> list[TagScore]:
+        """Get the average eval score per tag value over time.
+
+        Args:
+            tag_key (str): The tag to group by, e.g. "planning_model".
+            name (str | None): Optionally restrict to one metric name.
+            dataset (str | None): Optionally restrict to a dataset.
+            bucket (str): The size of each time bucket.
+
+        Returns:
+            list[TagScore]: Scores ordered by period, tag value and metric name.
+
+        """
+        query = """
+            SELECT t.value, strftime(:fmt, m.recorded_at, 'unixepoch') AS period, m.name,
+                   AVG(m.score), COUNT(*)
+            FROM eval_metric_tags t JOIN eval_metrics m ON m.id = t.metric_id
+            WHERE t.key = :key
+              AND (:name IS NULL OR m.name = :name)
+              AND (:dataset IS NULL OR m.dataset = :dataset)
+            GROUP BY t.value, period, m.name
+            ORDER BY period, t.value, m.name
+        """
+        params = {"fmt": BUCKET_FORMATS[bucket], "key": tag_key, "name": name, "dataset": dataset}
+        with self._connect() as conn:
+            return [TagScore(*row) for row in conn.execute(query, params)]
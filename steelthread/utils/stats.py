@@ -0,0 +1,257 @@
+"""Streaming statistics utils."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+DEFAULT_QUANTILES = (0.5, 0.9)
+_P2_MARKERS = 5
+
+
+class P2Quantile:
+    """Streaming quantile estimator using the P² algorithm.
+
+    Tracks a single quantile in O(1) memory by maintaining five markers whose heights
+    are adjusted with piecewise-parabolic interpolation as observations arrive.
+    """
+
+    def __init__(self, quantile: float) -> None:
+        """Initialize the estimator.
+
+        Args:
+            quantile (float): The quantile to track, between 0 and 1.
+
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError(f"quantile must be between 0 and 1, got {quantile}")
+        self.quantile = quantile
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float) -> None:
+        """Fold a single observation into the estimate."""
+        heights = self._heights
+        if len(heights) < _P2_MARKERS:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        for i in range(k + 1, _P2_MARKERS):
+            self._positions[i] += 1
+        for i in range(_P2_MARKERS):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            self._adjust(i)
+
+    def _adjust(self, i: int) -> None:
+        """Move marker i towards its desired position if it has drifted."""
+        q, n = self._heights, self._positions
+        d = self._desired[i] - n[i]
+        if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+            step = 1 if d > 0 else -1
+            parabolic = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+            )
+            if q[i - 1] < parabolic < q[i + 1]:
+                q[i] = parabolic
+            else:
+                q[i] = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+            n[i] += step
+
+    @property
+    def value(self) -> float:
+        """Get the current estimate (exact while fewer than five values have been seen)."""
+        heights = self._heights
+        if not heights:
+            return math.nan
+        if len(heights) < _P2_MARKERS:
+            rank = self.quantile * (len(heights) - 1)
+            lower = math.floor(rank)
+            upper = min(lower + 1, len(heights) - 1)
+            return heights[lower] + (heights[upper] - heights[lower]) * (rank - lower)
+        return heights[2]
+
+
+@dataclass
+class RunningStats:
+    """Running count, mean, variance, min/max and quantiles of a series of values."""
+
+    quantiles: Sequence[float] = DEFAULT_QUANTILES
+    count: int = 0
+    mean: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    _m2: float = field(default=0.0, init=False, repr=False)
+    _estimators: dict[float, P2Quantile] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create one estimator per tracked quantile."""
+        self._estimators = {q: P2Quantile(q) for q in self.quantiles}
+
+    def add(self, value: float) -> None:
+        """Fold a value into the running statistics (Welford's algorithm)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        for estimator in self._estimators.values():
+            estimator.add(value)
+
+    @property
+    def variance(self) -> float:
+        """Get the sample variance (NaN with fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        """Get the sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """Get the estimate for a tracked quantile."""
+        if q not in self._estimators:
+            raise KeyError(f"quantile {q} is not tracked")
+        return self._estimators[q].value
+
+
+class ScoredRecord(Protocol):
+    """Anything with a name, score and tags, e.g. an EvalMetric or StreamMetric."""
+
+    name: str
+    score: float
+    tags: dict[str, str] | None
+
+
+GroupKey = tuple[Hashable, ...]
+
+
+class MetricAggregator:
+    """Fold metrics into per-group running statistics as they arrive.
+
+    By default metrics are grouped by name plus their full set of tags. Only one
+    `RunningStats` is held per group so memory is O(groups) rather than O(metrics).
+    """
+
+    def __init__(
+        self,
+        key: Callable[[ScoredRecord], dict[str, str | None]] | None = None,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            key (Callable | None): Maps a metric to its group columns. Defaults to the metric
+                name followed by each of its tags.
+            quantiles (Sequence[float]): Quantiles to track per group.
+
+        """
+        self.key = key or self._name_and_tags
+        self.quantiles = quantiles
+        self.columns: list[str] = []
+        self.groups: dict[GroupKey, RunningStats] = {}
+        self._rows: dict[GroupKey, dict[str, str | None]] = {}
+
+    @staticmethod
+    def _name_and_tags(metric: ScoredRecord) -> dict[str, str | None]:
+        return {"name": metric.name, **(metric.tags or {})}
+
+    def add(self, metric: ScoredRecord) -> None:
+        """Fold a single metric into its group."""
+        row = self.key(metric)
+        for column in row:
+            if column not in self.columns:
+                self.columns.append(column)
+        group = tuple(sorted(row.items()))
+        stats = self.groups.get(group)
+        if stats is None:
+            stats = self.groups[group] = RunningStats(quantiles=self.quantiles)
+            self._rows[group] = row
+        stats.add(metric.score)
+
+    def extend(self, metrics: Iterable[ScoredRecord]) -> None:
+        """Fold many metrics."""
+        for metric in metrics:
+            self.add(metric)
+
+    def summary(self) -> list[tuple[dict[str, str | None], RunningStats]]:
+        """Get (group columns, stats) pairs sorted by group columns."""
+
+        def sort_key(item: tuple[dict[str, str | None], RunningStats]) -> list[tuple[bool, str]]:
+            row = item[0]
+            return [(row.get(c) is None, str(row.get(c) or "")) for c in self.columns]
+
+        return sorted(((self._rows[g], s) for g, s in self.groups.items()), key=sort_key)
+
+    def to_string(self, detailed: bool = False) -> str:
+        """Render the summary as a plain-text table.
+
+        Args:
+            detailed (bool): Also include count, std, min, max and quantile columns.
+
+        """
+        stat_columns: dict[str, Callable[[RunningStats], float]] = {"score": lambda s: s.mean}
+        if detailed:
+            stat_columns |= {
+                "count": lambda s: s.count,
+                "std": lambda s: s.std,
+                "min": lambda s: s.min,
+                "max": lambda s: s.max,
+            }
+            stat_columns |= {
+                f"p{round(q * 100)}": (lambda s, q=q: s.quantile(q)) for q in self.quantiles
+            }
+
+        summary = self.summary()
+        table: list[list[str]] = [
+            [_format_cell(row.get(c)) for c in self.columns] for row, _ in summary
+        ]
+        for getter in stat_columns.values():
+            formatted = _format_floats([getter(stats) for _, stats in summary])
+            for line, cell in zip(table, formatted, strict=True):
+                line.append(cell)
+
+        return render_table([*self.columns, *stat_columns], table)
+
+
+def _format_cell(value: str | None) -> str:
+    return "NaN" if value is None else str(value)
+
+
+def _format_floats(values: list[float], max_decimals: int = 6) -> list[str]:
+    """Format a column of numbers with the fewest decimals that represent every value."""
+    if all(isinstance(v, int) for v in values):
+        return [str(v) for v in values]
+    decimals = 1
+    for v in values:
+        if math.isfinite(v):
+            decimals = max(decimals, len(f"{v:.{max_decimals}f}".rstrip("0").split(".")[1]))
+    return ["NaN" if math.isnan(v) else f"{v:.{decimals}f}" for v in values]
+
+
+def render_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """Render right-aligned columns in the same layout as `DataFrame.to_string(index=False)`."""
+    widths = [
+        max(len(header), *(len(row[i]) for row in rows)) if rows else len(header)
+        for i, header in enumerate(headers)
+    ]
+    lines = [" ".join(h.rjust(w) for h, w in zip(headers, widths, strict=True))]
+    lines.extend(" ".join(c.rjust(w) for c, w in zip(row, widths, strict=True)) for row in rows)
+    return "\n".join(lines)
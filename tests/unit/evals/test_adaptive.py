@@ -0,0 +1,112 @@
+"""Test adaptive iterations."""
+
+import math
+
+import pytest
+
+from steelthread.evals.adaptive import AdaptiveIterations, AdaptiveSampler
+from steelthread.evals.checkpoint import WorkUnit
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase, InputConfig
+from steelthread.utils.stats import RunningStats
+
+
+def make_test_case(testcase: str) -> EvalTestCase:
+    """Make a test case."""
+    return EvalTestCase(
+        dataset="ds",
+        testcase=testcase,
+        test_case_name="test",
+        run="run",
+        input_config=InputConfig(type="query", value="q"),
+        assertions=[],
+    )
+
+
+def make_metrics(unit: WorkUnit, score: float) -> list[EvalMetric]:
+    """Make the metrics of a unit."""
+    return [
+        EvalMetric.from_test_case(
+            test_case=unit.test_case, score=score, name="accuracy", description="d"
+        )
+    ]
+
+
+def stats_of(*values: float) -> RunningStats:
+    """Make stats of some values."""
+    stats = RunningStats(quantiles=())
+    for value in values:
+        stats.add(value)
+    return stats
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"min_iterations": 1}, "min_iterations"),
+        ({"min_iterations": 4, "max_iterations": 3}, "max_iterations"),
+        ({"confidence": 1.0}, "confidence"),
+        ({"target_half_width": 0}, "target_half_width"),
+    ],
+)
+def test_policy_validation(kwargs: dict, match: str) -> None:
+    """Test invalid policies are rejected."""
+    with pytest.raises(ValueError, match=match):
+        AdaptiveIterations(**kwargs)
+
+
+def test_required_iterations() -> None:
+    """Test the estimate grows with the variance of the scores and is capped."""
+    policy = AdaptiveIterations(min_iterations=2, max_iterations=20, target_half_width=0.2)
+    assert math.isinf(policy.half_width(stats_of(1.0)))
+    assert policy.required_iterations(stats_of(1.0)) == 2
+    assert policy.required_iterations(stats_of(1.0, 1.0)) == 2
+    # std ~0.58 needs ceil((1.96 * 0.58 / 0.2) ** 2) = 32 runs, capped at 20
+    assert policy.required_iterations(stats_of(0.0, 1.0, 1.0)) == 20
+    moderate = policy.required_iterations(stats_of(0.3, 0.7, 0.5))
+    assert 3 < moderate < 20
+    # measured against the iterations run when some of them didn't record the metric
+    assert policy.required_iterations(stats_of(1.0, 1.0), iterations=4) == 4
+    assert policy.required_iterations(stats_of(0.0, 1.0), iterations=4) == 20
+    assert policy.required_iterations(stats_of(1.0), iterations=3) == 3
+
+
+def test_sampler_stops_stable_and_samples_flaky_cases() -> None:
+    """Test deterministic cases stop at the minimum while flaky ones get more runs."""
+    sampler = AdaptiveSampler(AdaptiveIterations(min_iterations=2, max_iterations=6))
+    stable, flaky = make_test_case("stable"), make_test_case("flaky")
+    queue = sampler.initial([stable, flaky])
+    assert [u.key for u in queue] == [("stable", 0), ("flaky", 0), ("stable", 1), ("flaky", 1)]
+
+    flaky_scores = iter([0.0, 1.0, 0.0, 1.0, 0.0, 1.0])
+    while queue:
+        unit = queue.pop(0)
+        score = 1.0 if unit.test_case.testcase == "stable" else next(flaky_scores)
+        queue.extend(sampler.record(unit, make_metrics(unit, score)))
+
+    assert sampler.iterations() == {"stable": 2, "flaky": 6}
+    assert sampler.scheduled == 8
+
+
+def test_sampler_keeps_assertions_of_the_same_type_apart() -> None:
+    """Test same-named metrics of a unit are separate samples, not pooled ones."""
+    sampler = AdaptiveSampler(AdaptiveIterations(min_iterations=2, max_iterations=10))
+    queue = sampler.initial([make_test_case("tc")])
+    while queue:
+        unit = queue.pop(0)
+        # two deterministic assertions of the same type that disagree with each other
+        metrics = make_metrics(unit, 1.0) + make_metrics(unit, 0.0)
+        queue.extend(sampler.record(unit, metrics))
+
+    assert sampler.iterations() == {"tc": 2}
+
+
+def test_sampler_respects_budget() -> None:
+    """Test no iterations are scheduled beyond the global budget."""
+    sampler = AdaptiveSampler(AdaptiveIterations(min_iterations=2, max_total_runs=3))
+    units = sampler.initial([make_test_case("a"), make_test_case("b")])
+    assert len(units) == 3
+    assert sampler.record(units[0], make_metrics(units[0], 0.0)) == []
+    assert sampler.record(units[2], make_metrics(units[2], 1.0)) == []
+    # units without metrics give nothing to estimate from
+    assert sampler.record(units[1], []) == []
@@ -1,11 +1,14 @@
 """Test backend."""
 
+from pathlib import Path
+
 import httpx
 import pytest
 from portia import Config
 from pytest_httpx import HTTPXMock
 
 from steelthread.evals.backend import PortiaBackend
+from steelthread.evals.compiler import DatasetCompilationError
 from steelthread.evals.models import EvalTestCase
 from tests.unit.utils import get_test_config
 
@@ -88,3 +91,90 @@ def test_check_response_raises_on_error(backend: PortiaBackend) -> None:
 
     with pytest.raises(ValueError, match="Bad request"):
         backend.check_response(response)
+
+
+def test_load_evals_fails_fast_on_invalid_test_cases(
+    backend: PortiaBackend, httpx_mock: HTTPXMock
+) -> None:
+    """Test a dataset with assertions that can never be evaluated fails when loaded."""
+    httpx_mock.add_response(
+        url=f"{backend.config.portia_api_endpoint}/api/v0/evals/dataset-test-cases/?dataset_name=myset&page=1",
+        json={
+            "results": [
+                {
+                    "id": "tc1",
+                    "dataset": "myset",
+                    "input_config": {"type": "query", "value": "hello"},
+                    "description": "test",
+                    "assertions": [
+                        {
+                            "type": "final_output",
+                            "output_type": "cascade",
+                            "value": "hello",
+                            "reject_similarity": 0.95,
+                        }
+                    ],
+                }
+            ],
+            "current_page": 1,
+            "total_pages": 1,
+        },
+        status_code=200,
+    )
+
+    with pytest.raises(DatasetCompilationError, match="similarity thresholds"):
+        backend.load_evals(dataset_name="myset", run_id="run-123")
+
+
+def _page(current: int, total: int, testcase: str) -> dict:
+    return {
+        "results": [
+            {
+                "id": testcase,
+                "dataset": "myset",
+                "input_config": {"type": "query", "value": testcase},
+                "description": testcase,
+                "assertions": [],
+            }
+        ],
+        "current_page": current,
+        "total_pages": total,
+    }
+
+
+def test_load_evals_revalidates_cached_pages(
+    config: Config, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    """Test cached pages are only downloaded again when changed, and can be used offline."""
+    backend = PortiaBackend(config=config, dataset_cache_dir=tmp_path)
+    url = f"{config.portia_api_endpoint}/api/v0/evals/dataset-test-cases/?dataset_name=myset&page="
+    modified = "Mon, 19 Oct 2026 10:00:00 GMT"
+    httpx_mock.add_response(url=f"{url}1", json=_page(1, 2, "tc1"), headers={"ETag": '"p1"'})
+    httpx_mock.add_response(
+        url=f"{url}2", json=_page(2, 2, "tc2"), headers={"Last-Modified": modified}
+    )
+    first = backend.load_evals(dataset_name="myset", run_id="run-1")
+    assert [tc.testcase for tc in first] == ["tc1", "tc2"]
+
+    # page 1 is unchanged, page 2 changed
+    httpx_mock.add_response(url=f"{url}1", status_code=304, match_headers={"If-None-Match": '"p1"'})
+    httpx_mock.add_response(
+        url=f"{url}2", json=_page(2, 2, "tc3"), match_headers={"If-Modified-Since": modified}
+    )
+    second = backend.load_evals(dataset_name="myset", run_id="run-2")
+    assert [(tc.testcase, tc.run) for tc in second] == [("tc1", "run-2"), ("tc3", "run-2")]
+    assert len(httpx_mock.get_requests()) == 4
+
+    offline = PortiaBackend(config=config, dataset_cache_dir=tmp_path, offline=True)
+    third = offline.load_evals(dataset_name="myset", run_id="run-3")
+    assert [tc.testcase for tc in third] == ["tc1", "tc3"]
+    assert len(httpx_mock.get_requests()) == 4
+
+
+def test_load_evals_offline_requires_cache(config: Config, tmp_path: Path) -> None:
+    """Test offline loading fails clearly without a cached dataset."""
+    with pytest.raises(ValueError, match="dataset_cache_dir is required"):
+        PortiaBackend(config=config, offline=True).load_evals("myset", "run")
+    backend = PortiaBackend(config=config, dataset_cache_dir=tmp_path, offline=True)
+    with pytest.raises(ValueError, match="Page 1 of dataset myset is not cached"):
+        backend.load_evals("myset", "run")
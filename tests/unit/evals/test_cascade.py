@@ -0,0 +1,114 @@
+"""Test cascade judging."""
+
+import pytest
+
+from steelthread.evals.cascade import (
+    CascadeJudge,
+    Expectation,
+    affirms_phrase,
+    contains_phrase,
+    lexical_similarity,
+    normalize,
+)
+
+
+def test_normalize() -> None:
+    """Test case, whitespace and edge punctuation are ignored."""
+    assert normalize("  The  Answer is\n42. ") == "the answer is 42"
+
+
+def test_lexical_similarity() -> None:
+    """Test similarity rewards shared words and their order."""
+    assert lexical_similarity("the cat sat", "The cat sat.") == pytest.approx(1)
+    assert lexical_similarity("the cat sat", "dogs bark") == 0
+    assert lexical_similarity("", "") == 1
+    assert lexical_similarity("", "x") == 0
+    assert lexical_similarity("cat sat the", "the cat sat") < 1
+
+
+def test_contains_phrase() -> None:
+    """Test phrases only match on word and number boundaries."""
+    assert contains_phrase("the answer is no", "no")
+    assert contains_phrase("yes, 4 apples", "4")
+    assert contains_phrase("it costs $4 today", "$4")
+    assert contains_phrase("the capital is new york city", "new york")
+    assert not contains_phrase("that is not it", "no")
+    assert not contains_phrase("there are 14 apples", "4")
+    assert not contains_phrase("it weighs 4.5kg", "4")
+    assert not contains_phrase("version 1.4", "4")
+    assert not contains_phrase("newark", "new")
+
+
+def test_affirms_phrase() -> None:
+    """Test phrases only found after a negation aren't affirmed."""
+    assert affirms_phrase("the answer is 4", "4")
+    assert affirms_phrase("it is 4, not 5", "4")
+    assert affirms_phrase("not 5 but 4", "4")
+    assert affirms_phrase("nothing but 4", "4")
+    assert not affirms_phrase("the answer is not 4", "4")
+    assert not affirms_phrase("it isn't paris", "paris")
+    assert not affirms_phrase("never on monday", "on monday")
+    assert not affirms_phrase("there are 14 apples", "4")
+
+
+@pytest.mark.parametrize(
+    ("actual", "expected", "stage", "score"),
+    [
+        ("Paris.", "paris", "exact_match", 1.0),
+        ("The capital is Paris", "paris", "partial_match", 1.0),
+        ("not", "no", None, None),
+        ("14", "4", None, None),
+        ("the answer is 4.", "4", "partial_match", 1.0),
+        ("the answer is not 4.", "4", None, None),
+        ('{"a": 1, "b": [1, 2]}', '{"b": [1, 3], "a": "1"}', "json", 2 / 3),
+        ("[]", "[ ]", "json", 1.0),
+        ("{}", '{"a": 1}', "json", 0.0),
+        ('{"a": 1}', "{}", "json", 0.0),
+        (
+            "report was sent to alice on monday",
+            "the report was sent to alice on monday",
+            "similarity",
+            1.0,
+        ),
+        ("the weather is sunny and warm", "stocks fell sharply today", None, None),
+        ("alice received the weekly report", "the weekly report was sent to alice", None, None),
+    ],
+)
+def test_judge_stages(actual: str, expected: str, stage: str | None, score: float | None) -> None:
+    """Test the first conclusive stage decides."""
+    verdict = CascadeJudge().judge(actual, expected)
+    if stage is None:
+        assert verdict is None
+        return
+    assert verdict
+    assert verdict.stage == stage
+    assert verdict.score == pytest.approx(score)
+
+
+def test_judge_similarity_thresholds() -> None:
+    """Test the thresholds decide whether similar outputs need an LLM judge."""
+    actual, expected = "alice received the weekly report", "the weekly report was sent to alice"
+    verdict = CascadeJudge(accept_similarity=0.5).judge(actual, expected)
+    assert verdict
+    assert (verdict.stage, verdict.score) == ("similarity", 1.0)
+
+    unrelated = "the weather is sunny and warm", "stocks fell sharply today"
+    verdict = CascadeJudge(reject_similarity=0.2).judge(*unrelated)
+    assert verdict
+    assert (verdict.stage, verdict.score) == ("similarity", 0.0)
+    assert CascadeJudge(reject_similarity=None).judge(*unrelated) is None
+
+    with pytest.raises(ValueError, match="thresholds"):
+        CascadeJudge(accept_similarity=0.5, reject_similarity=0.5)
+    with pytest.raises(ValueError, match="thresholds"):
+        CascadeJudge(accept_similarity=0)
+
+
+def test_judge_with_prepared_expectation() -> None:
+    """Test an expectation prepared once judges like the raw expected value."""
+    expectation = Expectation.of('{"name": "Alice", "age": 30}')
+    assert expectation.json_leaves == {"$.name": "alice", "$.age": "30"}
+    verdict = CascadeJudge().judge('{"age": 30, "name": "alice"}', expectation)
+    assert verdict
+    assert (verdict.stage, verdict.score) == ("json", 1.0)
+    assert Expectation.of("Plain text.") == Expectation("Plain text.", "plain text", None)
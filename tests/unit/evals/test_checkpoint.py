@@ -0,0 +1,64 @@
+"""Test checkpoints."""
+
+from pathlib import Path
+
+from steelthread.evals.checkpoint import EvalCheckpoint, WorkUnit
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase, InputConfig
+from tests.unit.utils import get_test_plan_run
+
+
+def make_test_case() -> EvalTestCase:
+    """Make a test case."""
+    return EvalTestCase(
+        dataset="ds",
+        testcase="tc",
+        test_case_name="test",
+        run="run",
+        input_config=InputConfig(type="query", value="q"),
+        assertions=[],
+    )
+
+
+def test_work_unit_key() -> None:
+    """Test units are keyed by test case and iteration."""
+    assert WorkUnit(make_test_case(), 2).key == ("tc", 2)
+
+
+def test_record_and_load(tmp_path: Path) -> None:
+    """Test recorded units are loaded back without eval_output."""
+    plan, plan_run = get_test_plan_run()
+    metric = EvalMetric.from_test_case(
+        test_case=make_test_case(),
+        score=0.5,
+        name="accuracy",
+        description="desc",
+        explanation="an explanation",
+        expectation=["a"],
+        eval_output={"plan": plan, "plan_run": plan_run},
+    )
+    metric.tags = {"model": "m"}
+
+    checkpoint = EvalCheckpoint(tmp_path / "checkpoints", "run")
+    checkpoint.record(("tc", 0), [metric])
+    checkpoint.record(("tc", 1), [])
+
+    loaded = EvalCheckpoint(tmp_path / "checkpoints", "run").load()
+    assert set(loaded) == {("tc", 0), ("tc", 1)}
+    restored = loaded[("tc", 0)][0]
+    assert restored.score == 0.5
+    assert restored.tags == {"model": "m"}
+    assert restored.expectation == ["a"]
+    assert restored.eval_output is None
+    assert loaded[("tc", 1)] == []
+
+
+def test_load_missing_and_corrupt(tmp_path: Path) -> None:
+    """Test a missing journal is empty and a torn trailing line is ignored."""
+    checkpoint = EvalCheckpoint(tmp_path, "run")
+    assert checkpoint.load() == {}
+
+    checkpoint.record(("tc", 0), [])
+    with checkpoint.path.open("a") as f:
+        f.write('{"testcase": "tc", "itera')
+    assert set(checkpoint.load()) == {("tc", 0)}
@@ -0,0 +1,161 @@
+"""Test compiling datasets."""
+
+import pytest
+
+from steelthread.evals.compiler import (
+    CompiledTestCase,
+    CostEstimate,
+    DatasetCompilationError,
+    compile_assertion,
+    compile_dataset,
+)
+from steelthread.evals.models import (
+    Assertion,
+    EvalTestCase,
+    FinalOutputAssertion,
+    ForbiddenToolsAssertion,
+    InputConfig,
+    LLMAsJudgeAssertion,
+    OutcomeAssertion,
+    ToolArgsAssertion,
+    ToolCallAssertion,
+    ToolCallCountAssertion,
+    ToolCallsAssertion,
+    ToolOrderAssertion,
+)
+
+
+def make_test_case(
+    testcase: str, assertions: list[Assertion], tools: list[str] | None = None
+) -> EvalTestCase:
+    """Make a test case."""
+    return EvalTestCase(
+        dataset="ds",
+        testcase=testcase,
+        test_case_name=f"name {testcase}",
+        run="run",
+        input_config=InputConfig(type="query", value="q", tools=tools),
+        assertions=assertions,
+    )
+
+
+def test_compile_assertion_prepares_matchers() -> None:
+    """Test expectations, judges and arguments are prepared once."""
+    cascade = compile_assertion(
+        FinalOutputAssertion(
+            type="final_output", output_type="cascade", value='{"a": 1}', accept_similarity=0.8
+        )
+    )
+    assert cascade.judge is not None
+    assert cascade.judge.accept_similarity == 0.8
+    assert cascade.expectation is not None
+    assert cascade.expectation.json_leaves == {"$.a": "1"}
+
+    exact = compile_assertion(
+        FinalOutputAssertion(type="final_output", output_type="exact_match", value=" Paris. ")
+    )
+    assert exact.expectation is not None
+    assert exact.expectation.normalized == "paris"
+
+    args = compile_assertion(ToolArgsAssertion(type="tool_args", tool="t", args={"x": {"b": 1}}))
+    assert args.args == {"x": '{"b":1}'}
+
+    outcome = compile_assertion(OutcomeAssertion(type="outcome", value="COMPLETE"))
+    assert (outcome.expectation, outcome.judge, outcome.args) == (None, None, None)
+
+
+def test_compile_assertion_rejects_unusable_assertions() -> None:
+    """Test assertions that could never be evaluated are rejected."""
+    with pytest.raises(ValueError, match="similarity thresholds"):
+        compile_assertion(
+            FinalOutputAssertion(
+                type="final_output", output_type="cascade", value="x", reject_similarity=0.95
+            )
+        )
+    with pytest.raises(ValueError, match="below min_calls"):
+        compile_assertion(
+            ToolCallCountAssertion(type="tool_call_count", tool="t", min_calls=2, max_calls=1)
+        )
+    with pytest.raises(ValueError, match="Unknown output_type"):
+        compile_assertion(
+            FinalOutputAssertion.model_construct(
+                type="final_output", output_type="fuzzy", value="x"
+            )
+        )
+
+
+def test_compiled_test_case_tools_and_cost() -> None:
+    """Test the tools a test case needs and its cost are worked out."""
+    tc = make_test_case(
+        "tc",
+        [
+            ToolCallsAssertion(
+                type="tool_calls",
+                calls={
+                    "search": ToolCallAssertion(called=True),
+                    "delete": ToolCallAssertion(called=False),
+                },
+            ),
+            ToolCallCountAssertion(type="tool_call_count", tool="fetch", min_calls=1),
+            ToolCallCountAssertion(type="tool_call_count", tool="retry", max_calls=0),
+            ToolArgsAssertion(type="tool_args", tool="send", args={}),
+            ToolOrderAssertion(type="tool_order", tools=["search", "send"]),
+            ForbiddenToolsAssertion(type="forbidden_tools", tools=["drop"]),
+            LLMAsJudgeAssertion(type="llm_as_judge", value="be nice"),
+            FinalOutputAssertion(type="final_output", output_type="llm_judge", value="x"),
+            FinalOutputAssertion(type="final_output", output_type="cascade", value="x"),
+        ],
+        tools=["lookup"],
+    )
+    compiled = tc.compiled()
+    assert compiled is tc.compiled()
+    assert len(compiled.assertions) == 9
+    assert compiled.tools == {"lookup", "search", "fetch", "send"}
+    assert compiled.cost == CostEstimate(plan_runs=1, judge_calls=2, possible_judge_calls=1)
+
+    replaced = tc.model_copy(update={"assertions": []})
+    assert replaced.compiled().assertions == ()
+    assert isinstance(replaced.compiled(), CompiledTestCase)
+    assert tc.compiled() is compiled
+    assert tc.model_copy().compiled() is compiled
+
+    tc.input_config = InputConfig(type="query", value="q")
+    assert tc.compiled() is not compiled
+    assert tc.compiled().tools == {"search", "fetch", "send"}
+
+
+def test_cost_estimate() -> None:
+    """Test estimates add up, scale and summarize."""
+    total = CostEstimate(1, 2, 0) + CostEstimate(1, 0, 1)
+    assert total == CostEstimate(2, 2, 1)
+    assert total.times(3) == CostEstimate(6, 6, 3)
+    assert str(total) == "2 plan runs and 2-3 LLM judge calls"
+    assert str(CostEstimate(1, 1, 0)) == "1 plan runs and 1 LLM judge calls"
+
+
+def test_compile_dataset_reports_every_problem() -> None:
+    """Test a dataset is compiled as a whole, listing the problems of all test cases."""
+    good = make_test_case("good", [ToolOrderAssertion(type="tool_order", tools=["search"])])
+    dataset = compile_dataset([good], tool_ids=["search"])
+    assert dataset.test_cases == [good]
+    assert dataset.cost == CostEstimate(plan_runs=1)
+    assert compile_dataset([good]).test_cases == [good]
+
+    bad = make_test_case(
+        "bad",
+        [
+            ToolCallCountAssertion(type="tool_call_count", tool="t", min_calls=2, max_calls=1),
+            FinalOutputAssertion(type="final_output", output_type="cascade", value="ok"),
+            FinalOutputAssertion(
+                type="final_output", output_type="cascade", value="x", accept_similarity=1.5
+            ),
+        ],
+    )
+    with pytest.raises(DatasetCompilationError) as exc_info:
+        compile_dataset([good, bad], tool_ids=["other"])
+    errors = exc_info.value.errors
+    assert len(errors) == 3
+    assert errors[0] == "test case good (name good) needs unknown tools: search"
+    assert errors[1].startswith("test case bad (name bad) assertion 0 (tool_call_count)")
+    assert errors[2].startswith("test case bad (name bad) assertion 2 (final_output)")
+    assert str(exc_info.value).startswith("3 problem(s) found in the dataset:\n- test case good")
@@ -0,0 +1,45 @@
+"""Test the dataset cache."""
+
+from pathlib import Path
+
+from steelthread.evals.dataset_cache import CachedPage, DatasetCache
+
+
+def test_cached_page_validators() -> None:
+    """Test a page is revalidated with whichever validators the server sent."""
+    assert CachedPage("{}").validators() == {}
+    assert CachedPage(
+        {}, etag='"v1"', last_modified="Mon, 19 Oct 2026 10:00:00 GMT"
+    ).validators() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 19 Oct 2026 10:00:00 GMT",
+    }
+
+
+def test_put_get_and_prune(tmp_path: Path) -> None:
+    """Test pages are stored per dataset and pages past the end are removed."""
+    cache = DatasetCache(tmp_path / "cache")
+    assert cache.get("my set/1", 1) is None
+    cache.prune("my set/1", 0)
+
+    for page in (1, 2, 3):
+        cache.put("my set/1", page, CachedPage(f"{page}", etag=f'"{page}"'))
+    cache.put("other", 1, CachedPage("1"))
+    assert cache.get("my set/1", 2) == CachedPage("2", etag='"2"')
+    assert cache.get("other", 1) == CachedPage("1")
+
+    cache.prune("my set/1", 2)
+    assert cache.get("my set/1", 2) is not None
+    assert cache.get("my set/1", 3) is None
+    assert not list((tmp_path / "cache").rglob("*.tmp"))
+
+
+def test_corrupt_entry_is_ignored(tmp_path: Path) -> None:
+    """Test a corrupt page is treated as not cached."""
+    cache = DatasetCache(tmp_path)
+    cache.put("set", 1, CachedPage("{}"))
+    (path,) = tmp_path.rglob("page-1.json")
+    path.write_text("{not json", encoding="utf-8")
+    assert cache.get("set", 1) is None
+    path.write_text('{"unexpected": 1}', encoding="utf-8")
+    assert cache.get("set", 1) is None
@@ -0,0 +1,108 @@
+"""Test deadlines and straggler re-execution."""
+
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from steelthread.evals.checkpoint import WorkUnit
+from steelthread.evals.deadlines import (
+    StragglerDetector,
+    StragglerPolicy,
+    UnitAttempts,
+    phase_timeout,
+    timeout_metric,
+)
+from steelthread.evals.models import EvalTestCase, InputConfig
+from steelthread.evals.scheduling import LatencyScheduler
+
+
+def make_unit(testcase: str) -> WorkUnit:
+    """Make a work unit."""
+    tc = EvalTestCase(
+        dataset="ds",
+        testcase=testcase,
+        test_case_name="test",
+        run="run",
+        input_config=InputConfig(type="query", value="q"),
+        assertions=[],
+    )
+    return WorkUnit(tc, 0)
+
+
+def test_phase_timeout() -> None:
+    """Test the tighter of the phase and remaining run deadline is used."""
+    assert phase_timeout(None, None) is None
+    assert phase_timeout(5, None) == 5
+    assert phase_timeout(None, 10, elapsed=4) == 6
+    assert phase_timeout(5, 10, elapsed=7) == 3
+    assert phase_timeout(5, 10, elapsed=12) == 0
+
+
+def test_timeout_metric() -> None:
+    """Test the timeout metric names the phase."""
+    metric = timeout_metric(make_unit("tc").test_case, "scoring", 2)
+    assert (metric.name, metric.score, metric.actual_value) == ("timeout", 0, "scoring")
+    assert metric.explanation == "The scoring phase did not finish within 2.0s"
+
+
+def test_straggler_policy_validation() -> None:
+    """Test invalid policies are rejected."""
+    with pytest.raises(ValueError, match="percentile"):
+        StragglerPolicy(percentile=1)
+    with pytest.raises(ValueError, match="min_samples"):
+        StragglerPolicy(min_samples=0)
+    with pytest.raises(ValueError, match="max_attempts"):
+        StragglerPolicy(max_attempts=0)
+    with pytest.raises(ValueError, match="check_interval"):
+        StragglerPolicy(check_interval=0)
+
+
+def test_straggler_detector() -> None:
+    """Test units running past the percentile get a limited number of extra attempts."""
+    detector = StragglerDetector(StragglerPolicy(percentile=0.5, min_samples=2, max_attempts=2))
+    detector.started(("fast", 0))
+    detector.started(("slow", 0))
+    assert list(detector.stragglers()) == []
+    detector.finished(("fast", 0))
+    detector.started(("fast", 1))
+    detector.finished(("fast", 1))
+    detector.finished(("unknown", 0))
+    threshold = detector.threshold()
+    assert threshold is not None
+
+    time.sleep(threshold + 0.01)
+    assert list(detector.stragglers()) == [("slow", 0)]
+    assert list(detector.stragglers()) == []
+    assert detector.duplicates == 1
+
+
+def test_unit_attempts_settle_on_first_finished() -> None:
+    """Test the first attempt to finish settles the unit and the others are discarded."""
+    scheduler = LatencyScheduler()
+    attempts = UnitAttempts(scheduler, StragglerPolicy(percentile=0.5, min_samples=1))
+    assert attempts.duplicates == 0
+
+    done = make_unit("done")
+    first: Future = Future()
+    attempts.start(first, done)
+    first.set_result([])
+    assert attempts.settle(first) == done
+    assert not attempts
+
+    slow = make_unit("slow")
+    original: Future = Future()
+    attempts.start(original, slow)
+    time.sleep(0.01)
+    duplicate: Future = Future()
+    attempts.retry_stragglers(lambda _: duplicate)
+    assert attempts.duplicates == 1
+    assert set(attempts) == {original, duplicate}
+
+    duplicate.set_result([])
+    assert attempts.settle(duplicate) == slow
+    assert original.cancelled()
+    assert len(attempts) == 0
+    assert original not in attempts
+
+    UnitAttempts(scheduler, None).retry_stragglers(lambda _: Future())
@@ -1,23 +1,30 @@
 """Test default evaluator."""
 
+import time
 from unittest.mock import patch
 
 import pytest
 from portia import Config, LocalDataValue, PlanRunState
 from portia.tool_call import ToolCallRecord, ToolCallStatus
 
-from steelthread.evals.default_evaluator import DefaultEvaluator
+from steelthread.evals.default_evaluator import DefaultEvaluator, OutputScoreCalculator
 from steelthread.evals.evaluator import PlanRunMetadata
 from steelthread.evals.models import (
     EvalTestCase,
     FinalOutputAssertion,
+    ForbiddenToolsAssertion,
     InputConfig,
     LatencyAssertion,
     LLMAsJudgeAssertion,
     OutcomeAssertion,
+    SemanticMatchAssertion,
+    ToolArgsAssertion,
     ToolCallAssertion,
+    ToolCallCountAssertion,
     ToolCallsAssertion,
+    ToolOrderAssertion,
 )
+from steelthread.utils.concurrency import BoundedExecutor
 from steelthread.utils.llm import LLMScorer, MetricOutput
 from tests.unit.utils import get_test_config, get_test_plan_run
 
@@ -353,3 +360,150 @@ def test_llm_judge_assertion(
 
     # Check LLMScorer was called correctly
     mock_scorer_class.assert_called_once_with(config)  # type: ignore  # noqa: PGH003
+
+
+def test_assertions_evaluated_concurrently_in_order(
+    config: Config, test_case: EvalTestCase
+) -> None:
+    """Test slow assertions overlap and metrics keep the assertion order."""
+    plan, plan_run = get_test_plan_run()
+    plan_run.state = PlanRunState.COMPLETE
+    metadata = PlanRunMetadata(tool_calls=[], latency_ms=10)
+    test_case.assertions = [
+        LLMAsJudgeAssertion(type="llm_as_judge", value=f"rule {i}") for i in range(4)
+    ]
+
+    def score(task_data: list[str], metrics_to_score: list) -> list[MetricOutput]:  # noqa: ARG001
+        time.sleep(0.1)
+        return [MetricOutput(name=task_data[0][-6:], description="d", score=1, explanation="e")]
+
+    with patch("steelthread.evals.default_evaluator.LLMScorer") as mock_scorer_class:
+        mock_scorer_class.return_value.score.side_effect = score
+        evaluator = DefaultEvaluator(config, executor=BoundedExecutor(max_workers=4))
+        start = time.perf_counter()
+        metrics = evaluator.eval_test_case(test_case, plan, plan_run, metadata)
+
+    assert time.perf_counter() - start < 0.3
+    assert metrics
+    assert [m.name for m in metrics] == [f"rule {i}" for i in range(4)]
+
+
+@patch("steelthread.evals.default_evaluator.LLMScorer")
+def test_final_output_cascade(
+    mock_scorer_class: LLMScorer, config: Config, test_case: EvalTestCase
+) -> None:
+    """Test cheap stages decide when they can and the LLM judge is asked otherwise."""
+    plan, plan_run = get_test_plan_run()
+    metadata = PlanRunMetadata(tool_calls=[], latency_ms=10)
+    plan_run.outputs.final_output = LocalDataValue(value='{"city": "London", "temp": 12}')
+    test_case.assertions = [
+        FinalOutputAssertion(
+            type="final_output", output_type="cascade", value='{"city": "london", "temp": 14}'
+        )
+    ]
+    evaluator = DefaultEvaluator(config)
+    metrics = evaluator.eval_test_case(test_case, plan, plan_run, metadata)
+    assert metrics
+    m = metrics[0]
+    assert m.score == 0.5
+    assert m.description == "Cascade final output match"
+    assert m.explanation
+    assert m.explanation.startswith("Decided by the json stage")
+    mock_scorer_class.assert_not_called()  # type: ignore  # noqa: PGH003
+
+    plan_run.outputs.final_output = LocalDataValue(value="actual result")
+    test_case.assertions = [
+        FinalOutputAssertion(type="final_output", output_type="cascade", value="expected result")
+    ]
+    mock_scorer = mock_scorer_class.return_value  # type: ignore  # noqa: PGH003
+    mock_scorer.score.return_value = [
+        MetricOutput(
+            name="final_output",
+            description="LLM-based final output score",
+            score=0.4,
+            explanation="LLM says it's not quite it",
+        )
+    ]
+    metrics = evaluator.eval_test_case(test_case, plan, plan_run, metadata)
+    assert metrics
+    m = metrics[0]
+    assert m.score == 0.4
+    assert m.explanation
+    assert m.explanation.startswith("Decided by the llm_judge stage")
+    assert m.explanation.endswith("LLM says it's not quite it")
+
+
+def test_semantic_match_assertion(config: Config, test_case: EvalTestCase) -> None:
+    """Test the output is scored by similarity to its closest reference."""
+    plan, plan_run = get_test_plan_run()
+    metadata = PlanRunMetadata(tool_calls=[], latency_ms=10)
+    plan_run.outputs.final_output = LocalDataValue(value="The capital of France is Paris")
+    test_case.assertions = [
+        SemanticMatchAssertion(
+            type="semantic_match", references=["berlin", "the capital of france is paris"]
+        ),
+        SemanticMatchAssertion(type="semantic_match", references=["berlin"], threshold=0.5),
+    ]
+    evaluator = DefaultEvaluator(config)
+    evaluator.prepare([test_case])
+    metrics = evaluator.eval_test_case(test_case, plan, plan_run, metadata)
+    assert metrics
+    assert [m.name for m in metrics] == ["semantic_match", "semantic_match"]
+    assert metrics[0].score == pytest.approx(1)
+    assert metrics[0].expectation == ["berlin", "the capital of france is paris"]
+    assert metrics[1].score == 0
+
+
+def test_tool_call_index_assertions(config: Config, test_case: EvalTestCase) -> None:
+    """Test count, order, argument and forbidden tool assertions."""
+    plan, plan_run = get_test_plan_run()
+    metadata = PlanRunMetadata(
+        tool_calls=[
+            ToolCallRecord(
+                tool_name=tool_name,
+                plan_run_id=plan_run.id,
+                step=step,
+                end_user_id=plan_run.end_user_id,
+                status=ToolCallStatus.SUCCESS,
+                input=tool_input,
+                output={},
+                latency_seconds=1,
+            )
+            for step, (tool_name, tool_input) in enumerate(
+                [("search", {"query": "weather"}), ("send", {"to": "a"}), ("search", {})]
+            )
+        ],
+        latency_ms=10,
+    )
+    test_case.assertions = [
+        ToolCallCountAssertion(type="tool_call_count", tool="search", min_calls=1, max_calls=2),
+        ToolCallCountAssertion(type="tool_call_count", tool="send", min_calls=2),
+        ToolOrderAssertion(type="tool_order", tools=["search", "send"]),
+        ToolOrderAssertion(type="tool_order", tools=["send", "send"]),
+        ToolArgsAssertion(type="tool_args", tool="search", args={"query": "weather"}),
+        ToolArgsAssertion(type="tool_args", tool="send", args={"to": "b"}),
+        ForbiddenToolsAssertion(type="forbidden_tools", tools=["delete"]),
+        ForbiddenToolsAssertion(type="forbidden_tools", tools=["delete", "send"]),
+    ]
+    evaluator = DefaultEvaluator(config)
+    metrics = evaluator.eval_test_case(test_case, plan, plan_run, metadata)
+    assert metrics
+    assert [m.score for m in metrics] == [1, 0, 1, 0, 1, 0, 1, 0]
+    assert metrics[0].expectation == "at least 1 and at most 2"
+    assert metrics[1].actual_value == "1"
+    assert metrics[3].actual_value == ["search", "send", "search"]
+    assert metrics[5].actual_value == ['{"to":"a"}']
+    assert metrics[7].actual_value == ["send"]
+
+
+def test_output_score_calculator() -> None:
+    """Test scoring outputs without a compiled assertion."""
+    output = LocalDataValue(value="Found 12 results")
+    partial = FinalOutputAssertion(type="final_output", output_type="partial_match", value="12")
+    assert OutputScoreCalculator.calculate(output, partial) == 1.0
+    assert OutputScoreCalculator.calculate(None, partial) == 0.0
+    unknown = FinalOutputAssertion.model_construct(
+        type="final_output", output_type="other", value="x"
+    )
+    with pytest.raises(ValueError, match="Unknown output_type"):
+        OutputScoreCalculator.calculate(output, unknown)
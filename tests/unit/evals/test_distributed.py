@@ -0,0 +1,161 @@
+"""Test distributed eval runs."""
+
+from pathlib import Path
+from threading import Thread
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from steelthread.evals.checkpoint import WorkUnit
+from steelthread.evals.distributed import EvalCoordinator, EvalWorker
+from steelthread.evals.eval_runner import EvalConfig, EvalRunner
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase, InputConfig
+from steelthread.evals.work_queue import Lease, SQLiteWorkQueue
+from tests.unit.utils import get_test_config
+
+
+def make_test_case(testcase: str) -> EvalTestCase:
+    """Make a test case."""
+    return EvalTestCase(
+        dataset="ds",
+        testcase=testcase,
+        test_case_name="test",
+        run="run",
+        input_config=InputConfig(type="query", value="q"),
+        assertions=[],
+    )
+
+
+def make_config(backend: MagicMock | None = None) -> EvalConfig:
+    """Make an eval config."""
+    return EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        iterations=2,
+        metrics_backends=[backend or MagicMock()],
+        max_concurrency=2,
+    )
+
+
+def execute(_: EvalRunner, tc: EvalTestCase) -> tuple[list[EvalMetric], float]:
+    """Stand in for running a test case."""
+    metric = EvalMetric.from_test_case(test_case=tc, score=1.0, name="acc", description="d")
+    return [metric], 1.0
+
+
+@patch("steelthread.evals.distributed.PortiaBackend")
+def test_workers_share_a_run(mock_backend_cls: MagicMock, tmp_path: Path) -> None:
+    """Test every unit is executed once across workers and merged by the coordinator."""
+    backend = MagicMock()
+    config = make_config(backend)
+    queue = SQLiteWorkQueue(tmp_path / "queue.db")
+    mock_backend_cls.return_value.load_evals.return_value = [
+        make_test_case("tc1"),
+        make_test_case("tc2"),
+    ]
+    coordinator = EvalCoordinator(config, queue, poll_seconds=0)
+
+    run_id = coordinator.enqueue("run-1")
+    mock_backend_cls.return_value.load_evals.assert_called_once_with("set", "run-1")
+
+    with patch.object(EvalRunner, "_execute_test_case", autospec=True, side_effect=execute):
+        first = EvalWorker(MagicMock(), config, queue, worker_id="a", poll_seconds=0)
+        second = EvalWorker(MagicMock(), config, queue, worker_id="b", poll_seconds=0)
+        assert first.run(run_id) + second.run(run_id) == 4
+
+    metrics = coordinator.wait(run_id, timeout=1)
+    assert len(metrics) == 4
+    backend.save_eval_metrics.assert_called_once_with(metrics)
+
+
+@patch("steelthread.evals.distributed.PortiaBackend")
+def test_worker_started_before_the_run_waits_for_it(
+    mock_backend_cls: MagicMock, tmp_path: Path
+) -> None:
+    """Test a worker started before the coordinator enqueues the run works on it."""
+    config = make_config()
+    queue = SQLiteWorkQueue(tmp_path / "queue.db")
+    mock_backend_cls.return_value.load_evals.return_value = [make_test_case("tc")]
+    worker = EvalWorker(MagicMock(), config, queue, worker_id="a", poll_seconds=0.01)
+    completed: list[int] = []
+
+    with patch.object(EvalRunner, "_execute_test_case", autospec=True, side_effect=execute):
+        thread = Thread(target=lambda: completed.append(worker.run("run-1", start_timeout=10)))
+        thread.start()
+        EvalCoordinator(config, queue, poll_seconds=0).enqueue("run-1")
+        thread.join(timeout=10)
+
+    assert completed == [2]
+    with pytest.raises(TimeoutError, match="run-2 wasn't enqueued"):
+        worker.run("run-2", start_timeout=0)
+
+
+def test_coordinator_reclaims_and_times_out(tmp_path: Path) -> None:
+    """Test the coordinator returns expired units to the queue while waiting."""
+    queue = SQLiteWorkQueue(tmp_path / "queue.db")
+    queue.enqueue("run-1", [WorkUnit(make_test_case("tc"), 0)])
+    queue.claim("run-1", "dead", lease_seconds=-1)
+    coordinator = EvalCoordinator(make_config(), queue, poll_seconds=0)
+
+    with pytest.raises(TimeoutError, match="1 of 1 units left"):
+        coordinator.wait("run-1", timeout=0)
+    assert queue.claim("run-1", "alive", lease_seconds=60) is not None
+
+
+def test_worker_waits_for_leases_held_elsewhere_and_renews() -> None:
+    """Test a worker polls while others hold units and keeps its own leases alive."""
+    lease = Lease("run-1", WorkUnit(make_test_case("tc"), 0), "a", expires_at=0)
+    queue = MagicMock()
+    queue.claim.side_effect = [None, lease, *[None] * 5]
+    queue.is_finished.side_effect = [False, True]
+    # renewed once, then lost to another worker before the unit completes
+    queue.renew.side_effect = [lease, None]
+    queue.complete.return_value = False
+    polls = {"n": 0}
+
+    def fake_wait(futures: dict, **_: object) -> tuple[set, set]:
+        polls["n"] += 1
+        if polls["n"] < 3:
+            return set(), set(futures)
+        return set(futures), set()
+
+    worker = EvalWorker(MagicMock(), make_config(), queue, poll_seconds=0)
+    with (
+        patch.object(EvalRunner, "_execute_test_case", autospec=True, side_effect=execute),
+        patch("steelthread.evals.distributed.wait", side_effect=fake_wait),
+    ):
+        assert worker.run("run-1") == 0
+
+    assert queue.renew.call_count == 2
+    queue.complete.assert_called_once()
+
+
+@patch("steelthread.evals.distributed.PortiaBackend")
+def test_worker_completes_failing_units_with_an_error_metric(
+    mock_backend_cls: MagicMock, tmp_path: Path
+) -> None:
+    """Test a unit that raises is completed with an error metric and the worker carries on."""
+    config = make_config()
+    queue = SQLiteWorkQueue(tmp_path / "queue.db")
+    mock_backend_cls.return_value.load_evals.return_value = [
+        make_test_case("poison"),
+        make_test_case("tc"),
+    ]
+    run_id = EvalCoordinator(config, queue, poll_seconds=0).enqueue("run-1")
+
+    def flaky(runner: EvalRunner, tc: EvalTestCase) -> tuple[list[EvalMetric], float]:
+        if tc.testcase == "poison":
+            raise RuntimeError("boom")
+        return execute(runner, tc)
+
+    with patch.object(EvalRunner, "_execute_test_case", autospec=True, side_effect=flaky):
+        worker = EvalWorker(MagicMock(), config, queue, worker_id="a", poll_seconds=0)
+        assert worker.run(run_id) == 4
+
+    metrics = queue.results(run_id)
+    errors = [m for m in metrics if m.name == "error"]
+    assert len(errors) == 2
+    assert all(m.testcase == "poison" and m.score == 0 for m in errors)
+    assert errors[0].explanation == "RuntimeError: boom"
+    assert sorted(m.name for m in metrics) == ["acc", "acc", "error", "error"]
@@ -1,13 +1,24 @@
 """Test eval runner."""
 
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 from uuid import UUID
 
 import pytest
 
+from steelthread.evals import eval_runner
+from steelthread.evals.adaptive import AdaptiveIterations
+from steelthread.evals.checkpoint import EvalCheckpoint
+from steelthread.evals.compiler import DatasetCompilationError
+from steelthread.evals.deadlines import StragglerPolicy
 from steelthread.evals.eval_runner import EvalConfig, EvalRunner
 from steelthread.evals.metrics import EvalMetric
 from steelthread.evals.models import EvalTestCase, InputConfig
+from steelthread.evals.pipeline import ExecutedTestCase
+from steelthread.utils.concurrency import BoundedExecutor
 from steelthread.utils.timing import EventTimer
 from tests.unit.utils import get_test_config, get_test_plan_run
 
@@ -121,6 +132,45 @@ def test_evaluate_and_collect_metrics(
     assert result[0].name == "clarity"
 
 
+@patch("steelthread.evals.eval_runner.NoAuthPullPortia")
+@patch("steelthread.evals.eval_runner.ReadOnlyStorage")
+def test_evaluators_run_concurrently_in_order(
+    mock_storage_cls: MagicMock,  # noqa: ARG001
+    mock_portia_cls: MagicMock,
+) -> None:
+    """Test evaluators overlap and their metrics are merged in evaluator order."""
+    test_case = make_test_case(with_plan=False)
+
+    def make_evaluator(name: str | None) -> MagicMock:
+        def evaluate(*_: object) -> list[EvalMetric] | None:
+            time.sleep(0.1)
+            if name is None:
+                return None
+            return [
+                EvalMetric.from_test_case(test_case=test_case, score=1, name=name, description="d")
+            ]
+
+        evaluator = MagicMock()
+        evaluator.eval_test_case.side_effect = evaluate
+        return evaluator
+
+    config = EvalConfig(
+        eval_dataset_name="dataset",
+        config=get_test_config(),
+        metrics_backends=[MagicMock()],
+        evaluators=[make_evaluator("a"), make_evaluator(None), make_evaluator("b")],
+        scoring_executor=BoundedExecutor(max_workers=3),
+    )
+    runner = EvalRunner(portia=mock_portia_cls, config=config)
+    with patch.object(runner, "_run_test_case", return_value=(MagicMock(), MagicMock(), 5.0)):
+        start = time.perf_counter()
+        metrics, latency = runner._execute_test_case(test_case)
+
+    assert time.perf_counter() - start < 0.25
+    assert [m.name for m in metrics] == ["a", "b"]
+    assert latency == 5.0
+
+
 @patch("steelthread.evals.eval_runner.PlanUUID.from_string")
 def test_run_test_case_query_input(mock_plan_uuid: MagicMock) -> None:  # noqa: ARG001
     """Test _run_test_case with input type 'query'."""
@@ -173,3 +223,454 @@ def test_run_test_case_invalid_type() -> None:
 
     with pytest.raises(ValueError, match="invalid input_config type: unknown"):
         runner._run_test_case(test_case, mock_portia)
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_checkpoints_and_resumes(mock_backend_cls: MagicMock, tmp_path: Path) -> None:
+    """Test completed iterations are journaled and skipped on resume."""
+    backend = MagicMock()
+    config = EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        iterations=2,
+        metrics_backends=[backend],
+        checkpoint_dir=tmp_path,
+    )
+    test_case = make_test_case(with_plan=False)
+    mock_backend_cls.return_value.load_evals.return_value = [test_case]
+    metric = EvalMetric.from_test_case(
+        test_case=test_case, score=1.0, name="clarity", description="desc"
+    )
+
+    # simulate a run that completed its first iteration before crashing
+    EvalCheckpoint(tmp_path, "run-1").record(("tc", 0), [metric])
+
+    runner = EvalRunner(MagicMock(), config=config)
+    with patch.object(runner, "_evaluate_and_collect_metrics", return_value=[metric]) as mock_eval:
+        runner.resume("run-1")
+
+    mock_eval.assert_called_once()
+    mock_backend_cls.return_value.load_evals.assert_called_once_with("set", "run-1")
+    saved = backend.save_eval_metrics.call_args[0][0]
+    assert len(saved) == 2
+    assert set(EvalCheckpoint(tmp_path, "run-1").load()) == {("tc", 0), ("tc", 1)}
+
+
+def test_eval_runner_resume_requires_checkpoint_dir() -> None:
+    """Test resume fails without a checkpoint directory."""
+    config = EvalConfig(eval_dataset_name="d", config=get_test_config())
+    runner = EvalRunner(MagicMock(), config=config)
+    with pytest.raises(ValueError, match="checkpoint_dir"):
+        runner.resume("run-1")
+
+
+def test_eval_config_requires_portia_factory_for_processes() -> None:
+    """Test process mode needs a way to build Portia in each worker."""
+    with pytest.raises(ValueError, match="portia_factory"):
+        EvalConfig(eval_dataset_name="d", config=get_test_config(), worker_processes=2)
+
+
+def test_eval_config_validates_shard() -> None:
+    """Test the shard index must fall within the shard count."""
+    with pytest.raises(ValueError, match="shard_index"):
+        EvalConfig(eval_dataset_name="d", config=get_test_config(), shard_index=2, shard_count=2)
+
+
+def test_eval_config_offline_requires_dataset_cache_dir() -> None:
+    """Test offline runs need a dataset cache to read from."""
+    with pytest.raises(ValueError, match="dataset_cache_dir"):
+        EvalConfig(eval_dataset_name="d", config=get_test_config(), offline=True)
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_runs_only_its_shard(mock_backend_cls: MagicMock) -> None:
+    """Test each shard runs a disjoint slice of the dataset under the shared run id."""
+    test_cases = [
+        make_test_case(with_plan=False).model_copy(update={"testcase": f"tc{i}"}) for i in range(6)
+    ]
+    mock_backend_cls.return_value.load_evals.return_value = test_cases
+
+    executed = []
+    for shard_index in range(3):
+        config = EvalConfig(
+            eval_dataset_name="set",
+            config=get_test_config(),
+            iterations=1,
+            metrics_backends=[MagicMock()],
+            run_id="pipeline-1",
+            shard_index=shard_index,
+            shard_count=3,
+            shard_weights={tc.testcase: 1.0 for tc in test_cases},
+        )
+        runner = EvalRunner(MagicMock(), config=config)
+        with patch.object(runner, "_evaluate_and_collect_metrics", return_value=[]) as mock_eval:
+            runner.run()
+        shard = [call.args[0].testcase for call in mock_eval.call_args_list]
+        assert len(shard) == 2
+        executed.extend(shard)
+
+    assert sorted(executed) == [tc.testcase for tc in test_cases]
+    mock_backend_cls.return_value.load_evals.assert_called_with("set", "pipeline-1")
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_rejects_unknown_tools_before_running(mock_backend_cls: MagicMock) -> None:
+    """Test test cases needing tools the registry doesn't have fail the run up front."""
+    test_case = make_test_case(with_plan=False).model_copy(
+        update={"input_config": InputConfig(type="query", value="q", tools=["missing"])}
+    )
+    mock_backend_cls.return_value.load_evals.return_value = [test_case]
+    portia = MagicMock()
+    portia.tool_registry.get_tools.return_value = [MagicMock(id="search")]
+    config = EvalConfig(eval_dataset_name="set", config=get_test_config(), iterations=1)
+    runner = EvalRunner(portia, config=config)
+
+    with (
+        patch.object(runner, "_evaluate_and_collect_metrics") as mock_eval,
+        pytest.raises(DatasetCompilationError, match="needs unknown tools: missing"),
+    ):
+        runner.run()
+    mock_eval.assert_not_called()
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_adaptive_iterations(mock_backend_cls: MagicMock, tmp_path: Path) -> None:
+    """Test flaky test cases are re-run while restored and stable ones are not."""
+    backend = MagicMock()
+    config = EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        metrics_backends=[backend],
+        checkpoint_dir=tmp_path,
+        adaptive=AdaptiveIterations(min_iterations=2, max_iterations=4),
+    )
+    stable = make_test_case(with_plan=False).model_copy(update={"testcase": "stable"})
+    flaky = make_test_case(with_plan=False).model_copy(update={"testcase": "flaky"})
+    mock_backend_cls.return_value.load_evals.return_value = [stable, flaky]
+
+    def metric(tc: EvalTestCase, score: float) -> EvalMetric:
+        return EvalMetric.from_test_case(test_case=tc, score=score, name="acc", description="d")
+
+    # the first iteration of the flaky test case was completed before a crash
+    EvalCheckpoint(tmp_path, "run-1").record(("flaky", 0), [metric(flaky, 0.0)])
+
+    def evaluate(tc: EvalTestCase, _: EventTimer) -> list[EvalMetric]:
+        return [metric(tc, 1.0)]
+
+    runner = EvalRunner(MagicMock(), config=config)
+    with patch.object(runner, "_evaluate_and_collect_metrics", side_effect=evaluate) as mock_eval:
+        runner.resume("run-1")
+
+    # stable: 2 runs, flaky: 1 restored + 3 executed up to max_iterations
+    assert mock_eval.call_count == 5
+    assert len(backend.save_eval_metrics.call_args[0][0]) == 6
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_reuses_unchanged_test_cases(
+    mock_backend_cls: MagicMock,
+    tmp_path: Path,
+) -> None:
+    """Test a second run only executes test cases whose fingerprint changed."""
+    first = make_test_case(with_plan=False).model_copy(update={"testcase": "first"})
+    second = make_test_case(with_plan=False).model_copy(update={"testcase": "second"})
+    mock_backend_cls.return_value.load_evals.return_value = [first, second]
+    portia = MagicMock()
+    portia.tool_registry.get_tools.return_value = []
+
+    def evaluate(tc: EvalTestCase, _: EventTimer) -> list[EvalMetric]:
+        return [EvalMetric.from_test_case(test_case=tc, score=1.0, name="acc", description="d")]
+
+    def run(
+        code_version: str, iterations: int = 1, tags: dict[str, str] | None = None
+    ) -> tuple[EvalRunner, MagicMock, MagicMock]:
+        backend = MagicMock()
+        config = EvalConfig(
+            eval_dataset_name="set",
+            config=get_test_config(),
+            iterations=iterations,
+            metrics_backends=[backend],
+            fingerprint_cache_dir=tmp_path,
+            code_version=code_version,
+            run_id="run",
+            additional_tags=tags,
+        )
+        runner = EvalRunner(portia, config=config)
+        with patch.object(runner, "_evaluate_and_collect_metrics", side_effect=evaluate) as ev:
+            runner.run()
+        return runner, ev, backend
+
+    run("v1")
+    mock_backend_cls.return_value.load_evals.return_value = [
+        first,
+        second.model_copy(update={"input_config": InputConfig(type="query", value="new")}),
+    ]
+    runner, mock_eval, backend = run("v1", tags={"branch": "main"})
+
+    assert runner.fingerprint_report is not None
+    assert runner.fingerprint_report.reused == ["first"]
+    assert runner.fingerprint_report.executed == ["second"]
+    assert [call.args[0].testcase for call in mock_eval.call_args_list] == ["second"]
+    saved = backend.save_eval_metrics.call_args[0][0]
+    assert len(saved) == 2
+    assert {m.run for m in saved} == {"run"}
+    # reused metrics get this run's tags, and the identity of the test case reusing them
+    # even though the identical second test case may have cached them
+    assert sorted(m.testcase for m in saved) == ["first", "second"]
+    assert [m.tags["branch"] for m in saved if m.testcase == "first"] == ["main"]
+    assert {m.dataset for m in saved} == {first.dataset}
+
+    # a new code version or iteration count invalidates everything
+    runner, mock_eval, _ = run("v2")
+    assert mock_eval.call_count == 2
+    runner, mock_eval, _ = run("v2", iterations=3)
+    assert mock_eval.call_count == 6
+
+
+def fake_process_pool(
+    max_workers: int,
+    mp_context: object,  # noqa: ARG001
+    initializer: Callable[..., None],
+    initargs: tuple,
+) -> ThreadPoolExecutor:
+    """Stand in for a process pool that runs workers in threads."""
+    return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+
+@patch("steelthread.evals.eval_runner.ProcessPoolExecutor", side_effect=fake_process_pool)
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_process_mode(
+    mock_backend_cls: MagicMock,
+    mock_pool_cls: MagicMock,
+) -> None:
+    """Test workers build their own runner and stream metrics back to the parent."""
+    backend = MagicMock()
+    factory = MagicMock()
+    config = EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        iterations=2,
+        metrics_backends=[backend],
+        worker_processes=2,
+        portia_factory=factory,
+    )
+    test_case = make_test_case(with_plan=False)
+    mock_backend_cls.return_value.load_evals.return_value = [test_case]
+    metric = EvalMetric.from_test_case(
+        test_case=test_case, score=1.0, name="clarity", description="desc"
+    )
+
+    with patch.object(
+        EvalRunner, "_execute_test_case", return_value=([metric], 12.0)
+    ) as mock_execute:
+        EvalRunner(MagicMock(), config=config).run()
+
+    assert mock_pool_cls.call_args.kwargs["max_workers"] == 2
+    worker_config = mock_pool_cls.call_args.kwargs["initargs"][0]
+    assert worker_config.metrics_backends == []
+    assert worker_config.worker_processes is None
+    factory.assert_called_with(config.portia_config)
+    assert mock_execute.call_count == 2
+    assert len(backend.save_eval_metrics.call_args[0][0]) == 2
+
+
+def test_worker_requires_initialization() -> None:
+    """Test worker entry points validate their state."""
+    config = EvalConfig(eval_dataset_name="d", config=get_test_config())
+    with pytest.raises(ValueError, match="portia_factory"):
+        eval_runner._init_worker(config)
+    with patch.object(eval_runner, "_worker_runner", None), pytest.raises(RuntimeError):
+        eval_runner._evaluate_in_worker(make_test_case(with_plan=False))
+
+
+def test_eval_config_rejects_scoring_pool_with_processes() -> None:
+    """Test the scoring stage is only available with thread workers."""
+    with pytest.raises(ValueError, match="scoring_concurrency"):
+        EvalConfig(
+            eval_dataset_name="d",
+            config=get_test_config(),
+            worker_processes=2,
+            portia_factory=MagicMock(),
+            scoring_concurrency=2,
+        )
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_scores_on_separate_pool(mock_backend_cls: MagicMock) -> None:
+    """Test slow scoring doesn't hold execution workers and each stage reports utilization."""
+    backend = MagicMock()
+    evaluator = MagicMock()
+    config = EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        iterations=2,
+        metrics_backends=[backend],
+        evaluators=[evaluator],
+        max_concurrency=1,
+        scoring_concurrency=4,
+        scoring_queue_size=4,
+        execution_rate_limit=1000,
+        scoring_rate_limit=1000,
+    )
+    test_cases = [
+        make_test_case(with_plan=False).model_copy(update={"testcase": f"tc{i}"}) for i in range(2)
+    ]
+    mock_backend_cls.return_value.load_evals.return_value = test_cases
+
+    def score(tc: EvalTestCase, *_: object) -> list[EvalMetric]:
+        time.sleep(0.2)
+        return [EvalMetric.from_test_case(test_case=tc, score=1, name="acc", description="d")]
+
+    evaluator.eval_test_case.side_effect = score
+    runner = EvalRunner(MagicMock(), config=config)
+
+    def execute(tc: EvalTestCase) -> ExecutedTestCase:
+        with runner.execution_monitor.busy():
+            time.sleep(0.05)
+        return ExecutedTestCase(tc, MagicMock(), MagicMock(), MagicMock(latency_ms=50.0))
+
+    with (
+        patch.object(runner, "_execute", side_effect=execute),
+        patch.object(
+            eval_runner.EvalMetricTagger, "attach_tags_to_test_case", side_effect=lambda m, *_: m
+        ),
+    ):
+        start = time.perf_counter()
+        runner.run()
+
+    # four 50ms executions on one worker overlap with four 200ms scorings on four workers
+    assert time.perf_counter() - start < 0.6
+    evaluator.prepare.assert_called_once_with(test_cases)
+    saved = backend.save_eval_metrics.call_args[0][0]
+    assert sorted(m.testcase for m in saved) == ["tc0", "tc0", "tc1", "tc1"]
+    execution, scoring = runner.stage_utilization
+    assert (execution.name, execution.workers, execution.items) == ("execution", 1, 4)
+    assert (scoring.name, scoring.workers, scoring.items) == ("scoring", 4, 4)
+    assert execution.utilization > 0.5
+
+
+@patch("steelthread.evals.eval_runner.NoAuthPullPortia")
+@patch("steelthread.evals.eval_runner.ReadOnlyStorage")
+def test_execute_test_case_records_timeouts(
+    mock_storage_cls: MagicMock,  # noqa: ARG001
+    mock_portia_cls: MagicMock,
+) -> None:
+    """Test a hung run or judge records a timeout metric instead of blocking."""
+    evaluator = MagicMock()
+    config = EvalConfig(
+        eval_dataset_name="d",
+        config=get_test_config(),
+        evaluators=[evaluator],
+        run_timeout=0.3,
+        execution_timeout=0.1,
+    )
+    runner = EvalRunner(portia=mock_portia_cls, config=config)
+    test_case = make_test_case(with_plan=False)
+
+    def hang(*_: object) -> None:
+        time.sleep(1)
+
+    with patch.object(runner, "_run_test_case", side_effect=hang):
+        metrics, latency = runner._execute_test_case(test_case)
+    assert [(m.name, m.actual_value) for m in metrics] == [("timeout", "execution")]
+    assert metrics[0].tags["test_case"] == "tc"
+    assert latency == 100
+
+    # the judge only gets what's left of the run's deadline
+    evaluator.eval_test_case.side_effect = hang
+    with patch.object(runner, "_run_test_case", return_value=(MagicMock(), MagicMock(), 200.0)):
+        start = time.perf_counter()
+        metrics, _ = runner._execute_test_case(test_case)
+    assert time.perf_counter() - start < 0.5
+    assert [(m.name, m.actual_value) for m in metrics] == [("timeout", "scoring")]
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_execution_timeout_with_scoring_pool(
+    mock_backend_cls: MagicMock, tmp_path: Path
+) -> None:
+    """Test timed out iterations skip scoring and aren't cached."""
+    backend = MagicMock()
+    config = EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        iterations=1,
+        metrics_backends=[backend],
+        evaluators=[MagicMock()],
+        scoring_concurrency=1,
+        fingerprint_cache_dir=tmp_path,
+    )
+    test_case = make_test_case(with_plan=False)
+    mock_backend_cls.return_value.load_evals.return_value = [test_case]
+    runner = EvalRunner(MagicMock(), config=config)
+
+    with patch.object(runner, "_execute", side_effect=eval_runner.DeadlineExceededError(1)):
+        runner.run()
+
+    saved = backend.save_eval_metrics.call_args[0][0]
+    assert [m.name for m in saved] == ["timeout"]
+    config.evaluators[0].eval_test_case.assert_not_called()  # type: ignore  # noqa: PGH003
+    assert not list(tmp_path.iterdir())
+
+
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_duplicates_stragglers(mock_backend_cls: MagicMock) -> None:
+    """Test a straggling iteration is re-run and the first attempt to finish is kept."""
+    backend = MagicMock()
+    config = EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        iterations=1,
+        metrics_backends=[backend],
+        max_concurrency=4,
+        straggler=StragglerPolicy(percentile=0.5, min_samples=2, check_interval=0.02),
+    )
+    test_cases = [
+        make_test_case(with_plan=False).model_copy(update={"testcase": f"tc{i}"}) for i in range(3)
+    ]
+    mock_backend_cls.return_value.load_evals.return_value = test_cases
+    calls: list[str] = []
+
+    def evaluate(tc: EvalTestCase, _: EventTimer) -> list[EvalMetric]:
+        calls.append(tc.testcase)
+        # the first attempt of tc2 hangs, its duplicate is quick
+        if tc.testcase == "tc2" and calls.count("tc2") == 1:
+            time.sleep(1)
+        else:
+            time.sleep(0.02)
+        return [
+            EvalMetric.from_test_case(
+                test_case=tc, score=calls.count(tc.testcase), name="attempt", description="d"
+            )
+        ]
+
+    runner = EvalRunner(MagicMock(), config=config)
+    with patch.object(runner, "_evaluate_and_collect_metrics", side_effect=evaluate):
+        start = time.perf_counter()
+        runner.run()
+        elapsed = time.perf_counter() - start
+
+    saved = backend.save_eval_metrics.call_args[0][0]
+    assert sorted((m.testcase, m.score) for m in saved) == [("tc0", 1), ("tc1", 1), ("tc2", 2)]
+    assert calls.count("tc2") == 2
+    # the hung attempt is abandoned, so the run finishes with its quick duplicate
+    assert elapsed < 0.6
+
+
+@patch("steelthread.evals.eval_runner.ProcessPoolExecutor")
+@patch("steelthread.evals.eval_runner.PortiaBackend")
+def test_eval_runner_abandons_worker_processes_with_stragglers(
+    mock_backend_cls: MagicMock,  # noqa: ARG001
+    mock_pool_cls: MagicMock,
+) -> None:
+    """Test a pool of worker processes is shut down without waiting when duplicating."""
+    config = EvalConfig(
+        eval_dataset_name="set",
+        config=get_test_config(),
+        worker_processes=2,
+        portia_factory=MagicMock(),
+        straggler=StragglerPolicy(),
+    )
+    with EvalRunner(MagicMock(), config=config)._executor() as executor:
+        assert executor is mock_pool_cls.return_value
+    mock_pool_cls.return_value.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
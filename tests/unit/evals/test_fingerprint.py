@@ -0,0 +1,130 @@
+"""Test fingerprinting."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel
+
+from steelthread.evals.adaptive import AdaptiveIterations
+from steelthread.evals.default_evaluator import DefaultEvaluator
+from steelthread.evals.fingerprint import (
+    FingerprintCache,
+    FingerprintContext,
+    FingerprintReport,
+    tool_signatures,
+)
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase, InputConfig, OutcomeAssertion
+from steelthread.evals.semantic import HashingEmbedder
+from tests.unit.utils import get_test_config
+
+
+class SearchArgs(BaseModel):
+    """Args of a test tool."""
+
+    query: str
+
+
+def make_registry(tool_ids: list[str]) -> MagicMock:
+    """Make a tool registry."""
+    tools = []
+    for tool_id in tool_ids:
+        tool = MagicMock()
+        tool.id = tool_id
+        tool.args_schema = SearchArgs
+        tool.output_schema = ("str", "results")
+        tools.append(tool)
+    registry = MagicMock()
+    registry.get_tools.return_value = tools
+    return registry
+
+
+def make_test_case(value: str = "do it") -> EvalTestCase:
+    """Make a test case."""
+    return EvalTestCase(
+        testcase="tc",
+        dataset="dataset",
+        run="run",
+        test_case_name="test",
+        input_config=InputConfig(type="query", value=value),
+        assertions=[OutcomeAssertion(type="outcome", value="COMPLETE")],
+    )
+
+
+def test_tool_signatures_are_ordered() -> None:
+    """Test tools are identified by id and schemas regardless of registry order."""
+    signatures = tool_signatures(make_registry(["b", "a"]))
+    assert [s["id"] for s in signatures] == ["a", "b"]
+    assert signatures[0]["args_schema"]["properties"] == {
+        "query": {"title": "Query", "type": "string"}
+    }
+    assert signatures[0]["output_schema"] == ["str", "results"]
+
+
+def test_fingerprint_changes_with_inputs() -> None:
+    """Test the fingerprint is stable and covers everything that affects results."""
+    config = get_test_config()
+    evaluators = [DefaultEvaluator(config)]
+    context = FingerprintContext.build(config, make_registry(["a"]), evaluators, "v1")
+    tc = make_test_case()
+
+    assert context.models["planning_model"] == "o3-mini"
+    assert context.evaluators == [
+        {
+            "class": "steelthread.evals.default_evaluator.DefaultEvaluator",
+            "settings": {
+                "embed": {"name": "steelthread.evals.semantic.HashingEmbedder", "dimensions": 1024}
+            },
+        }
+    ]
+    assert context.fingerprint(tc) == context.fingerprint(make_test_case())
+    assert context.fingerprint(tc) != context.fingerprint(make_test_case("do it again"))
+    # run ids don't affect results
+    assert context.fingerprint(tc) == context.fingerprint(tc.model_copy(update={"run": "run-2"}))
+
+    changed = [
+        FingerprintContext.build(config, make_registry(["a"]), evaluators, "v2"),
+        FingerprintContext.build(config, make_registry(["a", "b"]), evaluators, "v1"),
+        FingerprintContext.build(config, make_registry(["a"]), [], "v1"),
+        FingerprintContext.build(config, make_registry(["a"]), evaluators, "v1", iterations=5),
+        FingerprintContext.build(
+            config, make_registry(["a"]), evaluators, "v1", adaptive=AdaptiveIterations()
+        ),
+        FingerprintContext.build(
+            config,
+            make_registry(["a"]),
+            evaluators,
+            "v1",
+            adaptive=AdaptiveIterations(max_iterations=20),
+        ),
+        FingerprintContext.build(
+            config,
+            make_registry(["a"]),
+            [DefaultEvaluator(config, embed=HashingEmbedder(dimensions=64))],
+            "v1",
+        ),
+    ]
+    assert len({c.fingerprint(tc) for c in changed} | {context.fingerprint(tc)}) == 8
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    """Test metrics are stored and read back by fingerprint."""
+    cache = FingerprintCache(tmp_path / "cache")
+    metric = EvalMetric.from_test_case(
+        test_case=make_test_case(), score=0.5, name="accuracy", description="desc"
+    )
+    assert cache.get("abc") is None
+
+    cache.put("abc", [metric])
+    cached = cache.get("abc")
+    assert cached is not None
+    assert [(m.testcase, m.score) for m in cached] == [("tc", 0.5)]
+
+    (tmp_path / "cache" / "abc.json").write_text("{not json")
+    assert cache.get("abc") is None
+
+
+def test_report_summary() -> None:
+    """Test the report summarizes reused and executed test cases."""
+    report = FingerprintReport(reused=["a", "b"], executed=["c"])
+    assert str(report) == "Reused 2 test cases, executed 1"
@@ -1,18 +1,23 @@
 """Test metrics."""
 
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from httpx import Request, Response
 
 from steelthread.evals.metrics import (
+    ArrowEvalMetricsBackend,
     EvalLogMetricBackend,
     EvalMetric,
     MetricsBackend,
     PortiaEvalMetricsBackend,
+    SQLiteEvalMetricsBackend,
 )
 from steelthread.evals.models import EvalTestCase, InputConfig
-from tests.unit.utils import get_test_config
+from steelthread.utils.arrow import open_metrics_dataset
+from tests.unit.utils import get_test_config, get_test_plan_run
 
 
 @pytest.fixture
@@ -177,3 +182,69 @@ def test_eval_log_metric_backend_outputs(capfd: pytest.CaptureFixture) -> None:
     assert "=== Metric Averages ===" in out
     assert "clarity" in out
     assert "0.75" in out or "0.749" in out  # Average of 0.9 and 0.6
+
+
+def test_eval_log_metric_backend_detailed(capfd: pytest.CaptureFixture) -> None:
+    """Test EvalLogMetricBackend prints extra stats when detailed."""
+    backend = EvalLogMetricBackend(detailed=True)
+    metrics = [
+        EvalMetric(
+            dataset="d",
+            testcase="t1",
+            run="r",
+            score=score,
+            name="clarity",
+            description="desc",
+            expectation="yes",
+            actual_value="yes",
+            tags={"env": "test"},
+        )
+        for score in [0.2, 0.4, 0.6]
+    ]
+
+    backend.save_eval_metrics(metrics)
+
+    out, _ = capfd.readouterr()
+    header = out.strip().splitlines()[1].split()
+    assert header == ["name", "env", "score", "count", "std", "min", "max", "p50", "p90"]
+    assert "0.4" in out
+
+
+def test_arrow_eval_metrics_backend(tmp_path: Path, test_case: EvalTestCase) -> None:
+    """Test ArrowEvalMetricsBackend writes scores with eval_output in a blob column."""
+    pytest.importorskip("pyarrow")
+    plan, plan_run = get_test_plan_run()
+    metric = EvalMetric.from_test_case(
+        test_case=test_case,
+        score=1.0,
+        name="accuracy",
+        description="desc",
+        expectation=["a", "b"],
+        eval_output={"plan": plan, "plan_run": plan_run},
+    )
+    metric.tags = {"planning_model": "model-a"}
+    no_output = EvalMetric.from_test_case(
+        test_case=test_case, score=0.0, name="accuracy", description="desc"
+    )
+
+    ArrowEvalMetricsBackend(tmp_path).save_eval_metrics([metric, no_output])
+
+    assert list(tmp_path.glob("dataset=ds1/run=run1/date=*/*.parquet"))
+    dataset = open_metrics_dataset(tmp_path)
+    rows = dataset.to_table(columns=["score", "tag_planning_model", "expectation"]).to_pylist()
+    assert {"score": 1.0, "tag_planning_model": "model-a", "expectation": '["a", "b"]'} in rows
+
+    blobs = [b for b in dataset.to_table(columns=["eval_output"])["eval_output"].to_pylist() if b]
+    assert json.loads(blobs[0])["plan"]["id"] == str(plan.id)
+
+
+def test_sqlite_eval_metrics_backend(tmp_path: Path, test_case: EvalTestCase) -> None:
+    """Test SQLiteEvalMetricsBackend stores metrics for later queries."""
+    backend = SQLiteEvalMetricsBackend(tmp_path / "metrics.db")
+    metric = EvalMetric.from_test_case(
+        test_case=test_case, score=0.5, name="accuracy", description="desc"
+    )
+    backend.save_eval_metrics([metric])
+
+    runs = backend.store.latest_runs("tc1")
+    assert [(r.run, r.name, r.score) for r in runs] == [("run1", "accuracy", 0.5)]
@@ -1,5 +1,8 @@
 """Test models."""
 
+import pytest
+from pydantic import ValidationError
+
 from steelthread.evals.models import (
     CustomAssertion,
     EvalTestCase,
@@ -106,3 +109,18 @@ def test_eval_test_case_mixed_assertions() -> None:
     )
     assert len(test_case.assertions) == 2
     assert isinstance(test_case.assertions[0], OutcomeAssertion)
+
+
+def test_eval_test_case_from_api_response() -> None:
+    """Test test cases validate from the API's field names, taking the run from the context."""
+    data = {
+        "id": "t",
+        "dataset": "d",
+        "description": "test",
+        "input_config": {"type": "query", "value": "x"},
+        "assertions": [],
+    }
+    test_case = EvalTestCase.model_validate(data, context={"run": "r"})
+    assert (test_case.testcase, test_case.test_case_name, test_case.run) == ("t", "test", "r")
+    with pytest.raises(ValidationError, match="run is required"):
+        EvalTestCase.model_validate(data)
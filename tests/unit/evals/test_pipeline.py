@@ -0,0 +1,75 @@
+"""Test execution and scoring stages."""
+
+import threading
+import time
+
+import pytest
+
+from steelthread.evals.pipeline import ScoringStage, StageMonitor, StageUtilization
+from steelthread.utils.concurrency import RateLimiter
+
+
+def test_stage_monitor_reports_utilization() -> None:
+    """Test busy time is measured across workers and reset between runs."""
+    monitor = StageMonitor("execution", workers=2)
+    assert monitor.report().utilization == 0
+
+    def work() -> None:
+        with monitor.busy():
+            time.sleep(0.1)
+
+    threads = [threading.Thread(target=work) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = monitor.report()
+    assert report.items == 2
+    assert report.utilization > 0.8
+    assert str(report).startswith("Stage execution: 2 items on 2 workers, ")
+
+    monitor.reset()
+    assert monitor.report().items == 0
+
+
+def test_stage_monitor_excludes_rate_limit_waits() -> None:
+    """Test a stage held back by its rate limit shows as under utilized."""
+    monitor = StageMonitor("scoring", workers=1, rate_limiter=RateLimiter(rate=10))
+    for _ in range(3):
+        with monitor.busy():
+            pass
+    report = monitor.report()
+    assert report.wall_seconds >= 0.15
+    assert report.utilization < 0.1
+    assert StageUtilization("s", 1, 1, 2.0, 1.0).utilization == 1
+
+
+def test_scoring_stage_blocks_when_queue_is_full() -> None:
+    """Test submitting blocks once the workers and queue are taken."""
+    release = threading.Event()
+    submitted = []
+
+    def produce(stage: ScoringStage) -> None:
+        for i in range(3):
+            # append as each submit returns so the test can see which one blocks
+            submitted.append(stage.submit(lambda x: release.wait() and x, i))  # noqa: PERF401
+
+    with ScoringStage(workers=1, queue_size=1) as stage:
+        producer = threading.Thread(target=produce, args=(stage,))
+        producer.start()
+        time.sleep(0.1)
+        assert len(submitted) == 2
+        release.set()
+        producer.join()
+    assert [future.result() for future in submitted] == [0, 1, 2]
+
+
+def test_scoring_stage_rejects_after_shutdown() -> None:
+    """Test a failed submit gives its queue slot back."""
+    stage = ScoringStage(workers=1, queue_size=0)
+    stage.shutdown()
+    with pytest.raises(RuntimeError):
+        stage.submit(print)
+    with pytest.raises(RuntimeError):
+        stage.submit(print)
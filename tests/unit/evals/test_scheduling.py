@@ -0,0 +1,85 @@
+"""Test latency aware scheduling."""
+
+from concurrent.futures import Future
+
+from steelthread.evals.checkpoint import WorkUnit
+from steelthread.evals.models import EvalTestCase, InputConfig
+from steelthread.evals.scheduling import LatencyScheduler, MakespanReport, predict_makespan
+
+
+def make_units(testcase: str, iterations: int) -> list[WorkUnit]:
+    """Make the units of a test case."""
+    tc = EvalTestCase(
+        dataset="ds",
+        testcase=testcase,
+        test_case_name="test",
+        run="run",
+        input_config=InputConfig(type="query", value="q"),
+        assertions=[],
+    )
+    return [WorkUnit(tc, i) for i in range(iterations)]
+
+
+def keys(units: list[WorkUnit]) -> list[tuple[str, int]]:
+    """Get the keys of units."""
+    return [u.key for u in units]
+
+
+def test_predict_makespan() -> None:
+    """Test durations are placed on the first free worker."""
+    assert predict_makespan([2, 2, 4], workers=2) == 6
+    assert predict_makespan([4, 2, 2], workers=2) == 4
+    assert predict_makespan([], workers=2) == 0
+
+
+def test_longest_first_with_interleaved_iterations() -> None:
+    """Test slow test cases go first and ties interleave iterations."""
+    scheduler = LatencyScheduler({"fast": 10, "slow": 100, "mid": 50, "mid2": 50})
+    for testcase in ("fast", "mid", "mid2", "slow"):
+        scheduler.add(make_units(testcase, 2))
+    assert keys(scheduler.take(3)) == [("slow", 0), ("slow", 1), ("mid", 0)]
+    assert keys(scheduler.take(10)) == [
+        ("mid2", 0),
+        ("mid", 1),
+        ("mid2", 1),
+        ("fast", 0),
+        ("fast", 1),
+    ]
+    assert scheduler.take(1) == []
+
+
+def test_unknown_test_cases_run_first_and_observations_update_estimates() -> None:
+    """Test a first iteration of new test cases provides the estimate for the rest."""
+    scheduler = LatencyScheduler({"known": 1000})
+    scheduler.add([*make_units("known", 2), *make_units("new", 3)])
+    (first,) = scheduler.take(1)
+    assert first.key == ("new", 0)
+
+    future: Future = Future()
+    scheduler.started(future, first)
+    future.set_result([])
+    scheduler.finished(future)
+    # a fast observation moves the remaining iterations behind the known slow test case
+    new_estimate = scheduler.estimate("new")
+    assert new_estimate is not None
+    assert new_estimate < 1000
+    assert keys(scheduler.take(5)) == [("known", 0), ("known", 1), ("new", 1), ("new", 2)]
+    assert scheduler.actual_makespan() >= 0
+    # untracked futures are ignored
+    scheduler.finished(Future())
+
+
+def test_predicted_makespan_and_report() -> None:
+    """Test the prediction follows the scheduling order and unknowns use the mean."""
+    scheduler = LatencyScheduler()
+    scheduler.add(make_units("a", 1))
+    assert scheduler.predict_makespan(workers=2) is None
+    assert scheduler.actual_makespan() == 0
+
+    scheduler = LatencyScheduler({"slow": 4000, "fast": 2000})
+    scheduler.add([*make_units("fast", 2), *make_units("unknown", 1), *make_units("slow", 1)])
+    # unknown (3s) and slow (4s) start first, then the two fast units fill in
+    assert scheduler.predict_makespan(workers=2) == 6
+
+    assert str(MakespanReport(None, 1.25)) == "Makespan predicted=unknown actual=1.2s"
+    assert str(MakespanReport(3.0, 2.5)) == "Makespan predicted=3.0s actual=2.5s"
@@ -0,0 +1,79 @@
+"""Test semantic similarity scoring."""
+
+import pickle
+import sys
+from collections.abc import Sequence
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from steelthread.evals.models import EvalTestCase, InputConfig, SemanticMatchAssertion
+from steelthread.evals.semantic import HashingEmbedder, SemanticIndex, require_numpy
+
+
+def test_hashing_embedder_is_stable() -> None:
+    """Test embeddings are deterministic and count words and word pairs."""
+    embedder = HashingEmbedder(dimensions=64)
+    matrix = embedder(["The cat sat", "the cat sat.", ""])
+    assert matrix.shape == (3, 64)
+    assert np.array_equal(matrix[0], matrix[1])
+    assert matrix[0].sum() == 5
+    assert matrix[2].sum() == 0
+
+
+def test_index_embeds_each_reference_once() -> None:
+    """Test references are cached across calls and scored in one batch."""
+    calls: list[list[str]] = []
+
+    def embed(texts: Sequence[str]) -> np.ndarray:
+        calls.append(list(texts))
+        return HashingEmbedder()(texts)
+
+    index = SemanticIndex(embed)
+    test_case = EvalTestCase(
+        dataset="ds",
+        testcase="tc",
+        test_case_name="test",
+        run="run",
+        input_config=InputConfig(type="query", value="q"),
+        assertions=[
+            SemanticMatchAssertion(
+                type="semantic_match", references=["the answer is paris", "paris"]
+            ),
+        ],
+    )
+    index.add_test_cases([test_case, test_case])
+    index.add_references([])
+    assert len(index) == 2
+    assert calls == [["the answer is paris", "paris"]]
+
+    scores = index.score(
+        ["The answer is Paris", "london", "the answer is rome"],
+        [["the answer is paris", "paris"], ["paris"], ["the answer is paris", "berlin"]],
+    )
+    # only the outputs are embedded, in a single batch, besides the new reference
+    assert calls[1:] == [["berlin"], ["The answer is Paris", "london", "the answer is rome"]]
+    assert scores[0] == pytest.approx(1)
+    assert scores[1] == 0
+    assert 0.3 < scores[2] < 0.9
+    assert index.score([], []).shape == (0,)
+
+    with pytest.raises(ValueError, match="references"):
+        index.score(["a"], [])
+
+
+def test_empty_index_and_pickling() -> None:
+    """Test an index without references scores zero and pickles without its cache."""
+    index = SemanticIndex()
+    assert list(index.score(["a"], [[]])) == [0]
+    index.add_references(["a"])
+    copy = pickle.loads(pickle.dumps(index))  # noqa: S301
+    assert len(copy) == 0
+    assert isinstance(copy.embed, HashingEmbedder)
+
+
+def test_require_numpy() -> None:
+    """Test a helpful error is raised without numpy."""
+    with patch.dict(sys.modules, {"numpy": None}), pytest.raises(ImportError, match="semantic"):
+        require_numpy()
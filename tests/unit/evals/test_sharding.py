@@ -0,0 +1,46 @@
+"""Test sharding."""
+
+from steelthread.evals.models import EvalTestCase, InputConfig
+from steelthread.evals.sharding import assign_shards, select_shard, stable_shard
+
+
+def make_test_cases(n: int) -> list[EvalTestCase]:
+    """Make test cases."""
+    return [
+        EvalTestCase(
+            dataset="ds",
+            testcase=f"tc{i}",
+            test_case_name=f"test {i}",
+            run="run",
+            input_config=InputConfig(type="query", value="q"),
+            assertions=[],
+        )
+        for i in range(n)
+    ]
+
+
+def test_hash_sharding_partitions_and_is_stable() -> None:
+    """Test every test case lands on exactly one shard regardless of order or size."""
+    test_cases = make_test_cases(50)
+    shards = assign_shards(test_cases, 4)
+    assert sorted(tc.testcase for shard in shards for tc in shard) == sorted(
+        tc.testcase for tc in test_cases
+    )
+    assert all(shards)
+    assert assign_shards(list(reversed(test_cases)), 4)[1] == list(reversed(shards[1]))
+    # adding test cases doesn't move existing ones
+    grown = assign_shards(make_test_cases(60), 4)
+    for tc in test_cases:
+        assert tc.testcase in {t.testcase for t in grown[stable_shard(tc.testcase, 4)]}
+
+
+def test_weighted_sharding_balances_cost() -> None:
+    """Test weighted assignment keeps the slowest shard close to the average."""
+    test_cases = make_test_cases(7)
+    weights = {"tc0": 10.0, "tc1": 7.0, "tc2": 5.0, "tc3": 4.0, "tc4": 3.0, "tc5": 1.0}
+    shards = assign_shards(test_cases, 2, weights)
+    default = sum(weights.values()) / len(weights)
+    costs = [sum(weights.get(tc.testcase, default) for tc in shard) for shard in shards]
+    assert max(costs) - min(costs) <= default
+    assert select_shard(test_cases, 1, 2, weights) == shards[1]
+    assert select_shard(list(reversed(test_cases)), 1, 2, weights) == shards[1]
@@ -0,0 +1,71 @@
+"""Test the tool call index."""
+
+from portia.storage import ToolCallRecord, ToolCallStatus
+
+from steelthread.evals.evaluator import PlanRunMetadata
+from steelthread.evals.tool_calls import ToolCallIndex, canonical_args, canonicalize
+from tests.unit.utils import get_test_plan_run
+
+
+def _call(tool_name: str, step: int, tool_input: object) -> ToolCallRecord:
+    _, plan_run = get_test_plan_run()
+    return ToolCallRecord(
+        tool_name=tool_name,
+        plan_run_id=plan_run.id,
+        step=step,
+        end_user_id=plan_run.end_user_id,
+        status=ToolCallStatus.SUCCESS,
+        input=tool_input,
+        output={},
+        latency_seconds=1,
+    )
+
+
+def test_canonicalize() -> None:
+    """Test equal values get the same canonical form however they are written."""
+    assert canonicalize({"b": 1, "a": [1, 2]}) == canonicalize('{"a": [1, 2], "b": 1}')
+    assert canonicalize("plain text") == '"plain text"'
+    assert canonicalize("3") == canonicalize(3)
+    assert canonical_args('{"x": {"b": 2, "a": 1}}') == {"x": '{"a":1,"b":2}'}
+    assert canonical_args("not json") == {}
+    assert canonical_args([1, 2]) == {}
+
+
+def test_tool_call_index() -> None:
+    """Test the index answers lookups about the calls."""
+    index = ToolCallIndex(
+        [
+            _call("search", 0, {"query": "weather", "limit": 5}),
+            _call("fetch", 0, {"url": "https://example.com"}),
+            _call("search", 1, '{"query": "news", "limit": 5}'),
+            _call("send", 2, {"to": ["a", "b"]}),
+        ]
+    )
+    assert index.sequence == ["search", "fetch", "search", "send"]
+    assert index.count("search") == 2
+    assert index.count("delete") == 0
+    assert index.called("fetch")
+    assert not index.called("delete")
+    assert [call.tool_name for call in index.by_step[0]] == ["search", "fetch"]
+    assert len(index.by_tool["search"]) == 2
+
+    assert index.args_match("search", canonical_args({"query": "news"}))
+    assert index.args_match("search", canonical_args({"limit": "5", "query": "weather"}))
+    assert not index.args_match("search", canonical_args({"query": "sport"}))
+    assert index.args_match("send", canonical_args({"to": ["a", "b"]}))
+    assert not index.args_match("delete", canonical_args({}))
+
+    assert index.in_order(["search", "send"])
+    assert index.in_order(["fetch", "search"])
+    assert index.in_order(["search", "search", "send"])
+    assert not index.in_order(["send", "fetch"])
+    assert not index.in_order(["fetch", "fetch"])
+
+
+def test_plan_run_metadata_builds_index_once() -> None:
+    """Test the metadata builds its index on first use and reuses it."""
+    metadata = PlanRunMetadata(tool_calls=[_call("search", 0, {})], latency_ms=10)
+    index = metadata.tool_call_index
+    assert index.sequence == ["search"]
+    assert metadata.tool_call_index is index
+    assert "tool_call_index" not in metadata.model_dump()
@@ -0,0 +1,84 @@
+"""Test work queues."""
+
+from pathlib import Path
+
+from steelthread.evals.checkpoint import WorkUnit
+from steelthread.evals.metrics import EvalMetric
+from steelthread.evals.models import EvalTestCase, InputConfig
+from steelthread.evals.work_queue import SQLiteWorkQueue
+
+
+def make_test_case(testcase: str = "tc") -> EvalTestCase:
+    """Make a test case."""
+    return EvalTestCase(
+        dataset="ds",
+        testcase=testcase,
+        test_case_name="test",
+        run="run",
+        input_config=InputConfig(type="query", value="q"),
+        assertions=[],
+    )
+
+
+def make_metric(test_case: EvalTestCase, score: float) -> EvalMetric:
+    """Make a metric."""
+    return EvalMetric.from_test_case(
+        test_case=test_case, score=score, name="accuracy", description="desc"
+    )
+
+
+def test_claim_complete_and_results(tmp_path: Path) -> None:
+    """Test units are handed out once and their metrics merged in enqueue order."""
+    queue = SQLiteWorkQueue(tmp_path / "queue.db")
+    tc1, tc2 = make_test_case("tc1"), make_test_case("tc2")
+    assert not queue.is_started("run-1")
+    assert not queue.is_finished("run-1")
+    queue.enqueue("run-1", [WorkUnit(tc1, 0), WorkUnit(tc2, 0)])
+    assert queue.is_started("run-1")
+    # enqueueing again (e.g. a restarted coordinator) is a no-op
+    queue.enqueue("run-1", [WorkUnit(tc1, 0)])
+    assert queue.progress("run-1") == (0, 2)
+
+    first = queue.claim("run-1", "a", lease_seconds=60)
+    second = queue.claim("run-1", "b", lease_seconds=60)
+    assert first is not None
+    assert second is not None
+    assert first.unit.key == ("tc1", 0)
+    assert second.unit.test_case == tc2
+    assert queue.claim("run-1", "c", lease_seconds=60) is None
+    assert queue.claim("run-2", "c", lease_seconds=60) is None
+
+    assert queue.complete(second, [make_metric(tc2, 0.5)])
+    assert queue.complete(first, [make_metric(tc1, 1.0)])
+    assert queue.is_finished("run-1")
+    assert [(m.testcase, m.score) for m in queue.results("run-1")] == [("tc1", 1.0), ("tc2", 0.5)]
+
+
+def test_expired_leases_are_reclaimed(tmp_path: Path) -> None:
+    """Test a unit held by a dead worker is handed to another and the old lease is lost."""
+    queue = SQLiteWorkQueue(tmp_path / "queue.db")
+    tc = make_test_case()
+    queue.enqueue("run-1", [WorkUnit(tc, 0), WorkUnit(tc, 1)])
+
+    dead = queue.claim("run-1", "dead", lease_seconds=-1)
+    expired = queue.claim("run-1", "dead", lease_seconds=-1)
+    assert dead is not None
+    assert expired is not None
+    assert queue.reclaim_expired("run-1") == 2
+
+    alive = queue.claim("run-1", "alive", lease_seconds=60)
+    assert alive is not None
+    assert alive.unit.key == dead.unit.key
+    assert queue.renew(dead, 60) is None
+    assert not queue.complete(dead, [make_metric(tc, 0.0)])
+
+    renewed = queue.renew(alive, 120)
+    assert renewed is not None
+    assert renewed.expires_at > alive.expires_at
+    assert queue.complete(renewed, [make_metric(tc, 1.0)])
+    assert queue.progress("run-1") == (1, 2)
+
+    # expired leases can also be claimed directly without waiting for the coordinator
+    retried = queue.claim("run-1", "alive", lease_seconds=60)
+    assert retried is not None
+    assert retried.unit.key == ("tc", 1)
@@ -355,3 +355,36 @@ def test_tool_stub_registry_twice_wrapped_fallbacks() -> None:
     assert isinstance(tool_2, ToolStub)
     assert len(tool_2.tool_calls) == 1
     assert tool_2.tool_calls[0].input == {"name": "tool_2"}
+
+
+def test_tool_stub_registry_records_calls_in_order(dummy_context: ToolRunContext) -> None:
+    """Test calls to all stubs are returned in the order they were made."""
+
+    class DummyChildTool(Tool):
+        def run(self, ctx, *args, **kwargs) -> str:  # noqa: ANN001, ANN002, ANN003, ARG002
+            return kwargs["name"]
+
+    def stub_response(ctx: ToolStubContext) -> str:
+        return ctx.kwargs["name"]
+
+    tools = [
+        DummyChildTool(id=tool_id, name=tool_id, description="desc", output_schema=("any", "any"))
+        for tool_id in ("first-tool", "second-tool")
+    ]
+    inner_stub_registry = ToolStubRegistry(
+        registry=InMemoryToolRegistry.from_local_tools(tools),
+        stubs={"first-tool": stub_response},
+    )
+    stub_registry = ToolStubRegistry(registry=inner_stub_registry, stubs={})
+
+    first = stub_registry.get_tool("first-tool")
+    second = stub_registry.get_tool("second-tool")
+    assert first.run(dummy_context, name="a") == "a"
+    second.run(dummy_context, name="b")
+    first.run(dummy_context, name="c")
+
+    calls = stub_registry.get_tool_calls()
+    assert [call.tool_name for call in calls] == ["first-tool", "second-tool", "first-tool"]
+    assert [call.input for call in calls] == [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+    assert len(stub_registry.get_tool_calls("first-tool")) == 2
+    assert inner_stub_registry.get_tool_calls() == []
@@ -1,10 +1,12 @@
 """Test stream backend."""
 
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-from httpx import Request, Response
+from httpx import ConnectError, Request, Response
 
 from steelthread.streams.backend import PortiaStreamBackend
 from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem, Stream
@@ -68,20 +70,20 @@ def test_load_plan_stream_items_pagination(
     plan = get_test_plan_run()[0]
 
     page_1 = {
-        "results": [{"id": "item-1", "plan": plan.model_dump()}],
+        "results": [{"id": "item-1", "plan": plan.model_dump(mode="json")}],
         "current_page": 1,
         "total_pages": 3,
     }
 
     # Second page response
     page_2 = {
-        "results": [{"id": "item-2", "plan": plan.model_dump()}],
+        "results": [{"id": "item-2", "plan": plan.model_dump(mode="json")}],
         "current_page": 2,
         "total_pages": 3,
     }
 
     page_3 = {
-        "results": [{"id": "item-3", "plan": plan.model_dump()}],
+        "results": [{"id": "item-3", "plan": plan.model_dump(mode="json")}],
         "current_page": 3,
         "total_pages": 3,
     }
@@ -89,20 +91,22 @@ def test_load_plan_stream_items_pagination(
     mock_client = MagicMock()
     mock_client_class.return_value.new_client.return_value = mock_client
     mock_client.get.side_effect = [
-        MagicMock(is_success=True, json=MagicMock(return_value=page_1)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_2)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_3)),
+        make_mock_response(page_1),
+        make_mock_response(page_2),
+        make_mock_response(page_3),
     ]
     mock_client.return_value = mock_client  # type: ignore  # noqa: PGH003
 
     items = backend.load_plan_stream_items("stream-123", batch_size=2)
     assert len(items) == 2
     assert isinstance(items[0], PlanStreamItem)
+    assert items[0]._plan is None
+    assert items[0].plan.id == plan.id
 
     mock_client.get.side_effect = [
-        MagicMock(is_success=True, json=MagicMock(return_value=page_1)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_2)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_3)),
+        make_mock_response(page_1),
+        make_mock_response(page_2),
+        make_mock_response(page_3),
     ]
     mock_client.return_value = mock_client  # type: ignore  # noqa: PGH003
 
@@ -128,8 +132,8 @@ def test_load_plan_run_stream_items(
                     "id": str(plan_run.plan_id),
                     "query": plan.plan_context.query,
                     "tool_ids": plan.plan_context.tool_ids,
-                    "steps": [s.model_dump() for s in plan.steps],
-                    "plan_inputs": plan.plan_inputs,
+                    "steps": [s.model_dump(mode="json") for s in plan.steps],
+                    "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
                 },
                 "plan_run": {
                     "id": str(plan_run.id),
@@ -137,15 +141,15 @@ def test_load_plan_run_stream_items(
                         "id": str(plan_run.plan_id),
                         "query": plan.plan_context.query,
                         "tool_ids": plan.plan_context.tool_ids,
-                        "steps": [s.model_dump() for s in plan.steps],
-                        "plan_inputs": plan.plan_inputs,
+                        "steps": [s.model_dump(mode="json") for s in plan.steps],
+                        "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
                     },
                     "end_user": plan_run.end_user_id,
                     "current_step_index": plan_run.current_step_index,
                     "state": plan_run.state.value,
-                    "outputs": plan_run.outputs.model_dump(),
+                    "outputs": plan_run.outputs.model_dump(mode="json"),
                     "plan_run_inputs": {
-                        k: v.model_dump() for k, v in plan_run.plan_run_inputs.items()
+                        k: v.model_dump(mode="json") for k, v in plan_run.plan_run_inputs.items()
                     },
                 },
             }
@@ -161,8 +165,8 @@ def test_load_plan_run_stream_items(
                     "id": str(plan_run.plan_id),
                     "query": plan.plan_context.query,
                     "tool_ids": plan.plan_context.tool_ids,
-                    "steps": [s.model_dump() for s in plan.steps],
-                    "plan_inputs": plan.plan_inputs,
+                    "steps": [s.model_dump(mode="json") for s in plan.steps],
+                    "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
                 },
                 "plan_run": {
                     "id": str(plan_run.id),
@@ -170,15 +174,15 @@ def test_load_plan_run_stream_items(
                         "id": str(plan_run.plan_id),
                         "query": plan.plan_context.query,
                         "tool_ids": plan.plan_context.tool_ids,
-                        "steps": [s.model_dump() for s in plan.steps],
-                        "plan_inputs": plan.plan_inputs,
+                        "steps": [s.model_dump(mode="json") for s in plan.steps],
+                        "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
                     },
                     "end_user": plan_run.end_user_id,
                     "current_step_index": plan_run.current_step_index,
                     "state": plan_run.state.value,
-                    "outputs": plan_run.outputs.model_dump(),
+                    "outputs": plan_run.outputs.model_dump(mode="json"),
                     "plan_run_inputs": {
-                        k: v.model_dump() for k, v in plan_run.plan_run_inputs.items()
+                        k: v.model_dump(mode="json") for k, v in plan_run.plan_run_inputs.items()
                     },
                 },
             }
@@ -194,8 +198,8 @@ def test_load_plan_run_stream_items(
                     "id": str(plan_run.plan_id),
                     "query": plan.plan_context.query,
                     "tool_ids": plan.plan_context.tool_ids,
-                    "steps": [s.model_dump() for s in plan.steps],
-                    "plan_inputs": plan.plan_inputs,
+                    "steps": [s.model_dump(mode="json") for s in plan.steps],
+                    "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
                 },
                 "plan_run": {
                     "id": str(plan_run.id),
@@ -203,15 +207,15 @@ def test_load_plan_run_stream_items(
                         "id": str(plan_run.plan_id),
                         "query": plan.plan_context.query,
                         "tool_ids": plan.plan_context.tool_ids,
-                        "steps": [s.model_dump() for s in plan.steps],
-                        "plan_inputs": plan.plan_inputs,
+                        "steps": [s.model_dump(mode="json") for s in plan.steps],
+                        "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
                     },
                     "end_user": plan_run.end_user_id,
                     "current_step_index": plan_run.current_step_index,
                     "state": plan_run.state.value,
-                    "outputs": plan_run.outputs.model_dump(),
+                    "outputs": plan_run.outputs.model_dump(mode="json"),
                     "plan_run_inputs": {
-                        k: v.model_dump() for k, v in plan_run.plan_run_inputs.items()
+                        k: v.model_dump(mode="json") for k, v in plan_run.plan_run_inputs.items()
                     },
                 },
             }
@@ -220,20 +224,22 @@ def test_load_plan_run_stream_items(
         "total_pages": 3,
     }
     mock_client.get.side_effect = [
-        MagicMock(is_success=True, json=MagicMock(return_value=page_1)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_2)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_3)),
+        make_mock_response(page_1),
+        make_mock_response(page_2),
+        make_mock_response(page_3),
     ]
     mock_client.return_value = mock_client  # type: ignore  # noqa: PGH003
 
     items = backend.load_plan_run_stream_items("stream-123", batch_size=2)
     assert len(items) == 2
     assert isinstance(items[0], PlanRunStreamItem)
+    assert items[0]._plan_run is None
+    assert items[0].plan_run.id == plan_run.id
 
     mock_client.get.side_effect = [
-        MagicMock(is_success=True, json=MagicMock(return_value=page_1)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_2)),
-        MagicMock(is_success=True, json=MagicMock(return_value=page_3)),
+        make_mock_response(page_1),
+        make_mock_response(page_2),
+        make_mock_response(page_3),
     ]
     mock_client.return_value = mock_client  # type: ignore  # noqa: PGH003
 
@@ -286,3 +292,88 @@ def test_load_plan_stream_items_items_no_results(
 
     items = backend.load_plan_stream_items("stream-123", batch_size=2)
     assert len(items) == 0
+
+
+@patch("steelthread.streams.backend.PortiaCloudClient")
+def test_iter_plan_stream_items_loads_pages_as_reached(
+    mock_client_class: MagicMock, backend: PortiaStreamBackend
+) -> None:
+    """Test pages are only requested once iteration reaches them."""
+    mock_client = MagicMock()
+    mock_client_class.return_value.new_client.return_value = mock_client
+    mock_client.get.side_effect = [
+        make_mock_response(
+            {
+                "results": [{"id": f"item-{page}", "plan": {}}],
+                "current_page": page,
+                "total_pages": 2,
+            }
+        )
+        for page in (1, 2)
+    ]
+
+    items = backend.iter_plan_stream_items("stream-123")
+    assert next(items).stream_item == "item-1"
+    assert mock_client.get.call_count == 1
+    assert [i.stream_item for i in items] == ["item-2"]
+    assert mock_client.get.call_count == 2
+
+
+@patch("steelthread.streams.backend.PortiaCloudClient")
+def test_mark_many_processed(mock_client_class: MagicMock, backend: PortiaStreamBackend) -> None:
+    """Test many items are marked processed over one client."""
+    mock_client = MagicMock()
+    mock_client_class.return_value.new_client.return_value = mock_client
+    mock_client.patch.return_value = make_mock_response({}, 200)
+
+    assert backend.mark_many_processed(["a", "b"]) == []
+    assert sorted(c[1]["json"]["id"] for c in mock_client.patch.call_args_list) == ["a", "b"]
+    assert mock_client_class.return_value.new_client.call_count == 1
+
+
+@patch("steelthread.streams.backend.PortiaCloudClient")
+def test_mark_many_processed_collects_failures(
+    mock_client_class: MagicMock, backend: PortiaStreamBackend
+) -> None:
+    """Test failed requests don't stop the others and their items are returned."""
+    mock_client = MagicMock()
+    mock_client_class.return_value.new_client.return_value = mock_client
+    in_flight = 0
+    most_in_flight = 0
+    lock = threading.Lock()
+
+    def patch_item(url: str, json: dict) -> Response:  # noqa: ARG001
+        nonlocal in_flight, most_in_flight
+        with lock:
+            in_flight += 1
+            most_in_flight = max(most_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        match json["id"]:
+            case "rejected":
+                return make_mock_response({}, 500)
+            case "unreachable":
+                raise ConnectError("down")
+            case _:
+                return make_mock_response({}, 200)
+
+    mock_client.patch.side_effect = patch_item
+    items = ["rejected", *(str(i) for i in range(10)), "unreachable"]
+
+    assert backend.mark_many_processed(items, max_concurrency=3) == ["rejected", "unreachable"]
+    assert mock_client.patch.call_count == len(items)
+    assert 1 < most_in_flight <= 3
+
+
+@patch("steelthread.streams.backend.PortiaCloudClient")
+def test_client_is_reused(mock_client_class: MagicMock, backend: PortiaStreamBackend) -> None:
+    """Test the HTTP client is created once and kept across calls."""
+    mock_client = MagicMock()
+    mock_client_class.return_value.new_client.return_value = mock_client
+    mock_client.patch.return_value = make_mock_response({}, 200)
+
+    backend.mark_processed(PlanStreamItem(stream="s", stream_item="a", raw_plan={}))
+    backend.mark_many_processed(["b"])
+    assert backend.client() is mock_client
+    assert mock_client_class.return_value.new_client.call_count == 1
@@ -0,0 +1,61 @@
+"""Test stream item deduplication."""
+
+from steelthread.streams.dedup import content_hash, group_duplicates
+from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem
+from tests.unit.utils import get_test_plan_run
+
+
+def plan_item(stream_item: str, query: str, plan_id: str = "plan-1") -> PlanStreamItem:
+    """Build a plan stream item from a raw payload."""
+    return PlanStreamItem(
+        stream="s",
+        stream_item=stream_item,
+        raw_plan={
+            "id": plan_id,
+            "plan_context": {"query": query, "tool_ids": ["search"]},
+            "steps": [{"task": query, "output": "$out", "created_at": stream_item}],
+        },
+    )
+
+
+def test_content_hash_ignores_volatile_fields() -> None:
+    """Test items only differing in ids and timestamps hash the same."""
+    assert content_hash(plan_item("1", "q")) == content_hash(plan_item("2", "q", "plan-2"))
+    assert content_hash(plan_item("1", "q")) != content_hash(plan_item("1", "other"))
+
+    run = {"id": "prun-1", "plan": {"id": "plan-1"}, "end_user": "u1", "state": "COMPLETE"}
+    first = PlanRunStreamItem(stream="s", stream_item="1", raw_plan={}, raw_plan_run=run)
+    second = PlanRunStreamItem(
+        stream="s",
+        stream_item="2",
+        raw_plan={},
+        raw_plan_run={**run, "id": "prun-2", "end_user": "u2"},
+    )
+    failed = PlanRunStreamItem(
+        stream="s", stream_item="3", raw_plan={}, raw_plan_run={**run, "state": "FAILED"}
+    )
+    assert content_hash(first) == content_hash(second) != content_hash(failed)
+
+
+def test_content_hash_of_built_items() -> None:
+    """Test items built from plans and plan runs hash their dumped content."""
+    plan, plan_run = get_test_plan_run()
+    assert content_hash(PlanStreamItem(stream="s", stream_item="1", plan=plan)) == content_hash(
+        PlanStreamItem(stream="s", stream_item="2", plan=plan)
+    )
+    item = PlanRunStreamItem(stream="s", stream_item="1", plan=plan, plan_run=plan_run)
+    assert content_hash(item) == content_hash(item.model_copy(update={"stream_item": "2"}))
+
+
+def test_group_duplicates() -> None:
+    """Test duplicates are grouped in the order their content was first seen."""
+    items = [plan_item("1", "a"), plan_item("2", "b"), plan_item("3", "a"), plan_item("4", "a")]
+    duplicates = group_duplicates(items)
+    assert [[i.stream_item for i in g] for g in duplicates.groups] == [["1", "3", "4"], ["2"]]
+    assert duplicates.items == 4
+    assert duplicates.ratio == 0.5
+
+    unique = group_duplicates(items, deduplicate=False)
+    assert len(unique.groups) == 4
+    assert unique.ratio == 0
+    assert group_duplicates([]).ratio == 0
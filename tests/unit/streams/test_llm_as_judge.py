@@ -43,6 +43,7 @@ def test_process_plan_returns_metrics(
     assert isinstance(result[0], StreamMetric)
     assert result[0].name == "test_metric"
     mock_scorer.score.assert_called_once()
+    assert mock_scorer.score.call_args.kwargs["task_data"] == [plan.model_dump_json()]
 
 
 @patch("steelthread.streams.llm_as_judge.LLMScorer")
@@ -1,17 +1,22 @@
 """Test metrics."""
 
+import sqlite3
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from httpx import Request, Response
 
 from steelthread.streams.metrics import (
+    ArrowStreamMetricsBackend,
     PortiaStreamMetricsBackend,
+    SQLiteStreamMetricsBackend,
     StreamLogMetricBackend,
     StreamMetric,
     StreamMetricsBackend,
 )
 from steelthread.streams.models import PlanStreamItem
+from steelthread.utils.arrow import open_metrics_dataset
 from tests.unit.utils import get_test_config, get_test_plan_run
 
 
@@ -142,3 +147,36 @@ def test_stream_log_metrics_backend_logs_metrics(capfd: pytest.CaptureFixture) -
     out, _ = capfd.readouterr()
     assert "=== Metric Averages by Stream Item ===" in out
     assert "0.9" in out or "0.6" in out
+
+
+def test_arrow_stream_metrics_backend(tmp_path: Path) -> None:
+    """Test ArrowStreamMetricsBackend writes partitioned files."""
+    pytest.importorskip("pyarrow")
+    backend = ArrowStreamMetricsBackend(tmp_path)
+    backend.save_metrics(
+        [
+            StreamMetric(
+                stream="s1",
+                stream_item="i1",
+                score=0.5,
+                name="success",
+                description="desc",
+                tags={"env": "prod"},
+            )
+        ]
+    )
+
+    assert list(tmp_path.glob("stream=s1/date=*/*.parquet"))
+    rows = open_metrics_dataset(tmp_path).to_table().to_pylist()
+    assert rows[0]["stream_item"] == "i1"
+    assert rows[0]["tag_env"] == "prod"
+
+
+def test_sqlite_stream_metrics_backend(tmp_path: Path) -> None:
+    """Test SQLiteStreamMetricsBackend stores metrics."""
+    backend = SQLiteStreamMetricsBackend(tmp_path / "metrics.db")
+    backend.save_metrics(
+        [StreamMetric(stream="s", stream_item="i", score=1.0, name="success", description="d")]
+    )
+    with sqlite3.connect(backend.store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM stream_metrics").fetchone() == (1,)
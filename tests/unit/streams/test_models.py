@@ -0,0 +1,64 @@
+"""Test stream models."""
+
+import pytest
+
+from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem
+from tests.unit.utils import get_test_plan_run
+
+
+def test_plan_stream_item_builds_plan_on_first_use() -> None:
+    """Test the plan is only built from the raw payload when used, and then cached."""
+    plan, _ = get_test_plan_run()
+    raw_plan = plan.model_dump(mode="json")
+    item = PlanStreamItem(stream="s", stream_item="i", raw_plan=raw_plan)
+    assert item._plan is None
+
+    assert item.plan.id == plan.id
+    assert item.plan is item.plan
+
+    given = PlanStreamItem(stream="s", stream_item="i", plan=plan)
+    assert given.plan is plan
+    with pytest.raises(ValueError, match="stream item i has no plan"):
+        _ = PlanStreamItem(stream="s", stream_item="i").plan
+
+
+def test_plan_run_stream_item_builds_plan_run_on_first_use() -> None:
+    """Test the plan and plan run are only built from the raw payloads when used."""
+    plan, plan_run = get_test_plan_run()
+    raw_plan = {
+        "id": str(plan.id),
+        "query": plan.plan_context.query,
+        "tool_ids": plan.plan_context.tool_ids,
+        "steps": [s.model_dump(mode="json") for s in plan.steps],
+        "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
+    }
+    raw_plan_run = {
+        "id": str(plan_run.id),
+        "plan": raw_plan,
+        "end_user": plan_run.end_user_id,
+        "current_step_index": plan_run.current_step_index,
+        "state": plan_run.state.value,
+        "outputs": plan_run.outputs.model_dump(mode="json"),
+        "plan_run_inputs": {
+            k: v.model_dump(mode="json") for k, v in plan_run.plan_run_inputs.items()
+        },
+    }
+    item = PlanRunStreamItem(
+        stream="s", stream_item="i", raw_plan=raw_plan, raw_plan_run=raw_plan_run
+    )
+    assert item._plan is None
+    assert item._plan_run is None
+
+    assert item.plan_run.id == plan_run.id
+    assert item.plan_run.plan_id == plan.id
+    assert item.plan_run is item.plan_run
+    assert item._plan is None
+    assert item.plan.id == plan.id
+
+    given = PlanRunStreamItem(stream="s", stream_item="i", plan=plan, plan_run=plan_run)
+    assert (given.plan, given.plan_run) == (plan, plan_run)
+    empty = PlanRunStreamItem(stream="s", stream_item="i")
+    with pytest.raises(ValueError, match="has no plan"):
+        _ = empty.plan
+    with pytest.raises(ValueError, match="has no plan run"):
+        _ = empty.plan_run
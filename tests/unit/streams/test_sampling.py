@@ -0,0 +1,144 @@
+"""Test budgeted sampling of stream items."""
+
+import json
+from collections import Counter
+
+import pytest
+
+from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem
+from steelthread.streams.sampling import (
+    StreamSampler,
+    StreamSampling,
+    end_user,
+    judge_tokens,
+    plan_run_state,
+    tools_used,
+)
+from tests.unit.utils import get_test_plan_run
+
+
+def run_item(i: int, state: str = "COMPLETE", user: str = "u") -> PlanRunStreamItem:
+    """Build a plan run stream item from raw payloads."""
+    return PlanRunStreamItem(
+        stream="s",
+        stream_item=str(i),
+        raw_plan={"id": f"plan-{i}", "steps": [{"tool_id": "search"}, {"tool_id": None}]},
+        raw_plan_run={"id": f"prun-{i}", "state": state, "end_user": user},
+    )
+
+
+def sample(
+    policy: StreamSampling, items: list[PlanRunStreamItem]
+) -> tuple[list[PlanRunStreamItem], list[PlanRunStreamItem]]:
+    """Offer every item and return the sample and every skipped item."""
+    sampler: StreamSampler[PlanRunStreamItem] = StreamSampler(policy)
+    skipped = [s for item in items for s in sampler.offer(item)]
+    sampled, rest = sampler.finish()
+    assert sampler.offered == len(items)
+    return sampled, skipped + rest
+
+
+def test_stream_sampling_validation() -> None:
+    """Test the policy rejects budgets that can't be met."""
+    with pytest.raises(ValueError, match="max_items or max_cost"):
+        StreamSampling()
+    with pytest.raises(ValueError, match="max_items must be at least 1"):
+        StreamSampling(max_items=0)
+    with pytest.raises(ValueError, match="max_cost must be positive"):
+        StreamSampling(max_cost=0)
+    with pytest.raises(ValueError, match="unknown stratify_by 'colour'"):
+        StreamSampling(max_items=1, stratify_by="colour")  # type: ignore  # noqa: PGH003
+    assert StreamSampling(max_items=1, stratify_by="state").stratify_by is plan_run_state
+
+
+def test_sample_within_item_budget() -> None:
+    """Test the sample fits the budget, keeps the offered order and skips everything else."""
+    items = [run_item(i) for i in range(100)]
+    sampled, skipped = sample(StreamSampling(max_items=10, seed=1), items)
+    assert len(sampled) == 10
+    assert [int(i.stream_item) for i in sampled] == sorted(int(i.stream_item) for i in sampled)
+    assert {i.stream_item for i in sampled + skipped} == {i.stream_item for i in items}
+    assert len(skipped) == 90
+    again, _ = sample(StreamSampling(max_items=10, seed=1), items)
+    assert [i.stream_item for i in again] == [i.stream_item for i in sampled]
+
+    few, none_skipped = sample(StreamSampling(max_items=10), items[:3])
+    assert (len(few), none_skipped) == (3, [])
+    assert StreamSampler(StreamSampling(max_items=1)).finish() == ([], [])
+
+
+def test_sample_is_uniform() -> None:
+    """Test every item is about as likely to be sampled."""
+    items = [run_item(i) for i in range(10)]
+    counts: Counter[str] = Counter()
+    for seed in range(2000):
+        sampled, _ = sample(StreamSampling(max_items=3, seed=seed), items)
+        counts.update(i.stream_item for i in sampled)
+    assert all(500 < counts[i.stream_item] < 700 for i in items)
+
+
+def test_sample_is_stratified() -> None:
+    """Test the budget is split across strata in proportion to their sizes."""
+    items = [run_item(i, "FAILED" if i % 5 == 0 else "COMPLETE") for i in range(100)]
+    sampled, skipped = sample(StreamSampling(max_items=10, stratify_by="state", seed=3), items)
+    assert Counter(plan_run_state(i) for i in sampled) == {"COMPLETE": 8, "FAILED": 2}
+    assert len(skipped) == 90
+
+    # shares that round down are topped up by the largest remainders
+    items = [run_item(i, user=["a", "b", "c"][i % 3]) for i in range(9)]
+    sampled, _ = sample(StreamSampling(max_items=4, stratify_by=end_user, seed=3), items)
+    assert sorted(Counter(end_user(i) for i in sampled).values()) == [1, 1, 2]
+
+
+def test_sample_within_cost_budget() -> None:
+    """Test the sampled items never cost more than the budget."""
+    items = [run_item(i) for i in range(50)]
+
+    def cost(item: PlanStreamItem | PlanRunStreamItem) -> float:
+        return 100.0 if item.stream_item == "7" else float(int(item.stream_item) % 4 + 1)
+
+    for seed in range(20):
+        sampled, skipped = sample(StreamSampling(max_cost=10, cost=cost, seed=seed), items)
+        assert sum(cost(i) for i in sampled) <= 10
+        assert sampled
+        assert "7" not in {i.stream_item for i in sampled}
+        assert len(sampled) + len(skipped) == 50
+
+    sampled, _ = sample(StreamSampling(max_items=5, max_cost=1000, seed=0), items)
+    assert len(sampled) == 5
+
+
+def test_many_small_strata_share_the_cost_budget() -> None:
+    """Test strata whose share is too small for one item still get the unused budget."""
+    items = [run_item(i, user=f"user-{i}") for i in range(100)]
+    policy = StreamSampling(max_cost=50, cost=lambda _: 1.0, stratify_by="end_user", seed=2)
+    sampled, skipped = sample(policy, items)
+    assert len(sampled) == 50
+    assert len(skipped) == 50
+
+    # leftover budget goes to the least sampled strata first
+    items = [run_item(i, "FAILED" if i < 2 else "COMPLETE") for i in range(20)]
+    policy = StreamSampling(max_cost=4, cost=lambda _: 1.0, stratify_by="state", seed=2)
+    sampled, _ = sample(policy, items)
+    assert Counter(plan_run_state(i) for i in sampled) == {"COMPLETE": 3, "FAILED": 1}
+
+
+def test_strata_keys_and_cost() -> None:
+    """Test the strata and the default cost are read from raw payloads and built items."""
+    item = run_item(1, "FAILED", "alice")
+    assert (plan_run_state(item), end_user(item), tools_used(item)) == (
+        "FAILED",
+        "alice",
+        ("search",),
+    )
+    assert judge_tokens(item) == len(json.dumps(item.raw_plan) + json.dumps(item.raw_plan_run)) / 4
+    assert item._plan is None
+
+    plan, plan_run = get_test_plan_run()
+    plan_item = PlanStreamItem(stream="s", stream_item="1", plan=plan)
+    assert (plan_run_state(plan_item), end_user(plan_item)) == ("plan", None)
+    assert tools_used(plan_item) == tuple(sorted({s.tool_id for s in plan.steps if s.tool_id}))
+    assert judge_tokens(plan_item) == len(plan.model_dump_json()) / 4
+    built = PlanRunStreamItem(stream="s", stream_item="1", plan=plan, plan_run=plan_run)
+    assert plan_run_state(built) == plan_run.state.value
+    assert end_user(built) == plan_run.end_user_id
@@ -0,0 +1,60 @@
+"""Test fair scheduling across streams."""
+
+import pytest
+
+from steelthread.streams.scheduler import FairQueue, StreamThroughput
+
+
+def drain(queue: FairQueue[int]) -> list[str]:
+    """Pop everything from a queue, returning the stream of each pop."""
+    return [queue.pop()[0] for _ in range(len(queue))]
+
+
+def test_fair_queue_shares_by_weight() -> None:
+    """Test streams get pops in proportion to their weights."""
+    queue: FairQueue[int] = FairQueue()
+    for i in range(6):
+        queue.push("a", i, weight=2)
+    for i in range(3):
+        queue.push("b", i)
+    assert queue.backlog("a") == 6
+    assert len(queue) == 9
+    assert drain(queue) == ["a", "a", "b", "a", "a", "b", "a", "a", "b"]
+    assert queue.backlog("a") == 0
+
+
+def test_fair_queue_large_backlog_does_not_starve() -> None:
+    """Test a stream queued behind a large backlog is served straight away."""
+    queue: FairQueue[int] = FairQueue()
+    for i in range(100):
+        queue.push("noisy", i)
+    queue.push("quiet", 0)
+    assert drain(queue)[:2] == ["noisy", "quiet"]
+
+
+def test_fair_queue_idle_stream_gets_no_credit() -> None:
+    """Test a stream joining late starts at the current virtual time."""
+    queue: FairQueue[int] = FairQueue()
+    for i in range(4):
+        queue.push("a", i)
+    assert queue.pop() == ("a", 0)
+    assert queue.pop() == ("a", 1)
+    assert queue.pop() == ("a", 2)
+    for i in range(2):
+        queue.push("b", i)
+    # b joins at a's third start, so it alternates with a rather than going first twice
+    assert drain(queue) == ["b", "a", "b"]
+
+
+def test_fair_queue_validates_weight() -> None:
+    """Test weights must be positive."""
+    with pytest.raises(ValueError, match="weight"):
+        FairQueue().push("a", 0, weight=0)
+
+
+def test_stream_throughput() -> None:
+    """Test throughput is reported per second."""
+    throughput = StreamThroughput("s", weight=2, items=10, backlog=3, seconds=4)
+    assert throughput.items_per_second == 2.5
+    assert str(throughput) == "Stream s: 10 items at 2.5/s (weight 2), 3 waiting"
+    assert StreamThroughput("s", 1, 0, 0, 0).items_per_second == 0.0
@@ -1,13 +1,20 @@
 """Test stream processor."""
 
+import signal
 import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from steelthread.streams.metrics import StreamMetric
 from steelthread.streams.models import PlanRunStreamItem, PlanStreamItem, Stream, StreamSource
-from steelthread.streams.stream_processor import StreamConfig, StreamProcessor
+from steelthread.streams.sampling import StreamSampling
+from steelthread.streams.stream_processor import (
+    MultiStreamProcessor,
+    StreamConfig,
+    StreamProcessor,
+)
 from tests.unit.utils import get_test_config, get_test_plan_run
 
 
@@ -90,7 +97,7 @@ def test_process_plan_and_save_metrics(
     processor.run()
 
     # Should mark the item and save metrics
-    mock_backend.return_value.mark_processed.assert_called_once()
+    mock_backend.return_value.mark_many_processed.assert_called_once_with(["1"])
     for backend in config.metrics_backends:
         backend.save_metrics.assert_called_once()  # type: ignore  # noqa: PGH003
 
@@ -140,6 +147,540 @@ def test_process_plan_run_integration_style(
     processor = StreamProcessor(config)
     processor.run()
 
-    mock_backend.return_value.mark_processed.assert_called_once()
+    mock_backend.return_value.mark_many_processed.assert_called_once()
     for backend in config.metrics_backends:
         backend.save_metrics.assert_called_once()  # type: ignore  # noqa: PGH003
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_process_plan_evaluates_duplicates_once(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test items with the same content are judged once and every item gets the metrics."""
+    config = StreamConfig(stream_name="s", config=get_test_config(), additional_tags={"t": "v"})
+    items = [
+        PlanStreamItem(stream="s", stream_item=str(i), raw_plan={"id": f"plan-{i}", "q": q})
+        for i, q in enumerate(["a", "b", "a", "a"])
+    ]
+    mock_backend.return_value.get_stream.return_value = Stream(
+        id="123",
+        name="s",
+        source=StreamSource.PLAN,
+        sample_filters={},
+        sample_rate=100,
+        last_sampled="",
+    )
+    mock_backend.return_value.load_plan_stream_items.return_value = items
+
+    def process_plan(item: PlanStreamItem) -> list[StreamMetric]:
+        return [
+            StreamMetric.from_stream_item(
+                item, score=1.0, name="n", description="d", explanation=f"judged {item.raw_plan}"
+            )
+        ]
+
+    mock_evaluator = MagicMock()
+    mock_evaluator.process_plan.side_effect = process_plan
+    config.evaluators = [mock_evaluator]  # type: ignore  # noqa: PGH003
+    config.metrics_backends = [MagicMock()]  # type: ignore  # noqa: PGH003
+
+    StreamProcessor(config=config).run()
+
+    assert mock_evaluator.process_plan.call_count == 2
+    acknowledged = mock_backend.return_value.mark_many_processed.call_args_list
+    assert sorted(c.args[0] for c in acknowledged) == [["0", "2", "3"], ["1"]]
+    saved = config.metrics_backends[0].save_metrics.call_args[0][0]  # type: ignore  # noqa: PGH003
+    by_item = {m.stream_item: m for m in saved}
+    assert sorted(by_item) == ["0", "1", "2", "3"]
+    assert by_item["2"].explanation == by_item["0"].explanation
+    assert by_item["3"].tags == {"t": "v"}
+
+    config.deduplicate = False
+    mock_evaluator.reset_mock()
+    StreamProcessor(config=config).run()
+    assert mock_evaluator.process_plan.call_count == 4
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_process_plan_runs_samples_backlog(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test a sample of the backlog is evaluated and the rest acknowledged together."""
+    config = StreamConfig(
+        stream_name="s",
+        config=get_test_config(),
+        sampling=StreamSampling(max_items=3, stratify_by="state", seed=0),
+    )
+    items = [
+        PlanRunStreamItem(
+            stream="s",
+            stream_item=str(i),
+            raw_plan={"q": i},
+            raw_plan_run={"state": "FAILED" if i < 4 else "COMPLETE"},
+        )
+        for i in range(12)
+    ]
+    mock_backend.return_value.get_stream.return_value = Stream(
+        id="123",
+        name="s",
+        source=StreamSource.PLAN_RUN,
+        sample_filters={},
+        sample_rate=100,
+        last_sampled="",
+    )
+    mock_backend.return_value.iter_plan_run_stream_items.return_value = iter(items)
+    # a failed acknowledgement is logged rather than failing the batch
+    mock_backend.return_value.mark_many_processed.side_effect = [["0"], [], [], []]
+    mock_evaluator = MagicMock()
+    mock_evaluator.process_plan_run.return_value = []
+    config.evaluators = [mock_evaluator]  # type: ignore  # noqa: PGH003
+
+    StreamProcessor(config=config).run()
+
+    mock_backend.return_value.load_plan_run_stream_items.assert_not_called()
+    evaluated = [c[0][0] for c in mock_evaluator.process_plan_run.call_args_list]
+    assert sorted(i.raw_plan_run["state"] for i in evaluated) == ["COMPLETE", "COMPLETE", "FAILED"]
+    skipped, *acknowledged = mock_backend.return_value.mark_many_processed.call_args_list
+    assert sorted(skipped.args[0] + [i.stream_item for i in evaluated], key=int) == [
+        str(i) for i in range(12)
+    ]
+    assert sorted(c.args[0] for c in acknowledged) == sorted([i.stream_item] for i in evaluated)
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_process_plan_keeps_metrics_of_acknowledged_items(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test a duplicate that can't be acknowledged doesn't drop the metrics of the others."""
+    config = StreamConfig(stream_name="s", config=get_test_config(), metrics_backends=[MagicMock()])
+    items = [PlanStreamItem(stream="s", stream_item=str(i), raw_plan={"q": "a"}) for i in range(3)]
+    mock_backend.return_value.get_stream.return_value = Stream(
+        id="123",
+        name="s",
+        source=StreamSource.PLAN,
+        sample_filters={},
+        sample_rate=100,
+        last_sampled="",
+    )
+    mock_backend.return_value.load_plan_stream_items.return_value = items
+    mock_backend.return_value.mark_many_processed.return_value = ["1"]
+    mock_evaluator = MagicMock()
+    mock_evaluator.process_plan.side_effect = lambda item: [
+        StreamMetric.from_stream_item(item, 1.0, "n", "d", "judged once")
+    ]
+    config.evaluators = [mock_evaluator]  # type: ignore  # noqa: PGH003
+
+    StreamProcessor(config=config).run()
+
+    mock_backend.return_value.mark_many_processed.assert_called_once_with(["0", "1", "2"])
+    saved = config.metrics_backends[0].save_metrics.call_args[0][0]  # type: ignore  # noqa: PGH003
+    assert sorted(m.stream_item for m in saved) == ["0", "2"]
+
+
+def plan_stream(mock_backend: MagicMock) -> list[PlanStreamItem]:
+    """Serve a plan stream from the mocked backend, returning its items."""
+    mock_backend.return_value.get_stream.return_value = Stream(
+        id="123",
+        name="s",
+        source=StreamSource.PLAN,
+        sample_filters={},
+        sample_rate=100,
+        last_sampled="",
+    )
+    return [PlanStreamItem(stream="s", stream_item=str(i), raw_plan={"q": i}) for i in range(3)]
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_run_forever_polls_with_backoff(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test polls back off while empty and items already taken aren't evaluated again."""
+    config = StreamConfig(stream_name="s", config=get_test_config())
+    items = plan_stream(mock_backend)
+    # the second poll fails and item 0 stays listed, as if acknowledging it failed
+    mock_backend.return_value.iter_plan_stream_items.side_effect = [
+        iter(items[:2]),
+        RuntimeError("unavailable"),
+        iter(items),
+        iter(items),
+        iter([]),
+    ]
+    mock_evaluator = MagicMock()
+    mock_evaluator.process_plan.return_value = []
+    config.evaluators = [mock_evaluator]  # type: ignore  # noqa: PGH003
+    processor = StreamProcessor(config=config)
+
+    waits = []
+
+    def wait(timeout: float) -> bool:
+        waits.append(timeout)
+        if len(waits) == 3:
+            processor.stop()
+        return False
+
+    processor._stop.wait = wait  # type: ignore  # noqa: PGH003
+    processor.run_forever(min_interval=1.0, max_interval=1.5)
+
+    assert waits == [1.0, 1.0, 1.5]
+    evaluated = [c[0][0].stream_item for c in mock_evaluator.process_plan.call_args_list]
+    assert sorted(evaluated) == ["0", "1", "2"]
+    mock_backend.return_value.get_stream.assert_called_once()
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_run_forever_retries_failed_items(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test a failing item doesn't lose the metrics of the others and is retried."""
+    config = StreamConfig(stream_name="s", config=get_test_config(), metrics_backends=[MagicMock()])
+    items = plan_stream(mock_backend)
+    processed: set[str] = set()
+    mock_backend.return_value.iter_plan_stream_items.side_effect = lambda _: iter(
+        [i for i in items if i.stream_item not in processed]
+    )
+    mock_backend.return_value.mark_many_processed.side_effect = lambda ids: (
+        processed.update(ids) or []
+    )
+    failures = ["1"]
+
+    def process_plan(item: PlanStreamItem) -> list[StreamMetric]:
+        if item.stream_item in failures:
+            failures.remove(item.stream_item)
+            raise RuntimeError("judge failed")
+        return [StreamMetric.from_stream_item(item, 1.0, "n", "d", "judged eventually")]
+
+    mock_evaluator = MagicMock()
+    mock_evaluator.process_plan.side_effect = process_plan
+    config.evaluators = [mock_evaluator]  # type: ignore  # noqa: PGH003
+    processor = StreamProcessor(config=config)
+    processor._stop.wait = lambda _: processor.stop()  # type: ignore  # noqa: PGH003
+
+    processor.run_forever()
+
+    saved = [
+        sorted(m.stream_item for m in call.args[0])
+        for call in config.metrics_backends[0].save_metrics.call_args_list  # type: ignore  # noqa: PGH003
+    ]
+    assert saved == [["0", "2"], ["1"]]
+    assert processed == {"0", "1", "2"}
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_run_forever_backs_off_and_gives_up_on_failing_items(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test polls that only find failing items back off and the items stop being retried."""
+    config = StreamConfig(stream_name="s", config=get_test_config(), metrics_backends=[MagicMock()])
+    items = plan_stream(mock_backend)
+    mock_backend.return_value.iter_plan_stream_items.side_effect = lambda _: iter(items[:1])
+    mock_evaluator = MagicMock()
+    mock_evaluator.process_plan.side_effect = RuntimeError("judge failed")
+    config.evaluators = [mock_evaluator]  # type: ignore  # noqa: PGH003
+    processor = StreamProcessor(config=config)
+
+    waits = []
+
+    def wait(timeout: float) -> bool:
+        waits.append(timeout)
+        if len(waits) == 3:
+            processor.stop()
+        return False
+
+    processor._stop.wait = wait  # type: ignore  # noqa: PGH003
+    processor.run_forever(min_interval=1.0, max_interval=60.0, max_attempts=2)
+
+    assert waits == [1.0, 2.0, 4.0]
+    assert mock_evaluator.process_plan.call_count == 2
+    mock_backend.return_value.mark_many_processed.assert_not_called()
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_run_forever_drains_on_sigterm(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test SIGTERM lets the item being evaluated finish and leaves the rest unprocessed."""
+    config = StreamConfig(stream_name="s", config=get_test_config(), max_concurrency=1)
+    items = plan_stream(mock_backend)
+    mock_backend.return_value.iter_plan_stream_items.return_value = iter(items)
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def process_plan(item: PlanStreamItem) -> list[StreamMetric]:
+        signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)  # type: ignore  # noqa: PGH003
+        return [StreamMetric.from_stream_item(item, 1.0, "n", "d", "judged on sigterm")]
+
+    mock_evaluator = MagicMock()
+    mock_evaluator.process_plan.side_effect = process_plan
+    config.evaluators = [mock_evaluator]  # type: ignore  # noqa: PGH003
+    config.metrics_backends = [MagicMock()]  # type: ignore  # noqa: PGH003
+
+    StreamProcessor(config=config).run_forever()
+
+    assert mock_evaluator.process_plan.call_count == 1
+    mock_backend.return_value.mark_many_processed.assert_called_once_with(["0"])
+    saved = config.metrics_backends[0].save_metrics.call_args[0][0]  # type: ignore  # noqa: PGH003
+    assert [m.stream_item for m in saved] == ["0"]
+    assert signal.getsignal(signal.SIGTERM) is previous
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_run_forever_off_main_thread(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test run_forever can run on another thread and be stopped with stop()."""
+    config = StreamConfig(stream_name="s", config=get_test_config())
+    plan_stream(mock_backend)
+    mock_backend.return_value.iter_plan_stream_items.side_effect = lambda _: iter([])
+    processor = StreamProcessor(config=config)
+    previous = signal.getsignal(signal.SIGTERM)
+
+    thread = threading.Thread(target=processor.run_forever, kwargs={"min_interval": 0.01})
+    thread.start()
+    processor.stop()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert signal.getsignal(signal.SIGTERM) is previous
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_run_forever_validates(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test run_forever rejects bad intervals and invalid sources."""
+    processor = StreamProcessor(config=StreamConfig(stream_name="s", config=get_test_config()))
+    with pytest.raises(ValueError, match="intervals"):
+        processor.run_forever(min_interval=2, max_interval=1)
+    with pytest.raises(ValueError, match="intervals"):
+        processor.run_forever(min_interval=0)
+
+    mock_backend.return_value.get_stream.return_value = Stream.model_construct(
+        id="123", source="StreamSource.PLAN"
+    )
+    with pytest.raises(ValueError, match="invalid source"):
+        processor.run_forever()
+
+
+def serve_streams(mock_backend: MagicMock, items: dict[str, list[PlanStreamItem]]) -> None:
+    """Serve plan streams named after their ids from the mocked backend."""
+    mock_backend.return_value.get_stream.side_effect = lambda name: Stream(
+        id=name,
+        name=name,
+        source=StreamSource.PLAN,
+        sample_filters={},
+        sample_rate=100,
+        last_sampled="",
+    )
+    mock_backend.return_value.load_plan_stream_items.side_effect = lambda stream_id, _: items[
+        stream_id
+    ]
+    mock_backend.return_value.iter_plan_stream_items.side_effect = lambda stream_id: iter(
+        items[stream_id]
+    )
+
+
+def judged(order: list[str]) -> MagicMock:
+    """Make an evaluator recording the items it judges."""
+
+    def process_plan(item: PlanStreamItem) -> list[StreamMetric]:
+        order.append(item.stream_item)
+        return [StreamMetric.from_stream_item(item, 1.0, "n", "d", "judged fairly")]
+
+    evaluator = MagicMock()
+    evaluator.process_plan.side_effect = process_plan
+    return evaluator
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_multi_stream_processor_interleaves_streams(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test a stream with a large backlog shares the workers with a quiet one."""
+    portia_config = get_test_config()
+    items = {
+        name: [
+            PlanStreamItem(stream=name, stream_item=f"{name}{i}", raw_plan={"q": i})
+            for i in range(size)
+        ]
+        for name, size in [("noisy", 6), ("quiet", 2)]
+    }
+    serve_streams(mock_backend, items)
+    order: list[str] = []
+    configs = [
+        StreamConfig(
+            stream_name=name,
+            config=portia_config,
+            evaluators=[judged(order)],  # type: ignore  # noqa: PGH003
+            metrics_backends=[MagicMock()],
+        )
+        for name in items
+    ]
+
+    processor = MultiStreamProcessor(configs, max_concurrency=1)
+    processor.run()
+
+    assert order[:4] == ["noisy0", "quiet0", "noisy1", "quiet1"]
+    assert len(order) == 8
+    # both streams use the same Portia config, so share one backend
+    assert mock_backend.call_count == 1
+    for config in configs:
+        saved = config.metrics_backends[0].save_metrics.call_args[0][0]  # type: ignore  # noqa: PGH003
+        assert {m.stream for m in saved} == {config.stream_name}
+    assert [(t.stream, t.items, t.backlog) for t in processor.stream_throughput] == [
+        ("noisy", 6, 0),
+        ("quiet", 2, 0),
+    ]
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_multi_stream_processor_isolates_failures(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test a stream failing to load or evaluate doesn't stop the others."""
+    items = {
+        "ok": [PlanStreamItem(stream="ok", stream_item="ok0", raw_plan={})],
+        "broken": [PlanStreamItem(stream="broken", stream_item="broken0", raw_plan={})],
+    }
+    serve_streams(mock_backend, items)
+    load = mock_backend.return_value.load_plan_stream_items.side_effect
+
+    def load_or_fail(stream_id: str, batch_size: int) -> list[PlanStreamItem]:
+        if stream_id == "down":
+            raise RuntimeError("unavailable")
+        return load(stream_id, batch_size)
+
+    mock_backend.return_value.load_plan_stream_items.side_effect = load_or_fail
+    order: list[str] = []
+    broken = MagicMock()
+    broken.process_plan.side_effect = RuntimeError("judge failed")
+    configs = [
+        StreamConfig(stream_name="down", config=get_test_config()),
+        StreamConfig(stream_name="broken", config=get_test_config(), evaluators=[broken]),
+        StreamConfig(
+            stream_name="ok",
+            config=get_test_config(),
+            evaluators=[judged(order)],  # type: ignore  # noqa: PGH003
+            metrics_backends=[MagicMock()],
+            weight=2,
+        ),
+    ]
+
+    processor = MultiStreamProcessor(configs, judge_rate_limit=1000)
+    processor.rate_limiter = MagicMock()
+    processor.run()
+
+    assert order == ["ok0"]
+    assert processor.rate_limiter.acquire.call_count == 2
+    assert [(t.stream, t.weight, t.items) for t in processor.stream_throughput] == [
+        ("down", 1.0, 0),
+        ("broken", 1.0, 0),
+        ("ok", 2, 1),
+    ]
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_multi_stream_processor_run_forever(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test streams are polled until stopped and taken items aren't evaluated again."""
+    items = {
+        name: [PlanStreamItem(stream=name, stream_item=f"{name}0", raw_plan={})]
+        for name in ["a", "b"]
+    }
+    serve_streams(mock_backend, items)
+    order: list[str] = []
+    configs = [
+        StreamConfig(
+            stream_name=name,
+            config=get_test_config(),
+            evaluators=[judged(order)],  # type: ignore  # noqa: PGH003
+            metrics_backends=[MagicMock()],
+        )
+        for name in items
+    ]
+    processor = MultiStreamProcessor(configs)
+
+    waits = []
+
+    def wait(timeout: float) -> bool:
+        waits.append(timeout)
+        if len(waits) == 2:
+            processor.stop()
+        return False
+
+    processor._stop.wait = wait  # type: ignore  # noqa: PGH003
+    processor.run_forever(min_interval=1.0)
+
+    assert sorted(order) == ["a0", "b0"]
+    assert waits == [1.0, 2.0]
+    assert all(p.watermark is None for p in processor._processors.values())
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_multi_stream_processor_stop_leaves_backlog(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,
+) -> None:
+    """Test stopping lets running items finish and reports the rest as backlog."""
+    items = {
+        "s": [PlanStreamItem(stream="s", stream_item=f"s{i}", raw_plan={"q": i}) for i in range(3)]
+    }
+    serve_streams(mock_backend, items)
+    config = StreamConfig(stream_name="s", config=get_test_config(), metrics_backends=[MagicMock()])
+    processor = MultiStreamProcessor([config], max_concurrency=1)
+
+    def process_plan(item: PlanStreamItem) -> list[StreamMetric]:
+        processor.stop()
+        return [StreamMetric.from_stream_item(item, 1.0, "n", "d", "judged on stop")]
+
+    evaluator = MagicMock()
+    evaluator.process_plan.side_effect = process_plan
+    config.evaluators = [evaluator]  # type: ignore  # noqa: PGH003
+
+    processor.run_forever()
+
+    assert evaluator.process_plan.call_count == 1
+    (throughput,) = processor.stream_throughput
+    assert (throughput.items, throughput.backlog) == (1, 2)
+
+
+@patch("steelthread.streams.stream_processor.PortiaStreamBackend")
+@patch("steelthread.streams.stream_processor.PortiaCloudStorage")
+def test_multi_stream_processor_validates(
+    mock_storage: MagicMock,  # noqa: ARG001
+    mock_backend: MagicMock,  # noqa: ARG001
+) -> None:
+    """Test streams must be given once each and weights and intervals checked."""
+    config = StreamConfig(stream_name="s", config=get_test_config())
+    with pytest.raises(ValueError, match="at least one"):
+        MultiStreamProcessor([])
+    with pytest.raises(ValueError, match="more than once"):
+        MultiStreamProcessor([config, config])
+    with pytest.raises(ValueError, match="weight"):
+        StreamConfig(stream_name="s", config=get_test_config(), weight=0)
+    with pytest.raises(ValueError, match="intervals"):
+        MultiStreamProcessor([config]).run_forever(min_interval=0)
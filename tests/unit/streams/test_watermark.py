@@ -0,0 +1,59 @@
+"""Test stream watermark."""
+
+import pytest
+
+from steelthread.streams.watermark import StreamWatermark
+
+
+def test_watermark_remembers_taken_items() -> None:
+    """Test items are remembered once taken."""
+    watermark = StreamWatermark()
+    watermark.update(["a", "b"])
+    watermark.update(["b"])
+    assert "a" in watermark
+    assert "c" not in watermark
+    assert len(watermark) == 2
+
+
+def test_watermark_forgets_oldest_items() -> None:
+    """Test the oldest items are forgotten beyond max_size."""
+    watermark = StreamWatermark(max_size=2)
+    watermark.update(["a", "b", "c"])
+    assert "a" not in watermark
+    assert "b" in watermark
+    assert "c" in watermark
+    assert len(watermark) == 2
+
+
+def test_watermark_discards_items() -> None:
+    """Test discarded items can be taken again."""
+    watermark = StreamWatermark()
+    watermark.update(["a", "b"])
+    watermark.discard(["a", "unknown"])
+    assert "a" not in watermark
+    assert "b" in watermark
+
+
+def test_watermark_releases_failed_items_until_max_attempts() -> None:
+    """Test failed items are retried until they have failed max_attempts times."""
+    watermark = StreamWatermark(max_size=2, max_attempts=2)
+    watermark.update(["a", "b"])
+    assert watermark.release(["a"]) == []
+    assert "a" not in watermark
+    watermark.update(["a"])
+    assert watermark.release(["a", "b"]) == ["a"]
+    assert "a" in watermark
+    assert "b" not in watermark
+
+    # failure counts are bounded like the ids
+    assert watermark.release(["c", "d", "e"]) == []
+    assert watermark.release(["c"]) == []
+    assert watermark.release(["e"]) == ["e"]
+
+
+def test_watermark_validates_max_size() -> None:
+    """Test max_size and max_attempts must be positive."""
+    with pytest.raises(ValueError, match="max_size"):
+        StreamWatermark(max_size=0)
+    with pytest.raises(ValueError, match="max_attempts"):
+        StreamWatermark(max_attempts=0)
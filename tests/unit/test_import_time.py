@@ -0,0 +1,79 @@
+"""Import time benchmark.
+
+Runs each import in a fresh interpreter so the measurement reflects a cold start.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parents[2]
+
+# Budget for importing the top level packages in a fresh interpreter. These imports should
+# not pull in pandas, httpx or the portia SDK so this is generous even on slow CI machines.
+IMPORT_BUDGET_SECONDS = 0.25
+HEAVY_MODULES = ["pandas", "httpx", "portia"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(statement: str, repeats: int = 3) -> tuple[float, set[str]]:
+    """Import in a fresh interpreter and return the fastest time and the loaded modules."""
+    timings = []
+    modules: set[str] = set()
+    for _ in range(repeats):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            capture_output=True,
+            check=True,
+            cwd=REPO_ROOT,
+            text=True,
+        )
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(data["elapsed"])
+        modules = set(data["modules"])
+    return min(timings), modules
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import steelthread.evals",
+        "import steelthread.streams",
+        "import steelthread.portia",
+        "import steelthread.evals, steelthread.streams, steelthread.portia",
+    ],
+)
+def test_package_import_is_lazy_and_within_budget(statement: str) -> None:
+    """Test importing the packages is cheap and does not load heavy dependencies."""
+    elapsed, modules = measure_import(statement)
+    assert not [m for m in HEAVY_MODULES if m in modules]
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"{statement} took {elapsed:.3f}s"
+
+
+def test_evals_does_not_import_streams_or_pandas() -> None:
+    """Test the eval runner only pulls in what it needs."""
+    _, modules = measure_import("from steelthread.evals import EvalRunner")
+    assert "steelthread.evals.eval_runner" in modules
+    assert "steelthread.streams" not in modules
+    assert "pandas" not in modules
+
+
+def test_lazy_exports() -> None:
+    """Test lazily exported names resolve, are cached and are listed."""
+    import steelthread.evals  # noqa: PLC0415
+
+    assert "EvalMetric" in dir(steelthread.evals)
+    metric_cls = steelthread.evals.EvalMetric
+    assert vars(steelthread.evals)["EvalMetric"] is metric_cls
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        steelthread.evals.Missing  # noqa: B018
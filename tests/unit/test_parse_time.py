@@ -0,0 +1,108 @@
+"""Page parsing benchmark.
+
+Checks validating a page of 1k items straight from its raw bytes stays within a generous
+budget, and gives the same models as decoding it to dicts and building each model from them.
+"""
+
+import json
+import time
+from collections.abc import Callable
+
+from portia import PlanRun
+
+from steelthread.evals.backend import _DATASET_PAGE
+from steelthread.evals.models import EvalTestCase
+from steelthread.streams.backend import _PLAN_RUN_PAGE
+from steelthread.streams.models import PlanRunStreamItem
+from tests.unit.utils import get_test_plan_run
+
+ITEMS = 1000
+
+# Budget for validating a page of 1k items. Generous so it holds on slow CI machines.
+PARSE_BUDGET_SECONDS = 0.5
+
+
+def measure(parse: Callable[[], object], repeats: int = 5) -> float:
+    """Return the fastest of several timings of a parse."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_dataset_page_parse_time() -> None:
+    """Test validating test cases from raw bytes is within budget and matches dicts."""
+    body = json.dumps(
+        {
+            "results": [
+                {
+                    "id": f"tc{i}",
+                    "dataset": "myset",
+                    "description": f"test case {i}",
+                    "input_config": {"type": "query", "value": f"query {i}", "tools": ["t"]},
+                    "assertions": [
+                        {"type": "outcome", "value": "COMPLETE"},
+                        {"type": "final_output", "output_type": "exact_match", "value": "x"},
+                        {"type": "tool_calls", "calls": {"t": {"called": True}}},
+                    ],
+                }
+                for i in range(ITEMS)
+            ],
+            "current_page": 1,
+            "total_pages": 1,
+        }
+    ).encode()
+
+    def from_dicts() -> list[EvalTestCase]:
+        return [
+            EvalTestCase(**tc, testcase=tc["id"], test_case_name=tc["description"], run="r")
+            for tc in json.loads(body)["results"]
+        ]
+
+    def from_bytes() -> list[EvalTestCase]:
+        return _DATASET_PAGE.validate_json(body, context={"run": "r"})["results"]
+
+    assert from_bytes() == from_dicts()
+    assert measure(from_bytes) < PARSE_BUDGET_SECONDS
+
+
+def test_plan_run_stream_page_parse_time() -> None:
+    """Test loading plan run stream items from raw bytes is within budget."""
+    plan, plan_run = get_test_plan_run()
+    plan_response = {
+        "id": str(plan.id),
+        "query": plan.plan_context.query,
+        "tool_ids": plan.plan_context.tool_ids,
+        "steps": [s.model_dump(mode="json") for s in plan.steps],
+        "plan_inputs": [i.model_dump(mode="json") for i in plan.plan_inputs],
+    }
+    item = {
+        "id": "item",
+        "plan": plan_response,
+        "plan_run": {
+            "id": str(plan_run.id),
+            "plan": plan_response,
+            "end_user": plan_run.end_user_id,
+            "current_step_index": plan_run.current_step_index,
+            "state": plan_run.state.value,
+            "outputs": plan_run.outputs.model_dump(mode="json"),
+            "plan_run_inputs": {
+                k: v.model_dump(mode="json") for k, v in plan_run.plan_run_inputs.items()
+            },
+        },
+    }
+    body = json.dumps({"results": [item] * ITEMS, "current_page": 1, "total_pages": 1})
+
+    # plans and plan runs are only built when used, so time building them all too
+    def load_and_build() -> list[PlanRun]:
+        return [
+            PlanRunStreamItem(
+                stream="s", stream_item=r["id"], raw_plan=r["plan"], raw_plan_run=r["plan_run"]
+            ).plan_run
+            for r in _PLAN_RUN_PAGE.validate_json(body)["results"]
+        ]
+
+    assert load_and_build()[0].id == plan_run.id
+    assert measure(load_and_build) < PARSE_BUDGET_SECONDS
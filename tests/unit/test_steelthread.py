@@ -28,3 +28,15 @@ def test_process_stream() -> None:
 
         mock_runner.assert_called_once_with(mock_config)
         mock_runner_instance.run.assert_called_once()
+
+
+def test_process_streams() -> None:
+    """Test process streams."""
+    mock_configs = [Mock(), Mock()]
+
+    with patch("steelthread.steelthread.MultiStreamProcessor") as mock_runner:
+        mock_runner_instance = mock_runner.return_value
+        SteelThread.process_streams(mock_configs, judge_rate_limit=2)
+
+        mock_runner.assert_called_once_with(mock_configs, judge_rate_limit=2)
+        mock_runner_instance.run.assert_called_once()
@@ -0,0 +1,76 @@
+"""Test arrow writer."""
+
+import builtins
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from steelthread.utils.arrow import (
+    ArrowPartitionedWriter,
+    open_metrics_dataset,
+    require_pyarrow,
+)
+
+pytest.importorskip("pyarrow")
+
+
+def test_write_partitions_and_encodes_tags(tmp_path: Path) -> None:
+    """Test rows are split by partition with dictionary encoded tags."""
+    import pyarrow as pa  # noqa: PLC0415
+
+    writer = ArrowPartitionedWriter(tmp_path, partition_by=["dataset", "run"])
+    files = writer.write(
+        [
+            {"dataset": "ds/1", "run": "r1", "score": 1.0, "tags": {"model": "a"}},
+            {"dataset": "ds/1", "run": "r1", "score": 0.5, "tags": {"model": "b"}},
+            {
+                "dataset": "ds/1",
+                "run": "r2",
+                "score": 0.0,
+                "tags": {"model": "a", "env": "ci"},
+                "eval_output": b"{}",
+            },
+        ]
+    )
+
+    assert len(files) == 2
+    assert all("dataset=ds%2F1" in str(f) for f in files)
+    assert all(f.parent.name.startswith("date=") for f in files)
+
+    dataset = open_metrics_dataset(tmp_path)
+    assert pa.types.is_dictionary(dataset.schema.field("tag_model").type)
+    assert dataset.schema.field("eval_output").type == pa.large_binary()
+
+    table = dataset.to_table(columns=["run", "score", "tag_model", "tag_env"]).sort_by("score")
+    assert table.to_pylist() == [
+        {"run": "r2", "score": 0.0, "tag_model": "a", "tag_env": "ci"},
+        {"run": "r1", "score": 0.5, "tag_model": "b", "tag_env": None},
+        {"run": "r1", "score": 1.0, "tag_model": "a", "tag_env": None},
+    ]
+
+
+def test_write_is_append_only(tmp_path: Path) -> None:
+    """Test each write adds new files rather than rewriting old ones."""
+    writer = ArrowPartitionedWriter(tmp_path, partition_by=["stream"])
+    first = writer.write([{"stream": "s", "score": 1.0}])
+    second = writer.write([{"stream": "s", "score": 0.0}])
+    assert first != second
+    assert open_metrics_dataset(tmp_path).count_rows() == 2
+
+
+def test_require_pyarrow_missing() -> None:
+    """Test a helpful error is raised without pyarrow."""
+    real_import = builtins.__import__
+
+    def fake_import(name: str, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if name == "pyarrow":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    with (
+        patch("builtins.__import__", side_effect=fake_import),
+        pytest.raises(ImportError, match="steel-thread\\[arrow\\]"),
+    ):
+        require_pyarrow()
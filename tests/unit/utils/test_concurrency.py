@@ -0,0 +1,147 @@
+"""Test concurrency utils."""
+
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from steelthread.utils.concurrency import (
+    BoundedExecutor,
+    DaemonThreadExecutor,
+    DeadlineExceededError,
+    RateLimiter,
+    abandoning,
+    run_with_timeout,
+    shared_executor,
+)
+
+
+def test_map_runs_concurrently_in_order() -> None:
+    """Test calls overlap and results keep the item order."""
+    executor = BoundedExecutor(max_workers=4)
+
+    def slow(x: int) -> int:
+        time.sleep(0.1)
+        return x * 2
+
+    start = time.perf_counter()
+    assert executor.map(slow, range(5)) == [0, 2, 4, 6, 8]
+    assert time.perf_counter() - start < 0.3
+    assert executor.map(slow, []) == []
+    assert executor.map(slow, [1]) == [2]
+    executor.shutdown()
+    executor.shutdown()
+
+
+def test_saturated_executor_runs_in_caller() -> None:
+    """Test nested fan outs on a saturated executor complete instead of deadlocking."""
+    executor = BoundedExecutor(max_workers=1)
+    threads: set[str] = set()
+
+    def inner(x: int) -> int:
+        threads.add(threading.current_thread().name)
+        return x
+
+    def outer(x: int) -> list[int]:
+        return executor.map(inner, [x, x + 1, x + 2])
+
+    assert executor.map(outer, [0, 10]) == [[0, 1, 2], [10, 11, 12]]
+    assert any(name.startswith("steelthread-fanout") for name in threads)
+    assert threading.current_thread().name in threads
+
+
+def test_map_raises_first_error_in_order() -> None:
+    """Test the error of the earliest failing item is raised."""
+    executor = BoundedExecutor(max_workers=2)
+
+    def fail(x: int) -> int:
+        raise ValueError(f"bad {x}")
+
+    with pytest.raises(ValueError, match="bad 0"):
+        executor.map(fail, [0, 1, 2, 3])
+
+
+def test_pickle_and_shared() -> None:
+    """Test executors pickle as fresh copies and the shared executor is a singleton."""
+    executor = BoundedExecutor(max_workers=3)
+    executor.map(abs, [-1, -2])
+    copy = pickle.loads(pickle.dumps(executor))  # noqa: S301
+    assert copy.max_workers == 3
+    assert copy.map(abs, [-1, -2]) == [1, 2]
+    assert shared_executor() is shared_executor()
+
+
+def test_rate_limiter_spaces_out_calls() -> None:
+    """Test the burst starts immediately and later calls wait for the rate."""
+    limiter = RateLimiter(rate=20, burst=2)
+    start = time.perf_counter()
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() > 0
+    assert limiter.acquire() > 0
+    assert time.perf_counter() - start >= 0.09
+
+    with pytest.raises(ValueError, match="rate"):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError, match="burst"):
+        RateLimiter(rate=1, burst=0)
+
+
+def test_run_with_timeout() -> None:
+    """Test calls past their deadline are abandoned and other outcomes pass through."""
+    assert run_with_timeout(lambda: 1, None) == 1
+    assert run_with_timeout(lambda: 2, 1) == 2
+
+    start = time.perf_counter()
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        run_with_timeout(lambda: time.sleep(1), 0.05)
+    assert exc_info.value.timeout == 0.05
+    assert time.perf_counter() - start < 0.5
+
+    def fail() -> None:
+        raise TimeoutError("own")
+
+    with pytest.raises(TimeoutError, match="own"):
+        run_with_timeout(fail, 1)
+
+
+def test_daemon_thread_executor_abandons_running_calls() -> None:
+    """Test shutting down doesn't wait for calls still running."""
+    release = threading.Event()
+    with DaemonThreadExecutor() as executor:
+        hung = executor.submit(release.wait, 5)
+        quick = executor.submit(lambda x: x * 2, 21)
+        failing = executor.submit(int, "x")
+        assert quick.result(timeout=1) == 42
+        with pytest.raises(ValueError, match="invalid literal"):
+            failing.result(timeout=1)
+    assert not hung.done()
+    release.set()
+    assert hung.result(timeout=1) is True
+
+
+def test_daemon_thread_executor_skips_cancelled_calls() -> None:
+    """Test a call cancelled before its thread starts never runs."""
+    executor = DaemonThreadExecutor()
+    calls = []
+    with patch("steelthread.utils.concurrency.threading.Thread") as mock_thread:
+        future = executor.submit(calls.append, 1)
+    assert future.cancel()
+    mock_thread.call_args.kwargs["target"]()
+    assert calls == []
+
+
+def test_abandoning_does_not_wait_for_running_calls() -> None:
+    """Test an abandoned pool returns straight away and cancels queued calls."""
+    release = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+    start = time.perf_counter()
+    with abandoning(pool) as executor:
+        executor.submit(release.wait, 5)
+        queued = executor.submit(time.sleep, 0)
+    assert time.perf_counter() - start < 1
+    assert queued.cancelled()
+    release.set()
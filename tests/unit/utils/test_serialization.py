@@ -0,0 +1,12 @@
+"""Test serialization utils."""
+
+from datetime import date
+
+from steelthread.utils.serialization import to_json
+
+
+def test_to_json() -> None:
+    """Test JSON columns keep nulls and fall back to str for other values."""
+    assert to_json(None) is None
+    assert to_json(["a"]) == '["a"]'
+    assert to_json({"d": date(2024, 1, 2)}) == '{"d": "2024-01-02"}'
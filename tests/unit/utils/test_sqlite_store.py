@@ -0,0 +1,124 @@
+"""Test SQLite metrics store."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from steelthread.evals.metrics import EvalMetric
+from steelthread.streams.metrics import StreamMetric
+from steelthread.utils.sqlite_store import SQLiteMetricsStore
+
+
+def make_metric(run: str, score: float, model: str, testcase: str = "tc1") -> EvalMetric:
+    """Make an eval metric."""
+    return EvalMetric(
+        dataset="ds",
+        testcase=testcase,
+        run=run,
+        score=score,
+        name="accuracy",
+        description="desc",
+        expectation=["a"],
+        actual_value={"k": "v"},
+        tags={"planning_model": model},
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SQLiteMetricsStore:
+    """Store with a small batch size so batching is exercised."""
+    return SQLiteMetricsStore(tmp_path / "nested" / "metrics.db", batch_size=2)
+
+
+def test_add_eval_metrics_batches(store: SQLiteMetricsStore) -> None:
+    """Test metrics and tags are inserted across several transactions."""
+    inserted = store.add_eval_metrics(
+        [make_metric("r1", 1.0, "a"), make_metric("r1", 0.0, "a"), make_metric("r1", 0.5, "b")]
+    )
+    assert inserted == 3
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM eval_metrics").fetchone() == (3,)
+        assert conn.execute("SELECT COUNT(*) FROM eval_metric_tags").fetchone() == (3,)
+        assert conn.execute("SELECT expectation FROM eval_metrics LIMIT 1").fetchone() == ('["a"]',)
+
+
+def test_indexes_are_used(store: SQLiteMetricsStore) -> None:
+    """Test lookups hit the composite and tag indexes."""
+    with sqlite3.connect(store.path) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM eval_metrics "
+            "WHERE dataset = 'd' AND testcase = 't' AND run = 'r' AND name = 'n'"
+        ).fetchall()
+        assert "ix_eval_metrics_lookup" in str(plan)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT metric_id FROM eval_metric_tags "
+            "WHERE key = 'k' AND value = 'v'"
+        ).fetchall()
+        assert "ix_eval_metric_tags_kv" in str(plan)
+
+
+def test_failed_batch_rolls_back(store: SQLiteMetricsStore) -> None:
+    """Test a failing batch leaves no partial rows behind."""
+    bad = make_metric("r1", 1.0, "a")
+    bad.tags = {"planning_model": object()}  # type: ignore  # noqa: PGH003
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.add_eval_metrics([bad])
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM eval_metrics").fetchone() == (0,)
+
+
+def test_latest_runs(store: SQLiteMetricsStore) -> None:
+    """Test the latest N runs of a test case are returned newest first."""
+    with patch("steelthread.utils.sqlite_store.time.time", side_effect=[100.0, 200.0, 300.0]):
+        store.add_eval_metrics([make_metric("r1", 1.0, "a"), make_metric("r1", 0.0, "a")])
+        store.add_eval_metrics([make_metric("r2", 0.5, "a")])
+        store.add_eval_metrics([make_metric("r3", 0.5, "a", testcase="other")])
+
+    runs = store.latest_runs("tc1", n=5)
+    assert [(r.run, r.score, r.count) for r in runs] == [("r2", 0.5, 1), ("r1", 0.5, 2)]
+    assert [r.run for r in store.latest_runs("tc1", n=1)] == ["r2"]
+    assert store.latest_runs("tc1", dataset="missing") == []
+
+
+def test_testcase_latencies(store: SQLiteMetricsStore) -> None:
+    """Test latency assertions give an average latency per test case."""
+    latencies = []
+    for testcase, actual in [("tc1", "100.0"), ("tc1", "300.0"), ("tc2", "50.5")]:
+        metric = make_metric("r1", 0.5, "a", testcase=testcase)
+        metric.name = "latency"
+        metric.actual_value = actual
+        latencies.append(metric)
+    store.add_eval_metrics([*latencies, make_metric("r1", 1.0, "a")])
+
+    assert store.testcase_latencies() == {"tc1": 200.0, "tc2": 50.5}
+    assert store.testcase_latencies(dataset="other") == {}
+
+
+def test_average_score_by_tag(store: SQLiteMetricsStore) -> None:
+    """Test averages are grouped by tag value and time bucket."""
+    day = 24 * 60 * 60
+    with patch("steelthread.utils.sqlite_store.time.time", side_effect=[0.0, float(day)]):
+        store.add_eval_metrics([make_metric("r1", 1.0, "a"), make_metric("r1", 0.0, "b")])
+        store.add_eval_metrics([make_metric("r2", 0.5, "a")])
+
+    scores = store.average_score_by_tag("planning_model")
+    assert [(s.period, s.tag_value, s.score) for s in scores] == [
+        ("1970-01-01", "a", 1.0),
+        ("1970-01-01", "b", 0.0),
+        ("1970-01-02", "a", 0.5),
+    ]
+    monthly = store.average_score_by_tag("planning_model", name="accuracy", bucket="month")
+    assert [(s.tag_value, s.score, s.count) for s in monthly] == [("a", 0.75, 2), ("b", 0.0, 1)]
+
+
+def test_add_stream_metrics(store: SQLiteMetricsStore) -> None:
+    """Test stream metrics are stored with their tags."""
+    metric = StreamMetric(
+        stream="s", stream_item="i", score=1.0, name="success", description="d", tags={"k": "v"}
+    )
+    assert store.add_stream_metrics([metric]) == 1
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute("SELECT stream, score FROM stream_metrics").fetchall() == [("s", 1.0)]
+        assert conn.execute("SELECT key, value FROM stream_metric_tags").fetchall() == [("k", "v")]
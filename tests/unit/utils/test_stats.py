@@ -0,0 +1,109 @@
+"""Test streaming stats."""
+
+import math
+import random
+import statistics
+from types import SimpleNamespace
+
+import pytest
+
+from steelthread.utils.stats import MetricAggregator, P2Quantile, RunningStats, render_table
+
+
+def test_p2_quantile_exact_for_small_samples() -> None:
+    """Test estimates are exact before the markers are initialized."""
+    estimator = P2Quantile(0.5)
+    assert math.isnan(estimator.value)
+    for v in [3.0, 1.0, 2.0]:
+        estimator.add(v)
+    assert estimator.value == 2.0
+
+
+def test_p2_quantile_converges() -> None:
+    """Test the P² estimate is close to the true quantile."""
+    rng = random.Random(0)  # noqa: S311
+    values = [rng.random() for _ in range(5000)]
+    median = P2Quantile(0.5)
+    p90 = P2Quantile(0.9)
+    for v in values:
+        median.add(v)
+        p90.add(v)
+    assert median.value == pytest.approx(statistics.median(values), abs=0.02)
+    assert p90.value == pytest.approx(statistics.quantiles(values, n=10)[-1], abs=0.02)
+
+
+def test_p2_quantile_extremes() -> None:
+    """Test values outside the current markers move the end markers."""
+    estimator = P2Quantile(0.5)
+    for v in [5.0, 6.0, 7.0, 8.0, 9.0, 1.0, 20.0]:
+        estimator.add(v)
+    assert 5.0 <= estimator.value <= 9.0
+
+
+def test_p2_quantile_invalid() -> None:
+    """Test quantiles outside [0, 1] are rejected."""
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        P2Quantile(1.5)
+
+
+def test_running_stats() -> None:
+    """Test running stats match the batch computation."""
+    values = [0.1, 0.5, 0.9, 0.3, 0.7, 1.0, 0.0]
+    stats = RunningStats()
+    for v in values:
+        stats.add(v)
+    assert stats.count == 7
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert stats.std == pytest.approx(statistics.stdev(values))
+    assert stats.min == 0.0
+    assert stats.max == 1.0
+    assert 0.0 <= stats.quantile(0.5) <= 1.0
+    with pytest.raises(KeyError):
+        stats.quantile(0.99)
+
+
+def test_running_stats_single_value() -> None:
+    """Test variance is undefined for one value."""
+    stats = RunningStats()
+    stats.add(1.0)
+    assert math.isnan(stats.variance)
+
+
+def test_metric_aggregator_groups_by_name_and_tags() -> None:
+    """Test metrics are folded per (name, tags) group."""
+    aggregator = MetricAggregator()
+    aggregator.extend(
+        [
+            SimpleNamespace(name="clarity", score=0.9, tags={"env": "test"}),
+            SimpleNamespace(name="clarity", score=0.6, tags={"env": "test"}),
+            SimpleNamespace(name="clarity", score=0.2, tags={"env": "prod"}),
+            SimpleNamespace(name="accuracy", score=1.0, tags={"env": "test", "model": "m"}),
+        ]
+    )
+    assert len(aggregator.groups) == 3
+    assert aggregator.columns == ["name", "env", "model"]
+
+    summary = aggregator.summary()
+    assert [row["name"] for row, _ in summary] == ["accuracy", "clarity", "clarity"]
+    assert summary[2][1].mean == pytest.approx(0.75)
+
+    out = aggregator.to_string()
+    assert out.splitlines()[0].split() == ["name", "env", "model", "score"]
+    assert "0.75" in out
+    assert "NaN" in out
+
+
+def test_metric_aggregator_detailed_and_custom_key() -> None:
+    """Test custom keys and the detailed table."""
+    aggregator = MetricAggregator(key=lambda m: {"name": m.name})
+    aggregator.add(SimpleNamespace(name="a", score=1.0, tags=None))
+    aggregator.add(SimpleNamespace(name="a", score=0.0, tags=None))
+    header, row = aggregator.to_string(detailed=True).splitlines()
+    assert header.split() == ["name", "score", "count", "std", "min", "max", "p50", "p90"]
+    assert row.split()[:3] == ["a", "0.5", "2"]
+
+
+def test_render_table_empty() -> None:
+    """Test rendering a table without rows."""
+    assert render_table(["name", "score"], []) == "name score"